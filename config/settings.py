@@ -21,21 +21,89 @@ class Config:
     GATEWAY_URL = os.getenv("GATEWAY_URL", "http://localhost:8080")
     GATEWAY_API_BASE = f"{GATEWAY_URL}/v1" # Standard OpenAI-compatible endpoint
     MCP_SERVER_SSE_URL = os.getenv("MCP_SERVER_SSE_URL", f"{GATEWAY_URL}/mcp/sse")
+    # Stateless streamable HTTP endpoint; load-balances tool calls across gateway replicas
+    MCP_SERVER_HTTP_URL = os.getenv("MCP_SERVER_HTTP_URL", f"{GATEWAY_URL}/mcp/http/")
+    # Agent-side MCP transport: "sse" (one pinned stream) or "streamable_http"
+    MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "sse")
+    GATEWAY_GRPC_TARGET = os.getenv("GATEWAY_GRPC_TARGET", "localhost:50051")
     VLLM_FAST_API_BASE = os.getenv("VLLM_FAST_API_BASE", "http://vllm-service:8000/v1")
     MODEL_FAST = os.getenv("MODEL_FAST", "openai/meta-llama/Meta-Llama-3.1-8B-Instruct")
     MODEL_CONSENSUS = os.getenv("MODEL_CONSENSUS", MODEL_REASONING)
 
     MAX_TOKENS = int(os.getenv("MAX_TOKENS", 8192))
+
+    # --- GATEWAY STREAMING ---
+    # Output rails run over sliding windows of streamed text before it is flushed.
+    STREAM_RAIL_WINDOW_CHARS = int(os.getenv("STREAM_RAIL_WINDOW_CHARS", 256))
+    STREAM_RAIL_CONTEXT_CHARS = int(os.getenv("STREAM_RAIL_CONTEXT_CHARS", 64))
+    # Start vLLM generation concurrently with the input rails (opt-in; wasted work if a rail blocks)
+    SPECULATIVE_GENERATION = os.getenv("SPECULATIVE_GENERATION", "false").lower() == "true"
+    # Max read-only tools executing concurrently inside one /tools/execute_batch request
+    TOOL_BATCH_CONCURRENCY = int(os.getenv("TOOL_BATCH_CONCURRENCY", 8))
+    # gRPC transport (gateway.proto), served alongside the HTTP app
+    GATEWAY_GRPC_ENABLED = os.getenv("GATEWAY_GRPC_ENABLED", "true").lower() == "true"
+    GATEWAY_GRPC_PORT = int(os.getenv("GATEWAY_GRPC_PORT", 50051))
+    # Let several processes bind GATEWAY_GRPC_PORT (set by gunicorn_conf.py for its workers)
+    GATEWAY_GRPC_REUSEPORT = os.getenv("GATEWAY_GRPC_REUSEPORT", "false").lower() == "true"
+    # Worker threads for synchronous tools (yfinance, sync HTTP) offloaded from the event loop
+    TOOL_THREAD_POOL_SIZE = int(os.getenv("TOOL_THREAD_POOL_SIZE", 16))
     
     # --- INFRASTRUCTURE ---
     GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
     GOOGLE_CLOUD_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
     PORT = int(os.getenv("PORT", 8080))
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+    # Shared asyncio connection pool: max connections per worker, and how long a caller waits for one
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    REDIS_POOL_TIMEOUT_S = float(os.getenv("REDIS_POOL_TIMEOUT_S", 5.0))
+    # In-memory fallback (no Redis): least recently used keys are evicted beyond this count
+    REDIS_MEMORY_MAX_KEYS = int(os.getenv("REDIS_MEMORY_MAX_KEYS", 10000))
 
     # Sidecars
     OPA_URL = os.getenv("OPA_URL", "http://localhost:8181/v1/data/finance/allow")
     OPA_AUTH_TOKEN = os.getenv("OPA_AUTH_TOKEN")
+    # Batch rule for multi-step plans; defaults to `batch_allow` next to OPA_URL's rule
+    OPA_BATCH_URL = os.getenv("OPA_BATCH_URL")
+    # OPA_URL=embedded://finance evaluates these .rego files (or directories) in-process
+    OPA_EMBEDDED_POLICY_PATHS = [p for p in os.getenv("OPA_EMBEDDED_POLICY_PATHS", "").split(",") if p] or None
+    # Used when the embedded engine cannot compile the policy
+    OPA_FALLBACK_URL = os.getenv("OPA_FALLBACK_URL", "http://localhost:8181/v1/data/finance/allow")
+    # In-process OPA decision cache (LRU + TTL, cleared on bundle revision change or Redis message)
+    OPA_DECISION_CACHE_ENABLED = os.getenv("OPA_DECISION_CACHE_ENABLED", "true").lower() == "true"
+    OPA_DECISION_CACHE_TTL_S = float(os.getenv("OPA_DECISION_CACHE_TTL_S", 30.0))
+    OPA_DECISION_CACHE_MAX_ENTRIES = int(os.getenv("OPA_DECISION_CACHE_MAX_ENTRIES", 10000))
+    # Per-call fields no policy reads; excluded from the cache key
+    OPA_DECISION_CACHE_IGNORE_FIELDS = [f for f in os.getenv("OPA_DECISION_CACHE_IGNORE_FIELDS", "transaction_id,dry_run").split(",") if f]
+    OPA_CACHE_INVALIDATION_CHANNEL = os.getenv("OPA_CACHE_INVALIDATION_CHANNEL", "governance:opa_cache_invalidate")
+    # "local" (per-process) or "redis" (shared by all gateway workers; set by gunicorn_conf.py)
+    CIRCUIT_BREAKER_BACKEND = os.getenv("CIRCUIT_BREAKER_BACKEND", "local")
+    # OPA breaker: trips on failure or slow-call rate over a sliding window, then probes in HALF_OPEN
+    OPA_BREAKER_WINDOW_S = int(os.getenv("OPA_BREAKER_WINDOW_S", 30))
+    OPA_BREAKER_FAILURE_RATE = float(os.getenv("OPA_BREAKER_FAILURE_RATE", 0.5))
+    OPA_BREAKER_SLOW_CALL_MS = float(os.getenv("OPA_BREAKER_SLOW_CALL_MS", 250.0))
+    OPA_BREAKER_SLOW_CALL_RATE = float(os.getenv("OPA_BREAKER_SLOW_CALL_RATE", 0.8))
+    OPA_BREAKER_HALF_OPEN_PROBES = int(os.getenv("OPA_BREAKER_HALF_OPEN_PROBES", 3))
+    # Bankruptcy: don't start an OPA call with less of the request deadline left than this
+    OPA_MIN_REMAINING_MS = float(os.getenv("OPA_MIN_REMAINING_MS", 10.0))
+    # Evaluator dry runs: "short_circuit" stops at the first rejecting check (cheapest first), "exhaustive" reports all
+    GOVERNANCE_VERIFY_MODE = os.getenv("GOVERNANCE_VERIFY_MODE", "short_circuit")
+    # Signed dry-run verdicts that let govern() skip re-checking unchanged stages (disabled without a secret)
+    GOVERNANCE_VERDICT_SECRET = os.getenv("GOVERNANCE_VERDICT_SECRET")
+    GOVERNANCE_VERDICT_TTL_S = int(os.getenv("GOVERNANCE_VERDICT_TTL_S", 120))
+    # Input fields the OPA policies read: a verdict's OPA fingerprint covers only these
+    GOVERNANCE_POLICY_INPUT_FIELDS = [f for f in os.getenv(
+        "GOVERNANCE_POLICY_INPUT_FIELDS",
+        "action,trader_role,amount,currency,risk_profile,side,order_type,daily_volume,identity"
+    ).split(",") if f]
+    # govern_batch: concurrent consensus checks for the orders that pass every other stage
+    GOVERNANCE_BATCH_CONSENSUS_CONCURRENCY = int(os.getenv("GOVERNANCE_BATCH_CONSENSUS_CONCURRENCY", 8))
+    # CBF cash reservations: an uncommitted reservation is returned to the balance after this long
+    CBF_RESERVATION_TTL_S = int(os.getenv("CBF_RESERVATION_TTL_S", 30))
+    # STAMP ontology (UCAs, facts, constraints); polled for changes every STPA_ONTOLOGY_POLL_S (0 = no polling)
+    STPA_ONTOLOGY_FILE = os.getenv("STPA_ONTOLOGY_FILE", "src/gateway/governance/stpa_ontology.yaml")
+    STPA_ONTOLOGY_POLL_S = float(os.getenv("STPA_ONTOLOGY_POLL_S", 5.0))
+    # Bearer token for /admin endpoints (unset = admin endpoints disabled)
+    GATEWAY_ADMIN_TOKEN = os.getenv("GATEWAY_ADMIN_TOKEN")
     SANDBOX_URL = os.getenv("SANDBOX_URL", "http://localhost:8081/execute")
 
     # --- NEW: GKE INFERENCE GATEWAY ---
@@ -43,6 +111,27 @@ class Config:
     # Otherwise, it falls back to the split-brain URLs above.
     VLLM_GATEWAY_URL = os.getenv("VLLM_GATEWAY_URL")
 
+    # --- vLLM UPSTREAM POOL (Gateway) ---
+    # One long-lived keep-alive client per upstream, shared by chat and NeMo actions.
+    VLLM_POOL_MAX_CONNECTIONS = int(os.getenv("VLLM_POOL_MAX_CONNECTIONS", 100))
+    VLLM_POOL_MAX_KEEPALIVE = int(os.getenv("VLLM_POOL_MAX_KEEPALIVE", 20))
+    VLLM_POOL_KEEPALIVE_EXPIRY = float(os.getenv("VLLM_POOL_KEEPALIVE_EXPIRY", 30.0))
+    VLLM_HTTP2 = os.getenv("VLLM_HTTP2", "true").lower() == "true"
+    VLLM_REQUEST_TIMEOUT = float(os.getenv("VLLM_REQUEST_TIMEOUT", 120.0))
+
+    # --- ADMISSION CONTROL (Gateway) ---
+    # Per-route concurrency limits; queued requests are admitted governance > verifier > chat > planner
+    # and shed with 429 + Retry-After once they have waited longer than the budget.
+    ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() == "true"
+    ADMISSION_REASONING_CONCURRENCY = int(os.getenv("ADMISSION_REASONING_CONCURRENCY", 32))
+    ADMISSION_FAST_CONCURRENCY = int(os.getenv("ADMISSION_FAST_CONCURRENCY", 64))
+    ADMISSION_GATEWAY_CONCURRENCY = int(os.getenv("ADMISSION_GATEWAY_CONCURRENCY", 96))
+    ADMISSION_QUEUE_BUDGET_MS = int(os.getenv("ADMISSION_QUEUE_BUDGET_MS", 2000))
+    # End-to-end latency budgets (request deadline, see src/gateway/core/deadline.py).
+    # Callers can forward a tighter remaining budget in the X-Deadline-Ms header.
+    AGENT_REQUEST_DEADLINE_MS = float(os.getenv("AGENT_REQUEST_DEADLINE_MS", 120000))
+    GATEWAY_REQUEST_DEADLINE_MS = float(os.getenv("GATEWAY_REQUEST_DEADLINE_MS", 60000))
+
     # --- LangSmith ---
     LANGCHAIN_TRACING_V2 = os.getenv("LANGCHAIN_TRACING_V2", "true")
     LANGCHAIN_PROJECT = os.getenv("LANGCHAIN_PROJECT", "financial-advisor")
@@ -134,6 +134,11 @@ spec:
               value: "${GATEWAY_URL}"
             - name: MCP_SERVER_SSE_URL
               value: "http://gateway:8080/mcp/sse"
+            # Stateless streamable HTTP: tool calls are spread across gateway replicas
+            - name: MCP_SERVER_HTTP_URL
+              value: "http://gateway:8080/mcp/http/"
+            - name: MCP_TRANSPORT
+              value: "streamable_http"
 
 
 
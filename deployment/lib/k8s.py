@@ -404,7 +404,13 @@ def deploy_autoscaling(project_id, config):
     """
     print("\n--- 📈 Deploying Autoscaling (KEDA) ---")
     k8s_dir = Path("deployment/k8s")
-    
+
+    # 0. Gateway scaling signal (queue depth / in-flight per route) into Managed Prometheus
+    gateway_monitoring = k8s_dir / "gateway-podmonitoring.yaml"
+    if gateway_monitoring.exists():
+        print("📊 Applying PodMonitoring for Gateway scaling metrics...")
+        run_command(["kubectl", "apply", "-f", str(gateway_monitoring)])
+
     # 1. ScaledObject for Fast Model
     scaler_fast = k8s_dir / "vllm-inference-scaler-draft.yaml"
     if scaler_fast.exists():
@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import time
+import argparse
+import asyncio
+import statistics
+
+import httpx
+
+# Compares per-call overhead of the gateway's three agent-facing transports for
+# the same tool call: JSON over HTTP (/tools/execute), MCP over SSE, and gRPC.
+# The tool's own work is identical on every path, so differences between the
+# rows are transport + serialization overhead.
+
+sys.path.append(".")
+
+DEFAULT_GATEWAY_URL = os.getenv("GATEWAY_URL", "http://localhost:8080")
+DEFAULT_GRPC_TARGET = os.getenv("GATEWAY_GRPC_TARGET", "localhost:50051")
+DEFAULT_TOOL = "evaluate_policy"
+DEFAULT_PARAMS = {"action": "execute_trade", "symbol": "AAPL", "amount": 100.0, "trader_role": "junior", "dry_run": True}
+
+async def bench_http(base_url: str, tool: str, params: dict):
+    client = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+
+    async def call():
+        response = await client.post("/tools/execute", json={"tool_name": tool, "params": params})
+        response.raise_for_status()
+
+    return call, client.aclose
+
+async def bench_mcp(base_url: str, tool: str, params: dict):
+    from src.governed_financial_advisor.infrastructure.mcp_client import GatewayMCPClient
+    client = GatewayMCPClient(f"{base_url}/mcp/sse")
+    await client.connect()
+
+    async def call():
+        await client.call_tool(tool, params)
+
+    return call, client.close
+
+async def bench_grpc(target: str, tool: str, params: dict):
+    from src.governed_financial_advisor.infrastructure.grpc_gateway_client import GatewayGrpcClient
+    client = GatewayGrpcClient(target)
+    await client.connect()
+
+    async def call():
+        await client.execute_tool(tool, params)
+
+    return call, client.close
+
+async def measure(name: str, factory, iterations: int, warmup: int):
+    print(f"\n🚀 {name}: {warmup} warmup + {iterations} measured calls...")
+    try:
+        call, close = await factory()
+    except Exception as e:
+        print(f"❌ Could not connect: {e}")
+        return None
+
+    try:
+        for _ in range(warmup):
+            await call()
+
+        latencies = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        await close()
+
+    p95 = statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies)
+    return {
+        "transport": name,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": p95,
+        "stdev_ms": statistics.stdev(latencies) if len(latencies) > 1 else 0.0
+    }
+
+async def run(args):
+    params = json.loads(args.params) if args.params else DEFAULT_PARAMS
+    factories = {
+        "http": ("HTTP /tools/execute", lambda: bench_http(args.url, args.tool, params)),
+        "mcp": ("MCP over SSE", lambda: bench_mcp(args.url, args.tool, params)),
+        "grpc": ("gRPC ExecuteTool", lambda: bench_grpc(args.grpc_target, args.tool, params)),
+    }
+
+    rows = []
+    for key in args.transports:
+        name, factory = factories[key]
+        row = await measure(name, factory, args.iterations, args.warmup)
+        if row:
+            rows.append(row)
+
+    if not rows:
+        print("❌ No successful results.")
+        return
+
+    fastest = min(r["p50_ms"] for r in rows)
+    print(f"\n🏆 Transport Overhead ({args.tool}, sequential calls, persistent connections)")
+    print("-" * 76)
+    print(f"{'Transport':<22} | {'Mean ms':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'Stdev':>7} | {'vs fastest':>10}")
+    print("-" * 76)
+    for row in rows:
+        print(f"{row['transport']:<22} | {row['mean_ms']:>8.2f} | {row['p50_ms']:>8.2f} | {row['p95_ms']:>8.2f} | "
+              f"{row['stdev_ms']:>7.2f} | {row['p50_ms'] - fastest:>+9.2f}ms")
+    print("-" * 76)
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway transport overhead benchmark (HTTP vs MCP/SSE vs gRPC)")
+    parser.add_argument("--url", default=DEFAULT_GATEWAY_URL, help="Gateway HTTP base URL")
+    parser.add_argument("--grpc-target", default=DEFAULT_GRPC_TARGET, help="Gateway gRPC host:port")
+    parser.add_argument("--transports", nargs="+", choices=["http", "mcp", "grpc"], default=["http", "mcp", "grpc"])
+    parser.add_argument("--iterations", type=int, default=500, help="Measured calls per transport")
+    parser.add_argument("--warmup", type=int, default=50, help="Warmup calls per transport")
+    parser.add_argument("--tool", default=DEFAULT_TOOL, help="Tool to call")
+    parser.add_argument("--params", default=None, help="JSON params for the tool")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import asyncio
+import statistics
+import subprocess
+
+import httpx
+
+# Measures gateway throughput as the gunicorn worker count grows (one node).
+# For each worker count the gateway is started via server/gunicorn_conf.py,
+# driven at a fixed concurrency for a fixed duration, and then stopped.
+
+DEFAULT_TOOL = "check_safety_constraints"
+DEFAULT_PARAMS = {
+    "target_tool": "execute_trade",
+    "target_params": {"symbol": "AAPL", "amount": 100.0, "currency": "USD", "trader_role": "junior"},
+    "risk_profile": "Medium"
+}
+
+def start_gateway(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "GATEWAY_WORKERS": str(workers), "PORT": str(port)}
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "src/gateway/server/gunicorn_conf.py",
+         "src.gateway.server.hybrid_server:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+def stop_gateway(proc: subprocess.Popen):
+    os.killpg(proc.pid, signal.SIGTERM)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+
+async def wait_healthy(base_url: str, timeout: float = 300.0):
+    deadline = time.time() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.time() < deadline:
+            try:
+                if (await client.get(f"{base_url}/health", timeout=2.0)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(1.0)
+    raise TimeoutError(f"Gateway at {base_url} did not become healthy")
+
+async def drive_load(base_url: str, payload: dict, concurrency: int, duration: float):
+    latencies = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        async def user():
+            nonlocal errors
+            while time.perf_counter() < stop_at:
+                start = time.perf_counter()
+                try:
+                    response = await client.post("/tools/execute", json=payload)
+                    if response.status_code != 200 or response.json().get("status") != "SUCCESS":
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    return latencies, errors
+
+def summarize(workers: int, latencies: list, errors: int, duration: float) -> dict:
+    p95 = statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies, default=0.0)
+    return {
+        "workers": workers,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": p95 * 1000
+    }
+
+async def run(args):
+    payload = {"tool_name": args.tool, "params": json.loads(args.params) if args.params else DEFAULT_PARAMS}
+    base_url = f"http://127.0.0.1:{args.port}"
+    rows = []
+
+    for workers in args.workers:
+        print(f"\n🚀 {workers} worker(s): starting gateway...")
+        proc = start_gateway(workers, args.port)
+        try:
+            await wait_healthy(base_url)
+            print(f"🔥 Warming up ({args.warmup:.0f}s)...")
+            await drive_load(base_url, payload, args.concurrency, args.warmup)
+            print(f"⏱️  Measuring ({args.duration:.0f}s @ concurrency {args.concurrency})...")
+            latencies, errors = await drive_load(base_url, payload, args.concurrency, args.duration)
+            rows.append(summarize(workers, latencies, errors, args.duration))
+            print(f"   {rows[-1]['rps']:.1f} req/s | p50 {rows[-1]['p50_ms']:.1f} ms | p95 {rows[-1]['p95_ms']:.1f} ms | {errors} errors")
+        finally:
+            stop_gateway(proc)
+
+    baseline = rows[0]["rps"] / rows[0]["workers"] if rows and rows[0]["rps"] else 0.0
+
+    print("\n🏆 Worker Scaling Results")
+    print("-" * 78)
+    print(f"{'Workers':>7} | {'Req/s':>9} | {'Speedup':>7} | {'Efficiency':>10} | {'p50 ms':>8} | {'p95 ms':>8} | {'Errors':>6}")
+    print("-" * 78)
+    for row in rows:
+        speedup = row["rps"] / (baseline * rows[0]["workers"]) if baseline else 0.0
+        efficiency = speedup / (row["workers"] / rows[0]["workers"]) if baseline else 0.0
+        print(f"{row['workers']:>7} | {row['rps']:>9.1f} | {speedup:>6.2f}x | {efficiency:>9.0%} | "
+              f"{row['p50_ms']:>8.1f} | {row['p95_ms']:>8.1f} | {row['errors']:>6}")
+    print("-" * 78)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"📄 Raw results written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway multi-worker throughput scaling benchmark")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to test")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent client connections")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds per worker count")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Warmup seconds per worker count")
+    parser.add_argument("--port", type=int, default=18080, help="Port to run the gateway on")
+    parser.add_argument("--tool", default=DEFAULT_TOOL, help="Tool to call via /tools/execute")
+    parser.add_argument("--params", default=None, help="JSON params for the tool (default: dry-run trade check)")
+    parser.add_argument("--output", default=None, help="Write raw results as JSON")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
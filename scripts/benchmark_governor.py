@@ -0,0 +1,117 @@
+import sys
+import json
+import time
+import argparse
+import asyncio
+import statistics
+
+sys.path.insert(0, ".")
+
+from src.gateway.governance.symbolic_governor import GovernanceError, SymbolicGovernor
+
+# Microbenchmark of SymbolicGovernor.govern: the concurrent stage graph against
+# the sequential baseline (the same stages awaited one by one, in precedence
+# order). Stage latencies are simulated so the numbers isolate orchestration:
+# CBF is a blocking Redis read, OPA an HTTP call, consensus two LLM calls.
+
+PARAMS = {"confidence": 0.99, "amount": 100.0, "symbol": "AAPL", "currency": "USD", "trader_role": "junior"}
+
+class SimulatedSTPA:
+    def validate(self, tool_name, params):
+        return []
+
+class SimulatedCBF:
+    def __init__(self, latency_ms: float):
+        self.latency_s = latency_ms / 1000
+
+    def verify_action(self, action_name, payload):
+        time.sleep(self.latency_s)
+        return "SAFE"
+
+class SimulatedOPA:
+    def __init__(self, latency_ms: float, decision: str):
+        self.latency_s = latency_ms / 1000
+        self.decision = decision
+
+    async def evaluate_policy(self, input_data, current_latency_ms=None, bypass_cache=False):
+        await asyncio.sleep(self.latency_s)
+        return self.decision
+
+class SimulatedConsensus:
+    def __init__(self, latency_ms: float):
+        self.latency_s = latency_ms / 1000
+
+    async def check_consensus(self, action, amount, symbol):
+        # Two critic calls, one after the other (as in ConsensusEngine).
+        await asyncio.sleep(self.latency_s / 2)
+        await asyncio.sleep(self.latency_s / 2)
+        return {"status": "APPROVE", "reason": "simulated"}
+
+async def sequential_govern(governor: SymbolicGovernor, tool_name: str, params: dict):
+    for stage in governor.stages(tool_name, params):
+        await stage.run()
+
+async def measure(govern, iterations: int) -> list:
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            await govern("execute_trade", PARAMS)
+        except GovernanceError:
+            pass
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def summarize(name: str, latencies: list) -> dict:
+    cuts = statistics.quantiles(latencies, n=100)
+    return {"variant": name, "p50_ms": statistics.median(latencies), "p99_ms": cuts[98]}
+
+async def run(args):
+    rows = []
+    for decision in args.decisions:
+        governor = SymbolicGovernor(
+            SimulatedOPA(args.opa_ms, decision),
+            SimulatedCBF(args.cbf_ms),
+            SimulatedConsensus(args.consensus_ms),
+            SimulatedSTPA()
+        )
+        variants = [
+            ("sequential", lambda t, p: sequential_govern(governor, t, p)),
+            ("concurrent", governor.govern),
+        ]
+        for name, govern in variants:
+            await measure(govern, args.warmup)
+            row = summarize(name, await measure(govern, args.iterations))
+            row["opa_decision"] = decision
+            rows.append(row)
+
+    print("\n🏆 SymbolicGovernor.govern latency")
+    print("-" * 52)
+    print(f"{'OPA':>6} | {'Variant':>10} | {'p50 ms':>8} | {'p99 ms':>8} | {'Speedup':>7}")
+    print("-" * 52)
+    for baseline, row in zip(rows[::2], rows[1::2]):
+        for r in (baseline, row):
+            speedup = baseline["p50_ms"] / r["p50_ms"] if r["p50_ms"] else 0.0
+            print(f"{r['opa_decision']:>6} | {r['variant']:>10} | {r['p50_ms']:>8.1f} | {r['p99_ms']:>8.1f} | {speedup:>6.2f}x")
+    print("-" * 52)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"📄 Raw results written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="SymbolicGovernor stage-graph microbenchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="Measured govern() calls per variant")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured calls per variant")
+    parser.add_argument("--cbf-ms", type=float, default=2.0, help="Simulated CBF (Redis) latency")
+    parser.add_argument("--opa-ms", type=float, default=8.0, help="Simulated OPA latency")
+    parser.add_argument("--consensus-ms", type=float, default=40.0, help="Simulated consensus (2 LLM calls) latency")
+    parser.add_argument("--decisions", nargs="+", default=["ALLOW", "DENY"], help="OPA decisions to benchmark")
+    parser.add_argument("--output", default=None, help="Write raw results as JSON")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
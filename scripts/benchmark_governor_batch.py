@@ -0,0 +1,130 @@
+import sys
+import json
+import time
+import random
+import argparse
+import asyncio
+import logging
+
+sys.path.insert(0, ".")
+
+from src.gateway.governance import safety
+from src.gateway.governance.safety import ControlBarrierFunction
+from src.gateway.governance.stpa_validator import STPAValidator
+from src.gateway.governance.symbolic_governor import GovernanceError, SymbolicGovernor
+
+# Portfolio-scale governance: govern() once per order (the pre-batch path, one
+# Redis GET and one OPA round-trip per order) against govern_batch(). STPA and
+# the CBF are the real implementations; Redis and OPA latencies are simulated
+# per round-trip, and consensus approves instantly so it does not dominate.
+
+class SimulatedRedis:
+    def __init__(self, latency_ms: float):
+        self.latency_s = latency_ms / 1000
+        self.store = {}
+
+    def get(self, key):
+        time.sleep(self.latency_s)
+        return self.store.get(key)
+
+    def get_float(self, key, default=0.0):
+        value = self.get(key)
+        return float(value) if value is not None else default
+
+    def set(self, key, value, ttl=None):
+        time.sleep(self.latency_s)
+        self.store[key] = value
+
+class SimulatedOPA:
+    def __init__(self, latency_ms: float):
+        self.latency_s = latency_ms / 1000
+        self.policy_revision = None
+
+    async def evaluate_policy(self, input_data, current_latency_ms=None, bypass_cache=False):
+        await asyncio.sleep(self.latency_s)
+        return "ALLOW"
+
+    async def evaluate_policy_batch(self, inputs, current_latency_ms=None, bypass_cache=False):
+        await asyncio.sleep(self.latency_s)
+        return ["ALLOW"] * len(inputs)
+
+class SimulatedConsensus:
+    async def check_consensus(self, action, amount, symbol):
+        return {"status": "SKIPPED", "reason": "Below threshold"}
+
+def make_orders(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": rng.choice(["AAPL", "MSFT", "GOOG", "AMZN"]),
+            "amount": round(rng.uniform(10, 500), 2),
+            "currency": "USD",
+            "confidence": rng.choice([0.99, 0.97, 0.5]),
+            "approval_token": "signed",
+            "latency_ms": rng.uniform(5, 250),
+        }
+        for _ in range(n)
+    ]
+
+async def per_order(governor: SymbolicGovernor, orders: list):
+    results = []
+    for order in orders:
+        try:
+            await governor.govern("execute_trade", order)
+            results.append(None)
+        except GovernanceError as e:
+            results.append(str(e))
+    return results
+
+async def run(args):
+    # Keep per-order logging out of the measurement.
+    logging.disable(logging.WARNING)
+    redis = SimulatedRedis(args.redis_ms)
+    safety.redis_client = redis
+    governor = SymbolicGovernor(
+        SimulatedOPA(args.opa_ms), ControlBarrierFunction(), SimulatedConsensus(), STPAValidator()
+    )
+
+    rows = []
+    for size in args.sizes:
+        orders = make_orders(size)
+        for name, govern in (("per-order", lambda: per_order(governor, orders)),
+                             ("batch", lambda: governor.govern_batch(orders))):
+            redis.store[governor.safety_filter.redis_key] = "1000000000.0"
+            start = time.perf_counter()
+            results = await govern()
+            elapsed = time.perf_counter() - start
+            rows.append({
+                "orders": size, "variant": name, "seconds": elapsed,
+                "orders_per_s": size / elapsed, "approved": sum(r is None for r in results)
+            })
+            print(f"   {size:>6} orders | {name:>9} | {elapsed * 1000:>10.1f} ms | {size / elapsed:>10.0f} orders/s")
+
+    print("\n🏆 Bulk governance")
+    print("-" * 70)
+    print(f"{'Orders':>6} | {'Variant':>9} | {'Total ms':>10} | {'Orders/s':>10} | {'Approved':>8} | {'Speedup':>7}")
+    print("-" * 70)
+    for baseline, row in zip(rows[::2], rows[1::2]):
+        for r in (baseline, row):
+            speedup = baseline["seconds"] / r["seconds"]
+            print(f"{r['orders']:>6} | {r['variant']:>9} | {r['seconds'] * 1000:>10.1f} | "
+                  f"{r['orders_per_s']:>10.0f} | {r['approved']:>8} | {speedup:>6.1f}x")
+    print("-" * 70)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"📄 Raw results written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="SymbolicGovernor.govern_batch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="Order set sizes")
+    parser.add_argument("--redis-ms", type=float, default=0.2, help="Simulated Redis round-trip")
+    parser.add_argument("--opa-ms", type=float, default=1.0, help="Simulated OPA round-trip")
+    parser.add_argument("--output", default=None, help="Write raw results as JSON")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+import argparse
+import asyncio
+import statistics
+
+import httpx
+
+# Compares the gateway's two MCP transports with many agent processes connected:
+#   - SSE:             one long-lived stream (and server task) per client, pinned to a pod
+#   - Streamable HTTP: stateless POST per call, no per-client server state
+# Reports tool-call latency under concurrency and gateway resident memory per
+# connected client (RSS read from /proc/<pid> or the gateway's /metrics).
+
+sys.path.append(".")
+
+DEFAULT_GATEWAY_URL = os.getenv("GATEWAY_URL", "http://localhost:8080")
+DEFAULT_TOOL = "check_market_status"
+DEFAULT_PARAMS = {"symbol": "AAPL"}
+
+async def gateway_rss_bytes(base_url: str, pid: int | None) -> float | None:
+    if pid:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return float(line.split()[1]) * 1024
+    # Single-process gateway: prometheus_client's default process collector.
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+            response = await client.get("/metrics")
+        for line in response.text.splitlines():
+            if line.startswith("process_resident_memory_bytes"):
+                return float(line.split()[-1])
+    except Exception:
+        pass
+    return None
+
+async def run_transport(name: str, transport: str, url: str, args):
+    from src.governed_financial_advisor.infrastructure.mcp_client import GatewayMCPClient
+
+    print(f"\n🚀 {name}: connecting {args.clients} clients...")
+    baseline = await gateway_rss_bytes(args.url, args.gateway_pid)
+
+    clients = [GatewayMCPClient(url, transport=transport) for _ in range(args.clients)]
+    try:
+        await asyncio.gather(*(c.connect() for c in clients))
+    except Exception as e:
+        print(f"❌ Could not connect: {e}")
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+        return None
+
+    try:
+        # Let the server settle (SSE streams, session tasks) before sampling memory.
+        await asyncio.sleep(1.0)
+        connected = await gateway_rss_bytes(args.url, args.gateway_pid)
+
+        for client in clients[:args.warmup]:
+            await client.call_tool(args.tool, DEFAULT_PARAMS)
+
+        latencies = []
+
+        async def worker(client):
+            for _ in range(args.calls):
+                start = time.perf_counter()
+                await client.call_tool(args.tool, DEFAULT_PARAMS)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker(c) for c in clients))
+        wall = time.perf_counter() - wall_start
+    finally:
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    per_client_kb = None
+    if baseline is not None and connected is not None:
+        per_client_kb = (connected - baseline) / args.clients / 1024
+
+    return {
+        "transport": name,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies),
+        "calls_per_s": len(latencies) / wall,
+        "per_client_kb": per_client_kb,
+    }
+
+async def run(args):
+    transports = {
+        "sse": ("MCP over SSE", "sse", f"{args.url}/mcp/sse"),
+        "http": ("MCP Streamable HTTP", "streamable_http", f"{args.url}/mcp/http/"),
+    }
+    rows = []
+    for key in args.transports:
+        name, transport, url = transports[key]
+        row = await run_transport(name, transport, url, args)
+        if row:
+            rows.append(row)
+
+    if not rows:
+        print("❌ No successful results.")
+        return
+
+    print(f"\n🏆 MCP Transports ({args.clients} clients x {args.calls} calls of {args.tool})")
+    print("-" * 78)
+    print(f"{'Transport':<22} | {'p50 ms':>8} | {'p95 ms':>8} | {'Calls/s':>9} | {'Gateway KB/client':>18}")
+    print("-" * 78)
+    for row in rows:
+        mem = f"{row['per_client_kb']:>18.1f}" if row["per_client_kb"] is not None else f"{'n/a':>18}"
+        print(f"{row['transport']:<22} | {row['p50_ms']:>8.2f} | {row['p95_ms']:>8.2f} | {row['calls_per_s']:>9.1f} | {mem}")
+    print("-" * 78)
+    if any(r["per_client_kb"] is None for r in rows):
+        print("ℹ️  Pass --gateway-pid (or run a single-worker gateway exposing /metrics) to measure memory.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway MCP transport benchmark (SSE vs stateless streamable HTTP)")
+    parser.add_argument("--url", default=DEFAULT_GATEWAY_URL, help="Gateway HTTP base URL")
+    parser.add_argument("--transports", nargs="+", choices=["sse", "http"], default=["sse", "http"])
+    parser.add_argument("--clients", type=int, default=50, help="Concurrently connected MCP clients")
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per client")
+    parser.add_argument("--warmup", type=int, default=5, help="Clients that make one warmup call")
+    parser.add_argument("--tool", default=DEFAULT_TOOL, help="Read-only tool to call")
+    parser.add_argument("--gateway-pid", type=int, default=None, help="Gateway process id (local runs) for RSS sampling")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import sys
+import json
+import time
+import argparse
+import asyncio
+import logging
+import os
+
+sys.path.insert(0, ".")
+
+from src.governed_financial_advisor.infrastructure.redis_client import SAFETY_VIOLATION_KEY, RedisClient
+
+# Event-loop blocking of the gateway's Redis reads. Each "check" is what a
+# trade needs before it runs: the safety interrupt flag and the shared cash
+# balance. `sync` calls the blocking facade from the event loop (two GETs, as
+# execute_trade and the CBF did); `async` awaits one pipelined MGET on the
+# shared asyncio pool. A 1 ms heartbeat task stands in for the other requests
+# on the worker: its lag is how long they would have waited for the loop.
+# Needs a reachable Redis (REDIS_URL / REDIS_HOST).
+
+CASH_KEY = "safety:current_cash"
+
+async def heartbeat(lags: list, stop: asyncio.Event, interval_s: float = 0.001):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval_s)
+        lags.append(max(0.0, time.perf_counter() - start - interval_s))
+
+async def sync_check(client: RedisClient):
+    client.get(SAFETY_VIOLATION_KEY)
+    client.get_float(CASH_KEY)
+
+async def async_check(client: RedisClient):
+    await client.amget([SAFETY_VIOLATION_KEY, CASH_KEY])
+
+async def measure(client: RedisClient, check, checks: int, concurrency: int) -> dict:
+    lags, stop = [], asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await check(client)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(checks)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    lags.sort()
+    return {
+        "seconds": elapsed,
+        "checks_per_s": checks / elapsed,
+        "heartbeats": len(lags),
+        "p50_lag_ms": lags[len(lags) // 2] * 1000 if lags else 0.0,
+        "max_lag_ms": lags[-1] * 1000 if lags else 0.0,
+        "p99_lag_ms": lags[int(len(lags) * 0.99)] * 1000 if lags else 0.0,
+    }
+
+async def run(args):
+    logging.disable(logging.WARNING)
+    client = RedisClient()
+    if not client.use_redis:
+        print("❌ No Redis reachable (set REDIS_URL / REDIS_HOST): nothing to measure.")
+        return
+    client.set(CASH_KEY, "100000.0")
+    # Open the pool's connections outside the measurement.
+    await asyncio.gather(*(async_check(client) for _ in range(args.concurrency)))
+
+    rows = []
+    for name, check in (("sync", sync_check), ("async", async_check)):
+        row = {"variant": name, **await measure(client, check, args.checks, args.concurrency)}
+        rows.append(row)
+
+    print(f"\n🏆 {args.checks} interrupt checks, concurrency {args.concurrency}")
+    print("-" * 88)
+    print(f"{'Variant':>7} | {'Total ms':>9} | {'Checks/s':>9} | {'Heartbeats':>10} | "
+          f"{'p50 lag ms':>10} | {'p99 lag ms':>10} | {'Max lag ms':>10}")
+    print("-" * 88)
+    for r in rows:
+        print(f"{r['variant']:>7} | {r['seconds'] * 1000:>9.1f} | {r['checks_per_s']:>9.0f} | {r['heartbeats']:>10} | "
+              f"{r['p50_lag_ms']:>10.2f} | {r['p99_lag_ms']:>10.2f} | {r['max_lag_ms']:>10.2f}")
+    print("-" * 88)
+    await client.aclose()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"📄 Raw results written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="RedisClient event-loop blocking benchmark")
+    parser.add_argument("--checks", type=int, default=5000, help="Interrupt checks per variant")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("REDIS_MAX_CONNECTIONS", 50)),
+                        help="Checks in flight at once")
+    parser.add_argument("--output", default=None, help="Write raw results as JSON")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
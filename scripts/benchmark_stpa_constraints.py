@@ -0,0 +1,117 @@
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+import statistics
+
+sys.path.insert(0, ".")
+
+from src.gateway.governance.constraint_compiler import compile_constraint, compile_facts
+from src.gateway.governance.ontology import Constraint, TradingKnowledgeGraph
+from src.gateway.governance.stpa_validator import STPAValidator
+
+# STPAValidator.validate on synthetic ontologies with hundreds of constraints:
+# the compiled engine (action index + predicates compiled at load time) against
+# the per-call shape it replaces (a linear scan of every constraint's scope,
+# with the logic string parsed on each call). validate_batch is also timed
+# over a batch of orders for one action.
+
+ACTIONS = [f"action_{i}" for i in range(20)]
+FIELDS = ["amount", "price", "latency_ms", "quantity", "exposure"]
+TEMPLATES = [
+    "{a} <= {n}",
+    "{a} * {b} < {n}",
+    "{a} is not None and {b} > {m}",
+    "0 < {a} / {b} <= {n}",
+    "not ({a} > {n}) or {b} is None",
+]
+
+def make_ontology(n_constraints: int, seed: int = 11) -> TradingKnowledgeGraph:
+    rng = random.Random(seed)
+    ontology = TradingKnowledgeGraph()
+    for i in range(n_constraints):
+        a, b = rng.sample(FIELDS, 2)
+        logic = rng.choice(TEMPLATES).format(a=a, b=b, n=rng.randint(100, 10_000), m=rng.randint(0, 50))
+        ontology.add_constraint(Constraint(
+            id=f"SYN-{i}", description=f"Synthetic constraint {i}", logic=logic,
+            scope=rng.sample(ACTIONS, rng.randint(1, 3))
+        ))
+    return ontology
+
+def make_params(rng: random.Random) -> dict:
+    return {field: round(rng.uniform(1, 500), 2) for field in FIELDS}
+
+def scan_and_interpret(ontology: TradingKnowledgeGraph, action_name: str, params: dict) -> list:
+    facts = compile_facts(ontology.facts)
+    violations = []
+    for c in [c for c in ontology.constraints.values() if action_name in c.scope]:
+        try:
+            passed = compile_constraint(c.logic, facts)(params)
+        except Exception:
+            passed = False
+        if not passed:
+            violations.append(f"STPA Violation {c.id}: {c.description}")
+    return violations
+
+def measure(validate, calls: list) -> list:
+    latencies = []
+    for action_name, params in calls:
+        start = time.perf_counter()
+        validate(action_name, params)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+def run(args):
+    # Keep the per-call approval/violation logging out of the measurement.
+    logging.disable(logging.WARNING)
+    rng = random.Random(5)
+    rows = []
+    for size in args.sizes:
+        ontology = make_ontology(size)
+        start = time.perf_counter()
+        validator = STPAValidator(ontology)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        calls = [(rng.choice(ACTIONS), make_params(rng)) for _ in range(args.calls)]
+        for variant, validate in (("scan+parse", lambda a, p: scan_and_interpret(ontology, a, p)),
+                                  ("compiled", validator.validate)):
+            latencies = measure(validate, calls)
+            rows.append({"constraints": size, "variant": variant, "p50_us": statistics.median(latencies),
+                         "compile_ms": compile_ms})
+
+        batch = [make_params(rng) for _ in range(args.batch)]
+        start = time.perf_counter()
+        validator.validate_batch(ACTIONS[0], batch)
+        rows.append({"constraints": size, "variant": f"batch x{args.batch}",
+                     "p50_us": (time.perf_counter() - start) * 1e6 / args.batch, "compile_ms": compile_ms})
+
+    print("\n🏆 STPAValidator latency per action")
+    print("-" * 62)
+    print(f"{'Constraints':>11} | {'Variant':>12} | {'p50 µs':>10} | {'Compile ms':>10} | {'Speedup':>7}")
+    print("-" * 62)
+    for i in range(0, len(rows), 3):
+        baseline = rows[i]
+        for r in rows[i:i + 3]:
+            print(f"{r['constraints']:>11} | {r['variant']:>12} | {r['p50_us']:>10.1f} | "
+                  f"{r['compile_ms']:>10.1f} | {baseline['p50_us'] / r['p50_us']:>6.1f}x")
+    print("-" * 62)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"📄 Raw results written to {args.output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="STPA constraint engine benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000], help="Constraints per ontology")
+    parser.add_argument("--calls", type=int, default=500, help="validate() calls per variant")
+    parser.add_argument("--batch", type=int, default=1000, help="Orders in the validate_batch run")
+    parser.add_argument("--output", default=None, help="Write raw results as JSON")
+
+    args = parser.parse_args()
+    run(args)
+
+if __name__ == "__main__":
+    main()
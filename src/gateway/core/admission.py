@@ -0,0 +1,240 @@
+"""
+Gateway Core: Admission Control
+
+Sits in front of every vLLM call made by the gateway process and gives each
+upstream route (reasoning / fast / unified gateway) its own concurrency limit
+and priority queue. Queued requests are admitted strictly by priority class:
+
+    governance (NeMo self-checks)  >  verifier (consensus critics)  >  chat  >  planner
+
+so a burst of planning traffic can never starve the latency-critical governance
+checks. A request that cannot be admitted within its queue-wait budget is shed
+with `AdmissionRejected`, which the HTTP layer maps to 429 + Retry-After.
+
+A chat request binds its generation slot to its context (`bind_request`). The
+NeMo self-checks it triggers on the same route then run on that slot instead of
+queueing for a second one: otherwise, at saturation, every admitted request
+would hold the slot its own governance call is waiting for.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import Config
+from src.gateway.core.deadline import timeout_for
+from src.gateway.core.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_QUEUE_WAIT,
+    ADMISSION_REJECTED,
+)
+
+logger = logging.getLogger("Gateway.Admission")
+
+# Lower value = admitted first.
+PRIORITY_CLASSES = {"governance": 0, "verifier": 1, "chat": 2, "planner": 3}
+
+# Request modes (GatewayClient / ChatCompletionRequest.mode) -> priority class.
+MODE_CLASSES = {
+    "governance": "governance",
+    "verifier": "verifier",
+    "chat": "chat",
+    "planner": "planner",
+    "reasoning": "planner",
+    "analysis": "planner",
+}
+
+
+def priority_class(mode: Optional[str]) -> str:
+    return MODE_CLASSES.get((mode or "chat").lower(), "chat")
+
+
+def route_for_model(model: str) -> str:
+    """Upstream route for a model name; mirrors VLLMUpstreamPool / VLLMLLM routing."""
+    if Config.VLLM_GATEWAY_URL:
+        return "gateway"
+    if "deepseek" in model.lower() or "reasoning" in model.lower():
+        return "reasoning"
+    return "fast"
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request's queue wait exceeds the budget (load shedding)."""
+
+    def __init__(self, route: str, priority: str, retry_after_s: int):
+        super().__init__(f"Admission rejected: '{route}' lane saturated for {priority} traffic")
+        self.route = route
+        self.priority = priority
+        self.retry_after_s = retry_after_s
+
+
+class _Lane:
+    def __init__(self, route: str, limit: int):
+        self.route = route
+        self.limit = limit
+        self.in_flight = 0
+        # Heap of (priority, seq, future); futures that timed out are skipped on pop.
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.depth: Dict[str, int] = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self.active: Dict[str, int] = dict.fromkeys(PRIORITY_CLASSES, 0)
+        # EWMA of how long an admitted request holds its slot (drives Retry-After).
+        self.avg_hold_s = 1.0
+
+    @property
+    def queued(self) -> int:
+        return sum(self.depth.values())
+
+
+class Admission:
+    """
+    A granted slot. `release()` is idempotent, so every owner may call it.
+    A nested admission runs on its request's slot and frees nothing on release.
+    """
+
+    def __init__(self, controller: "AdmissionController", lane: _Lane, priority: str, nested: bool = False):
+        self.controller = controller
+        self.lane = lane
+        self.priority = priority
+        self.nested = nested
+        self.admitted_at = time.perf_counter()
+        self.released = False
+
+    def release(self):
+        if self.released:
+            return
+        self.released = True
+        if not self.nested:
+            self.controller._release(self.lane, self.priority, time.perf_counter() - self.admitted_at)
+
+
+# The slot held by the request being served in this context (see bind_request).
+_request_admission: ContextVar[Optional[Admission]] = ContextVar("gateway_request_admission", default=None)
+
+
+def bind_request(admission: Admission):
+    """
+    Marks `admission` as the current request's slot. Governance calls made
+    within the request on the same route are then admitted on it; once the
+    slot is released they queue normally again.
+    """
+    _request_admission.set(admission)
+
+
+class AdmissionController:
+    """
+    Per-route concurrency limits with strict-priority queues and a queue-wait budget.
+    Single event loop per process; under gunicorn each worker admits independently.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, queue_budget_s: Optional[float] = None, enabled: Optional[bool] = None):
+        self.limits = limits or {
+            "reasoning": Config.ADMISSION_REASONING_CONCURRENCY,
+            "fast": Config.ADMISSION_FAST_CONCURRENCY,
+            "gateway": Config.ADMISSION_GATEWAY_CONCURRENCY,
+        }
+        self.queue_budget_s = Config.ADMISSION_QUEUE_BUDGET_MS / 1000 if queue_budget_s is None else queue_budget_s
+        self.enabled = Config.ADMISSION_CONTROL_ENABLED if enabled is None else enabled
+        self.lanes: Dict[str, _Lane] = {}
+        self._seq = itertools.count()
+
+    def _lane(self, route: str) -> _Lane:
+        lane = self.lanes.get(route)
+        if lane is None:
+            limit = self.limits.get(route) or max(self.limits.values())
+            lane = self.lanes[route] = _Lane(route, limit)
+        return lane
+
+    def retry_after(self, route: str) -> int:
+        """Seconds until the current backlog on `route` is expected to drain."""
+        lane = self._lane(route)
+        return max(1, math.ceil(lane.avg_hold_s * (lane.queued + 1) / lane.limit))
+
+    def _admitted(self, lane: _Lane, priority: str, waited_s: float) -> Admission:
+        ADMISSION_QUEUE_WAIT.labels(lane.route, priority).observe(waited_s)
+        lane.active[priority] += 1
+        ADMISSION_IN_FLIGHT.labels(lane.route, priority).set(lane.active[priority])
+        return Admission(self, lane, priority)
+
+    async def acquire(self, route: str, mode: Optional[str] = None) -> Admission:
+        """
+        Waits for a slot on `route` in priority order.
+        Raises AdmissionRejected if none frees up within the queue budget.
+        """
+        lane = self._lane(route)
+        priority = priority_class(mode)
+
+        outer = _request_admission.get()
+        if priority == "governance" and outer is not None and outer.lane is lane and not outer.released:
+            # A self-check of a request already holding a slot here: waiting
+            # for another slot would be hold-and-wait.
+            return Admission(self, lane, priority, nested=True)
+
+        # Fast path: a free slot and nobody waiting ahead of us. When disabled,
+        # requests are never queued but are still counted (autoscaling signal).
+        if not self.enabled or (lane.in_flight < lane.limit and not lane.queued):
+            lane.in_flight += 1
+            return self._admitted(lane, priority, 0.0)
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(lane.waiters, (PRIORITY_CLASSES[priority], next(self._seq), waiter))
+        lane.depth[priority] += 1
+        ADMISSION_QUEUE_DEPTH.labels(lane.route, priority).set(lane.depth[priority])
+        wait_start = time.perf_counter()
+        # Never queue past the request's own deadline.
+        budget_s = timeout_for(self.queue_budget_s)
+        try:
+            # The slot is handed over by `_release` (in_flight already accounts for it).
+            await asyncio.wait_for(waiter, timeout=budget_s)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the budget ran out.
+                return self._admitted(lane, priority, time.perf_counter() - wait_start)
+            ADMISSION_REJECTED.labels(lane.route, priority).inc()
+            retry_after = self.retry_after(route)
+            logger.warning(f"🚦 Shedding {priority} request on '{route}' after {budget_s:.2f}s (retry in {retry_after}s)")
+            raise AdmissionRejected(route, priority, retry_after) from None
+        except asyncio.CancelledError:
+            # Cancelled after being granted a slot: pass it on rather than leak it.
+            if waiter.done() and not waiter.cancelled():
+                self._hand_off(lane)
+            raise
+        finally:
+            lane.depth[priority] -= 1
+            ADMISSION_QUEUE_DEPTH.labels(lane.route, priority).set(lane.depth[priority])
+
+        return self._admitted(lane, priority, time.perf_counter() - wait_start)
+
+    def _release(self, lane: _Lane, priority: str, held_s: float):
+        lane.active[priority] -= 1
+        ADMISSION_IN_FLIGHT.labels(lane.route, priority).set(lane.active[priority])
+        if held_s > 0:
+            lane.avg_hold_s = 0.8 * lane.avg_hold_s + 0.2 * held_s
+        self._hand_off(lane)
+
+    def _hand_off(self, lane: _Lane):
+        """Passes a freed slot to the highest-priority live waiter, or frees it."""
+        while lane.waiters:
+            _, _, waiter = heapq.heappop(lane.waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        lane.in_flight -= 1
+
+    @asynccontextmanager
+    async def admit(self, route: str, mode: Optional[str] = None):
+        admission = await self.acquire(route, mode)
+        try:
+            yield admission
+        finally:
+            admission.release()
+
+
+# Global Instance
+admission_controller = AdmissionController()
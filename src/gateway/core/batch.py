@@ -0,0 +1,114 @@
+"""
+Gateway Core: Batch Tool Execution
+
+Executes a list of `{tool_name, params}` calls in one request. Read-only tools
+run concurrently (bounded by a semaphore) and identical read-only calls are
+executed once, except for `distinct_tools` whose every call has its own result
+(a dry-run check issues a single-use verdict token per call). Any tool not known to be read-only is a barrier: everything
+before it completes first, it runs alone, and only then does the batch continue.
+That preserves the relative order of side-effecting calls such as trades.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from config.settings import Config
+
+logger = logging.getLogger("Gateway.Batch")
+
+ToolDispatcher = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+def call_key(tool_name: str, params: Dict[str, Any]) -> str:
+    """Canonical identity of a call, used to de-duplicate inside a batch."""
+    return f"{tool_name}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+def invalid_call(call: Any) -> Optional[str]:
+    """Reason a batch entry cannot be dispatched, or None if it is well-formed."""
+    if not isinstance(call, dict):
+        return "call must be an object with 'tool_name' and 'params'"
+    tool_name = call.get("tool_name")
+    if not isinstance(tool_name, str) or not tool_name:
+        return "missing or invalid 'tool_name'"
+    if call.get("params") is not None and not isinstance(call["params"], dict):
+        return "'params' must be an object"
+    return None
+
+
+async def execute_batch(
+    calls: List[Dict[str, Any]],
+    dispatch: ToolDispatcher,
+    read_only_tools: Iterable[str],
+    concurrency: Optional[int] = None,
+    distinct_tools: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Runs `calls` through `dispatch` and returns one result per call, in input order:
+    `{"index", "tool_name", "status": "SUCCESS"|"ERROR", "output"|"error"}`.
+    Malformed entries get an ERROR result of their own; the rest of the batch runs.
+    """
+    read_only = set(read_only_tools)
+    distinct = set(distinct_tools)
+    limit = asyncio.Semaphore(concurrency or Config.TOOL_BATCH_CONCURRENCY)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+
+    async def _run(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            output = await dispatch(tool_name, params)
+            return {"status": "SUCCESS", "output": str(output)}
+        except Exception as e:
+            logger.error(f"Batch Tool Error ({tool_name}): {e}")
+            return {"status": "ERROR", "error": str(e)}
+
+    async def _run_limited(tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with limit:
+            return await _run(tool_name, params)
+
+    async def _flush(segment: Dict[str, List[int]]):
+        """Executes the pending read-only segment; duplicates share one execution."""
+        if not segment:
+            return
+        keys = list(segment)
+        outcomes = await asyncio.gather(*(
+            _run_limited(calls[segment[k][0]]["tool_name"], calls[segment[k][0]].get("params") or {})
+            for k in keys
+        ))
+        for key, outcome in zip(keys, outcomes):
+            for index in segment[key]:
+                results[index] = outcome
+        segment.clear()
+
+    segment: Dict[str, List[int]] = {}
+    deduplicated = 0
+
+    for index, call in enumerate(calls):
+        reason = invalid_call(call)
+        if reason:
+            logger.warning(f"Batch call {index} rejected: {reason}")
+            results[index] = {"status": "ERROR", "error": reason}
+            continue
+
+        tool_name = call["tool_name"]
+        params = call.get("params") or {}
+
+        if tool_name in read_only:
+            key = f"#{index}" if tool_name in distinct else call_key(tool_name, params)
+            if key in segment:
+                deduplicated += 1
+            segment.setdefault(key, []).append(index)
+            continue
+
+        # Side-effecting barrier: drain pending reads, then run this call alone.
+        await _flush(segment)
+        results[index] = await _run(tool_name, params)
+
+    await _flush(segment)
+
+    logger.info(f"📦 Batch executed {len(calls)} calls ({deduplicated} de-duplicated).")
+    return [
+        {"index": i, "tool_name": call.get("tool_name") if isinstance(call, dict) else None, **results[i]}
+        for i, call in enumerate(calls)
+    ]
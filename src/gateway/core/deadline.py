@@ -0,0 +1,186 @@
+"""
+Gateway Core: Request Deadlines
+
+A request-scoped latency budget carried by a ContextVar, so every stage of the
+governance pipeline (STPA, CBF, OPA, consensus, NeMo, vLLM calls) sees how much
+of the request's budget is left without threading it through signatures.
+
+Deadlines are set at the entry points: `/agent/query` in the agent service and
+the gateway's HTTP endpoints, MCP tool dispatch and gRPC handlers. Across
+process hops the remaining budget travels as the `X-Deadline-Ms` header (or the
+native gRPC deadline). Nested scopes can only tighten a deadline, never extend
+it, and `elapsed_ms()` always measures from the outermost scope, which is the
+cumulative spend the bankruptcy protocol in OPAClient checks.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from src.gateway.core.metrics import DEADLINE_EXCEEDED
+
+logger = logging.getLogger("Gateway.Deadline")
+
+DEADLINE_HEADER = "X-Deadline-Ms"
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """The request's latency budget ran out before `stage` could finish."""
+    def __init__(self, stage: str, elapsed_ms: float, budget_ms: float):
+        self.stage = stage
+        self.elapsed_ms = elapsed_ms
+        self.budget_ms = budget_ms
+        super().__init__(f"Deadline exceeded in {stage}: {elapsed_ms:.0f}ms of {budget_ms:.0f}ms budget spent")
+
+
+class Deadline:
+    def __init__(self, expires_at: float, started: float):
+        self.expires_at = expires_at
+        self.started = started
+
+    @property
+    def budget_ms(self) -> float:
+        return (self.expires_at - self.started) * 1000
+
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.started) * 1000
+
+    def remaining_s(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("gateway_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget_ms: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Runs the body under a deadline `budget_ms` from now, or the enclosing
+    deadline if that is sooner. `None` keeps whatever is already set.
+    """
+    outer = _current_deadline.get()
+    if budget_ms is None:
+        yield outer
+        return
+    now = time.monotonic()
+    expires_at = now + max(0.0, budget_ms) / 1000
+    if outer is not None and outer.expires_at <= expires_at:
+        yield outer
+        return
+    deadline = Deadline(expires_at, outer.started if outer is not None else now)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def parse_deadline_header(value: Optional[str]) -> Optional[float]:
+    """Remaining budget (ms) from an `X-Deadline-Ms` header, ignoring junk."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def deadline_headers() -> Dict[str, str]:
+    """Headers that forward the remaining budget to the next hop."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return {}
+    return {DEADLINE_HEADER: str(int(deadline.remaining_s() * 1000))}
+
+
+def elapsed_ms() -> float:
+    """Cumulative spend of the current request (0 outside a deadline scope)."""
+    deadline = _current_deadline.get()
+    return deadline.elapsed_ms() if deadline is not None else 0.0
+
+
+def remaining_ms() -> Optional[float]:
+    """Budget left for the current request (None outside a deadline scope)."""
+    deadline = _current_deadline.get()
+    return deadline.remaining_s() * 1000 if deadline is not None else None
+
+
+def timeout_for(default_s: Optional[float] = None) -> Optional[float]:
+    """A stage timeout: its own default, capped by the remaining budget."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default_s
+    remaining = deadline.remaining_s()
+    return remaining if default_s is None else min(default_s, remaining)
+
+
+def check_deadline(stage: str):
+    """Raises DeadlineExceeded if the budget is already spent: don't start `stage`."""
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired():
+        DEADLINE_EXCEEDED.labels(stage).inc()
+        raise DeadlineExceeded(stage, deadline.elapsed_ms(), deadline.budget_ms)
+
+
+async def within_deadline(awaitable: Awaitable[T], stage: str, default_timeout_s: Optional[float] = None) -> T:
+    """
+    Awaits `awaitable`, cancelling it when the request deadline (or the stage's
+    own default timeout) passes. Deadline cancellation raises DeadlineExceeded.
+    """
+    try:
+        check_deadline(stage)
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    timeout = timeout_for(default_timeout_s)
+    if timeout is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        deadline = _current_deadline.get()
+        if deadline is not None and deadline.expired():
+            DEADLINE_EXCEEDED.labels(stage).inc()
+            logger.warning(f"⏱️ {stage} cancelled: request deadline reached after {deadline.elapsed_ms():.0f}ms")
+            raise DeadlineExceeded(stage, deadline.elapsed_ms(), deadline.budget_ms) from None
+        raise
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware opening a deadline scope per HTTP request: the caller's
+    `X-Deadline-Ms` if sent, else `default_ms`. Paths under `exclude_prefixes`
+    (MCP, health, metrics) are passed through untouched.
+    """
+    def __init__(self, app, default_ms: Optional[float], exclude_prefixes: Iterable[str] = ()):
+        self.app = app
+        self.default_ms = default_ms
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self.header = DEADLINE_HEADER.lower().encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        budget_ms = self.default_ms
+        for name, value in scope.get("headers", []):
+            if name == self.header:
+                requested = parse_deadline_header(value.decode("latin-1"))
+                if requested is not None:
+                    budget_ms = requested if budget_ms is None else min(budget_ms, requested)
+                break
+        with deadline_scope(budget_ms):
+            await self.app(scope, receive, send)
@@ -0,0 +1,127 @@
+"""
+Gateway Core: OPA Decision Cache
+
+In-process LRU + TTL cache of OPA decisions, keyed by a canonical hash of the
+policy input. The same input is evaluated repeatedly in normal operation (the
+evaluator's dry run, then execute_trade_action, then retries), and OPA is pure
+for a given policy revision, so those repeats are served locally.
+
+Invalidation:
+  - bundle revision: every OPA round-trip reports the loaded revision
+    (`?provenance=true`); a change clears the cache.
+  - explicit: a message on the Redis channel `Config.OPA_CACHE_INVALIDATION_CHANNEL`
+    (published by the policy deployment pipeline via `publish_invalidation`).
+  - TTL bounds staleness between the two.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config.settings import Config
+from src.gateway.core.metrics import OPA_CACHE_ENTRIES, OPA_CACHE_INVALIDATIONS, OPA_CACHE_LOOKUPS
+
+logger = logging.getLogger("Gateway.DecisionCache")
+
+
+def canonical_key(input_data: Dict[str, Any], ignore_fields: Iterable[str] = ()) -> str:
+    """SHA-256 of the input as canonical JSON (sorted keys, no whitespace)."""
+    ignored = set(ignore_fields)
+    payload = {k: v for k, v in input_data.items() if k not in ignored}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def bundle_revision(body: Dict[str, Any]) -> Optional[str]:
+    """Extracts the policy revision from an OPA response's `provenance` block."""
+    provenance = body.get("provenance") or {}
+    bundles = provenance.get("bundles") or {}
+    if bundles:
+        return ",".join(f"{name}@{b.get('revision', '')}" for name, b in sorted(bundles.items()))
+    return provenance.get("revision")
+
+
+class DecisionCache:
+    # Used from the event loop and from the Redis listener thread.
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_s: Optional[float] = None,
+        ignore_fields: Optional[Iterable[str]] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.max_entries = max_entries or Config.OPA_DECISION_CACHE_MAX_ENTRIES
+        self.ttl_s = Config.OPA_DECISION_CACHE_TTL_S if ttl_s is None else ttl_s
+        self.ignore_fields = tuple(Config.OPA_DECISION_CACHE_IGNORE_FIELDS if ignore_fields is None else ignore_fields)
+        self.enabled = Config.OPA_DECISION_CACHE_ENABLED if enabled is None else enabled
+        self.revision: Optional[str] = None
+        self.entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self._listener = None
+
+    def key(self, input_data: Dict[str, Any]) -> str:
+        return canonical_key(input_data, self.ignore_fields)
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                    OPA_CACHE_ENTRIES.set(len(self.entries))
+                OPA_CACHE_LOOKUPS.labels("miss").inc()
+                return None
+            self.entries.move_to_end(key)
+        OPA_CACHE_LOOKUPS.labels("hit").inc()
+        return entry[0]
+
+    def put(self, key: str, decision: str, revision: Optional[str] = None):
+        with self.lock:
+            if revision is not None and revision != self.revision:
+                if self.revision is not None:
+                    self._clear("revision")
+                    logger.info(f"🔄 OPA policy revision {self.revision} -> {revision}: decision cache cleared.")
+                self.revision = revision
+            self.entries[key] = (decision, time.monotonic() + self.ttl_s)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            OPA_CACHE_ENTRIES.set(len(self.entries))
+
+    def invalidate(self, reason: str = "manual"):
+        with self.lock:
+            self._clear(reason)
+        logger.info(f"🧹 OPA decision cache invalidated ({reason}).")
+
+    def _clear(self, reason: str):
+        self.entries.clear()
+        OPA_CACHE_ENTRIES.set(0)
+        OPA_CACHE_INVALIDATIONS.labels(reason).inc()
+
+    def start_listener(self, redis_client=None):
+        """Subscribes to explicit invalidations; a no-op without a live Redis."""
+        if self._listener is not None or not self.enabled:
+            return
+        if redis_client is None:
+            from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+        self._listener = redis_client.subscribe(
+            Config.OPA_CACHE_INVALIDATION_CHANNEL, lambda message: self.invalidate("redis")
+        )
+        if self._listener is not None:
+            logger.info(f"📡 OPA decision cache listening on '{Config.OPA_CACHE_INVALIDATION_CHANNEL}'.")
+
+    def stop_listener(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+def publish_invalidation(reason: str = "policy-updated", redis_client=None) -> int:
+    """Asks every gateway process to drop its cached decisions. Returns receiver count."""
+    if redis_client is None:
+        from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+    return redis_client.publish(Config.OPA_CACHE_INVALIDATION_CHANNEL, reason)
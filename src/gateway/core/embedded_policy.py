@@ -0,0 +1,434 @@
+"""
+Gateway Core: Embedded Policy Engine
+
+Evaluates the finance Rego policies in-process instead of paying the OPA
+sidecar hop (~10-50ms, see docs/LATENCY_STRATEGY.md) on every trade.
+Selected with `OPA_URL=embedded://<package>[/<rule>]`, e.g. `embedded://finance`.
+
+The policy files are compiled once into decision tables: one row per rule
+body, each row a list of predicates over `input`. Only the subset of Rego the
+finance policies use is supported:
+
+  - `default <rule> = <literal>`
+  - `<rule> = <literal> if { ... }` and boolean `<rule> if { ... }`
+  - constants: `<name> := <literal>` (scalars, arrays, sets)
+  - body expressions: `[not] <term> [<op> <term>]` with ==, !=, <, <=, >, >=, in,
+    where a term is `input.<path>`, a literal, a constant or another rule
+
+Semantics follow OPA: a missing input field makes an expression undefined
+(false; true under `not`), comparisons are type-aware, and a complete rule
+producing two different values is a conflict (OPA answers 500
+eval_conflict_error). Anything outside the subset raises `UnsupportedRego` at
+compile time and OPAClient falls back to HTTP. `tests/test_embedded_policy.py`
+replays recorded inputs against a real OPA to catch divergence.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("Gateway.EmbeddedPolicy")
+
+POLICY_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "../../governed_financial_advisor/governance/policy"
+))
+DEFAULT_POLICY_PATHS = [os.path.join(POLICY_DIR, "finance_policy.rego")]
+
+UNDEFINED = object()
+
+
+class UnsupportedRego(Exception):
+    """The policy uses Rego outside the embedded subset; use OPA over HTTP."""
+
+
+class PolicyConflict(Exception):
+    """A complete rule produced more than one value (OPA: eval_conflict_error)."""
+
+
+class RegoSet(tuple):
+    """Set literal. Kept ordered so results are deterministic."""
+
+
+# --- Value semantics ---
+
+def _rank(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, RegoSet):
+        return 5
+    if isinstance(value, (list, tuple)):
+        return 4
+    if isinstance(value, dict):
+        return 6
+    raise UnsupportedRego(f"Unsupported value type {type(value).__name__}")
+
+
+def rego_equal(a: Any, b: Any) -> bool:
+    rank = _rank(a)
+    if rank != _rank(b):
+        return False
+    if rank == 5:
+        return len(a) == len(b) and all(any(rego_equal(x, y) for y in b) for x in a)
+    if rank == 4:
+        return len(a) == len(b) and all(rego_equal(x, y) for x, y in zip(a, b))
+    if rank == 6:
+        return a.keys() == b.keys() and all(rego_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _compare(a: Any, b: Any) -> int:
+    """Total order across types (null < boolean < number < string < ...)."""
+    ra, rb = _rank(a), _rank(b)
+    if ra != rb:
+        return -1 if ra < rb else 1
+    if ra == 0:
+        return 0
+    if ra in (1, 2, 3):
+        return (a > b) - (a < b)
+    raise UnsupportedRego("Ordering of arrays, sets and objects is not supported")
+
+
+def _member(item: Any, collection: Any) -> bool:
+    if isinstance(collection, dict):
+        return any(rego_equal(item, v) for v in collection.values())
+    if isinstance(collection, (list, tuple)):
+        return any(rego_equal(item, v) for v in collection)
+    return False
+
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": rego_equal,
+    "!=": lambda a, b: not rego_equal(a, b),
+    "<": lambda a, b: _compare(a, b) < 0,
+    "<=": lambda a, b: _compare(a, b) <= 0,
+    ">": lambda a, b: _compare(a, b) > 0,
+    ">=": lambda a, b: _compare(a, b) >= 0,
+    "in": _member,
+}
+
+
+# --- Parsing ---
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<op>==|!=|<=|>=|:=|<|>|=)
+    | (?P<punct>[{}\[\],:])
+    | (?P<name>[A-Za-z_][\w]*(?:\.[A-Za-z_][\w]*)*)
+    )""", re.VERBOSE)
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens, pos, text = [], 0, text.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise UnsupportedRego(f"Cannot parse {text[pos:]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+def _strip_comment(line: str) -> str:
+    in_string = False
+    for i, ch in enumerate(line):
+        if ch == '"' and (i == 0 or line[i - 1] != "\\"):
+            in_string = not in_string
+        elif ch == "#" and not in_string:
+            return line[:i]
+    return line
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None or (value is not None and token[1] != value):
+            raise UnsupportedRego(f"Expected {value or 'token'}, got {token}")
+        self.pos += 1
+        return token
+
+    def done(self) -> bool:
+        return self.pos == len(self.tokens)
+
+    def term(self):
+        """Returns ("lit", value) | ("input", path) | ("ref", name)."""
+        kind, value = self.take()
+        if kind == "string":
+            return ("lit", json.loads(value))
+        if kind == "number":
+            return ("lit", json.loads(value))
+        if kind == "name":
+            if value in ("true", "false", "null"):
+                return ("lit", json.loads(value))
+            parts = value.split(".")
+            if parts[0] == "input":
+                return ("input", tuple(parts[1:]))
+            if len(parts) == 1 and value not in ("not", "in", "some", "every", "with", "if", "else"):
+                return ("ref", value)
+            raise UnsupportedRego(f"Unsupported reference {value!r}")
+        if value in ("[", "{"):
+            return ("lit", self._collection(value))
+        raise UnsupportedRego(f"Unsupported term {value!r}")
+
+    def _collection(self, opener: str):
+        closer = "]" if opener == "[" else "}"
+        items, keys = [], []
+        while self.peek() and self.peek()[1] != closer:
+            item = self.term()
+            if item[0] != "lit":
+                raise UnsupportedRego("Only literal collections are supported")
+            if opener == "{" and self.peek() and self.peek()[1] == ":":
+                self.take(":")
+                value = self.term()
+                if value[0] != "lit":
+                    raise UnsupportedRego("Only literal collections are supported")
+                keys.append(item[1])
+                items.append(value[1])
+            else:
+                items.append(item[1])
+            if self.peek() and self.peek()[1] == ",":
+                self.take(",")
+        self.take(closer)
+        if opener == "[":
+            return items
+        if keys or not items:
+            return dict(zip(keys, items))
+        return RegoSet(items)
+
+
+# --- Compilation ---
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+class DecisionTable:
+    """One complete rule: rows of (value, predicates); a row fires when all hold."""
+    def __init__(self, name: str):
+        self.name = name
+        self.default: Any = UNDEFINED
+        self.rows: List[Tuple[Any, List[Predicate]]] = []
+
+    def evaluate(self, input_data: Dict[str, Any]) -> Any:
+        result = UNDEFINED
+        for value, predicates in self.rows:
+            if all(p(input_data) for p in predicates):
+                if result is UNDEFINED:
+                    result = value
+                elif not rego_equal(result, value):
+                    raise PolicyConflict(f"{self.name}: {result!r} vs {value!r}")
+        return self.default if result is UNDEFINED else result
+
+
+class EmbeddedPolicyEngine:
+    def __init__(self, package: str, rule: str, tables: Dict[str, DecisionTable], revision: Optional[str] = None):
+        self.package = package
+        self.rule = rule
+        self.tables = tables
+        # Digest of the package source: the embedded counterpart of a bundle revision.
+        self.revision = revision
+
+    def evaluate(self, input_data: Dict[str, Any], rule: Optional[str] = None) -> Any:
+        """Returns the rule's value, or None if undefined. Raises PolicyConflict."""
+        value = self.tables[rule or self.rule].evaluate(input_data)
+        return None if value is UNDEFINED else value
+
+
+def _statements(source: str) -> List[str]:
+    """Splits a Rego file into top-level statements (brackets balanced)."""
+    statements, current, depth = [], [], 0
+    for raw in source.splitlines():
+        line = _strip_comment(raw).strip()
+        if not line:
+            continue
+        current.append(line)
+        depth += sum(line.count(c) for c in "{[(") - sum(line.count(c) for c in "}])")
+        if depth <= 0:
+            statements.append("\n".join(current))
+            current, depth = [], 0
+    if current:
+        raise UnsupportedRego("Unbalanced brackets")
+    return statements
+
+
+_PACKAGE = re.compile(r"^package\s+([\w.]+)$")
+_IMPORT = re.compile(r"^import\s+(\S+)$")
+_DEFAULT = re.compile(r"^default\s+(\w+)\s*:?=\s*(.+)$", re.S)
+_RULE = re.compile(r"^(\w+)(?:\s*:?=\s*(.+?))?\s+if\s*\{(.*)\}$", re.S)
+_CONST = re.compile(r"^(\w+)\s*:?=\s*(.+)$", re.S)
+_SUPPORTED_IMPORTS = ("rego.v1", "future.keywords", "future.keywords.if", "future.keywords.in")
+
+
+def _literal(text: str) -> Any:
+    parser = _Parser(text)
+    kind, value = parser.term()
+    if kind != "lit" or not parser.done():
+        raise UnsupportedRego(f"Expected a literal, got {text!r}")
+    return value
+
+
+def _parse_packages(paths: Sequence[str]) -> Dict[str, List[Tuple[str, str]]]:
+    """Returns {package: [statements]} across all files."""
+    packages: Dict[str, List[str]] = {}
+    for path in paths:
+        with open(path) as f:
+            statements = _statements(f.read())
+        if not statements or not _PACKAGE.match(statements[0]):
+            raise UnsupportedRego(f"{path}: missing package declaration")
+        package = _PACKAGE.match(statements[0]).group(1)
+        packages.setdefault(package, []).extend(statements[1:])
+    return packages
+
+
+def compile_policy(paths: Sequence[str], package: str, rule: str = "allow") -> EmbeddedPolicyEngine:
+    """
+    Compiles the `package` statements of the given .rego files into decision tables.
+    Raises UnsupportedRego if `rule` (or anything it depends on) is outside the subset.
+    """
+    statements = _parse_packages(paths).get(package)
+    if statements is None:
+        raise UnsupportedRego(f"Package {package!r} not found in {list(paths)}")
+
+    constants: Dict[str, Any] = {}
+    bodies: Dict[str, List[Tuple[str, str]]] = {}
+    defaults: Dict[str, str] = {}
+    unsupported: Dict[str, str] = {}
+
+    for statement in statements:
+        if _IMPORT.match(statement):
+            if _IMPORT.match(statement).group(1) not in _SUPPORTED_IMPORTS:
+                raise UnsupportedRego(f"Unsupported import: {statement}")
+            continue
+        if m := _DEFAULT.match(statement):
+            defaults[m.group(1)] = m.group(2)
+            continue
+        if m := _RULE.match(statement):
+            bodies.setdefault(m.group(1), []).append((m.group(2) or "true", m.group(3)))
+            continue
+        if m := _CONST.match(statement):
+            try:
+                constants[m.group(1)] = _literal(m.group(2))
+            except UnsupportedRego as e:
+                unsupported[m.group(1)] = str(e)
+            continue
+        name = re.match(r"^(\w+)", statement)
+        unsupported[name.group(1) if name else statement] = f"Unsupported statement: {statement[:60]}"
+
+    tables: Dict[str, DecisionTable] = {}
+
+    def table(name: str, stack: Tuple[str, ...] = ()) -> DecisionTable:
+        if name in tables:
+            return tables[name]
+        if name in unsupported:
+            raise UnsupportedRego(f"{package}.{name}: {unsupported[name]}")
+        if name in stack:
+            raise UnsupportedRego(f"Recursive rule {name}")
+        if name not in bodies and name not in defaults:
+            raise UnsupportedRego(f"Unknown rule {package}.{name}")
+        compiled = DecisionTable(name)
+        if name in defaults:
+            compiled.default = _literal(defaults[name])
+        for value_text, body in bodies.get(name, []):
+            predicates = [
+                _compile_expression(expr, constants, lambda ref: table(ref, stack + (name,)))
+                for expr in re.split(r"[\n;]", body) if expr.strip()
+            ]
+            compiled.rows.append((_literal(value_text), predicates))
+        tables[name] = compiled
+        return compiled
+
+    table(rule)
+    logger.info(f"🧮 Embedded policy {package}.{rule}: {len(tables[rule].rows)} decision rows compiled.")
+    revision = hashlib.sha256("\n".join(statements).encode()).hexdigest()[:16]
+    return EmbeddedPolicyEngine(package, rule, tables, revision)
+
+
+def _compile_term(term, constants: Dict[str, Any], rule_table) -> Callable[[Dict[str, Any]], Any]:
+    kind, value = term
+    if kind == "lit":
+        return lambda _input: value
+    if kind == "input":
+        path = value
+
+        def lookup(input_data):
+            current = input_data
+            for part in path:
+                if not isinstance(current, dict) or part not in current:
+                    return UNDEFINED
+                current = current[part]
+            return current
+        return lookup
+    if value in constants:
+        constant = constants[value]
+        return lambda _input: constant
+    return rule_table(value).evaluate
+
+
+def _compile_expression(text: str, constants: Dict[str, Any], rule_table) -> Predicate:
+    parser = _Parser(text)
+    negated = False
+    if parser.peek() == ("name", "not"):
+        parser.take()
+        negated = True
+    left = _compile_term(parser.term(), constants, rule_table)
+
+    if parser.done():
+        def truthy(input_data):
+            value = left(input_data)
+            return value is not UNDEFINED and value is not False
+        check = truthy
+    else:
+        op = parser.take()[1]
+        if op not in _OPERATORS:
+            raise UnsupportedRego(f"Unsupported operator {op!r} in {text!r}")
+        right = _compile_term(parser.term(), constants, rule_table)
+        if not parser.done():
+            raise UnsupportedRego(f"Unsupported expression {text!r}")
+        compare = _OPERATORS[op]
+
+        def check(input_data):
+            a = left(input_data)
+            if a is UNDEFINED:
+                return False
+            b = right(input_data)
+            if b is UNDEFINED:
+                return False
+            return compare(a, b)
+
+    if negated:
+        return lambda input_data: not check(input_data)
+    return check
+
+
+def load_embedded_engine(package_path: str, policy_paths: Optional[Sequence[str]] = None) -> EmbeddedPolicyEngine:
+    """
+    `package_path` is the part after `embedded://`, e.g. "finance" or "finance/allow".
+    `policy_paths` are .rego files or directories (default: the finance policy).
+    """
+    parts = [p for p in package_path.strip("/").split("/") if p]
+    if not parts:
+        raise UnsupportedRego("embedded:// URL needs a package, e.g. embedded://finance")
+    package, rule = (".".join(parts[:-1]), parts[-1]) if len(parts) > 1 else (parts[0], "allow")
+
+    files: List[str] = []
+    for path in policy_paths or DEFAULT_POLICY_PATHS:
+        files.extend(sorted(glob.glob(os.path.join(path, "*.rego"))) if os.path.isdir(path) else [path])
+    return compile_policy(files, package, rule)
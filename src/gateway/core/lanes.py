@@ -0,0 +1,80 @@
+"""
+Gateway Core: Keyed Execution Lanes
+
+Serialises side-effecting tool calls per key (e.g. per trader/account) while
+calls for different keys run fully in parallel. Each key gets a FIFO lane that
+exists only while it has work, so idle accounts cost nothing.
+
+Used by the tool registry for tools registered with a `lane_key`
+(execute_trade_action is keyed by `trader_id`): governance, the safety-filter
+state update and the broker call for one account can no longer interleave
+with another trade for the same account. Read-only tools never enter a lane.
+
+Lanes are per process; under gunicorn each worker orders its own requests.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from src.gateway.core.metrics import LANE_ACTIVE, LANE_DEPTH, LANE_QUEUED, LANE_WAIT
+
+logger = logging.getLogger("Gateway.Lanes")
+
+
+class _Lane:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Holder + waiters; the lane is dropped when this reaches zero.
+        self.users = 0
+
+
+class KeyedExecutionLanes:
+    def __init__(self):
+        self.lanes: Dict[str, _Lane] = {}
+
+    def depth(self, key: str) -> int:
+        lane = self.lanes.get(key)
+        return lane.users if lane else 0
+
+    @asynccontextmanager
+    async def hold(self, key: str, tool: str = "unknown"):
+        """Runs the body exclusively for `key`, after earlier holders of the same key (FIFO)."""
+        lane = self.lanes.get(key)
+        if lane is None:
+            lane = self.lanes[key] = _Lane()
+            LANE_ACTIVE.set(len(self.lanes))
+        lane.users += 1
+        LANE_DEPTH.labels(tool).observe(lane.users - 1)
+
+        wait_start = time.perf_counter()
+        LANE_QUEUED.labels(tool).inc()
+        try:
+            await lane.lock.acquire()
+        except BaseException:
+            self._leave(key, lane)
+            raise
+        finally:
+            LANE_QUEUED.labels(tool).dec()
+
+        waited = time.perf_counter() - wait_start
+        LANE_WAIT.labels(tool).observe(waited)
+        if waited > 1.0:
+            logger.info(f"⏳ {tool} waited {waited:.2f}s for lane '{key}'")
+        try:
+            yield
+        finally:
+            lane.lock.release()
+            self._leave(key, lane)
+
+    def _leave(self, key: str, lane: _Lane):
+        lane.users -= 1
+        if lane.users == 0 and self.lanes.get(key) is lane:
+            del self.lanes[key]
+            LANE_ACTIVE.set(len(self.lanes))
+
+
+# Global Instance
+execution_lanes = KeyedExecutionLanes()
@@ -1,8 +1,12 @@
 import json
 import logging
+import time
 from openai import AsyncOpenAI
 from opentelemetry import trace
 from src.governed_financial_advisor.utils.telemetry import genai_span, record_completion, record_usage
+from src.gateway.core.admission import admission_controller
+from src.gateway.core.deadline import check_deadline, deadline_headers, timeout_for
+from src.gateway.core.usage import record_tokens
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
@@ -34,23 +38,27 @@ class GatewayClient:
 
     def _get_route(self, mode: str):
         """
-        Determines the (client, model) tuple based on the task mode.
+        Determines the (client, model, admission route) tuple based on the task mode.
         """
         if mode in ["planner", "reasoning", "analysis", "verifier"]:
             target_model = Config.MODEL_REASONING
             # In gateway mode, we always use the single client.
             # In local mode, we route to the reasoning service.
-            client = self.gateway_client if self.mode == "gateway" else self.reasoning_client
-            return client, target_model
+            if self.mode == "gateway":
+                return self.gateway_client, target_model, "gateway"
+            return self.reasoning_client, target_model, "reasoning"
 
         # Default / Governance / Fast tasks
         target_model = Config.MODEL_FAST
-        client = self.gateway_client if self.mode == "gateway" else self.governance_client
-        return client, target_model
+        if self.mode == "gateway":
+            return self.gateway_client, target_model, "gateway"
+        return self.governance_client, target_model, "fast"
 
 
     async def generate(self, prompt: str, system_instruction: str = None, mode: str = "chat", **kwargs) -> str:
-        client, model = self._get_route(mode)
+        client, model, route = self._get_route(mode)
+        # Callers (e.g. consensus critics) may pin a specific model on the routed client.
+        model = kwargs.pop("model", None) or model
         
         # Use GenAI Span for Langfuse/OTLP Tracing
         with genai_span(name=f"llm.generate.{mode}", prompt=prompt, model=model) as span:
@@ -79,21 +87,30 @@ class GatewayClient:
                     # extra_headers["traceparent"] = ... (Optional, X-Trace-Id is enough for AgentSight)
             except Exception:
                 pass
+            extra_headers.update(deadline_headers())
+            if timeout_for() is not None:
+                # The request deadline caps the client timeout.
+                kwargs.setdefault("timeout", timeout_for())
     
             try:
-                response = await client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system_instruction or "You are a helpful assistant."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    extra_headers=extra_headers,
-                    **kwargs
-                )
+                # Priority lanes: governance/verifier calls are admitted ahead of planning.
+                async with admission_controller.admit(route, mode):
+                    check_deadline(f"llm.{mode}")
+                    start = time.perf_counter()
+                    response = await client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_instruction or "You are a helpful assistant."},
+                            {"role": "user", "content": prompt}
+                        ],
+                        extra_headers=extra_headers,
+                        **kwargs
+                    )
                 
                 # Capture Token Usage
                 if getattr(response, "usage", None):
                     record_usage(span, response.usage)
+                    record_tokens(route, mode, response.usage, time.perf_counter() - start)
 
                 content = response.choices[0].message.content
                 record_completion(span, content)
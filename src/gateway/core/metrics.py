@@ -0,0 +1,273 @@
+"""
+Gateway Core: Prometheus Metrics
+
+All gateway metrics are declared here so that every module exports into the same
+registry and the `/metrics` endpoint renders them in one scrape.
+
+Under gunicorn (see server/gunicorn_conf.py) PROMETHEUS_MULTIPROC_DIR is set and
+each worker writes its samples there; the scrape aggregates all workers. Gauges
+declare how they combine across workers via `multiprocess_mode`.
+"""
+
+import os
+from typing import Iterable, Optional
+
+from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+# Latency buckets tuned for in-cluster hops (sub-ms pool waits up to multi-second generations).
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# --- vLLM Upstream Pool ---
+UPSTREAM_IN_FLIGHT = Gauge(
+    "gateway_upstream_in_flight_requests",
+    "Requests currently holding a connection slot to a vLLM upstream.",
+    ["upstream"],
+    multiprocess_mode="livesum"
+)
+UPSTREAM_POOL_SATURATION = Gauge(
+    "gateway_upstream_pool_saturation_ratio",
+    "In-flight requests divided by the upstream's max connection limit.",
+    ["upstream"],
+    multiprocess_mode="livemax"
+)
+UPSTREAM_POOL_WAIT = Histogram(
+    "gateway_upstream_pool_wait_seconds",
+    "Time spent waiting for a free connection slot to a vLLM upstream.",
+    ["upstream"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_CONNECTIONS = Counter(
+    "gateway_upstream_connections_total",
+    "Upstream requests by whether they reused a pooled connection or opened a new one.",
+    ["upstream", "reused"]
+)
+UPSTREAM_REQUEST_LATENCY = Histogram(
+    "gateway_upstream_request_seconds",
+    "End-to-end latency of vLLM upstream requests (full stream for streaming calls).",
+    ["upstream", "stream"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_TOKENS = Counter(
+    "gateway_upstream_tokens_total",
+    "Tokens reported by vLLM, per upstream, kind (prompt/completion) and source (generation/guardrails).",
+    ["upstream", "kind", "source"]
+)
+UPSTREAM_OUTPUT_TOKEN_RATE = Histogram(
+    "gateway_upstream_output_tokens_per_second",
+    "Per-request completion throughput (completion tokens / request duration).",
+    ["upstream"],
+    buckets=(1, 5, 10, 25, 50, 100, 200, 400, 800, 1600)
+)
+
+# --- Speculative Generation ---
+SPECULATION_OUTCOMES = Counter(
+    "gateway_speculation_total",
+    "Speculative generations by outcome (committed after input rails passed, or cancelled).",
+    ["outcome"]
+)
+SPECULATION_CANCELLED_TOKENS = Counter(
+    "gateway_speculation_cancelled_tokens_total",
+    "Completion tokens generated speculatively and discarded because an input rail blocked."
+)
+SPECULATION_TIME_SAVED = Counter(
+    "gateway_speculation_time_saved_seconds_total",
+    "Generation time that overlapped the input rails on committed speculative requests."
+)
+
+# --- Tool Registry ---
+TOOL_IN_FLIGHT = Gauge(
+    "gateway_tool_in_flight",
+    "Tool invocations currently executing, per tool.",
+    ["tool"],
+    multiprocess_mode="livesum"
+)
+TOOL_QUEUED = Gauge(
+    "gateway_tool_queued",
+    "Synchronous tool calls waiting for a worker thread, per tool.",
+    ["tool"],
+    multiprocess_mode="livesum"
+)
+TOOL_LATENCY = Histogram(
+    "gateway_tool_latency_seconds",
+    "Tool execution latency (including thread-pool wait for sync tools).",
+    ["tool", "status"],
+    buckets=LATENCY_BUCKETS
+)
+
+# --- Keyed Execution Lanes ---
+LANE_ACTIVE = Gauge(
+    "gateway_execution_lanes_active",
+    "Keys (e.g. trader accounts) with a side-effecting tool call running or queued.",
+    multiprocess_mode="livesum"
+)
+LANE_QUEUED = Gauge(
+    "gateway_execution_lane_queued",
+    "Tool calls waiting behind an earlier call for the same key, per tool.",
+    ["tool"],
+    multiprocess_mode="livesum"
+)
+LANE_DEPTH = Histogram(
+    "gateway_execution_lane_depth",
+    "Calls already in the lane (running + queued) when a call joined it.",
+    ["tool"],
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64)
+)
+LANE_WAIT = Histogram(
+    "gateway_execution_lane_wait_seconds",
+    "Time a tool call waited for its key's lane.",
+    ["tool"],
+    buckets=LATENCY_BUCKETS
+)
+
+# --- Request Deadlines ---
+DEADLINE_EXCEEDED = Counter(
+    "gateway_deadline_exceeded_total",
+    "Stages skipped or cancelled because the request's latency budget ran out.",
+    ["stage"]
+)
+
+# --- Governance Verdicts ---
+GOVERNANCE_VERDICTS = Counter(
+    "gateway_governance_verdicts_total",
+    "Signed dry-run verdicts by outcome (issued, reused, mismatch, expired, invalid, consumed).",
+    ["outcome"]
+)
+GOVERNANCE_STAGES_REUSED = Counter(
+    "gateway_governance_stages_reused_total",
+    "govern() stages skipped because a verdict covered unchanged inputs.",
+    ["stage"]
+)
+
+# --- Governance Ontology ---
+GOVERNANCE_ONTOLOGY_RELOADS = Counter(
+    "gateway_governance_ontology_reloads_total",
+    "STPA ontology reloads by trigger (file, admin) and outcome (swapped, unchanged, error).",
+    ["trigger", "outcome"]
+)
+GOVERNANCE_ONTOLOGY_LOAD_SECONDS = Histogram(
+    "gateway_governance_ontology_load_seconds",
+    "Time to load (read + parse) and compile an ontology snapshot.",
+    ["phase"],
+    buckets=LATENCY_BUCKETS
+)
+GOVERNANCE_ONTOLOGY_VERSION = Gauge(
+    "gateway_governance_ontology_version_info",
+    "Active STPA ontology snapshot (1 for the active version label, 0 for replaced ones).",
+    ["version"],
+    multiprocess_mode="livemax"
+)
+
+# --- Control Barrier Function ---
+CBF_RESERVATIONS = Counter(
+    "gateway_cbf_reservations_total",
+    "CBF cash reservations by outcome (reserved, rejected, committed, late_commit, released, error).",
+    ["outcome"]
+)
+
+# --- Circuit Breakers ---
+BREAKER_STATE = Gauge(
+    "gateway_circuit_breaker_state",
+    "Breaker state: 0 closed, 1 half-open, 2 open.",
+    ["breaker"],
+    multiprocess_mode="livemax"
+)
+BREAKER_TRANSITIONS = Counter(
+    "gateway_circuit_breaker_transitions_total",
+    "Breaker state transitions by target state.",
+    ["breaker", "state"]
+)
+BREAKER_CALLS = Counter(
+    "gateway_circuit_breaker_calls_total",
+    "Calls seen by the breaker by outcome (success, slow, failure, rejected, released).",
+    ["breaker", "outcome"]
+)
+BREAKER_WINDOW_RATE = Gauge(
+    "gateway_circuit_breaker_window_rate",
+    "Failure and slow-call rate over the breaker's sliding window.",
+    ["breaker", "kind"],
+    multiprocess_mode="livemax"
+)
+
+# --- OPA Decision Cache ---
+OPA_CACHE_LOOKUPS = Counter(
+    "gateway_opa_decision_cache_total",
+    "OPA decision cache lookups by result (hit, miss, bypass).",
+    ["result"]
+)
+OPA_CACHE_INVALIDATIONS = Counter(
+    "gateway_opa_decision_cache_invalidations_total",
+    "Decision cache flushes by reason (revision, redis, manual).",
+    ["reason"]
+)
+OPA_CACHE_ENTRIES = Gauge(
+    "gateway_opa_decision_cache_entries",
+    "Decisions currently cached.",
+    multiprocess_mode="livesum"
+)
+
+# --- Admission Control ---
+ADMISSION_IN_FLIGHT = Gauge(
+    "gateway_admission_in_flight",
+    "Requests currently admitted to a vLLM route, per priority class.",
+    ["route", "priority"],
+    multiprocess_mode="livesum"
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "gateway_admission_queue_depth",
+    "Requests waiting for admission, per route and priority class.",
+    ["route", "priority"],
+    multiprocess_mode="livesum"
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "gateway_admission_queue_wait_seconds",
+    "Time admitted requests spent queued before getting a slot.",
+    ["route", "priority"],
+    buckets=LATENCY_BUCKETS
+)
+ADMISSION_REJECTED = Counter(
+    "gateway_admission_rejected_total",
+    "Requests shed with 429 because their queue wait exceeded the budget.",
+    ["route", "priority"]
+)
+
+
+# In-flight / queued work per vLLM route and per tool: the gateway-side backlog
+# that KEDA scales vLLM and the gateway on (served at /metrics/scaling).
+SCALING_METRICS = (
+    "gateway_admission_in_flight",
+    "gateway_admission_queue_depth",
+    "gateway_tool_in_flight",
+    "gateway_tool_queued",
+    "gateway_execution_lane_queued",
+)
+
+
+class _NamedFamilies:
+    """
+    The families of `registry` whose name (or one of whose samples) is in `names`.
+    Filters what is collected rather than using `restricted_registry`, which
+    relies on `describe()` and so yields nothing for a MultiProcessCollector.
+    """
+    def __init__(self, registry: CollectorRegistry, names: Iterable[str]):
+        self.registry = registry
+        self.names = set(names)
+
+    def collect(self):
+        for family in self.registry.collect():
+            if family.name in self.names or any(sample.name in self.names for sample in family.samples):
+                yield family
+
+
+def render_latest(names: Optional[Iterable[str]] = None) -> tuple[bytes, str]:
+    """
+    Returns the Prometheus exposition payload and its content type,
+    optionally restricted to the given metric names.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    if names is not None:
+        return generate_latest(_NamedFamilies(registry, names)), CONTENT_TYPE_LATEST
+    return generate_latest(registry), CONTENT_TYPE_LATEST
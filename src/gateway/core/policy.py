@@ -2,6 +2,7 @@
 Gateway Core: Policy & Governance (OPA + CircuitBreaker)
 """
 
+import asyncio
 import logging
 import time
 import urllib.parse
@@ -13,6 +14,10 @@ from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
 from config.settings import Config
+from src.gateway.core.deadline import current_deadline, elapsed_ms, remaining_ms, timeout_for
+from src.gateway.core.decision_cache import DecisionCache, bundle_revision
+from src.gateway.core.embedded_policy import PolicyConflict, UnsupportedRego, load_embedded_engine
+from src.gateway.core.metrics import BREAKER_CALLS, BREAKER_STATE, BREAKER_TRANSITIONS, BREAKER_WINDOW_RATE, OPA_CACHE_LOOKUPS
 
 logger = logging.getLogger("Gateway.Policy")
 tracer = trace.get_tracer("gateway.policy")
@@ -20,39 +25,260 @@ tracer = trace.get_tracer("gateway.policy")
 class CircuitBreaker:
     """
     Implements a Fail-Fast Circuit Breaker pattern.
+
+    CLOSED: calls flow and their outcomes are counted in a sliding time window
+    (`window_s`, 1s buckets). Once the window holds `failure_threshold` calls,
+    the breaker trips when the failure rate or the slow-call rate (calls slower
+    than `slow_call_ms`) reaches its threshold.
+    OPEN: calls fail fast for `recovery_timeout` seconds.
+    HALF_OPEN: only `half_open_max_calls` probes are let through; if they all
+    succeed the breaker closes with a fresh window, any failure re-opens it.
+    A probe that ends without an outcome gives its slot back (`release_probe`),
+    and if no outcome arrives within another `recovery_timeout` a new probe
+    epoch starts, so a lost probe cannot hold the breaker HALF_OPEN forever.
+
+    With `shared_key`, the breaker state and window live in Redis so every
+    gateway worker and replica trips and recovers together instead of each
+    process discovering an outage on its own. Its methods then make blocking
+    Redis calls: callers on the event loop run them on a thread (see OPAClient).
     """
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 30, max_latency_budget: int = 3000):
+    STATE_VALUES = {"CLOSED": 0, "HALF_OPEN": 1, "OPEN": 2}
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: int = 30,
+        min_remaining_ms: float | None = None,
+        shared_key: str | None = None,
+        window_s: int | None = None,
+        failure_rate_threshold: float | None = None,
+        slow_call_ms: float | None = None,
+        slow_call_rate_threshold: float | None = None,
+        half_open_max_calls: int | None = None,
+        name: str = "opa"
+    ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
-        self.max_latency_budget = max_latency_budget
-        self.failures = 0
-        self.last_failure_time = 0.0
-        self.state = "CLOSED"
+        self.min_remaining_ms = Config.OPA_MIN_REMAINING_MS if min_remaining_ms is None else min_remaining_ms
+        self.window_s = window_s or Config.OPA_BREAKER_WINDOW_S
+        self.failure_rate_threshold = failure_rate_threshold or Config.OPA_BREAKER_FAILURE_RATE
+        self.slow_call_ms = slow_call_ms or Config.OPA_BREAKER_SLOW_CALL_MS
+        self.slow_call_rate_threshold = slow_call_rate_threshold or Config.OPA_BREAKER_SLOW_CALL_RATE
+        self.half_open_max_calls = half_open_max_calls or Config.OPA_BREAKER_HALF_OPEN_PROBES
+        self.name = name
+        self.shared_key = shared_key
+        self.store = None
+        if shared_key:
+            from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+            self.store = redis_client
+        self._state = "CLOSED"
+        self._last_failure_time = 0.0
+        self._half_open_since = 0.0
+        self._window_start = 0
+        # bucket (unix second) -> [calls, failures, slow]
+        self._buckets: dict[int, list[int]] = {}
+        self._counters: dict[str, int] = {}
+        BREAKER_STATE.labels(name).set(0)
 
-    def record_failure(self):
-        self.failures += 1
+    def _load(self, field: str, default: Any) -> Any:
+        if self.store is None:
+            return getattr(self, f"_{field}")
+        value = self.store.get(f"{self.shared_key}:{field}")
+        return default if value is None else type(default)(float(value))
+
+    def _save(self, field: str, value: Any):
+        if self.store is None:
+            setattr(self, f"_{field}", value)
+        else:
+            self.store.set(f"{self.shared_key}:{field}", str(value))
+
+    def _incr(self, counter: str, amount: int = 1) -> int:
+        if self.store is not None:
+            return self.store.incr(f"{self.shared_key}:{counter}", amount, ttl=self.recovery_timeout + self.window_s)
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+        return self._counters[counter]
+
+    @property
+    def state(self) -> str:
+        if self.store is None:
+            return self._state
+        value = self.store.get(f"{self.shared_key}:state")
+        return "CLOSED" if value is None else value
+
+    @state.setter
+    def state(self, value: str):
+        self._save("state", value)
+        BREAKER_STATE.labels(self.name).set(self.STATE_VALUES.get(value, 0))
+
+    @property
+    def last_failure_time(self) -> float:
+        return self._load("last_failure_time", 0.0)
+
+    @last_failure_time.setter
+    def last_failure_time(self, value: float):
+        self._save("last_failure_time", value)
+
+    @property
+    def half_open_since(self) -> float:
+        return self._load("half_open_since", 0.0)
+
+    @half_open_since.setter
+    def half_open_since(self, value: float):
+        self._save("half_open_since", value)
+
+    @property
+    def failures(self) -> int:
+        """Failures in the current window."""
+        return self.window()[1]
+
+    @failures.setter
+    def failures(self, value: int):
+        # Only a reset is meaningful for a windowed count: start a fresh window.
+        if value == 0:
+            self._save("window_start", int(time.time()))
+
+    # --- Sliding window ---
+
+    def _bucket_key(self, bucket: int, field: str) -> str:
+        return f"{self.shared_key}:w:{bucket}:{field}"
+
+    def _record(self, failed: bool, slow: bool):
+        bucket = int(time.time())
+        if self.store is None:
+            counts = self._buckets.setdefault(bucket, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += failed
+            counts[2] += slow
+            for old in [b for b in self._buckets if b <= bucket - self.window_s]:
+                del self._buckets[old]
+            return
+        ttl = self.window_s + 2
+        self.store.incr(self._bucket_key(bucket, "calls"), ttl=ttl)
+        if failed:
+            self.store.incr(self._bucket_key(bucket, "failures"), ttl=ttl)
+        if slow:
+            self.store.incr(self._bucket_key(bucket, "slow"), ttl=ttl)
+
+    def window(self) -> tuple[int, int, int]:
+        """(calls, failures, slow calls) within the last `window_s` seconds of this window."""
+        now = int(time.time())
+        first = max(now - self.window_s + 1, int(self._load("window_start", 0)))
+        buckets = range(first, now + 1)
+        if self.store is None:
+            counts = [self._buckets.get(b, (0, 0, 0)) for b in buckets]
+            return tuple(sum(c[i] for c in counts) for i in range(3))
+        keys = [self._bucket_key(b, field) for b in buckets for field in ("calls", "failures", "slow")]
+        values = [int(v) if v else 0 for v in self.store.mget(keys)]
+        return sum(values[0::3]), sum(values[1::3]), sum(values[2::3])
+
+    # --- Transitions ---
+
+    def _open(self, reason: str):
         self.last_failure_time = time.time()
-        if self.state == "CLOSED" and self.failures >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.warning(f"🔥 Circuit Breaker OPENED after {self.failures} failures.")
-
-    def record_success(self):
-        if self.state == "OPEN":
-            logger.info("✅ Circuit Breaker RECOVERED (CLOSED).")
-        self.failures = 0
+        self.state = "OPEN"
+        BREAKER_TRANSITIONS.labels(self.name, "OPEN").inc()
+        logger.warning(f"🔥 Circuit Breaker OPENED ({reason}).")
+
+    def _close(self):
+        self._save("window_start", int(time.time()) + 1)
         self.state = "CLOSED"
+        BREAKER_TRANSITIONS.labels(self.name, "CLOSED").inc()
+        logger.info("✅ Circuit Breaker RECOVERED (CLOSED).")
+
+    def _half_open(self):
+        self.half_open_since = time.time()
+        self.state = "HALF_OPEN"
+        BREAKER_TRANSITIONS.labels(self.name, "HALF_OPEN").inc()
+        logger.info(f"🩺 Circuit Breaker HALF_OPEN: admitting {self.half_open_max_calls} probes.")
+
+    def _renew_probes(self):
+        # Moving last_failure_time starts a new probe epoch with a full budget.
+        now = time.time()
+        self.last_failure_time = now
+        self.half_open_since = now
+        BREAKER_TRANSITIONS.labels(self.name, "HALF_OPEN").inc()
+        logger.warning(f"🩺 Circuit Breaker HALF_OPEN for {self.recovery_timeout}s without a probe outcome: admitting new probes.")
+
+    def _probe_epoch(self) -> str:
+        # Probe counters are scoped to one OPEN->HALF_OPEN cycle, so workers
+        # share the probe budget without having to reset it.
+        return str(int(self.last_failure_time * 1000))
+
+    def _evaluate_window(self):
+        calls, failures, slow = self.window()
+        if calls == 0:
+            return
+        failure_rate, slow_rate = failures / calls, slow / calls
+        BREAKER_WINDOW_RATE.labels(self.name, "failure").set(failure_rate)
+        BREAKER_WINDOW_RATE.labels(self.name, "slow").set(slow_rate)
+        if calls < self.failure_threshold:
+            return
+        if failure_rate >= self.failure_rate_threshold:
+            self._open(f"{failures}/{calls} calls failed in {self.window_s}s")
+        elif slow_rate >= self.slow_call_rate_threshold:
+            self._open(f"{slow}/{calls} calls slower than {self.slow_call_ms:.0f}ms in {self.window_s}s")
+
+    def record_failure(self):
+        BREAKER_CALLS.labels(self.name, "failure").inc()
+        state = self.state
+        if state == "HALF_OPEN":
+            self._open("probe failed")
+        elif state == "CLOSED":
+            self._record(failed=True, slow=False)
+            self._evaluate_window()
+
+    def record_success(self, latency_ms: float = 0.0):
+        slow = latency_ms >= self.slow_call_ms
+        BREAKER_CALLS.labels(self.name, "slow" if slow else "success").inc()
+        state = self.state
+        if state == "HALF_OPEN":
+            if slow:
+                self._open(f"probe took {latency_ms:.0f}ms")
+            elif self._incr(f"probe_ok:{self._probe_epoch()}") >= self.half_open_max_calls:
+                self._close()
+        elif state == "CLOSED":
+            self._record(failed=False, slow=slow)
+            if slow:
+                self._evaluate_window()
+        # OPEN: a call admitted before the trip; it says nothing about recovery.
 
     def can_execute(self) -> bool:
-        if self.state == "CLOSED":
-            return True
-        if time.time() - self.last_failure_time > self.recovery_timeout:
-            return True
-        return False
+        """Admits a call. In HALF_OPEN each True is a probe: follow it with record_success/failure."""
+        return self.admit() is not None
 
-    def is_bankrupt(self, cumulative_spend_ms: float) -> bool:
-        if cumulative_spend_ms > self.max_latency_budget:
-            return True
-        return False
+    def admit(self) -> str | None:
+        """
+        Like can_execute, but returns a ticket: "" for a normal call, the probe
+        epoch for a HALF_OPEN probe, None when rejected. A probe that ends
+        without record_success/failure (cancelled, or cut short by the caller's
+        own deadline) must hand its ticket to release_probe.
+        """
+        state = self.state
+        BREAKER_STATE.labels(self.name).set(self.STATE_VALUES.get(state, 0))
+        if state == "CLOSED":
+            return ""
+        if state == "OPEN":
+            if time.time() - self.last_failure_time <= self.recovery_timeout:
+                BREAKER_CALLS.labels(self.name, "rejected").inc()
+                return None
+            self._half_open()
+        elif time.time() - self.half_open_since > self.recovery_timeout:
+            self._renew_probes()
+        epoch = self._probe_epoch()
+        if self._incr(f"probes:{epoch}") <= self.half_open_max_calls:
+            return epoch
+        BREAKER_CALLS.labels(self.name, "rejected").inc()
+        return None
+
+    def release_probe(self, ticket: str | None):
+        """Gives back the probe slot of a call that ended without an outcome."""
+        if ticket and self.state == "HALF_OPEN" and ticket == self._probe_epoch():
+            self._incr(f"probes:{ticket}", -1)
+            BREAKER_CALLS.labels(self.name, "released").inc()
+
+    def is_bankrupt(self, remaining_ms: float) -> bool:
+        """Too little of the request deadline is left for an OPA call to finish."""
+        return remaining_ms < self.min_remaining_ms
 
     def check_soft_ceiling(self, cumulative_spend_ms: float, soft_ceiling_ms: float = 2000.0) -> bool:
         if cumulative_spend_ms > soft_ceiling_ms:
@@ -61,16 +287,32 @@ class CircuitBreaker:
 
 class OPAClient:
     """
-    Async OPA Client with Circuit Breaker.
+    Async OPA Client with Circuit Breaker and a local decision cache.
+    Pass `bypass_cache=True` for audit-critical checks that must reach OPA.
+    With `OPA_URL=embedded://<package>` the policy is evaluated in-process
+    (see embedded_policy.py); HTTP to OPA remains the fallback.
     """
     def __init__(self):
         self.url = Config.OPA_URL
         self.auth_token = Config.OPA_AUTH_TOKEN
-        self.cb = CircuitBreaker()
+        self.cb = CircuitBreaker(
+            shared_key="governance:opa_breaker" if Config.CIRCUIT_BREAKER_BACKEND == "redis" else None
+        )
+        self.cache = DecisionCache()
+        self.engine = None
         self.transport = None
-        self.target_url = self.url
 
         parsed = urllib.parse.urlparse(self.url)
+        if parsed.scheme == "embedded":
+            try:
+                self.engine = load_embedded_engine(parsed.netloc + parsed.path, Config.OPA_EMBEDDED_POLICY_PATHS)
+                logger.info(f"🧮 OPAClient using embedded policy engine: {self.engine.package}.{self.engine.rule}")
+            except (UnsupportedRego, OSError) as e:
+                logger.warning(f"⚠️ Embedded policy unavailable ({e}). Falling back to OPA at {Config.OPA_FALLBACK_URL}")
+            self.url = Config.OPA_FALLBACK_URL
+            parsed = urllib.parse.urlparse(self.url)
+
+        self.target_url = self.url
         if parsed.scheme == "http+unix":
             socket_path = urllib.parse.unquote(parsed.netloc)
             self.transport = httpx.AsyncHTTPTransport(uds=socket_path)
@@ -79,23 +321,123 @@ class OPAClient:
         else:
             self.transport = httpx.AsyncHTTPTransport(retries=0)
             logger.info(f"🌐 OPAClient configured for HTTP: {self.target_url}")
+        # Companion rule that evaluates `input.inputs` element-wise (finance.batch_allow).
+        self.batch_target_url = Config.OPA_BATCH_URL or f"{self.target_url.rsplit('/', 1)[0]}/batch_allow"
 
         self.client = httpx.AsyncClient(transport=self.transport)
 
     async def close(self):
         await self.client.aclose()
 
-    async def evaluate_policy(self, input_data: dict[str, Any], current_latency_ms: float = 0.0) -> str:
-        if not self.cb.can_execute():
-            logger.warning("⚠️ Circuit Breaker OPEN. Fast failing OPA check -> DENY.")
-            return "DENY"
+    @property
+    def policy_revision(self) -> str | None:
+        """The policy revision decisions are made against, if known."""
+        if self.engine is not None:
+            return f"embedded:{self.engine.revision}"
+        # Learned from OPA's provenance block (requested while the decision cache is on).
+        return self.cache.revision
 
-        if self.cb.is_bankrupt(current_latency_ms):
-             logger.critical(f"💀 Bankruptcy Protocol: {current_latency_ms}ms > {self.cb.max_latency_budget}ms.")
-             return "DENY"
+    def _headers(self) -> dict[str, str]:
+        headers = {}
+        if self.auth_token:
+            headers["Authorization"] = f"Bearer {self.auth_token}"
+        return headers
+
+    async def _breaker(self, method, *args):
+        """Calls a breaker method; a shared breaker's Redis round-trips run on a thread."""
+        if self.cb.store is None:
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def _admit(self, current_latency_ms: float | None) -> str | None:
+        """
+        Breaker and latency-budget checks shared by single and batch evaluation.
+        Bankruptcy is judged on what is left of the request deadline, so a long
+        plan under a generous budget still reaches OPA; spend (defaulting to the
+        deadline's elapsed time) only drives the soft-ceiling warning.
+        Returns the breaker ticket (see CircuitBreaker.admit), None to deny.
+        """
+        if current_latency_ms is None:
+            current_latency_ms = elapsed_ms()
+
+        # Budget first: a HALF_OPEN probe admitted below must reach OPA.
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired():
+            logger.critical(f"⏱️ Request deadline exhausted ({current_latency_ms:.0f}ms spent). OPA check -> DENY.")
+            return None
+
+        remaining = remaining_ms()
+        if remaining is not None and self.cb.is_bankrupt(remaining):
+            logger.critical(f"💀 Bankruptcy Protocol: {remaining:.0f}ms left < {self.cb.min_remaining_ms}ms needed for OPA.")
+            return None
+
+        ticket = await self._breaker(self.cb.admit)
+        if ticket is None:
+            logger.warning("⚠️ Circuit Breaker OPEN. Fast failing OPA check -> DENY.")
+            return None
 
         if self.cb.check_soft_ceiling(current_latency_ms):
             logger.warning(f"📉 Latency Inflation Warning: {current_latency_ms}ms > 2000ms.")
+        return ticket
+
+    async def _record_failure(self, ticket: str | None):
+        # A timeout caused by our own request deadline says nothing about OPA's
+        # health; a probe cut short that way just hands its slot back.
+        deadline = current_deadline()
+        if deadline is None or not deadline.expired():
+            await self._breaker(self.cb.record_failure)
+        else:
+            await self._breaker(self.cb.release_probe, ticket)
+
+    def _cached(self, input_data: dict[str, Any], bypass_cache: bool) -> tuple[str | None, str | None]:
+        """Returns (cache_key, cached_decision); both None when the cache is off or bypassed."""
+        if not self.cache.enabled:
+            return None, None
+        if bypass_cache:
+            OPA_CACHE_LOOKUPS.labels("bypass").inc()
+            return None, None
+        cache_key = self.cache.key(input_data)
+        return cache_key, self.cache.get(cache_key)
+
+    def _evaluate_embedded(self, input_data: dict[str, Any]) -> str:
+        with tracer.start_as_current_span("governance.opa_check") as span:
+            start_time = time.perf_counter()
+            span.set_attribute("iso.control_id", "A.10.1")
+            span.set_attribute("governance.engine", "embedded")
+            span.set_attribute("governance.action", input_data.get("action", "unknown"))
+            try:
+                result = self.engine.evaluate(input_data)
+            except PolicyConflict as e:
+                # OPA answers eval_conflict_error (HTTP 500) here; the HTTP path denies too.
+                logger.critical(f"🔥 Policy conflict: {e} | Input: {input_data}")
+                span.set_attribute("governance.denial_reason", "POLICY_CONFLICT")
+                return "DENY"
+            if not isinstance(result, str):
+                result = "DENY"
+            span.set_attribute("governance.decision", result)
+            span.set_attribute("latency_currency_tax", (time.perf_counter() - start_time) * 1000)
+            if result == "DENY":
+                span.set_attribute("governance.denial_reason", "POLICY_VIOLATION")
+            logger.debug(f"🧮 Embedded policy | Action: {input_data.get('action')} -> {result}")
+            return result
+
+    async def evaluate_policy(self, input_data: dict[str, Any], current_latency_ms: float | None = None, bypass_cache: bool = False) -> str:
+        if self.engine is not None:
+            return self._evaluate_embedded(input_data)
+
+        cache_key, cached = self._cached(input_data, bypass_cache)
+        if cached is not None:
+            with tracer.start_as_current_span("governance.opa_check") as span:
+                span.set_attribute("governance.action", input_data.get("action", "unknown"))
+                span.set_attribute("governance.decision", cached)
+                span.set_attribute("governance.cache", "hit")
+            logger.debug(f"⚡ OPA cache hit | Action: {input_data.get('action')} -> {cached}")
+            return cached
+
+        ticket = await self._admit(current_latency_ms)
+        if ticket is None:
+            return "DENY"
+        settled = False
 
         with tracer.start_as_current_span("governance.opa_check") as span:
             start_time = time.time()
@@ -104,27 +446,32 @@ class OPAClient:
             span.set_attribute("governance.opa_url", self.url)
             span.set_attribute("governance.action", input_data.get("action", "unknown"))
             span.set_attribute("governance.policy_input_size", len(json.dumps(input_data)))
-
-            headers = {}
-            if self.auth_token:
-                headers["Authorization"] = f"Bearer {self.auth_token}"
+            span.set_attribute("governance.cache", "bypass" if bypass_cache else "miss")
 
             try:
                 response = await self.client.post(
                     self.target_url,
                     json={"input": input_data},
-                    headers=headers,
-                    timeout=1.0
+                    headers=self._headers(),
+                    # Provenance carries the bundle revision used for cache invalidation.
+                    params={"provenance": "true"} if self.cache.enabled else None,
+                    timeout=timeout_for(1.0)
                 )
 
                 governance_tax_ms = (time.time() - start_time) * 1000
                 span.set_attribute("latency_currency_tax", governance_tax_ms)
 
                 response.raise_for_status()
-                self.cb.record_success()
+                # Settled first: the outcome is recorded even if this await is cancelled.
+                settled = True
+                await self._breaker(self.cb.record_success, governance_tax_ms)
 
-                result = response.json().get("result", "DENY")
+                body = response.json()
+                result = body.get("result", "DENY")
                 span.set_attribute("governance.decision", result)
+                # Only real policy answers are cached; failure DENYs below never are.
+                if self.cache.enabled and "result" in body:
+                    self.cache.put(cache_key or self.cache.key(input_data), result, bundle_revision(body))
 
                 if result == "ALLOW":
                     logger.info(f"✅ OPA ALLOWED | Action: {input_data.get('action')}")
@@ -137,9 +484,89 @@ class OPAClient:
                 return result
 
             except Exception as e:
-                self.cb.record_failure()
+                settled = True
+                await self._record_failure(ticket)
                 logger.critical(f"🔥 OPA FAILURE: {e}")
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR))
                 span.set_attribute("governance.denial_reason", "SYSTEM_FAILURE")
                 return "DENY"
+            finally:
+                # Cancelled mid-call: no outcome, so the probe slot goes back.
+                if not settled:
+                    await self._breaker(self.cb.release_probe, ticket)
+
+    async def evaluate_policy_batch(self, inputs: list[dict[str, Any]], current_latency_ms: float | None = None, bypass_cache: bool = False) -> list[str]:
+        """
+        Evaluates many policy inputs (e.g. every step of an ExecutionPlan) in one
+        OPA round-trip via `batch_allow`. Returns one decision per input, in order.
+        Cached decisions are served locally; only the misses are sent to OPA.
+        """
+        if self.engine is not None:
+            return [self._evaluate_embedded(input_data) for input_data in inputs]
+
+        decisions: list[str | None] = [None] * len(inputs)
+        pending: list[tuple[int, str | None]] = []
+        for i, input_data in enumerate(inputs):
+            cache_key, cached = self._cached(input_data, bypass_cache)
+            if cached is not None:
+                decisions[i] = cached
+            else:
+                pending.append((i, cache_key))
+
+        if not pending:
+            return decisions
+
+        ticket = await self._admit(current_latency_ms)
+        if ticket is None:
+            return [d if d is not None else "DENY" for d in decisions]
+        settled = False
+
+        with tracer.start_as_current_span("governance.opa_batch_check") as span:
+            start_time = time.time()
+            span.set_attribute("iso.control_id", "A.10.1")
+            span.set_attribute("governance.opa_url", self.batch_target_url)
+            span.set_attribute("governance.batch_size", len(inputs))
+            span.set_attribute("governance.batch_cache_hits", len(inputs) - len(pending))
+
+            try:
+                response = await self.client.post(
+                    self.batch_target_url,
+                    json={"input": {"inputs": [inputs[i] for i, _ in pending]}},
+                    headers=self._headers(),
+                    params={"provenance": "true"} if self.cache.enabled else None,
+                    timeout=timeout_for(1.0)
+                )
+                governance_tax_ms = (time.time() - start_time) * 1000
+                span.set_attribute("latency_currency_tax", governance_tax_ms)
+                response.raise_for_status()
+
+                body = response.json()
+                results = body.get("result")
+                if not isinstance(results, list) or len(results) != len(pending):
+                    raise ValueError(f"batch_allow returned {results!r} for {len(pending)} inputs")
+                settled = True
+                await self._breaker(self.cb.record_success, governance_tax_ms)
+
+            except Exception as e:
+                settled = True
+                await self._record_failure(ticket)
+                logger.critical(f"🔥 OPA BATCH FAILURE: {e}")
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR))
+                span.set_attribute("governance.denial_reason", "SYSTEM_FAILURE")
+                return [d if d is not None else "DENY" for d in decisions]
+            finally:
+                if not settled:
+                    await self._breaker(self.cb.release_probe, ticket)
+
+            revision = bundle_revision(body)
+            for (i, cache_key), result in zip(pending, results):
+                decisions[i] = result
+                if self.cache.enabled:
+                    self.cache.put(cache_key or self.cache.key(inputs[i]), result, revision)
+
+            denied = sum(1 for d in decisions if d != "ALLOW")
+            span.set_attribute("governance.batch_denied", denied)
+            logger.info(f"⚖️ OPA batch | {len(inputs)} inputs ({len(pending)} evaluated) | {denied} not allowed")
+            return decisions
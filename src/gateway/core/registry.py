@@ -0,0 +1,266 @@
+"""
+Gateway Core: Tool Registry
+
+Single source of truth for the gateway's tools. Each tool is registered once at
+import time with a precompiled pydantic argument model; the MCP server and the
+HTTP endpoints both dispatch through the registry, so argument binding, thread
+offloading of synchronous tools and per-tool metrics behave identically on
+every transport.
+
+Side-effecting tools registered with a `lane_key` are serialised per value of
+that argument (see lanes.py); read-only tools never wait on a lane. Read-only
+tools registered with `deduplicate=False` (e.g. ones issuing single-use verdict
+tokens) run once per call even when a batch repeats them.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Optional, Type, get_type_hints
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
+from pydantic import BaseModel, ConfigDict, create_model
+
+from config.settings import Config
+from src.gateway.core.deadline import deadline_scope
+from src.gateway.core.lanes import KeyedExecutionLanes, execution_lanes
+from src.gateway.core.metrics import TOOL_IN_FLIGHT, TOOL_LATENCY, TOOL_QUEUED
+
+logger = logging.getLogger("Gateway.ToolRegistry")
+
+
+class ToolNotFoundError(LookupError):
+    pass
+
+
+class ToolArguments(BaseModel):
+    """Argument model base. Binding dumps one level deep: nested models stay models."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def model_dump_one_level(self) -> Dict[str, Any]:
+        kwargs = {name: getattr(self, name) for name in type(self).model_fields}
+        kwargs.update(self.model_extra or {})
+        return kwargs
+
+
+class OpenToolArguments(ToolArguments):
+    """For tools taking **kwargs: unknown arguments are passed through."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
+
+
+def build_arguments_model(name: str, func: Callable) -> Type[ToolArguments]:
+    """Compiles a function signature into a pydantic model (once, at registration)."""
+    hints = get_type_hints(func)
+    fields = {}
+    accepts_kwargs = False
+
+    for param in inspect.signature(func).parameters.values():
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            accepts_kwargs = True
+            continue
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            continue
+        annotation = hints.get(param.name, Any)
+        if param.default is inspect.Parameter.empty:
+            fields[param.name] = (annotation, ...)
+        else:
+            if param.default is None:
+                annotation = Optional[annotation]
+            fields[param.name] = (annotation, param.default)
+
+    base = OpenToolArguments if accepts_kwargs else ToolArguments
+    return create_model(f"{name}Arguments", __base__=base, **fields)
+
+
+def var_keyword_name(func: Callable) -> Optional[str]:
+    """Name of the function's **kwargs parameter, if it takes one."""
+    return next((
+        param.name for param in inspect.signature(func).parameters.values()
+        if param.kind is inspect.Parameter.VAR_KEYWORD
+    ), None)
+
+
+def mcp_signature(func: Callable, arguments: Type[ToolArguments]) -> inspect.Signature:
+    """
+    The signature FastMCP sees for a tool, taken from its compiled model so both
+    transports bind the same way. FastMCP cannot pass unknown arguments through,
+    so a **kwargs parameter is exposed as an optional object of the same name.
+    """
+    params = [
+        inspect.Parameter(
+            name,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=inspect.Parameter.empty if field.is_required() else field.default,
+            annotation=field.annotation,
+        )
+        for name, field in arguments.model_fields.items()
+    ]
+    var_keyword = var_keyword_name(func)
+    if var_keyword:
+        params.append(inspect.Parameter(
+            var_keyword, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[Dict[str, Any]]
+        ))
+    # The return type decides whether FastMCP reports structured output.
+    return inspect.Signature(params, return_annotation=get_type_hints(func).get("return", inspect.Signature.empty))
+
+
+class _QueuedCall:
+    """Counts a sync call in TOOL_QUEUED until a worker thread picks it up (or it is abandoned)."""
+
+    def __init__(self, tool: str):
+        self.gauge = TOOL_QUEUED.labels(tool)
+        self.lock = threading.Lock()
+        self.waiting = True
+        self.gauge.inc()
+
+    def leave(self):
+        with self.lock:
+            if self.waiting:
+                self.waiting = False
+                self.gauge.dec()
+
+
+@dataclass(frozen=True)
+class RegisteredTool:
+    name: str
+    func: Callable[..., Any]
+    arguments: Type[ToolArguments]
+    read_only: bool
+    is_async: bool
+    # Argument whose value selects the execution lane (None: no serialisation)
+    lane_key: Optional[str] = None
+    # Whether identical calls in one batch may share a single execution
+    deduplicate: bool = True
+
+
+class ToolRegistry:
+    """
+    Maps tool names to their callables. Synchronous tools are run on a bounded
+    thread pool so blocking I/O (yfinance, sync HTTP, sync Redis) never stalls
+    the event loop.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, lanes: Optional[KeyedExecutionLanes] = None):
+        self.tools: Dict[str, RegisteredTool] = {}
+        self.lanes = lanes or execution_lanes
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.TOOL_THREAD_POOL_SIZE,
+            thread_name_prefix="gateway-tool"
+        )
+
+    @property
+    def read_only_tools(self) -> FrozenSet[str]:
+        return frozenset(name for name, tool in self.tools.items() if tool.read_only)
+
+    @property
+    def distinct_tools(self) -> FrozenSet[str]:
+        """Tools whose every call must execute, never de-duplicated in a batch."""
+        return frozenset(name for name, tool in self.tools.items() if not tool.deduplicate)
+
+    def register(
+        self,
+        func: Callable[..., Any],
+        name: Optional[str] = None,
+        read_only: bool = False,
+        lane_key: Optional[str] = None,
+        deduplicate: bool = True
+    ) -> RegisteredTool:
+        name = name or func.__name__
+        if lane_key and read_only:
+            raise ValueError(f"Read-only tool '{name}' cannot take an execution lane")
+        arguments = build_arguments_model(name, func)
+        if lane_key and lane_key not in arguments.model_fields:
+            raise ValueError(f"Tool '{name}' has no argument '{lane_key}' to key its lane on")
+        tool = RegisteredTool(
+            name=name,
+            func=func,
+            arguments=arguments,
+            read_only=read_only,
+            is_async=inspect.iscoroutinefunction(func),
+            lane_key=lane_key,
+            deduplicate=deduplicate,
+        )
+        self.tools[name] = tool
+        return tool
+
+    def tool(self, mcp: FastMCP, read_only: bool = False, lane_key: Optional[str] = None, deduplicate: bool = True):
+        """
+        Decorator: registers the function here and exposes it on the MCP server
+        through an entry point that dispatches back into this registry.
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            tool = self.register(func, read_only=read_only, lane_key=lane_key, deduplicate=deduplicate)
+            var_keyword = var_keyword_name(func)
+
+            async def mcp_entry(**kwargs: Any) -> Any:
+                # FastMCP has already validated kwargs against mcp_signature();
+                # extra arguments arrive as one object and are passed on flat.
+                extra = kwargs.pop(var_keyword, None) if var_keyword else None
+                return await self.invoke(tool, {**(extra or {}), **kwargs})
+
+            functools.update_wrapper(mcp_entry, func)
+            mcp_entry.__signature__ = mcp_signature(func, tool.arguments)
+            mcp.add_tool(mcp_entry, name=tool.name, annotations=ToolAnnotations(readOnlyHint=read_only))
+            return func
+
+        return decorator
+
+    def bind(self, tool: RegisteredTool, params: Dict[str, Any]) -> Dict[str, Any]:
+        return tool.arguments.model_validate(params).model_dump_one_level()
+
+    async def invoke(self, tool: RegisteredTool, kwargs: Dict[str, Any]) -> Any:
+        # MCP calls arrive without a request deadline; HTTP/gRPC callers may already be tighter.
+        with deadline_scope(Config.GATEWAY_REQUEST_DEADLINE_MS):
+            if tool.lane_key is None:
+                return await self._run(tool, kwargs)
+            # One call at a time per key (e.g. per trader account), FIFO.
+            async with self.lanes.hold(str(kwargs.get(tool.lane_key)), tool.name):
+                return await self._run(tool, kwargs)
+
+    async def _run(self, tool: RegisteredTool, kwargs: Dict[str, Any]) -> Any:
+        TOOL_IN_FLIGHT.labels(tool.name).inc()
+        start = time.perf_counter()
+        status = "error"
+        try:
+            if tool.is_async:
+                result = await tool.func(**kwargs)
+            else:
+                loop = asyncio.get_running_loop()
+                queued = _QueuedCall(tool.name)
+
+                def run():
+                    queued.leave()
+                    return tool.func(**kwargs)
+
+                # Carry the trace context into the worker thread.
+                ctx = contextvars.copy_context()
+                try:
+                    result = await loop.run_in_executor(self.executor, ctx.run, run)
+                finally:
+                    queued.leave()
+            status = "success"
+            return result
+        finally:
+            TOOL_IN_FLIGHT.labels(tool.name).dec()
+            TOOL_LATENCY.labels(tool.name, status).observe(time.perf_counter() - start)
+
+    async def dispatch(self, name: str, params: Dict[str, Any]) -> Any:
+        """Validates `params` against the tool's model and invokes it."""
+        tool = self.tools.get(name)
+        if tool is None:
+            raise ToolNotFoundError(f"Tool '{name}' not found")
+        return await self.invoke(tool, self.bind(tool, params))
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global Instance (tools register themselves at import time of the server module)
+tool_registry = ToolRegistry()
@@ -0,0 +1,114 @@
+"""
+Gateway Core: Speculative Generation
+
+Starts the main vLLM generation concurrently with the NeMo input rails instead
+of after them. Generated chunks are held in a buffer and only released once the
+input rails have passed; if a rail blocks, the generation is cancelled and the
+tokens it already produced are counted as wasted work.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from src.gateway.core.metrics import (
+    SPECULATION_CANCELLED_TOKENS,
+    SPECULATION_OUTCOMES,
+    SPECULATION_TIME_SAVED,
+)
+
+logger = logging.getLogger("Gateway.Speculation")
+
+_END = object()
+
+
+class SpeculativeGeneration:
+    """
+    Drains an upstream chunk stream into a buffer from a background task.
+    Exactly one of `commit()` or `cancel()` must be called once the input
+    rails have decided.
+    """
+
+    def __init__(self, source: AsyncIterator[Dict[str, Any]]):
+        self.source = source
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.tokens = 0
+        self.started_at = 0.0
+        self.finished_at: Optional[float] = None
+        self.time_saved_s = 0.0
+        self.outcome: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "SpeculativeGeneration":
+        self.started_at = time.perf_counter()
+        self._task = asyncio.create_task(self._drain())
+        return self
+
+    async def _drain(self):
+        try:
+            async for event in self.source:
+                choices = event.get("choices") or []
+                if choices and choices[0].get("delta", {}).get("content"):
+                    # vLLM emits one token per content delta.
+                    self.tokens += 1
+                usage = event.get("usage")
+                if usage and usage.get("completion_tokens") is not None:
+                    self.tokens = usage["completion_tokens"]
+                await self.queue.put(event)
+            await self.queue.put(_END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self.queue.put(e)
+        finally:
+            self.finished_at = time.perf_counter()
+            await self.source.aclose()
+
+    def commit(self):
+        """Input rails passed: the buffered generation becomes the response."""
+        now = time.perf_counter()
+        end = self.finished_at if self.finished_at is not None else now
+        # Everything generated while the rails were running is latency we did not pay.
+        self.time_saved_s = max(0.0, min(end, now) - self.started_at)
+        self.outcome = "committed"
+        SPECULATION_OUTCOMES.labels("committed").inc()
+        SPECULATION_TIME_SAVED.inc(self.time_saved_s)
+        logger.info(f"⚡ Speculation committed: {self.time_saved_s * 1000:.1f}ms of generation overlapped input rails.")
+
+    async def cancel(self) -> int:
+        """Input rails blocked (or failed): stop generation, return wasted tokens."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.outcome = "cancelled"
+        SPECULATION_OUTCOMES.labels("cancelled").inc()
+        SPECULATION_CANCELLED_TOKENS.inc(self.tokens)
+        logger.info(f"🗑️ Speculation cancelled after {self.tokens} tokens.")
+        return self.tokens
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Replays buffered chunks, then follows the live generation to its end."""
+        try:
+            while True:
+                item = await self.queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if self._task and not self._task.done():
+                self._task.cancel()
+
+    async def text(self) -> str:
+        """Collects the full completion text (non-streaming responses)."""
+        parts = []
+        async for event in self.events():
+            choices = event.get("choices") or []
+            if choices:
+                parts.append(choices[0].get("delta", {}).get("content") or "")
+        return "".join(parts)
@@ -6,7 +6,7 @@ import logging
 import asyncio
 from pydantic import BaseModel, Field
 from src.gateway.core.structs import TradeOrder
-from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+from src.governed_financial_advisor.infrastructure.redis_client import SAFETY_VIOLATION_KEY, redis_client
 from src.governed_financial_advisor.infrastructure.config_manager import config_manager
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ async def execute_trade(order: TradeOrder) -> str:
     CONFIG: Uses ConfigManager for secure key retrieval.
     """
     # --- INTERRUPT CHECK (Module 6) ---
-    violation = redis_client.get("safety_violation")
+    violation = await redis_client.aget(SAFETY_VIOLATION_KEY)
     if violation:
         logger.warning(f"🛑 Trade INTERRUPTED by Safety Monitor: {violation}")
         raise RuntimeError(f"Trade INTERRUPTED by Safety Monitor: {violation}")
@@ -57,7 +57,7 @@ async def execute_trade(order: TradeOrder) -> str:
     # We execute in a thread to avoid blocking asyncio loop with requests
     def _do_post():
         # --- LATE INTERRUPT CHECK (Just before HTTP call) ---
-        latest_violation = redis_client.get("safety_violation")
+        latest_violation = redis_client.get(SAFETY_VIOLATION_KEY)
         if latest_violation:
              raise RuntimeError(f"Trade INTERRUPTED immediately before HTTP call: {latest_violation}")
 
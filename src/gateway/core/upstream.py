@@ -0,0 +1,251 @@
+"""
+Gateway Core: Pooled vLLM Upstream Client
+
+One long-lived `httpx.AsyncClient` per vLLM upstream (fast, reasoning, or the
+unified GKE Inference Gateway), shared by the chat endpoint and the NeMo actions.
+Connections are kept alive across requests, HTTP/2 is negotiated where the `h2`
+package and the upstream support it, and pool saturation / wait / reuse are
+exported as Prometheus metrics.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from config.settings import Config
+from src.gateway.core.admission import Admission, admission_controller, route_for_model
+from src.gateway.core.deadline import check_deadline, timeout_for
+from src.gateway.core.metrics import (
+    UPSTREAM_CONNECTIONS,
+    UPSTREAM_IN_FLIGHT,
+    UPSTREAM_POOL_SATURATION,
+    UPSTREAM_POOL_WAIT,
+    UPSTREAM_REQUEST_LATENCY,
+)
+from src.gateway.core.usage import record_tokens
+from src.governed_financial_advisor.infrastructure.config_manager import config_manager
+
+logger = logging.getLogger("Gateway.Upstream")
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+
+class VLLMUpstreamPool:
+    """
+    Process-wide pool of vLLM HTTP clients, keyed by upstream name.
+    Created in the FastAPI lifespan; lazily started when used outside of it
+    (e.g. by the standalone NeMo server).
+    """
+
+    def __init__(self):
+        self.api_key = config_manager.get("VLLM_API_KEY", "EMPTY")
+        self.default_model = config_manager.get(
+            "GUARDRAILS_MODEL_NAME", "meta-llama/Meta-Llama-3.1-8B-Instruct"
+        ).replace("openai/", "")
+        self.max_connections = Config.VLLM_POOL_MAX_CONNECTIONS
+        self.http2 = Config.VLLM_HTTP2 and HAS_H2
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+        self.slots: Dict[str, asyncio.Semaphore] = {}
+        self.in_flight: Dict[str, int] = {}
+
+    def _upstreams(self) -> Dict[str, str]:
+        # Mode 1: GKE Inference Gateway (Unified Endpoint)
+        if Config.VLLM_GATEWAY_URL:
+            return {"gateway": Config.VLLM_GATEWAY_URL}
+        # Mode 2: Split-Brain (Reasoning / Fast)
+        return {
+            "reasoning": Config.VLLM_REASONING_API_BASE,
+            "fast": Config.VLLM_FAST_API_BASE,
+        }
+
+    async def start(self):
+        if self.clients:
+            return
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=Config.VLLM_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=Config.VLLM_POOL_KEEPALIVE_EXPIRY,
+        )
+        timeout = httpx.Timeout(Config.VLLM_REQUEST_TIMEOUT, connect=5.0)
+
+        for name, base_url in self._upstreams().items():
+            self.clients[name] = httpx.AsyncClient(
+                base_url=base_url.rstrip("/"),
+                limits=limits,
+                timeout=timeout,
+                http2=self.http2,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            self.slots[name] = asyncio.Semaphore(self.max_connections)
+            self.in_flight[name] = 0
+            logger.info(f"🔌 vLLM upstream pool '{name}' -> {base_url} (max={self.max_connections}, http2={self.http2})")
+
+    async def close(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+        self.slots.clear()
+
+    def route(self, model: str) -> str:
+        """Maps a model name to an upstream, mirroring VLLMLLM's routing rule."""
+        return route_for_model(model)
+
+    @asynccontextmanager
+    async def _slot(self, upstream: str, mode: str, admission: Optional[Admission]):
+        """
+        Admits the request (unless the caller already holds an admission for it),
+        then holds one connection slot; measures pool wait and saturation.
+        The admission is released together with the slot.
+        """
+        if admission is None:
+            admission = await admission_controller.acquire(upstream, mode)
+        try:
+            async with self._connection(upstream):
+                yield
+        finally:
+            admission.release()
+
+    @asynccontextmanager
+    async def _connection(self, upstream: str):
+        wait_start = time.perf_counter()
+        async with self.slots[upstream]:
+            UPSTREAM_POOL_WAIT.labels(upstream).observe(time.perf_counter() - wait_start)
+            self.in_flight[upstream] += 1
+            UPSTREAM_IN_FLIGHT.labels(upstream).set(self.in_flight[upstream])
+            UPSTREAM_POOL_SATURATION.labels(upstream).set(self.in_flight[upstream] / self.max_connections)
+            try:
+                yield
+            finally:
+                self.in_flight[upstream] -= 1
+                UPSTREAM_IN_FLIGHT.labels(upstream).set(self.in_flight[upstream])
+                UPSTREAM_POOL_SATURATION.labels(upstream).set(self.in_flight[upstream] / self.max_connections)
+
+    @staticmethod
+    def _connection_tracer(upstream: str):
+        """
+        httpx trace hook: a request that never emits a TCP connect event was
+        served from a kept-alive connection.
+        """
+        state = {"new": False}
+
+        async def trace(event_name: str, info: dict):
+            if event_name == "connection.connect_tcp.started":
+                state["new"] = True
+            elif event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+                UPSTREAM_CONNECTIONS.labels(upstream, "false" if state["new"] else "true").inc()
+
+        return trace
+
+    @staticmethod
+    def _timeout() -> httpx.Timeout:
+        # The request deadline caps the pool's default timeout.
+        return httpx.Timeout(timeout_for(Config.VLLM_REQUEST_TIMEOUT), connect=timeout_for(5.0))
+
+    def _payload(self, messages: List[Dict[str, Any]], model: Optional[str], stream: bool, params: Dict[str, Any]) -> Dict[str, Any]:
+        payload = {"model": model or self.default_model, "messages": messages, "stream": stream}
+        if stream:
+            # vLLM reports the real token counts on a final chunk with empty `choices`.
+            payload["stream_options"] = {"include_usage": True}
+        # Guided decoding and sampling params are forwarded verbatim; vLLM accepts them top-level.
+        payload.update({k: v for k, v in params.items() if v is not None})
+        return payload
+
+    async def chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        mode: str = "chat",
+        admission: Optional[Admission] = None,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Non-streaming chat completion. Returns the raw OpenAI-compatible JSON body.
+        `mode` selects the admission priority class; pass a pre-acquired `admission`
+        to have it released when the call completes instead of admitting again.
+        """
+        await self.start()
+        payload = self._payload(messages, model, False, params)
+        upstream = self.route(payload["model"])
+
+        async with self._slot(upstream, mode, admission):
+            check_deadline(f"vllm.{mode}")
+            start = time.perf_counter()
+            response = await self.clients[upstream].post(
+                "/chat/completions",
+                json=payload,
+                timeout=self._timeout(),
+                extensions={"trace": self._connection_tracer(upstream)},
+            )
+            elapsed = time.perf_counter() - start
+            UPSTREAM_REQUEST_LATENCY.labels(upstream, "false").observe(elapsed)
+            response.raise_for_status()
+            body = response.json()
+            record_tokens(upstream, mode, body.get("usage"), elapsed)
+            return body
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        mode: str = "chat",
+        admission: Optional[Admission] = None,
+        **params: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming chat completion. Yields each parsed `chat.completion.chunk` event.
+        The connection slot is held until the stream is exhausted or closed.
+        """
+        await self.start()
+        payload = self._payload(messages, model, True, params)
+        upstream = self.route(payload["model"])
+
+        async with self._slot(upstream, mode, admission):
+            check_deadline(f"vllm.{mode}")
+            start = time.perf_counter()
+            try:
+                async with self.clients[upstream].stream(
+                    "POST",
+                    "/chat/completions",
+                    json=payload,
+                    timeout=self._timeout(),
+                    extensions={"trace": self._connection_tracer(upstream)},
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            break
+                        event = json.loads(data)
+                        if event.get("usage"):
+                            record_tokens(upstream, mode, event["usage"], time.perf_counter() - start)
+                        yield event
+            finally:
+                UPSTREAM_REQUEST_LATENCY.labels(upstream, "true").observe(time.perf_counter() - start)
+
+    async def complete_text(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        mode: str = "chat",
+        admission: Optional[Admission] = None,
+        **params: Any
+    ) -> str:
+        """Convenience wrapper returning only the first choice's content."""
+        body = await self.chat(messages, model=model, mode=mode, admission=admission, **params)
+        return body["choices"][0]["message"]["content"] or ""
+
+
+# Global Instance (clients are opened in the FastAPI lifespan)
+vllm_pool = VLLMUpstreamPool()
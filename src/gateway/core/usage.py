@@ -0,0 +1,92 @@
+"""
+Gateway Core: Token Usage Accounting
+
+Carries the real token counts reported by vLLM (`usage` on completions, and on
+the final chunk of streams opened with `stream_options.include_usage`) through
+to the chat response and to per-route Prometheus counters.
+
+Each gateway request binds a `TokenUsage` accumulator to a ContextVar; every
+vLLM call made while serving the request (the generation itself, and the NeMo
+self-check calls issued by the rails) adds its usage to it, attributed to
+"generation" or "guardrails" by the call's admission mode.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from src.gateway.core.admission import priority_class
+from src.gateway.core.metrics import UPSTREAM_OUTPUT_TOKEN_RATE, UPSTREAM_TOKENS
+
+SOURCES = ("generation", "guardrails")
+
+
+def usage_source(mode: Optional[str]) -> str:
+    """Rail self-checks run in "governance" mode; everything else is generation."""
+    return "guardrails" if priority_class(mode) == "governance" else "generation"
+
+
+class TokenUsage:
+    """Per-request prompt/completion token totals, split by source."""
+
+    def __init__(self):
+        self.counts = {source: {"prompt_tokens": 0, "completion_tokens": 0} for source in SOURCES}
+
+    def add(self, source: str, prompt_tokens: int, completion_tokens: int):
+        self.counts[source]["prompt_tokens"] += prompt_tokens
+        self.counts[source]["completion_tokens"] += completion_tokens
+
+    def openai_usage(self) -> Dict[str, Any]:
+        """OpenAI `usage` block for the generation, with guardrail spend reported alongside."""
+        generation = self.counts["generation"]
+        guardrails = self.counts["guardrails"]
+        return {
+            "prompt_tokens": generation["prompt_tokens"],
+            "completion_tokens": generation["completion_tokens"],
+            "total_tokens": generation["prompt_tokens"] + generation["completion_tokens"],
+            "guardrails": {
+                "prompt_tokens": guardrails["prompt_tokens"],
+                "completion_tokens": guardrails["completion_tokens"],
+                "total_tokens": guardrails["prompt_tokens"] + guardrails["completion_tokens"],
+            },
+        }
+
+
+_current_usage: ContextVar[Optional[TokenUsage]] = ContextVar("gateway_token_usage", default=None)
+
+
+@contextmanager
+def track_usage(usage: Optional[TokenUsage] = None):
+    """Binds `usage` (or a fresh accumulator) to the current context."""
+    usage = usage or TokenUsage()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+def _field(usage: Any, name: str) -> int:
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return int(value or 0)
+
+
+def record_tokens(route: str, mode: Optional[str], usage: Any, elapsed_s: Optional[float] = None):
+    """
+    Records a vLLM `usage` block (dict or OpenAI/litellm object) against the
+    route's counters and the current request's accumulator, if any.
+    """
+    if not usage:
+        return
+    source = usage_source(mode)
+    prompt_tokens = _field(usage, "prompt_tokens")
+    completion_tokens = _field(usage, "completion_tokens")
+
+    UPSTREAM_TOKENS.labels(route, "prompt", source).inc(prompt_tokens)
+    UPSTREAM_TOKENS.labels(route, "completion", source).inc(completion_tokens)
+    if elapsed_s and completion_tokens:
+        UPSTREAM_OUTPUT_TOKEN_RATE.labels(route).observe(completion_tokens / elapsed_s)
+
+    current = _current_usage.get()
+    if current is not None:
+        current.add(source, prompt_tokens, completion_tokens)
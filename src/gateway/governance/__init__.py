@@ -1,3 +1,3 @@
-from .symbolic_governor import SymbolicGovernor, GovernanceError
+from .symbolic_governor import SymbolicGovernor, GovernanceError, VERIFY_EXHAUSTIVE, VERIFY_SHORT_CIRCUIT
 
-__all__ = ["SymbolicGovernor", "GovernanceError"]
+__all__ = ["SymbolicGovernor", "GovernanceError", "VERIFY_EXHAUSTIVE", "VERIFY_SHORT_CIRCUIT"]
@@ -0,0 +1,321 @@
+"""
+Constraint Compiler
+
+Compiles the `Constraint.logic` strings of the STPA ontology into predicate
+closures, once, at load time. The grammar is a safe subset of Python
+expressions, checked node by node on the AST (nothing is ever `eval`'d):
+
+    names, number/string/bool/None literals, tuples of literals,
+    + - * / %, unary - and not, and/or,
+    == != < <= > >= (chainable), in / not in, is None / is not None
+
+Names resolve to derived facts first (`TradingKnowledgeGraph.facts`, so an
+agent cannot supply its own `has_approval_token`), then to the action's
+parameters. A missing parameter reads as None and numeric strings as numbers.
+Any evaluation error (ordering against None, division by zero, ...) makes the
+predicate fail: constraints fail closed.
+
+Expressions built from numeric comparisons, arithmetic, presence checks and
+boolean logic also get a column form evaluated with NumPy over a whole batch
+(`STPAValidator.validate_batch`), with the same fail-closed semantics.
+"""
+
+import ast
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+Rows = Sequence[dict[str, Any]]
+# A column form returns (values, ok): `ok` is False where the scalar form would raise.
+ColumnFn = Callable[[Rows], tuple[np.ndarray, np.ndarray]]
+
+
+class ConstraintSyntaxError(ValueError):
+    """Raised when constraint logic falls outside the supported grammar."""
+
+
+@dataclass(frozen=True)
+class CompiledPredicate:
+    source: str
+    evaluate: Callable[[dict[str, Any]], Any]
+    evaluate_column: Optional[ColumnFn] = None
+
+    def __call__(self, params: dict[str, Any]) -> bool:
+        """Truth value of the logic for one action; raises if it cannot be evaluated."""
+        return bool(self.evaluate(params))
+
+    def check_batch(self, rows: Rows) -> np.ndarray:
+        """Boolean pass mask over `rows`; rows that cannot be evaluated fail."""
+        if self.evaluate_column is not None:
+            values, ok = self.evaluate_column(rows)
+            return ok & values
+        passed = np.zeros(len(rows), dtype=bool)
+        for i, row in enumerate(rows):
+            try:
+                passed[i] = bool(self.evaluate(row))
+            except Exception:
+                pass
+        return passed
+
+
+class _Expr(NamedTuple):
+    evaluate: Callable[[dict[str, Any]], Any]
+    column: Optional[ColumnFn]
+    kind: Optional[str]  # column dtype, "num" | "bool"; None when there is no column form
+
+
+_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+_ORDERING = (ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+
+def read_param(params: dict[str, Any], name: str) -> Any:
+    value = params.get(name)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def numeric_column(rows: Rows, key: str, default: float = np.nan) -> np.ndarray:
+    """`float(row.get(key, default))` for every row; unparseable values become NaN."""
+    column = np.full(len(rows), np.nan)
+    for i, row in enumerate(rows):
+        try:
+            column[i] = float(row.get(key, default))
+        except (TypeError, ValueError):
+            pass
+    return column
+
+
+def compile_facts(facts: dict[str, str]) -> dict[str, _Expr]:
+    """Compiles derived facts in order; a fact may use the facts defined before it."""
+    compiled: dict[str, _Expr] = {}
+    for name, source in facts.items():
+        compiled[name] = _Compiler(source, compiled).compile()
+    return compiled
+
+
+def compile_constraint(source: str, facts: Optional[dict[str, _Expr]] = None) -> CompiledPredicate:
+    expr = _Compiler(source, facts or {}).compile()
+    column = expr.column if expr.kind == "bool" else None
+    return CompiledPredicate(source=source, evaluate=expr.evaluate, evaluate_column=column)
+
+
+class _Compiler:
+    def __init__(self, source: str, facts: dict[str, _Expr]):
+        self.source = source
+        self.facts = facts
+
+    def compile(self) -> _Expr:
+        try:
+            tree = ast.parse(self.source, mode="eval")
+        except SyntaxError as e:
+            raise ConstraintSyntaxError(f"Invalid constraint logic {self.source!r}: {e.msg}") from e
+        return self.visit(tree.body)
+
+    def visit(self, node: ast.AST) -> _Expr:
+        handler = getattr(self, f"visit_{type(node).__name__}", None)
+        if handler is None:
+            raise ConstraintSyntaxError(f"{type(node).__name__} is not allowed in constraint logic: {self.source!r}")
+        return handler(node)
+
+    def visit_Constant(self, node: ast.Constant) -> _Expr:
+        value = node.value
+        if isinstance(value, bool):
+            kind, dtype = "bool", bool
+        elif isinstance(value, (int, float)):
+            kind, dtype = "num", float
+        elif isinstance(value, str) or value is None:
+            return _Expr(lambda params: value, None, None)
+        else:
+            raise ConstraintSyntaxError(f"Unsupported literal {value!r} in constraint logic: {self.source!r}")
+
+        def column(rows):
+            return np.full(len(rows), value, dtype=dtype), np.ones(len(rows), dtype=bool)
+
+        return _Expr(lambda params: value, column, kind)
+
+    def visit_Tuple(self, node: ast.Tuple) -> _Expr:
+        if not all(isinstance(elt, ast.Constant) for elt in node.elts):
+            raise ConstraintSyntaxError(f"Only literals are allowed in collections: {self.source!r}")
+        values = tuple(elt.value for elt in node.elts)
+        return _Expr(lambda params: values, None, None)
+
+    visit_List = visit_Tuple
+
+    def visit_Name(self, node: ast.Name) -> _Expr:
+        name = node.id
+        if name in self.facts:
+            return self.facts[name]
+
+        def column(rows):
+            return numeric_column(rows, name), np.ones(len(rows), dtype=bool)
+
+        return _Expr(lambda params: read_param(params, name), column, "num")
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> _Expr:
+        operand = self.visit(node.operand)
+        evaluate = operand.evaluate
+        if isinstance(node.op, ast.Not):
+            column = None
+            if operand.kind == "bool":
+                def column(rows):
+                    values, ok = operand.column(rows)
+                    return ~values, ok
+            return _Expr(lambda params: not evaluate(params), column, "bool" if column else None)
+        if isinstance(node.op, ast.USub):
+            column = None
+            if operand.kind == "num":
+                def column(rows):
+                    values, ok = operand.column(rows)
+                    return -values, ok & ~np.isnan(values)
+            return _Expr(lambda params: -evaluate(params), column, "num" if column else None)
+        raise ConstraintSyntaxError(f"{type(node.op).__name__} is not allowed in constraint logic: {self.source!r}")
+
+    def visit_BinOp(self, node: ast.BinOp) -> _Expr:
+        op = _ARITHMETIC.get(type(node.op))
+        if op is None:
+            raise ConstraintSyntaxError(f"{type(node.op).__name__} is not allowed in constraint logic: {self.source!r}")
+        left, right = self.visit(node.left), self.visit(node.right)
+        left_eval, right_eval = left.evaluate, right.evaluate
+
+        def evaluate(params):
+            return op(left_eval(params), right_eval(params))
+
+        column = None
+        if left.kind == right.kind == "num":
+            guard_zero = isinstance(node.op, (ast.Div, ast.Mod))
+
+            def column(rows):
+                (lv, lok), (rv, rok) = left.column(rows), right.column(rows)
+                ok = lok & rok & ~np.isnan(lv) & ~np.isnan(rv)
+                if guard_zero:
+                    ok &= rv != 0
+                with np.errstate(all="ignore"):
+                    return op(lv, rv), ok
+
+        return _Expr(evaluate, column, "num" if column else None)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> _Expr:
+        operands = [self.visit(value) for value in node.values]
+        evaluators = [o.evaluate for o in operands]
+        is_and = isinstance(node.op, ast.And)
+
+        def evaluate(params):
+            value = None
+            for operand in evaluators:
+                value = operand(params)
+                if bool(value) != is_and:
+                    return value
+            return value
+
+        column = None
+        if all(o.kind == "bool" for o in operands):
+            def column(rows):
+                values, ok = operands[0].column(rows)
+                for operand in operands[1:]:
+                    more, more_ok = operand.column(rows)
+                    # Short-circuit: once decided, later errors do not matter.
+                    decided = ~values if is_and else values
+                    ok = ok & (decided | more_ok)
+                    values = (values & more) if is_and else (values | more)
+                return values, ok
+
+        return _Expr(evaluate, column, "bool" if column else None)
+
+    def visit_Compare(self, node: ast.Compare) -> _Expr:
+        nodes = [node.left, *node.comparators]
+        operands = [self.visit(n) for n in nodes]
+        pairs = []
+        for i, op_node in enumerate(node.ops):
+            if isinstance(op_node, (ast.Is, ast.IsNot)) and not self._is_none(nodes[i + 1]):
+                raise ConstraintSyntaxError(f"'is' may only compare against None: {self.source!r}")
+            pairs.append((_COMPARISONS[type(op_node)], self._compare_column(op_node, nodes[i], nodes[i + 1], operands[i], operands[i + 1])))
+        evaluators = [o.evaluate for o in operands]
+        ops = [op for op, _ in pairs]
+
+        def evaluate(params):
+            left = evaluators[0](params)
+            for op, right_eval in zip(ops, evaluators[1:]):
+                right = right_eval(params)
+                if not op(left, right):
+                    return False
+                left = right
+            return True
+
+        column = None
+        if all(c is not None for _, c in pairs):
+            columns = [c for _, c in pairs]
+
+            def column(rows):
+                values, ok = columns[0](rows)
+                for pair in columns[1:]:
+                    more, more_ok = pair(rows)
+                    ok = ok & (~values | more_ok)
+                    values = values & more
+                return values, ok
+
+        return _Expr(evaluate, column, "bool" if column else None)
+
+    def _compare_column(self, op_node, left_node, right_node, left: _Expr, right: _Expr) -> Optional[ColumnFn]:
+        op = _COMPARISONS[type(op_node)]
+        if isinstance(op_node, (ast.Is, ast.IsNot)):
+            # Presence check on a raw parameter.
+            if not isinstance(left_node, ast.Name) or left_node.id in self.facts:
+                return None
+            name, present = left_node.id, isinstance(op_node, ast.IsNot)
+
+            def column(rows):
+                values = np.fromiter((row.get(name) is not None for row in rows), dtype=bool, count=len(rows))
+                return (values if present else ~values), np.ones(len(rows), dtype=bool)
+            return column
+
+        if left.kind is None or right.kind is None:
+            return None
+        if isinstance(op_node, _ORDERING):
+            if left.kind != "num" or right.kind != "num":
+                return None
+
+            def column(rows):
+                (lv, lok), (rv, rok) = left.column(rows), right.column(rows)
+                with np.errstate(invalid="ignore"):
+                    return op(lv, rv), lok & rok & ~np.isnan(lv) & ~np.isnan(rv)
+            return column
+
+        if isinstance(op_node, (ast.Eq, ast.NotEq)):
+            # Equality never raises; against a literal, NaN (missing) compares like None would.
+            if not (isinstance(left_node, ast.Constant) or isinstance(right_node, ast.Constant)):
+                return None
+
+            def column(rows):
+                (lv, lok), (rv, rok) = left.column(rows), right.column(rows)
+                return op(lv, rv), lok & rok
+            return column
+
+        return None
+
+    @staticmethod
+    def _is_none(node: ast.AST) -> bool:
+        return isinstance(node, ast.Constant) and node.value is None
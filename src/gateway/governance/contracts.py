@@ -18,12 +18,14 @@ This module defines the interfaces that the Gateway expects for governance compo
 decoupling the Gateway from the specific application implementations.
 """
 
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
 class SafetyFilter(Protocol):
     """
     Protocol for a Control Barrier Function or similar safety filter.
     Enforces hard constraints on actions (e.g. bankruptcy prevention).
+    An implementation may also provide `async averify_action` (same contract
+    as `verify_action`); the governor awaits it instead of using a thread.
     """
     def verify_action(self, action_name: str, payload: Dict[str, Any]) -> str:
         """
@@ -32,6 +34,48 @@ class SafetyFilter(Protocol):
         """
         ...
 
+    def verify_batch(
+        self,
+        action_name: str,
+        payloads: Sequence[Dict[str, Any]],
+        active: Optional[Sequence[bool]] = None,
+        reserve: Optional[Sequence[bool]] = None
+    ) -> List[Optional[str]]:
+        """
+        Verifies an ordered set of actions, each against the state left by the
+        earlier ones that pass (among `reserve`). Returns one `verify_action`-style
+        result per action (None for inactive ones).
+        """
+        ...
+
+    def state_version(self) -> str:
+        """
+        Identifies the state `verify_action` reads; a verdict issued against one
+        version is not reused once it changes.
+        """
+        ...
+
+    def reserve(self, action_name: str, payload: Dict[str, Any], ttl_s: Optional[float] = None) -> Tuple[str, Optional[str]]:
+        """
+        Verifies the action and, if safe, atomically holds its cost against the
+        shared state. Returns the `verify_action`-style result and a reservation
+        id (None if nothing was held) that expires after `ttl_s`.
+        """
+        ...
+
+    def commit(self, reservation_id: str, cost: Optional[float] = None) -> bool:
+        """
+        Makes a reservation permanent after the action executed (`cost` is
+        deducted again if the reservation already expired).
+        """
+        ...
+
+    def release(self, reservation_id: str) -> bool:
+        """
+        Returns a reservation's hold (the action did not go ahead).
+        """
+        ...
+
     def update_state(self, cost: float) -> None:
         """
         Updates the safety state (e.g. deducts cash).
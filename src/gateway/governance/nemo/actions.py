@@ -52,8 +52,8 @@ async def CheckDrawdownLimitAction(context: dict[str, Any] = {}, event: dict[str
     Checks if system is healthy enough to trade.
     """
     amount = context.get("amount", 0.0)
-    # CBF Check via SafetyFilter
-    result = symbolic_governor.safety_filter.verify_action("execute_trade", {"amount": amount})
+    # CBF Check via SafetyFilter (awaited Redis read: the action runs on the event loop)
+    result = await symbolic_governor.safety_filter.averify_action("execute_trade", {"amount": amount})
 
     if result.startswith("UNSAFE"):
         logger.warning(f"🛡️ NeMo Action BLOCKED: CheckDrawdownLimitAction - {result}")
@@ -68,7 +68,7 @@ async def CheckSlippageRiskAction(context: dict[str, Any] = {}, event: dict[str,
     """
     amount = context.get("amount", 0.0)
     # SafetyFilter handles both Drawdown and Slippage
-    result = symbolic_governor.safety_filter.verify_action("execute_trade", {"amount": amount})
+    result = await symbolic_governor.safety_filter.averify_action("execute_trade", {"amount": amount})
 
     if result.startswith("UNSAFE"):
         logger.warning(f"🛡️ NeMo Action BLOCKED: CheckSlippageRiskAction - {result}")
@@ -104,16 +104,12 @@ async def InvokeVllmFallbackAction(context: dict = {}, events: list = [], conten
             
         logger.info(f"DEBUG: Executing InvokeVllmFallbackAction with content='{final_content}'")
         
-        # Restore actual VLLM call for fallback
-        from src.gateway.governance.nemo.vllm_client import VLLMLLM
-        from langchain_core.messages import HumanMessage
+        # Shared, long-lived upstream client (opened in the gateway lifespan)
+        from src.gateway.core.upstream import vllm_pool
 
-        llm = VLLMLLM()
-        # Create a simple message list
-        messages = [HumanMessage(content=final_content)]
-        
-        # Use _acall (or _agenerate) directly
-        response = await llm._acall(messages)
+        # Governance mode: runs on the slot the chat request already holds instead of
+        # queueing behind it for a second one.
+        response = await vllm_pool.complete_text([{"role": "user", "content": final_content}], mode="governance")
         
         print(f"DEBUG: InvokeVllmFallbackAction returning response length={len(response)}")
         return response
@@ -4,6 +4,7 @@ Factory for creating NeMo Guardrails manager with vLLM/Llama support.
 """
 import logging
 import os
+from functools import lru_cache
 from typing import Any, List, Optional, AsyncIterator
 import json
 
@@ -44,7 +45,8 @@ try:
                 return []
             return super().analyze(text=text, **kwargs)
 
-    def _get_analyzer_patch(score_threshold: float = 0.4):
+    @lru_cache(maxsize=1)
+    def _get_nlp_engine():
         try:
             import spacy
             if not spacy.util.is_package("en_core_web_lg"):
@@ -57,8 +59,17 @@ try:
             "models": [{"lang_code": "en", "model_name": "en_core_web_lg"}],
         }
         provider = NlpEngineProvider(nlp_configuration=configuration)
-        nlp_engine = provider.create_engine()
-        return SafeAnalyzer(nlp_engine=nlp_engine, default_score_threshold=score_threshold)
+        return provider.create_engine()
+
+    @lru_cache
+    def _build_analyzer(score_threshold: float):
+        # One spaCy model shared by every threshold's analyzer.
+        return SafeAnalyzer(nlp_engine=_get_nlp_engine(), default_score_threshold=score_threshold)
+
+    def _get_analyzer_patch(score_threshold: float = 0.4):
+        # Cached like NeMo's own _get_analyzer (normalised so positional and
+        # keyword calls hit the same entry); loading en_core_web_lg per call is seconds.
+        return _build_analyzer(float(score_threshold))
 
     sdd_actions._get_analyzer = _get_analyzer_patch
     logger.info("✅ Monkeypatched NeMo Sensitive Data Detection to use SafeAnalyzer + en_core_web_lg")
@@ -192,6 +203,30 @@ def initialize_rails() -> LLMRails:
     """Wrapper for unified gateway."""
     return create_nemo_manager()
 
+def warm_shared_resources(rails: LLMRails) -> None:
+    """
+    Eagerly builds the read-only resources NeMo otherwise loads on first use
+    (Presidio analyzers backed by en_core_web_lg). Called in the gunicorn master
+    before fork so all workers share the model pages copy-on-write.
+    """
+    try:
+        from nemoguardrails.library.sensitive_data_detection import actions as sdd_actions
+    except ImportError as e:
+        logger.warning(f"⚠️ Sensitive data detection unavailable, nothing to warm: {e}")
+        return
+
+    sdd_config = rails.config.rails.config.sensitive_data_detection
+    # mask_sensitive_data always uses the default threshold; detection uses the configured ones.
+    thresholds = {0.4}
+    for source in ("input", "output", "retrieval"):
+        options = getattr(sdd_config, source, None)
+        if options is not None and options.entities:
+            thresholds.add(options.score_threshold)
+
+    for threshold in sorted(thresholds):
+        sdd_actions._get_analyzer(score_threshold=threshold)
+    logger.info(f"✅ Warmed PII analyzers for thresholds {sorted(thresholds)}")
+
 async def validate_with_nemo(user_input: str, rails: LLMRails) -> tuple[bool, str]:
     """
     Validates user input using NeMo Guardrails.
@@ -0,0 +1,105 @@
+"""
+Sliding-window output rails for token streaming.
+
+The gateway streams vLLM tokens to the client as they arrive, but output rails
+(PII masking, unsafe-dialogue checks) still have to see every byte before it
+leaves the process. `StreamingOutputRails` buffers incoming chunks into windows,
+runs the rail check over each window (plus a tail of already-flushed text for
+context) and only then releases the window. A blocking verdict stops the stream
+before the offending span is ever flushed.
+"""
+
+import logging
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+logger = logging.getLogger("NeMo.StreamRails")
+
+# (checked_text) -> (rewritten_text, blocked)
+RailCheck = Callable[[str], Awaitable[Tuple[str, bool]]]
+
+
+class StreamingOutputRails:
+    """
+    Buffers streamed chunks and releases them window by window after the
+    output rails have approved (or rewritten) them.
+
+    Windows are cut at the last whitespace once `window_chars` have accumulated,
+    so single-token entities (emails, SSNs, card numbers) are never split across
+    two rail checks. The last `context_chars` of flushed text are prepended to
+    each check so conversational rails keep some context; they are stripped from
+    the rail output again before flushing.
+    """
+
+    def __init__(self, check: RailCheck, window_chars: int = 256, context_chars: int = 64):
+        self.check = check
+        self.window_chars = max(1, window_chars)
+        self.context_chars = max(0, context_chars)
+        self.pending = ""
+        self.flushed = ""
+        self.blocked = False
+        self.refusal = ""
+        self.window_latencies_ms: List[float] = []
+
+    async def feed(self, chunk: str) -> List[str]:
+        """
+        Adds a chunk to the buffer. Returns the text that is safe to flush now.
+        """
+        if self.blocked or not chunk:
+            return []
+
+        self.pending += chunk
+        if len(self.pending) < self.window_chars:
+            return []
+
+        cut = max(self.pending.rfind(" "), self.pending.rfind("\n"))
+        if cut <= 0:
+            # No whitespace yet; wait for more text unless the buffer is runaway.
+            if len(self.pending) < self.window_chars * 4:
+                return []
+            cut = len(self.pending) - 1
+
+        window, self.pending = self.pending[:cut + 1], self.pending[cut + 1:]
+        return await self._check_window(window)
+
+    async def close(self) -> List[str]:
+        """
+        Checks and flushes whatever is left in the buffer at end of stream.
+        """
+        if self.blocked or not self.pending:
+            return []
+        window, self.pending = self.pending, ""
+        return await self._check_window(window)
+
+    async def _check_window(self, window: str) -> List[str]:
+        context = self.flushed[-self.context_chars:] if self.context_chars else ""
+
+        start = time.perf_counter()
+        checked, blocked = await self._run_check(context + window)
+        if not blocked and checked and not checked.startswith(context):
+            # The rail rewrote part of the context we already flushed (an entity
+            # straddling the boundary). Re-check the new window on its own so we
+            # release exactly the rewritten window and nothing else.
+            logger.info("Output rails rewrote stream context; re-checking window alone.")
+            context = ""
+            checked, blocked = await self._run_check(window)
+        self.window_latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        if blocked:
+            logger.warning("🛡️ Output rails BLOCKED stream window; terminating stream.")
+            self.blocked = True
+            self.refusal = checked
+            self.pending = ""
+            return []
+
+        released = checked[len(context):] if checked else window
+        self.flushed += released
+        return [released] if released else []
+
+    async def _run_check(self, text: str) -> Tuple[str, bool]:
+        try:
+            return await self.check(text)
+        except Exception as e:
+            # Fail closed: an output rail we cannot run is treated as a block.
+            logger.error(f"Output rail check failed on stream window: {e}")
+            return "I apologize, but I cannot provide that response.", True
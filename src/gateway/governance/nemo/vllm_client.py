@@ -8,17 +8,23 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage, AIMessageChunk, AIMessage
 from langchain_core.outputs import ChatGenerationChunk, ChatResult, ChatGeneration
 
+from src.gateway.core.upstream import vllm_pool
 from src.governed_financial_advisor.infrastructure.config_manager import config_manager
 
 # Configure Logging
 logger = logging.getLogger("NeMo.LLM")
 
 class VLLMLLM(BaseChatModel):
-    """Custom LangChain-compatible wrapper for vLLM using LiteLLM."""
+    """
+    Custom LangChain-compatible wrapper for vLLM. Async calls (what NeMo uses)
+    go through the shared `vllm_pool`; the sync path still uses LiteLLM.
+    """
 
     model_name: str = config_manager.get("GUARDRAILS_MODEL_NAME", "meta-llama/Meta-Llama-3.1-8B-Instruct")
     api_base: str = config_manager.get("VLLM_BASE_URL", "http://localhost:8000/v1")
     api_key: str = config_manager.get("VLLM_API_KEY", "EMPTY")
+    # Admission priority class: rail self-checks are governance traffic and jump the queue.
+    mode: str = "governance"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -28,6 +34,20 @@ class VLLMLLM(BaseChatModel):
     def _llm_type(self) -> str:
         return "vllm"
 
+    def _resolve_api_base(self, model_id: str) -> str:
+        """Routes reasoning models to the reasoning service and everything else to the fast one."""
+        if "deepseek" in model_id.lower() or "reasoning" in model_id.lower():
+            reasoning_base = config_manager.get("VLLM_REASONING_API_BASE")
+            if reasoning_base:
+                logger.debug(f"Routing to Reasoning Service: {reasoning_base}")
+                return reasoning_base
+        else:
+            fast_base = config_manager.get("VLLM_FAST_API_BASE")
+            if fast_base:
+                logger.debug(f"Routing to Fast/Governance Service: {fast_base}")
+                return fast_base
+        return self.api_base
+
     def _generate(self, messages: List[BaseMessage], stop: list[str] | None = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
         """Call the vLLM model via LiteLLM."""
         try:
@@ -39,17 +59,7 @@ class VLLMLLM(BaseChatModel):
             model_id = self.model_name
             
             # Dynamic Routing Logic
-            api_base = self.api_base
-            if "deepseek" in model_id.lower() or "reasoning" in model_id.lower():
-                reasoning_base = config_manager.get("VLLM_REASONING_API_BASE")
-                if reasoning_base:
-                    api_base = reasoning_base
-                    print(f"DEBUG: Routing to Reasoning Service: {api_base}")
-            else:
-                 fast_base = config_manager.get("VLLM_FAST_API_BASE")
-                 if fast_base:
-                     api_base = fast_base
-                     print(f"DEBUG: Routing to Fast/Governance Service: {api_base}")
+            api_base = self._resolve_api_base(model_id)
 
             print(f"DEBUG: Calling vLLM via litellm... model={model_id} base={api_base}")
             
@@ -85,83 +95,38 @@ class VLLMLLM(BaseChatModel):
         return result.generations[0].message.content
 
     async def _agenerate(self, messages: List[BaseMessage], stop: list[str] | None = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
-        """Async call to the vLLM model via LiteLLM."""
-        try:
-            import litellm
-            
-            model_id = self.model_name.replace("openai/", "")
-            
-            model_id = self.model_name.replace("openai/", "")
-            
-            print(f"DEBUG: VLLMLLM using model_id='{model_id}' (original='{self.model_name}')")
-
-            # Dynamic Routing Logic (Async)
-            api_base = self.api_base
-            if "deepseek" in model_id.lower() or "reasoning" in model_id.lower():
-                reasoning_base = config_manager.get("VLLM_REASONING_API_BASE")
-                if reasoning_base:
-                    api_base = reasoning_base
-                    print(f"DEBUG: Routing to Reasoning Service: {api_base}")
-            else:
-                 fast_base = config_manager.get("VLLM_FAST_API_BASE")
-                 if fast_base:
-                     api_base = fast_base
-                     print(f"DEBUG: Routing to Fast/Governance Service: {api_base}")
-
-            print(f"DEBUG: Async Calling vLLM via litellm... model={model_id} base={api_base}")
-            print(f"DEBUG: vLLM Request Messages: {json.dumps([{'role': m.type if m.type != 'ai' else 'assistant', 'content': m.content} for m in messages])}")
-            
-            formatted_messages = [{"role": m.type if m.type != "ai" else "assistant", "content": m.content} for m in messages]
-            for m in formatted_messages:
-                if m["role"] == "human": m["role"] = "user"
+        """Async call to the vLLM model through the gateway's pooled upstream client."""
+        model_id = self.model_name.replace("openai/", "")
+        print(f"DEBUG: VLLMLLM using model_id='{model_id}' (original='{self.model_name}')")
 
-            try:
-                response = await litellm.acompletion(
-                    model=model_id,
-                    custom_llm_provider="openai",
-                    api_base=api_base,
-                    api_key=self.api_key,
-                    messages=formatted_messages,
-                    stop=stop,
-                    **kwargs
-                )
-                content = response.choices[0].message.content
-                print(f"DEBUG: vLLM Response Content: {content[:100]}...")
-                return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
-            except Exception as e:
-                print(f"❌ Failed to call vLLM (async): {e}")
-                raise e
+        formatted_messages = self._format_messages(messages)
+        print(f"DEBUG: vLLM Request Messages: {json.dumps(formatted_messages)}")
+
+        try:
+            # The pool admits the call (or nests it on the request's bound slot),
+            # applies the deadline and records the self-check tokens as "guardrails".
+            content = await vllm_pool.complete_text(
+                formatted_messages, model=model_id, mode=self.mode, stop=stop, **kwargs
+            )
         except Exception as e:
-            logger.error(f"❌ Failed to initialize/call vLLM: {e}")
+            logger.error(f"❌ Failed to call vLLM (async): {e}")
             raise e
+        print(f"DEBUG: vLLM Response Content: {content[:100]}...")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
 
     async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
         """
         Enables Optimistic Streaming for NeMo Guardrails.
         """
-        import litellm
-
-        model_id = self.model_name
-        if not model_id.startswith("gs://") and not model_id.startswith("openai/") and "gpt" not in model_id:
-            model_id = f"openai/{model_id}"
-
-        formatted_messages = [{"role": m.type if m.type != "ai" else "assistant", "content": m.content} for m in messages]
-        for m in formatted_messages:
-            if m["role"] == "human": m["role"] = "user"
-
-        # Use litellm with stream=True
-        stream = await litellm.acompletion(
-            model=model_id,
-            messages=formatted_messages,
-            api_base=self.api_base,
-            api_key=self.api_key,
-            stream=True,
-            stop=stop,
-            **kwargs
+        # Same pool and routing as _agenerate; the admission slot is held for the whole stream.
+        model_id = self.model_name.replace("openai/", "")
+        stream = vllm_pool.stream_chat(
+            self._format_messages(messages), model=model_id, mode=self.mode, stop=stop, **kwargs
         )
-
-        async for chunk in stream:
-            content = chunk.choices[0].delta.content
+        async for event in stream:
+            if not event.get("choices"):
+                continue
+            content = event["choices"][0].get("delta", {}).get("content")
             if content:
                 # Yield it as a LangChain Chunk for NeMo
                 yield ChatGenerationChunk(message=AIMessageChunk(content=content))
@@ -169,6 +134,12 @@ class VLLMLLM(BaseChatModel):
                 if run_manager:
                     await run_manager.on_llm_new_token(content)
 
+    @staticmethod
+    def _format_messages(messages: List[BaseMessage]) -> List[dict]:
+        # BaseMessage types are 'human', 'ai', 'system'; the OpenAI roles are 'user' and 'assistant'.
+        roles = {"human": "user", "ai": "assistant"}
+        return [{"role": roles.get(m.type, m.type), "content": m.content} for m in messages]
+
     @property
     def _identifying_params(self) -> dict:
         return {"model": self.model_name, "api_base": self.api_base}
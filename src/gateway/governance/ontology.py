@@ -1,8 +1,17 @@
+import hashlib
 import logging
 from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import yaml
 
 logger = logging.getLogger("Gateway.Governance.Ontology")
 
+
+class OntologyError(ValueError):
+    """Raised when a STAMP ontology specification cannot be loaded."""
+
+
 @dataclass
 class Constraint:
     """
@@ -10,7 +19,7 @@ class Constraint:
     """
     id: str
     description: str
-    logic: str  # Simplified representation of the logic (e.g., "cash_balance > 1000")
+    logic: str  # Expression over action parameters and facts (e.g., "cash_balance > 1000"); see constraint_compiler
     scope: list[str] = field(default_factory=list) # e.g., ["execute_trade", "withdraw"]
 
 @dataclass
@@ -28,96 +37,74 @@ class STAMP_UCA:
 @dataclass
 class TradingKnowledgeGraph:
     """
-    Ontology mapping STAMP UCAs to constraints.
+    Ontology mapping STAMP UCAs to constraints, loaded from a STAMP YAML specification.
+    Facts are named expressions derived from the action parameters, usable in constraint logic.
     """
     ucas: dict[str, STAMP_UCA] = field(default_factory=dict)
     constraints: dict[str, Constraint] = field(default_factory=dict)
+    facts: dict[str, str] = field(default_factory=dict)
+    version: str = ""
+    # action -> constraints in scope, maintained by add_constraint
+    _by_action: dict[str, list[Constraint]] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self):
-        # 1. Map STAMP UCAs (From STPA Analysis)
-
-        # UCA-1: Not Providing Authorization
-        self.add_uca(STAMP_UCA(
-            id="UCA-1",
-            category="Unsafe Action",
-            description="Agent executes write operation without approval token.",
-            hazard_link="H-1",
-            detection_pattern="action='write_db' AND approval_token IS NULL"
-        ))
-
-        # UCA-2: Wrong Timing (Latency)
-        self.add_uca(STAMP_UCA(
-            id="UCA-2",
-            category="Wrong Timing",
-            description="Agent executes trade with stale market data (>200ms latency).",
-            hazard_link="H-2",
-            detection_pattern="action='execute_trade' AND latency_ms > 200"
-        ))
-
-        # UCA-3: Unsafe Action (PII Leak)
-        self.add_uca(STAMP_UCA(
-            id="UCA-3",
-            category="Unsafe Action",
-            description="Agent outputs PII to user interface.",
-            hazard_link="H-3",
-            detection_pattern="output_contains_pii=True"
-        ))
-
-        # UCA-4: Stopped Too Soon (Partial Transaction)
-        self.add_uca(STAMP_UCA(
-            id="UCA-4",
-            category="Stopped Too Soon",
-            description="Agent debits account but fails to credit asset (Atomic Failure).",
-            hazard_link="H-2",
-            detection_pattern="span='debit' AND NOT span='credit'"
-        ))
-
-        # --- SPECIFIC FINANCIAL UCAS ---
-        self.add_uca(STAMP_UCA(
-            id="UCA-5",
-            category="Unsafe Action",
-            description="Agent executes buy_order when daily_drawdown > 4.5%.",
-            hazard_link="H-Drawdown: Insolvency",
-            detection_pattern="drawdown > 4.5"
-        ))
-        self.add_uca(STAMP_UCA(
-            id="UCA-6",
-            category="Wrong Order",
-            description="Agent submits market_order > 1% of daily volume (Slippage).",
-            hazard_link="H-Slippage: Liquidity Risk",
-            detection_pattern="order_size > 0.01 * daily_vol"
-        ))
-
-        # 2. Map Symbolic Constraints (For Logic Engine)
-        self.add_constraint(Constraint(
-            id="SC-1",
-            description="The Agent must never execute a write operation to the Production Database without a signed approval token.",
-            logic="has_approval_token == True",
-            scope=["write_db", "delete_db", "execute_trade"]
-        ))
-        self.add_constraint(Constraint(
-            id="FIN-1",
-            description="Cannot sell more than 10% of portfolio without explicit confirmation.",
-            logic="sell_percentage <= 0.10",
-            scope=["execute_sell"]
-        ))
-
-        # New: Map executing trades to constraints (for the SymbolicGovernor)
-        self.add_constraint(Constraint(
-            id="FIN-2",
-            description="Agent must not execute trade if latency > 200ms",
-            logic="latency_ms <= 200",
-            scope=["execute_trade"]
-        ))
+        for constraint in list(self.constraints.values()):
+            self.add_constraint(constraint)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], version: Optional[str] = None) -> "TradingKnowledgeGraph":
+        """
+        Builds the ontology from a STAMP specification (see stpa_ontology.yaml):
+        `ucas` and `constraints` lists and a `facts` mapping.
+        """
+        if not isinstance(data, dict):
+            raise OntologyError("Ontology must be a mapping with 'ucas', 'facts' and 'constraints'.")
+        graph = cls(version=version or str(data.get("version", "")))
+        try:
+            for uca in data.get("ucas") or []:
+                graph.add_uca(STAMP_UCA(**uca))
+            for name, logic in (data.get("facts") or {}).items():
+                graph.add_fact(name, str(logic))
+            for constraint in data.get("constraints") or []:
+                constraint = Constraint(**constraint)
+                if not isinstance(constraint.scope, list):
+                    raise OntologyError(f"Constraint {constraint.id}: scope must be a list of actions")
+                if constraint.id in graph.constraints:
+                    raise OntologyError(f"Duplicate constraint id {constraint.id}")
+                graph.add_constraint(constraint)
+        except TypeError as e:
+            raise OntologyError(f"Malformed ontology entry: {e}") from e
+        return graph
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "TradingKnowledgeGraph":
+        """Loads a STAMP YAML file; the version is the spec's `version` plus a content hash."""
+        with open(path, "rb") as f:
+            content = f.read()
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise OntologyError(f"Invalid ontology YAML in {path}: {e}") from e
+        spec_version = data.get("version", "") if isinstance(data, dict) else ""
+        return cls.from_dict(data, version=f"{spec_version}+{hashlib.sha256(content).hexdigest()[:12]}")
 
     def add_uca(self, uca: STAMP_UCA):
         self.ucas[uca.id] = uca
 
+    def add_fact(self, name: str, logic: str):
+        self.facts[name] = logic
+
     def add_constraint(self, constraint: Constraint):
+        previous = self.constraints.get(constraint.id)
+        if previous is not None:
+            for action in previous.scope:
+                self._by_action[action] = [c for c in self._by_action.get(action, []) if c.id != constraint.id]
         self.constraints[constraint.id] = constraint
+        for action in constraint.scope:
+            self._by_action.setdefault(action, []).append(constraint)
 
     def get_rubric(self) -> list[STAMP_UCA]:
         return list(self.ucas.values())
 
     def get_constraints_for_action(self, action_name: str) -> list[Constraint]:
-        return [c for c in self.constraints.values() if action_name in c.scope]
+        return list(self._by_action.get(action_name, ()))
@@ -0,0 +1,127 @@
+"""
+STPA Ontology Hot Reload
+
+Reloads the STAMP YAML ontology into an `STPAValidator` without a restart.
+A reload is triggered by a change to the file (polled every
+`STPA_ONTOLOGY_POLL_S`) or by the admin endpoint. The new ontology is read,
+parsed and compiled into an `OntologySnapshot` off the event loop and then
+swapped in with a single reference assignment: validators on the hot path
+never take a lock. A file that fails to load or compile is logged and
+counted, and the active snapshot stays in place.
+
+Each gateway worker polls the file itself, so a changed file reaches every
+worker even though an admin request only reaches one.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from opentelemetry import trace
+
+from config.settings import Config
+from src.gateway.core.metrics import (
+    GOVERNANCE_ONTOLOGY_LOAD_SECONDS,
+    GOVERNANCE_ONTOLOGY_RELOADS,
+    GOVERNANCE_ONTOLOGY_VERSION,
+)
+from src.gateway.governance.constraint_compiler import ConstraintSyntaxError
+from src.gateway.governance.ontology import OntologyError
+from src.gateway.governance.stpa_validator import OntologySnapshot, STPAValidator
+
+logger = logging.getLogger("Gateway.Governance.OntologyReloader")
+# Errors from a file that cannot be loaded or compiled: the active snapshot stays.
+RELOAD_ERRORS = (OSError, OntologyError, ConstraintSyntaxError)
+tracer = trace.get_tracer("gateway.governance")
+
+
+class OntologyReloader:
+    def __init__(self, validator: STPAValidator, path: Optional[str] = None, poll_s: Optional[float] = None):
+        self.validator = validator
+        self.path = path or Config.STPA_ONTOLOGY_FILE
+        self.poll_s = Config.STPA_ONTOLOGY_POLL_S if poll_s is None else poll_s
+        self._signature = self._file_signature()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._publish(validator.snapshot)
+
+    def _file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    async def reload(self, trigger: str = "admin") -> Optional[OntologySnapshot]:
+        """
+        Loads the ontology file and swaps it in if its content changed.
+        Returns the new snapshot, or None if the content is unchanged; raises
+        one of RELOAD_ERRORS (after logging it) if the file is invalid.
+        """
+        # Serializes reloads (file watcher vs admin); validators never wait on this.
+        async with self._lock:
+            self._signature = self._file_signature()
+            return await asyncio.to_thread(self._reload, trigger)
+
+    def _reload(self, trigger: str) -> Optional[OntologySnapshot]:
+        with tracer.start_as_current_span("governance.ontology.reload") as span:
+            span.set_attribute("governance.ontology.trigger", trigger)
+            span.set_attribute("governance.ontology.path", self.path)
+            try:
+                snapshot = OntologySnapshot.load(self.path)
+            except RELOAD_ERRORS as e:
+                GOVERNANCE_ONTOLOGY_RELOADS.labels(trigger, "error").inc()
+                span.set_attribute("governance.ontology.outcome", "error")
+                span.record_exception(e)
+                logger.error(f"❌ Ontology reload ({trigger}) failed, keeping {self.validator.version}: {e}")
+                raise
+
+            span.set_attribute("governance.ontology.version", snapshot.version)
+            span.set_attribute("governance.ontology.load_ms", snapshot.load_ms)
+            span.set_attribute("governance.ontology.compile_ms", snapshot.compile_ms)
+            if snapshot.version == self.validator.version:
+                GOVERNANCE_ONTOLOGY_RELOADS.labels(trigger, "unchanged").inc()
+                span.set_attribute("governance.ontology.outcome", "unchanged")
+                return None
+
+            previous = self.validator.swap(snapshot)
+            GOVERNANCE_ONTOLOGY_RELOADS.labels(trigger, "swapped").inc()
+            span.set_attribute("governance.ontology.outcome", "swapped")
+            GOVERNANCE_ONTOLOGY_VERSION.labels(previous.version).set(0)
+            self._publish(snapshot)
+            logger.info(
+                f"🔄 Ontology {previous.version} -> {snapshot.version} ({trigger}): "
+                f"load {snapshot.load_ms:.1f} ms, compile {snapshot.compile_ms:.1f} ms"
+            )
+            return snapshot
+
+    @staticmethod
+    def _publish(snapshot: OntologySnapshot):
+        GOVERNANCE_ONTOLOGY_LOAD_SECONDS.labels("load").observe(snapshot.load_ms / 1000)
+        GOVERNANCE_ONTOLOGY_LOAD_SECONDS.labels("compile").observe(snapshot.compile_ms / 1000)
+        GOVERNANCE_ONTOLOGY_VERSION.labels(snapshot.version).set(1)
+
+    def start(self):
+        """Starts polling the ontology file; a no-op if polling is disabled."""
+        if self._task is None and self.poll_s > 0:
+            self._task = asyncio.create_task(self._watch())
+            logger.info(f"👀 Watching {self.path} for ontology changes every {self.poll_s}s.")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.poll_s)
+            if self._file_signature() != self._signature:
+                try:
+                    await self.reload("file")
+                except RELOAD_ERRORS:
+                    pass  # Logged and counted by _reload; retried on the next change.
@@ -7,18 +7,95 @@ CACHE_TTL = 5.0  # Seconds
 
 import logging
 import os
+import threading
 import time
-from typing import Any
+import uuid
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from redis import RedisError
 
 # --- STATIC CBF CONSTANTS ---
 SAFETY_PARAMS_FILE = "src/gateway/governance/safety_params.json"
 DEFAULT_DRAWDOWN_LIMIT = 0.05  # 5% default fallback
 
-from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+from config.settings import Config
+from src.gateway.core.metrics import CBF_RESERVATIONS
+from src.gateway.governance.constraint_compiler import numeric_column
+from src.governed_financial_advisor.infrastructure.redis_client import SAFETY_VIOLATION_KEY, redis_client
 from src.governed_financial_advisor.utils.telemetry import get_tracer
 
 logger = logging.getLogger("SafetyLayer")
 
+# --- CBF RESERVATIONS (server-side scripts) ---
+# KEYS[1] cash balance, KEYS[2] reservation expiries (ZSET id -> unix time),
+# KEYS[3] reserved amounts (HASH id -> cost). Every script first returns the
+# holds of expired reservations to the balance, using the Redis server clock.
+_SETTLE_LUA = """
+local function settle(default_cash)
+  if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('SET', KEYS[1], default_cash)
+  end
+  local t = redis.call('TIME')
+  local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+  for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)) do
+    local cost = redis.call('HGET', KEYS[3], id)
+    if cost then
+      redis.call('INCRBYFLOAT', KEYS[1], cost)
+      redis.call('HDEL', KEYS[3], id)
+    end
+    redis.call('ZREM', KEYS[2], id)
+  end
+  return now
+end
+"""
+
+# ARGV: id, cost, -cost, ttl_s, min_cash_balance, gamma, default_cash
+# Returns {1, cash} with the cost held, or {0, cash} if h(next) >= (1-gamma)*h(current) fails.
+RESERVE_LUA = _SETTLE_LUA + """
+local now = settle(ARGV[7])
+local cash = redis.call('GET', KEYS[1])
+local h_t = tonumber(cash) - tonumber(ARGV[5])
+local h_next = h_t - tonumber(ARGV[2])
+if h_next < (1 - tonumber(ARGV[6])) * h_t or h_next < 0 then
+  return {0, cash}
+end
+redis.call('INCRBYFLOAT', KEYS[1], ARGV[3])
+redis.call('HSET', KEYS[3], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[4]), ARGV[1])
+return {1, cash}
+"""
+
+# ARGV: id, default_cash, -cost of a reservation that expired before its commit ('' = none)
+# Returns 1 committed, 2 expired and re-deducted, 0 unknown.
+COMMIT_LUA = _SETTLE_LUA + """
+settle(ARGV[2])
+if redis.call('HDEL', KEYS[3], ARGV[1]) == 1 then
+  redis.call('ZREM', KEYS[2], ARGV[1])
+  return 1
+end
+if ARGV[3] ~= '' then
+  redis.call('INCRBYFLOAT', KEYS[1], ARGV[3])
+  return 2
+end
+return 0
+"""
+
+# ARGV: id, default_cash. Returns 1 if the hold went back to the balance, 0 if there was none.
+RELEASE_LUA = _SETTLE_LUA + """
+settle(ARGV[2])
+local cost = redis.call('HGET', KEYS[3], ARGV[1])
+if not cost then
+  return 0
+end
+redis.call('INCRBYFLOAT', KEYS[1], cost)
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+DEFAULT_CASH_BALANCE = "100000.0"
+
 def _get_drawdown_limit() -> float:
     """
     Helper to safely read the dynamic drawdown limit from JSON.
@@ -73,21 +150,46 @@ class ControlBarrierFunction:
     CRITICAL: Uses Redis for state persistence.
     In Cloud Run (Stateless), local variables reset on every request.
     We MUST fetch `current_cash` from Redis for every verification.
+
+    Live trades use `reserve` / `commit` / `release`: a server-side script
+    checks the barrier and holds the cost in one atomic round-trip, so two
+    concurrent trades can never both pass against the same balance. A hold
+    that is neither committed nor released expires back to the balance.
     """
 
     def __init__(self, min_cash_balance: float = 1000.0, gamma: float = 0.5):
         self.min_cash_balance = min_cash_balance
         self.gamma = gamma
         self.redis_key = "safety:current_cash"
+        self.reservations_key = "safety:cbf:reservations"
+        self.reserved_key = "safety:cbf:reserved"
+        self._scripts: dict[tuple[str, int], Any] = {}
+        # Stands in for the scripts' atomicity when redis_client runs in memory.
+        self._local_lock = threading.Lock()
+        self._local_reservations: dict[str, tuple[float, float]] = {}
 
         # Bootstrap state if empty (e.g. first run)
         if redis_client.get(self.redis_key) is None:
-            redis_client.set(self.redis_key, "100000.0")
+            redis_client.set(self.redis_key, DEFAULT_CASH_BALANCE)
 
         self.tracer = get_tracer()
 
     def _get_current_cash(self) -> float:
-        return redis_client.get_float(self.redis_key, 100000.0)
+        return redis_client.get_float(self.redis_key, float(DEFAULT_CASH_BALANCE))
+
+    @staticmethod
+    def _parse_state(values: list[Optional[str]]) -> tuple[float, Optional[str]]:
+        """(current cash, safety interrupt reason) from an MGET of [redis_key, SAFETY_VIOLATION_KEY]."""
+        cash, violation = values
+        try:
+            current_cash = float(cash) if cash is not None else float(DEFAULT_CASH_BALANCE)
+        except ValueError:
+            current_cash = float(DEFAULT_CASH_BALANCE)
+        return current_cash, violation
+
+    def state_version(self) -> str:
+        """Identifies the state a verification was made against (the shared cash balance)."""
+        return repr(self._get_current_cash())
 
     def get_h(self, cash_balance: float) -> float:
         """
@@ -99,19 +201,39 @@ class ControlBarrierFunction:
         """
         Verifies if the action is safe relative to the *shared* state in Redis.
         """
-        # 1. Fetch State (Hot Path)
-        current_cash = self._get_current_cash()
+        # 1. Fetch State (Hot Path): cash and the safety interrupt flag in one round-trip
+        current_cash, violation = self._parse_state(redis_client.mget([self.redis_key, SAFETY_VIOLATION_KEY]))
 
         # Wrap logic in trace
         if self.tracer:
              with self.tracer.start_as_current_span("safety.cbf_check") as span:
-                 return self._do_verify_action(action_name, payload, current_cash, span)
+                 return self._do_verify_action(action_name, payload, current_cash, span, violation)
         else:
-             return self._do_verify_action(action_name, payload, current_cash, None)
+             return self._do_verify_action(action_name, payload, current_cash, None, violation)
+
+    async def averify_action(self, action_name: str, payload: dict[str, Any]) -> str:
+        """
+        `verify_action` for callers on the event loop: the shared state is read
+        with the asyncio Redis client, so no thread is tied up for the round-trip.
+        """
+        current_cash, violation = self._parse_state(await redis_client.amget([self.redis_key, SAFETY_VIOLATION_KEY]))
 
-    def _do_verify_action(self, action_name: str, payload: dict[str, Any], current_cash: float, span) -> str:
+        if self.tracer:
+             with self.tracer.start_as_current_span("safety.cbf_check") as span:
+                 return self._do_verify_action(action_name, payload, current_cash, span, violation)
+        else:
+             return self._do_verify_action(action_name, payload, current_cash, None, violation)
+
+    def _do_verify_action(
+        self, action_name: str, payload: dict[str, Any], current_cash: float, span, violation: Optional[str] = None
+    ) -> str:
         if span:
              span.set_attribute("safety.cash.current", current_cash)
+        if violation:
+            # The safety monitor has locked the system (trigger_safety_intervention).
+            if span:
+                 span.set_attribute("safety.result", "INTERRUPTED")
+            return f"UNSAFE: Safety interrupt active: {violation}"
 
         # 2. Calculate Next State
         cost = 0.0
@@ -151,28 +273,226 @@ class ControlBarrierFunction:
 
         # 5. Drawdown Check (Merged from Backend)
         # Check if 'drawdown_pct' is in payload (e.g. from market data context)
-        if "drawdown_pct" in payload:
-            limit = _get_drawdown_limit()
-            raw_drawdown = float(payload.get("drawdown_pct", 0.0))
-            current_drawdown = raw_drawdown / 100.0
-            barrier_value = limit - current_drawdown
-            
-            if barrier_value < 0:
-                msg = f"UNSAFE: Drawdown Violation. {current_drawdown:.2%} > Limit {limit:.2%}"
-                logger.warning(f"⛔ {msg}")
-                if result == "SAFE":
-                    result = msg
-                else:
-                    result += f"; {msg}"
+        msg = self._check_drawdown(payload)
+        if msg:
+            if result == "SAFE":
+                result = msg
+            else:
+                result += f"; {msg}"
 
         return result
 
+    def verify_batch(
+        self,
+        action_name: str,
+        payloads: Sequence[dict[str, Any]],
+        active: Optional[Sequence[bool]] = None,
+        reserve: Optional[Sequence[bool]] = None
+    ) -> list[Optional[str]]:
+        """
+        `verify_action` for an ordered set of actions against one read of the
+        shared state. Cash depletes cumulatively: action N is checked against the
+        balance left after every earlier action that passes. Inactive actions
+        (already rejected upstream) are not checked and do not deplete (None).
+        `reserve` limits depletion further to actions known to go ahead if safe
+        (e.g. not denied by policy); they are still checked.
+        """
+        n = len(payloads)
+        active = np.ones(n, dtype=bool) if active is None else np.asarray(active, dtype=bool)
+        reserve = active if reserve is None else active & np.asarray(reserve, dtype=bool)
+        results: list[Optional[str]] = [("SAFE" if a else None) for a in active]
+        if n == 0:
+            return results
+
+        current_cash = self._get_current_cash()
+        cost = numeric_column(payloads, "amount", 0.0) if action_name == "execute_trade" else np.zeros(n)
+        cost = np.nan_to_num(cost, nan=0.0)
+
+        # Drawdown is independent per action; a failing action will not execute, so it does not deplete.
+        drawdown = numeric_column(payloads, "drawdown_pct") / 100.0
+        limit = _get_drawdown_limit()
+        drawdown_unsafe = active & ~np.isnan(drawdown) & (limit - drawdown < 0)
+        depletes = reserve & ~drawdown_unsafe
+
+        # Barrier sequence: vectorized over the whole suffix, re-run after each violation
+        # (a rejected action frees its cash for the ones after it).
+        start, cash = 0, current_cash
+        while start < n:
+            spend = np.where(depletes[start:], cost[start:], 0.0)
+            cash_before = cash - (np.cumsum(spend) - spend)
+            h_t = cash_before - self.min_cash_balance
+            h_next = h_t - cost[start:]
+            required_h_next = (1.0 - self.gamma) * h_t
+            unsafe = active[start:] & ((h_next < required_h_next) | (h_next < 0))
+            hits = np.flatnonzero(unsafe)
+            if not hits.size:
+                break
+            j = start + hits[0]
+            results[j] = f"UNSAFE: CBF violation. h(next)={float(h_next[hits[0]])} < threshold={float(required_h_next[hits[0]])}"
+            depletes[j] = False
+            cash, start = float(cash_before[hits[0]]), j + 1
+
+        for i in np.flatnonzero(drawdown_unsafe):
+            msg = f"UNSAFE: Drawdown Violation. {drawdown[i]:.2%} > Limit {limit:.2%}"
+            results[i] = msg if results[i] == "SAFE" else f"{results[i]}; {msg}"
+
+        unsafe_count = sum(1 for r in results if r is not None and r != "SAFE")
+        logger.info(f"🛡️ CBF Batch Check | {int(active.sum())} actions, {unsafe_count} unsafe | Cash: {current_cash}")
+        return results
+
+    def reserve(self, action_name: str, payload: dict[str, Any], ttl_s: Optional[float] = None) -> tuple[str, Optional[str]]:
+        """
+        `verify_action` that also holds the action's cost against the shared
+        balance, atomically (one round-trip). Returns the verification result
+        and, if it is SAFE and has a cost, a reservation id valid for `ttl_s`
+        (CBF_RESERVATION_TTL_S): `commit` it after the action executes or
+        `release` it if the action does not go ahead.
+        """
+        cost = float(payload.get("amount", 0.0)) if action_name == "execute_trade" else 0.0
+        if cost == 0.0 or self._check_drawdown(payload):
+            # Nothing to hold: no cost, or rejected whatever the balance.
+            return self.verify_action(action_name, payload), None
+
+        if self.tracer:
+            with self.tracer.start_as_current_span("safety.cbf_reserve") as span:
+                return self._do_reserve(cost, ttl_s or Config.CBF_RESERVATION_TTL_S, span)
+        return self._do_reserve(cost, ttl_s or Config.CBF_RESERVATION_TTL_S, None)
+
+    def _do_reserve(self, cost: float, ttl_s: float, span) -> tuple[str, Optional[str]]:
+        reservation_id = uuid.uuid4().hex
+        try:
+            reserved, cash = self._run_script(
+                "reserve", RESERVE_LUA,
+                [reservation_id, repr(cost), repr(-cost), ttl_s, self.min_cash_balance, self.gamma, DEFAULT_CASH_BALANCE],
+                self._local_reserve
+            )
+        except RedisError as e:
+            # Fail closed: without the shared balance the barrier cannot be evaluated.
+            CBF_RESERVATIONS.labels("error").inc()
+            logger.error(f"CBF reservation failed: {e}")
+            return f"UNSAFE: CBF state unavailable ({e})", None
+
+        current_cash = float(cash)
+        h_t = self.get_h(current_cash)
+        h_next = self.get_h(current_cash - cost)
+        result = "SAFE" if int(reserved) else f"UNSAFE: CBF violation. h(next)={h_next} < threshold={(1.0 - self.gamma) * h_t}"
+        if span:
+            span.set_attribute("safety.cash.current", current_cash)
+            span.set_attribute("safety.barrier.h_next", h_next)
+            span.set_attribute("safety.result", result)
+        if not int(reserved):
+            CBF_RESERVATIONS.labels("rejected").inc()
+            return result, None
+
+        CBF_RESERVATIONS.labels("reserved").inc()
+        if span:
+            span.set_attribute("safety.reservation_id", reservation_id)
+        logger.info(f"🛡️ CBF Reserved {cost} | Cash: {current_cash} -> {current_cash - cost} ({reservation_id})")
+        return result, reservation_id
+
+    def commit(self, reservation_id: str, cost: Optional[float] = None) -> bool:
+        """
+        Makes a reservation's hold permanent once the action has executed.
+        If it already expired (its hold went back to the balance), `cost` is
+        deducted again so the balance still reflects the executed action.
+        """
+        try:
+            outcome = int(self._run_script(
+                "commit", COMMIT_LUA,
+                [reservation_id, DEFAULT_CASH_BALANCE, "" if cost is None else repr(-float(cost))],
+                self._local_commit
+            ))
+        except RedisError as e:
+            CBF_RESERVATIONS.labels("error").inc()
+            logger.error(f"CBF commit of {reservation_id} failed: {e}")
+            return False
+        if outcome == 2:
+            CBF_RESERVATIONS.labels("late_commit").inc()
+            logger.warning(f"⚠️ CBF reservation {reservation_id} expired before commit: {cost} deducted again.")
+        elif outcome == 1:
+            CBF_RESERVATIONS.labels("committed").inc()
+            logger.info(f"✅ CBF reservation {reservation_id} committed.")
+        else:
+            logger.warning(f"⚠️ CBF reservation {reservation_id} not found at commit.")
+        return outcome != 0
+
+    def release(self, reservation_id: str) -> bool:
+        """Returns a reservation's hold to the balance (the action did not go ahead)."""
+        try:
+            released = int(self._run_script("release", RELEASE_LUA, [reservation_id, DEFAULT_CASH_BALANCE], self._local_release))
+        except RedisError as e:
+            CBF_RESERVATIONS.labels("error").inc()
+            logger.error(f"CBF release of {reservation_id} failed: {e}")
+            return False
+        if released:
+            CBF_RESERVATIONS.labels("released").inc()
+            logger.info(f"🔄 CBF reservation {reservation_id} released.")
+        return bool(released)
+
+    def _check_drawdown(self, payload: dict[str, Any]) -> Optional[str]:
+        """Drawdown barrier: independent of the shared balance, so checked locally."""
+        if "drawdown_pct" not in payload:
+            return None
+        limit = _get_drawdown_limit()
+        current_drawdown = float(payload.get("drawdown_pct", 0.0)) / 100.0
+        if limit - current_drawdown < 0:
+            msg = f"UNSAFE: Drawdown Violation. {current_drawdown:.2%} > Limit {limit:.2%}"
+            logger.warning(f"⛔ {msg}")
+            return msg
+        return None
+
+    def _run_script(self, name: str, source: str, args: list, local_fn):
+        """Runs a reservation script on Redis (EVALSHA), or its in-memory equivalent."""
+        if not (redis_client.use_redis and redis_client.client):
+            with self._local_lock:
+                self._local_settle()
+                return local_fn(*args)
+        key = (name, id(redis_client.client))
+        script = self._scripts.get(key)
+        if script is None:
+            script = self._scripts[key] = redis_client.client.register_script(source)
+        return script(keys=[self.redis_key, self.reservations_key, self.reserved_key], args=args)
+
+    # In-memory equivalents of the scripts (called under self._local_lock).
+    def _local_settle(self):
+        if redis_client.get(self.redis_key) is None:
+            redis_client.set(self.redis_key, DEFAULT_CASH_BALANCE)
+        now = time.time()
+        for reservation_id, (cost, expires_at) in list(self._local_reservations.items()):
+            if expires_at <= now:
+                del self._local_reservations[reservation_id]
+                redis_client.set(self.redis_key, repr(self._get_current_cash() + cost))
+
+    def _local_reserve(self, reservation_id, cost, neg_cost, ttl_s, min_cash_balance, gamma, default_cash):
+        cash = redis_client.get(self.redis_key)
+        h_t = float(cash) - min_cash_balance
+        h_next = h_t - float(cost)
+        if h_next < (1 - gamma) * h_t or h_next < 0:
+            return [0, cash]
+        redis_client.set(self.redis_key, repr(float(cash) + float(neg_cost)))
+        self._local_reservations[reservation_id] = (float(cost), time.time() + ttl_s)
+        return [1, cash]
+
+    def _local_commit(self, reservation_id, default_cash, neg_cost):
+        if self._local_reservations.pop(reservation_id, None) is not None:
+            return 1
+        if neg_cost != "":
+            redis_client.set(self.redis_key, repr(self._get_current_cash() + float(neg_cost)))
+            return 2
+        return 0
+
+    def _local_release(self, reservation_id, default_cash):
+        held = self._local_reservations.pop(reservation_id, None)
+        if held is None:
+            return 0
+        redis_client.set(self.redis_key, repr(self._get_current_cash() + held[0]))
+        return 1
+
     def update_state(self, cost: float):
         """
         Commits the new state to Redis after successful execution.
+        Not atomic: live trades go through `reserve` / `commit` instead.
         """
-        # Note: In high-concurrency production, use Redis transactions (WATCH/MULTI).
-        # For this implementation, simple SET is used.
         current = self._get_current_cash()
         new_balance = current - cost
         redis_client.set(self.redis_key, str(new_balance))
@@ -181,7 +501,7 @@ class ControlBarrierFunction:
     def rollback_state(self, cost: float):
         """
         Reverts state after a failed execution (e.g., broker API error).
-        Call this when a trade was approved but failed downstream.
+        Not atomic: a reserved trade that fails downstream is `release`d instead.
         """
         current = self._get_current_cash()
         restored_balance = current + cost
@@ -1,6 +1,7 @@
 import logging
 from src.gateway.core.policy import OPAClient
 from src.gateway.governance.consensus import consensus_engine
+from src.gateway.governance.ontology_reloader import OntologyReloader
 from src.gateway.governance.safety import safety_filter
 from src.gateway.governance.stpa_validator import STPAValidator
 from src.gateway.governance.symbolic_governor import SymbolicGovernor
@@ -10,6 +11,7 @@ logger = logging.getLogger("Gateway.Governance.Singletons")
 # Singleton Instances
 opa_client = OPAClient()
 stpa_validator = STPAValidator()
+ontology_reloader = OntologyReloader(stpa_validator)
 
 symbolic_governor = SymbolicGovernor(
     opa_client=opa_client,
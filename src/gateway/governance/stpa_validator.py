@@ -1,18 +1,106 @@
 import logging
-from typing import Any
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Sequence
 
-from .ontology import Constraint, TradingKnowledgeGraph
+import numpy as np
+
+from config.settings import Config
+from .constraint_compiler import CompiledPredicate, compile_constraint, compile_facts
+from .ontology import STAMP_UCA, TradingKnowledgeGraph
 
 logger = logging.getLogger("Gateway.Governance.STPAValidator")
 
+
+class Rule(NamedTuple):
+    constraint_id: str
+    logic: str
+    message: str
+    predicate: CompiledPredicate
+
+
+@dataclass(frozen=True)
+class OntologySnapshot:
+    """
+    Immutable, compiled view of an ontology: the action -> rules index and the
+    UCA rubric. A reload builds a new snapshot and swaps the reference, so a
+    reader holding a snapshot never sees a half-built index.
+    """
+    version: str
+    rules: Mapping[str, tuple[Rule, ...]]
+    rubric: tuple[STAMP_UCA, ...]
+    load_ms: float = 0.0
+    compile_ms: float = 0.0
+
+    @classmethod
+    def load(cls, path: str) -> "OntologySnapshot":
+        """Reads, parses and compiles a STAMP YAML ontology."""
+        start = time.perf_counter()
+        ontology = TradingKnowledgeGraph.from_yaml(path)
+        return cls.compile(ontology, load_ms=(time.perf_counter() - start) * 1000)
+
+    @classmethod
+    def compile(cls, ontology: TradingKnowledgeGraph, load_ms: float = 0.0) -> "OntologySnapshot":
+        start = time.perf_counter()
+        facts = compile_facts(ontology.facts)
+        predicates: dict[str, CompiledPredicate] = {}
+        rules: dict[str, list[Rule]] = {}
+        for constraint in ontology.constraints.values():
+            if constraint.logic not in predicates:
+                predicates[constraint.logic] = compile_constraint(constraint.logic, facts)
+            rule = Rule(
+                constraint.id, constraint.logic,
+                f"STPA Violation {constraint.id}: {constraint.description}",
+                predicates[constraint.logic]
+            )
+            for action in constraint.scope:
+                rules.setdefault(action, []).append(rule)
+        return cls(
+            version=ontology.version,
+            rules=MappingProxyType({action: tuple(r) for action, r in rules.items()}),
+            rubric=tuple(ontology.get_rubric()),
+            load_ms=load_ms,
+            compile_ms=(time.perf_counter() - start) * 1000
+        )
+
+    def rules_for(self, action_name: str) -> tuple[Rule, ...]:
+        return self.rules.get(action_name, ())
+
+
 class STPAValidator:
     """
     The 'Symbolic' component of the Neuro-Symbolic architecture.
     It evaluates deterministic constraints (STPA UCAs) against an action.
     Refactored from `SymbolicReasoner`.
+
+    Constraint logic is compiled once per ontology version into an
+    `OntologySnapshot` (see `constraint_compiler`): a malformed constraint fails
+    at load time, and validation is an index lookup plus compiled predicate
+    calls. `swap` replaces the snapshot (hot reload, see `ontology_reloader`);
+    each call reads the reference once and never takes a lock.
     """
-    def __init__(self, ontology: TradingKnowledgeGraph = None):
-        self.ontology = ontology or TradingKnowledgeGraph()
+    def __init__(self, ontology: Optional[TradingKnowledgeGraph] = None):
+        if ontology is None:
+            self._snapshot = OntologySnapshot.load(Config.STPA_ONTOLOGY_FILE)
+        else:
+            self._snapshot = OntologySnapshot.compile(ontology)
+
+    @property
+    def snapshot(self) -> OntologySnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def swap(self, snapshot: OntologySnapshot) -> OntologySnapshot:
+        """Makes `snapshot` the active ontology; returns the previous one."""
+        previous, self._snapshot = self._snapshot, snapshot
+        return previous
+
+    def get_rubric(self) -> list[STAMP_UCA]:
+        return list(self._snapshot.rubric)
 
     def validate(self, action_name: str, params: dict[str, Any]) -> list[str]:
         """
@@ -21,12 +109,10 @@ class STPAValidator:
         """
         violations = []
 
-        # Get constraints for this action from the ontology
-        constraints = self.ontology.get_constraints_for_action(action_name)
-
-        for constraint in constraints:
-            if not self._check_constraint(constraint, params):
-                violations.append(f"STPA Violation {constraint.id}: {constraint.description}")
+        # Rules for this action from the active snapshot
+        for rule in self._snapshot.rules_for(action_name):
+            if not self._check_rule(rule, params):
+                violations.append(rule.message)
 
         if violations:
             logger.warning(f"⚠️ STPA Validator blocked {action_name}: {violations}")
@@ -35,40 +121,31 @@ class STPAValidator:
 
         return violations
 
-    def _check_constraint(self, constraint: Constraint, params: dict[str, Any]) -> bool:
+    def validate_batch(self, action_name: str, params_list: Sequence[dict[str, Any]]) -> list[list[str]]:
+        """
+        `validate` for many actions at once. Constraints with a column form are
+        evaluated as NumPy column operations; others fall back to per-row checks.
+        """
+        violations: list[list[str]] = [[] for _ in params_list]
+        if not params_list:
+            return violations
+
+        for rule in self._snapshot.rules_for(action_name):
+            passed = rule.predicate.check_batch(params_list)
+            for i in np.flatnonzero(~passed):
+                violations[i].append(rule.message)
+
+        blocked = sum(1 for v in violations if v)
+        logger.info(f"✅ STPA Validator batch {action_name}: {len(params_list) - blocked}/{len(params_list)} approved")
+        return violations
+
+    def _check_rule(self, rule: Rule, params: dict[str, Any]) -> bool:
         """
         Evaluates a single constraint logic against parameters.
         """
         try:
-            # SC-1: Approval Token
-            if constraint.id == "SC-1":
-                # Check if 'approval_token' is present
-                return params.get("approval_token") is not None
-
-            # FIN-1: Sell Percentage
-            if constraint.id == "FIN-1":
-                quantity = float(params.get("quantity", 0))
-                # Security Fix: Fail if portfolio_total is missing/zero (Fail Closed)
-                portfolio_total = float(params.get("portfolio_total", 0))
-                if portfolio_total <= 0:
-                     logger.warning(f"Constraint {constraint.id}: Missing or invalid portfolio_total.")
-                     return False # Fail Closed
-                return (quantity / portfolio_total) <= 0.10
-
-            # FIN-2: Latency Check (UCA-2)
-            if constraint.id == "FIN-2":
-                # Security Fix: Fail Closed if latency_ms is missing.
-                # In production, Gateway should inject this, not the agent.
-                if "latency_ms" in params:
-                    return float(params["latency_ms"]) <= 200
-                else:
-                    logger.warning(f"Constraint {constraint.id}: Missing latency_ms metric.")
-                    return False # Fail Closed: Cannot verify latency safety
-
-            # Default: If we don't have a specific handler, we assume SAFE
-            return True
-
+            return rule.predicate(params)
         except Exception as e:
-            logger.error(f"Error evaluating constraint {constraint.id}: {e}")
-            # Fail closed on error for safety
+            # Missing or malformed inputs (e.g. no latency_ms): fail closed for safety
+            logger.warning(f"Constraint {rule.constraint_id}: cannot evaluate {rule.logic!r} ({e}). Failing closed.")
             return False
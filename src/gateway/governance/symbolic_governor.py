@@ -29,52 +29,139 @@ See `docs/NEURO_SYMBOLIC_GOVERNANCE.md` for detailed architecture combining
 Residual-Based Control (RBC) and Optimization-Based Control (OPC).
 """
 
+import asyncio
+import inspect
 import logging
 import os
-from typing import Any, Dict, List
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
+from opentelemetry import trace
+
+from config.settings import Config
+from src.gateway.core.deadline import DeadlineExceeded, check_deadline, elapsed_ms, within_deadline
+from src.gateway.core.decision_cache import canonical_key
+from src.gateway.core.metrics import GOVERNANCE_STAGES_REUSED
 from src.gateway.core.policy import OPAClient
 from src.gateway.governance.contracts import SafetyFilter, ConsensusProvider
+from src.gateway.governance.constraint_compiler import numeric_column
 from src.gateway.governance.stpa_validator import STPAValidator
+from src.gateway.governance.verdicts import VerdictStore
 
 logger = logging.getLogger("SymbolicGovernor")
+tracer = trace.get_tracer("gateway.governance")
 
 class GovernanceError(Exception):
     """Raised when a symbolic rule is violated."""
     pass
 
+# Dry-run modes of `verify` / `verify_plan`
+VERIFY_EXHAUSTIVE = "exhaustive"
+VERIFY_SHORT_CIRCUIT = "short_circuit"
+VERIFY_MODES = (VERIFY_EXHAUSTIVE, VERIFY_SHORT_CIRCUIT)
+
+@dataclass(frozen=True)
+class GovernanceStage:
+    """One check of `govern`: raises GovernanceError on a violation."""
+    name: str
+    run: Callable[[], Awaitable[None]]
+    # Stages that must pass before this one starts (e.g. before spending LLM calls).
+    depends_on: Tuple[str, ...] = ()
+
 class SymbolicGovernor:
     def __init__(
         self,
         opa_client: OPAClient,
         safety_filter: SafetyFilter,
         consensus_engine: ConsensusProvider,
-        stpa_validator: STPAValidator = None
+        stpa_validator: STPAValidator = None,
+        verdict_store: VerdictStore = None
     ):
         self.opa_client = opa_client
         self.safety_filter = safety_filter
         self.consensus_engine = consensus_engine
         self.stpa_validator = stpa_validator or STPAValidator()
+        self.verdict_store = verdict_store or VerdictStore()
+        # OPA calls left to finish after their stage was cancelled (see the opa stage).
+        self._detached: Set[asyncio.Task] = set()
 
-    async def govern(self, tool_name: str, params: Dict[str, Any]) -> None:
+    async def govern(
+        self,
+        tool_name: str,
+        params: Dict[str, Any],
+        verdict_token: Optional[str] = None,
+        reserve: bool = False
+    ) -> Optional[str]:
         """
         Orchestrates the governance checks.
-        Raises GovernanceError if any check fails.
+        Raises GovernanceError if any check fails, including when the request
+        deadline (see core/deadline.py) runs out before every check has passed.
+
+        The checks run concurrently as a dependency graph (see `stages`). The
+        first violation cancels every lower-precedence stage still running, and
+        the error raised is always the highest-precedence violation, so the
+        outcome is the same as running the stages one by one.
+
+        `verdict_token` (from `verify_with_verdict`) skips the stages whose
+        inputs are unchanged since that dry run; see governance/verdicts.py.
+
+        `reserve` (live trades): the CBF stage holds the trade's cost against
+        the shared balance atomically (`SafetyFilter.reserve`) and the
+        reservation id is returned, to be committed or released by the caller.
+        If any stage rejects the action the hold is released here.
         """
         logger.info(f"⚖️ Symbolic Governor evaluating: {tool_name}")
+        with tracer.start_as_current_span("governance.govern") as span:
+            span.set_attribute("governance.tool", tool_name)
+            self._set_ontology_version(span)
+            holds: Optional[List[str]] = [] if reserve and not params.get("dry_run", False) else None
+            stages = self.stages(tool_name, params, holds)
+            if verdict_token:
+                reused = await self.verdict_store.reusable_stages(
+                    verdict_token, tool_name, await self.stage_fingerprints(tool_name, params),
+                    consume=not params.get("dry_run", False)
+                )
+                if holds is not None:
+                    # The reservation is the CBF check: it always runs.
+                    reused.discard("cbf")
+                for name in reused:
+                    GOVERNANCE_STAGES_REUSED.labels(name).inc()
+                    span.set_attribute(f"governance.stage.{name}.outcome", "reused")
+                stages = [stage for stage in stages if stage.name not in reused]
+            try:
+                try:
+                    await self._run_stages(stages, span)
+                except DeadlineExceeded as e:
+                    # Fail closed: an action that could not be fully governed in time is rejected.
+                    raise GovernanceError(f"Latency Budget Exhausted: {e}") from e
+            except BaseException:
+                await self._release_holds(holds)
+                raise
+        logger.info(f"✅ Symbolic Governor Approved: {tool_name}")
+        return holds[0] if holds else None
 
-        # 0. STAMP/STPA: "Unsafe Control Actions" (Module 5)
-        # Check against the STPA ontology for UCAs (e.g., Latency, Authorization).
-        # This applies to ALL tools, not just execute_trade.
-        stpa_violations = self.stpa_validator.validate(tool_name, params)
-        if stpa_violations:
-             # Just raise the first one for now, or join them
-             raise GovernanceError(f"STPA Violation: {stpa_violations[0]}")
-
-        # 1. SR 11-7: "Conceptual Soundness" / Deterministic Rules
-        # Rule: "If confidence interval < 95%, do not execute trade."
-        # This applies specifically to trade execution.
-        if tool_name == "execute_trade":
+    def stages(self, tool_name: str, params: Dict[str, Any], holds: Optional[List[str]] = None) -> List[GovernanceStage]:
+        """
+        The checks for one action, in precedence order (first = reported first).
+        With `holds`, the CBF stage reserves the trade's cost and appends the reservation id.
+        """
+        trade = tool_name == "execute_trade"
+
+        async def stpa():
+            # 0. STAMP/STPA: "Unsafe Control Actions" (Module 5)
+            # Check against the STPA ontology for UCAs (e.g., Latency, Authorization).
+            # This applies to ALL tools, not just execute_trade.
+            check_deadline("stpa")
+            stpa_violations = self.stpa_validator.validate(tool_name, params)
+            if stpa_violations:
+                # Just raise the first one for now, or join them
+                raise GovernanceError(f"STPA Violation: {stpa_violations[0]}")
+
+        async def confidence():
+            # 1. SR 11-7: "Conceptual Soundness" / Deterministic Rules
+            # Rule: "If confidence interval < 95%, do not execute trade."
             confidence = params.get("confidence", 0.0)
             min_confidence = float(os.getenv("GOVERNANCE_MIN_CONFIDENCE", "0.95"))
             if confidence < min_confidence:
@@ -82,96 +169,513 @@ class SymbolicGovernor:
                     f"SR 11-7 Violation: Model Confidence {confidence} < {min_confidence}. Action Rejected."
                 )
 
+        async def cbf():
             # 2. Residual-Based Control (RBC) / Cybernetic Stability: Control Barrier Function (Safety)
             # Checks if the action violates safety boundaries (e.g. bankruptcy).
-            # This is a fast, local check (CBF).
-            cbf_result = self.safety_filter.verify_action(tool_name, params)
+            check_deadline("cbf")
+            if holds is None:
+                cbf_result = await self._verify_action(tool_name, params)
+            else:
+                cbf_result = await self._reserve(tool_name, params, holds)
             if cbf_result.startswith("UNSAFE"):
                 raise GovernanceError(f"Safety Violation (RBC/CBF): {cbf_result}")
 
-        # 3. Optimization-Based Control (OPC) / ISO 42001: Policy Compliance (OPA)
-        # Checks organizational policies (e.g. "No trading in restricted regions").
-        # This is a "Process" check using global policy rules.
-        # We construct the payload for OPA.
-        opa_payload = params.copy()
-        opa_payload["action"] = tool_name
-
-        policy_decision = await self.opa_client.evaluate_policy(opa_payload)
-        if policy_decision == "DENY":
-            raise GovernanceError("ISO 42001 Policy Violation: OPA Denied Action.")
-        if policy_decision == "MANUAL_REVIEW":
-            raise GovernanceError("ISO 42001 Policy Check: Manual Review Required.")
+        async def opa():
+            # 3. Optimization-Based Control (OPC) / ISO 42001: Policy Compliance (OPA)
+            # Checks organizational policies (e.g. "No trading in restricted regions").
+            opa_payload = params.copy()
+            opa_payload["action"] = tool_name
+            # A real trade is audit-critical: always ask OPA, never a cached decision.
+            live_trade = trade and not params.get("dry_run", False)
+            check_deadline("opa")
+            call = asyncio.ensure_future(self.opa_client.evaluate_policy(
+                opa_payload, current_latency_ms=elapsed_ms(), bypass_cache=live_trade
+            ))
+            try:
+                # Shielded: the call may be the breaker's HALF_OPEN probe, and a
+                # probe cancelled by another stage's violation must still
+                # report its outcome, or the breaker waits on it.
+                policy_decision = await asyncio.shield(call)
+            except asyncio.CancelledError:
+                self._detach(call)
+                raise
+            if policy_decision == "DENY":
+                raise GovernanceError("ISO 42001 Policy Violation: OPA Denied Action.")
+            if policy_decision == "MANUAL_REVIEW":
+                raise GovernanceError("ISO 42001 Policy Check: Manual Review Required.")
 
-        # 4. ISO 42001: Human Oversight / Consensus (Adaptive Compute)
-        # For high-stakes actions, trigger multi-agent consensus.
-        if tool_name == "execute_trade":
+        async def consensus():
+            # 4. ISO 42001: Human Oversight / Consensus (Adaptive Compute)
             amount = params.get("amount", 0.0)
             symbol = params.get("symbol", "UNKNOWN")
+            # The two critic LLM calls are cancelled if they would overrun the deadline.
+            result = await within_deadline(
+                self.consensus_engine.check_consensus(tool_name, amount, symbol), "consensus"
+            )
+            if result["status"] == "REJECT":
+                raise GovernanceError(f"Consensus Rejection: {result['reason']}")
+            # ESCALATE is treated as a block for automation safety (no human loop yet).
+            if result["status"] == "ESCALATE":
+                raise GovernanceError(f"Consensus Escalation: {result['reason']}")
 
-            consensus = await self.consensus_engine.check_consensus(tool_name, amount, symbol)
-            if consensus["status"] == "REJECT":
-                raise GovernanceError(f"Consensus Rejection: {consensus['reason']}")
-            # ESCALATE is currently treated as a block in the original code,
-            # or could be allowed if human loop is implemented.
-            # Here we will treat ESCALATE as a GovernanceError for automation safety.
-            if consensus["status"] == "ESCALATE":
-                raise GovernanceError(f"Consensus Escalation: {consensus['reason']}")
+        if not trade:
+            return [GovernanceStage("stpa", stpa), GovernanceStage("opa", opa)]
+        return [
+            GovernanceStage("stpa", stpa),
+            GovernanceStage("confidence", confidence),
+            GovernanceStage("cbf", cbf),
+            GovernanceStage("opa", opa),
+            # LLM calls are only spent once the free local gates have passed.
+            GovernanceStage("consensus", consensus, depends_on=("stpa", "confidence")),
+        ]
 
-        logger.info(f"✅ Symbolic Governor Approved: {tool_name}")
+    async def _reserve(self, tool_name: str, params: Dict[str, Any], holds: List[str]) -> str:
+        task = asyncio.ensure_future(asyncio.to_thread(self.safety_filter.reserve, tool_name, params))
+        try:
+            result, reservation_id = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Cancelled by a higher-precedence failure: the script still completes, so release its hold.
+            task.add_done_callback(
+                lambda t: self._detach(asyncio.ensure_future(self._release_holds([t.result()[1]])))
+                if not t.cancelled() and t.exception() is None else None
+            )
+            raise
+        if reservation_id:
+            holds.append(reservation_id)
+        return result
+
+    async def _release_holds(self, holds: Optional[List[Optional[str]]]):
+        # The release script is a blocking Redis call: run it on a thread.
+        releases = [asyncio.to_thread(self.safety_filter.release, r) for r in holds or [] if r]
+        if releases:
+            # Shielded: a cancelled govern() still returns its hold before unwinding.
+            await asyncio.shield(asyncio.gather(*releases))
+
+    async def _verify_action(self, tool_name: str, params: Dict[str, Any]) -> str:
+        # The shared cash state is a Redis read: await it, or keep a blocking read off the event loop.
+        averify_action = getattr(self.safety_filter, "averify_action", None)
+        if inspect.iscoroutinefunction(averify_action):
+            return await averify_action(tool_name, params)
+        return await asyncio.to_thread(self.safety_filter.verify_action, tool_name, params)
+
+    def _detach(self, task: asyncio.Future):
+        # Keeps a call that outlives its stage referenced until it finishes.
+        self._detached.add(task)
+        task.add_done_callback(self._detached.discard)
+
+    async def stage_fingerprints(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        Per reusable stage, a hash of every input its outcome depends on.
+        None means the stage cannot be vouched for (e.g. unknown policy revision).
+        """
+        fingerprints: Dict[str, Optional[str]] = {}
+        revision = self.opa_client.policy_revision
+        # Only the fields the policy reads: a dry run and the live call carry
+        # different bookkeeping (transaction id, trader id, dry_run flag).
+        policy_input = {field: params[field] for field in Config.GOVERNANCE_POLICY_INPUT_FIELDS if field in params}
+        fingerprints["opa"] = canonical_key(
+            {**policy_input, "action": tool_name, "_policy_revision": revision}
+        ) if isinstance(revision, str) else None
+
+        if tool_name == "execute_trade":
+            state_version = getattr(self.safety_filter, "state_version", None)
+            # A Redis read of the shared balance: off the event loop.
+            state_version = await asyncio.to_thread(state_version) if callable(state_version) else None
+            fingerprints["cbf"] = canonical_key({
+                "tool": tool_name,
+                "amount": params.get("amount", 0.0),
+                "drawdown_pct": params.get("drawdown_pct"),
+                "state": state_version,
+            }) if isinstance(state_version, str) else None
+            fingerprints["consensus"] = canonical_key({
+                "tool": tool_name, "amount": params.get("amount", 0.0), "symbol": params.get("symbol", "UNKNOWN")
+            })
+        return fingerprints
+
+    def _set_ontology_version(self, span):
+        # The STPA snapshot this evaluation runs against (hot-reloaded, see ontology_reloader).
+        version = getattr(self.stpa_validator, "version", None)
+        if isinstance(version, str):
+            span.set_attribute("governance.ontology.version", version)
+
+    async def _run_stages(self, stages: List[GovernanceStage], span) -> None:
+        """
+        Runs `stages` concurrently (each as soon as its dependencies pass) and
+        raises the violation of the highest-precedence failing stage.
+        """
+        order = [stage.name for stage in stages]
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, float] = {}
+        skipped = set()
+
+        async def run(stage: GovernanceStage):
+            for dependency in stage.depends_on:
+                try:
+                    # Shielded: cancelling this stage must not cancel its dependency.
+                    await asyncio.shield(tasks[dependency])
+                except Exception:
+                    skipped.add(stage.name)
+                    return
+            start = time.perf_counter()
+            try:
+                await stage.run()
+            finally:
+                timings[stage.name] = (time.perf_counter() - start) * 1000
+
+        for stage in stages:
+            if any(order.index(d) >= order.index(stage.name) for d in stage.depends_on):
+                raise ValueError(f"Stage '{stage.name}' must come after its dependencies {stage.depends_on}")
+            tasks[stage.name] = asyncio.create_task(run(stage), name=f"governance.{stage.name}")
+
+        start = time.perf_counter()
+        try:
+            pending = set(tasks.values())
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = self._first_failure(order, tasks)
+                if failed is None:
+                    continue
+                # Lower-precedence stages can no longer change the outcome.
+                for name in order[order.index(failed) + 1:]:
+                    tasks[name].cancel()
+                # Higher-precedence stages still running could report a different violation.
+                if all(tasks[name].done() for name in order[:order.index(failed)]):
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            span.set_attribute("governance.latency_ms", (time.perf_counter() - start) * 1000)
+            for name, task in tasks.items():
+                outcome = "skipped" if name in skipped else self._stage_outcome(task)
+                span.set_attribute(f"governance.stage.{name}.outcome", outcome)
+                if name in timings:
+                    span.set_attribute(f"governance.stage.{name}.ms", timings[name])
+
+        failed = self._first_failure(order, tasks)
+        if failed is not None:
+            span.set_attribute("governance.failed_stage", failed)
+            raise tasks[failed].exception()
+
+    @staticmethod
+    def _first_failure(order: List[str], tasks: Dict[str, asyncio.Task]) -> Optional[str]:
+        for name in order:
+            task = tasks[name]
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                return name
+        return None
+
+    @staticmethod
+    def _stage_outcome(task: asyncio.Task) -> str:
+        if task.cancelled():
+            return "cancelled"
+        return "failed" if task.exception() is not None else "passed"
+
+    async def govern_batch(self, orders: List[Dict[str, Any]], tool_name: str = "execute_trade") -> List[Optional[str]]:
+        """
+        `govern` for a whole order set (e.g. a portfolio rebalance), in order.
+        Returns, per order, None if approved or the message `govern` would have
+        raised for it. Raises GovernanceError only if the deadline runs out.
+
+        STPA, confidence and the CBF barrier are evaluated over NumPy columns
+        against a single read of the cash state, with cumulative depletion
+        (order N sees orders 1..N-1 that pass). One batched OPA call covers the
+        orders that pass the local gates, and only orders that pass everything
+        go on to consensus. Depletion is conservative in one respect: an order
+        later rejected by consensus still counts against the orders after it.
+        """
+        logger.info(f"⚖️ Symbolic Governor evaluating batch: {len(orders)} x {tool_name}")
+        with tracer.start_as_current_span("governance.govern_batch") as span:
+            span.set_attribute("governance.tool", tool_name)
+            span.set_attribute("governance.batch.size", len(orders))
+            self._set_ontology_version(span)
+            try:
+                errors = await self._govern_batch(tool_name, orders, span)
+            except DeadlineExceeded as e:
+                raise GovernanceError(f"Latency Budget Exhausted: {e}") from e
+            approved = sum(1 for error in errors if error is None)
+            span.set_attribute("governance.batch.approved", approved)
+        logger.info(f"✅ Symbolic Governor batch: {approved}/{len(orders)} approved")
+        return errors
+
+    async def _govern_batch(self, tool_name: str, orders: List[Dict[str, Any]], span) -> List[Optional[str]]:
+        trade = tool_name == "execute_trade"
+        errors: List[Optional[str]] = [None] * len(orders)
+        timings: Dict[str, float] = {}
+
+        def reject(indices, message_for):
+            for i in indices:
+                if errors[i] is None:
+                    errors[i] = message_for(i)
+
+        # 0. STPA (numeric constraints as column operations)
+        check_deadline("stpa")
+        start = time.perf_counter()
+        stpa_violations = self.stpa_validator.validate_batch(tool_name, orders)
+        reject((i for i, v in enumerate(stpa_violations) if v), lambda i: f"STPA Violation: {stpa_violations[i][0]}")
+        timings["stpa"] = (time.perf_counter() - start) * 1000
+
+        if trade:
+            # 1. SR 11-7 confidence threshold (missing or unparseable confidence fails)
+            min_confidence = float(os.getenv("GOVERNANCE_MIN_CONFIDENCE", "0.95"))
+            confidences = numeric_column(orders, "confidence", 0.0)
+            reject(
+                np.flatnonzero(~(confidences >= min_confidence)),
+                lambda i: f"SR 11-7 Violation: Model Confidence {orders[i].get('confidence', 0.0)} < {min_confidence}. Action Rejected."
+            )
 
-    async def verify(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
+        # 3. OPA: one batched round-trip for the orders that passed the local gates.
+        # It runs before the CBF so that policy-denied orders do not reserve cash.
+        opa_errors: Dict[int, str] = {}
+        pending = [i for i, error in enumerate(errors) if error is None]
+        if pending:
+            check_deadline("opa")
+            start = time.perf_counter()
+            live = trade and any(not orders[i].get("dry_run", False) for i in pending)
+            decisions = await self.opa_client.evaluate_policy_batch(
+                [{**orders[i], "action": tool_name} for i in pending],
+                current_latency_ms=elapsed_ms(), bypass_cache=live
+            )
+            for i, decision in zip(pending, decisions):
+                violations = self._policy_violations(decision)
+                if violations:
+                    opa_errors[i] = violations[0]
+            timings["opa"] = (time.perf_counter() - start) * 1000
+
+        if trade:
+            # 2. CBF barrier sequence: every order still standing is checked (CBF
+            # violations take precedence over OPA's), only policy-approved ones deplete.
+            check_deadline("cbf")
+            start = time.perf_counter()
+            active = [error is None for error in errors]
+            reserve = [i not in opa_errors for i in range(len(orders))]
+            cbf_results = await asyncio.to_thread(self.safety_filter.verify_batch, tool_name, orders, active, reserve)
+            reject(
+                (i for i, result in enumerate(cbf_results) if result is not None and result.startswith("UNSAFE")),
+                lambda i: f"Safety Violation (RBC/CBF): {cbf_results[i]}"
+            )
+            timings["cbf"] = (time.perf_counter() - start) * 1000
+        reject(opa_errors, opa_errors.get)
+
+        # 4. Consensus only for orders that passed everything else
+        pending = [i for i, error in enumerate(errors) if error is None]
+        if trade and pending:
+            start = time.perf_counter()
+            limit = asyncio.Semaphore(Config.GOVERNANCE_BATCH_CONSENSUS_CONCURRENCY)
+
+            async def consensus(order: Dict[str, Any]) -> Optional[str]:
+                async with limit:
+                    result = await within_deadline(
+                        self.consensus_engine.check_consensus(
+                            tool_name, order.get("amount", 0.0), order.get("symbol", "UNKNOWN")
+                        ),
+                        "consensus"
+                    )
+                if result["status"] == "REJECT":
+                    return f"Consensus Rejection: {result['reason']}"
+                if result["status"] == "ESCALATE":
+                    return f"Consensus Escalation: {result['reason']}"
+                return None
+
+            results = await asyncio.gather(*(consensus(orders[i]) for i in pending), return_exceptions=True)
+            for i, result in zip(pending, results):
+                if isinstance(result, DeadlineExceeded):
+                    errors[i] = f"Latency Budget Exhausted: {result}"
+                elif isinstance(result, Exception):
+                    # Fail closed per order, as govern() would for this order alone.
+                    errors[i] = f"Consensus Check Failed: {result}"
+                elif result is not None:
+                    errors[i] = result
+            timings["consensus"] = (time.perf_counter() - start) * 1000
+
+        for name, ms in timings.items():
+            span.set_attribute(f"governance.stage.{name}.ms", ms)
+        return errors
+
+    async def verify(self, tool_name: str, params: Dict[str, Any], mode: str = VERIFY_EXHAUSTIVE) -> List[str]:
         """
         Performs a 'Dry Run' of all governance checks and returns a list of violations.
         Used by the Evaluator Agent (System 3) for simulation.
         Does NOT raise exceptions.
+
+        mode="exhaustive" runs every check and reports every violation.
+        mode="short_circuit" runs the checks cheapest first (STPA, confidence,
+        CBF, OPA, consensus) and stops at the first one that rejects, so a doomed
+        action never reaches the consensus LLM calls.
         """
-        violations = []
+        self._check_mode(mode)
+        violations: List[str] = []
+        checks = [
+            ("stpa", lambda: self._simulate_stpa(tool_name, params)),
+            ("confidence", lambda: self._simulate_confidence(tool_name, params)),
+            ("cbf", lambda: self._simulate_cbf(tool_name, params)),
+        ]
+        for name, check in checks:
+            result = check()
+            violations.extend(await result if inspect.isawaitable(result) else result)
+            if violations and mode == VERIFY_SHORT_CIRCUIT:
+                return self._short_circuit(tool_name, name, violations)
+
+        # 3. OPA Check
+        opa_payload = params.copy()
+        opa_payload["action"] = tool_name
+        try:
+            check_deadline("opa")
+            policy_decision = await self.opa_client.evaluate_policy(opa_payload, current_latency_ms=elapsed_ms())
+            violations.extend(self._policy_violations(policy_decision))
+        except Exception as e:
+            violations.append(f"OPA Check Failed: {e}")
+        if violations and mode == VERIFY_SHORT_CIRCUIT:
+            return self._short_circuit(tool_name, "opa", violations)
+
+        violations.extend(await self._simulate_consensus(tool_name, params))
+        return violations
+
+    async def verify_with_verdict(
+        self, tool_name: str, params: Dict[str, Any], mode: str = VERIFY_EXHAUSTIVE
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        `verify`, plus a signed verdict token when the dry run is clean. Passing
+        the token to `govern` for the same action skips the checks whose inputs
+        have not changed since (None when verdicts are disabled).
+        """
+        # Fingerprinted before the checks run: a state change during the dry run invalidates it.
+        fingerprints = await self.stage_fingerprints(tool_name, params)
+        violations = await self.verify(tool_name, params, mode=mode)
+        if violations:
+            return violations, None
+        return violations, await self._issue_verdict(tool_name, params, fingerprints)
+
+    async def verify_plan_with_verdicts(
+        self, steps: List[Dict[str, Any]], mode: str = VERIFY_EXHAUSTIVE
+    ) -> Tuple[List[List[str]], List[Optional[str]]]:
+        """
+        `verify_plan`, plus one verdict token per clean step (None for a step
+        with violations, or when verdicts are disabled). Each token covers that
+        step's own action, for `govern` to honour when the step is executed.
+        """
+        calls = [(step.get("action", "unknown"), step.get("parameters") or {}) for step in steps]
+        fingerprints = [await self.stage_fingerprints(tool_name, params) for tool_name, params in calls]
+        results = await self.verify_plan(steps, mode=mode)
+        verdicts = [
+            None if violations else await self._issue_verdict(tool_name, params, step_fingerprints)
+            for (tool_name, params), step_fingerprints, violations in zip(calls, fingerprints, results)
+        ]
+        return results, verdicts
+
+    async def _issue_verdict(
+        self, tool_name: str, params: Dict[str, Any], fingerprints: Dict[str, Optional[str]]
+    ) -> Optional[str]:
+        # The revision may only be learned from this dry run's own OPA round-trip.
+        if fingerprints.get("opa") is None:
+            fingerprints["opa"] = (await self.stage_fingerprints(tool_name, params)).get("opa")
+        return await self.verdict_store.issue(tool_name, fingerprints)
+
+    async def verify_plan(self, steps: List[Dict[str, Any]], mode: str = VERIFY_EXHAUSTIVE) -> List[List[str]]:
+        """
+        Dry-runs every step of an ExecutionPlan (`{"action", "parameters"}` dicts)
+        in one pass: local checks per step, a single batched OPA round-trip for
+        the whole plan, then consensus for trade steps concurrently.
+        Returns the violations for each step, in plan order.
+
+        In "short_circuit" mode a step rejected by a local check is left out of
+        the OPA batch, and only steps still clean after OPA reach consensus.
+        """
+        self._check_mode(mode)
+        short_circuit = mode == VERIFY_SHORT_CIRCUIT
+        calls = [(step.get("action", "unknown"), step.get("parameters") or {}) for step in steps]
+        violations = list(await asyncio.gather(*(self._simulate_local_checks(tool_name, params) for tool_name, params in calls)))
 
+        # 3. OPA Check (one request for the plan)
+        pending = [i for i, v in enumerate(violations) if not (short_circuit and v)]
+        opa_payloads = [{**calls[i][1], "action": calls[i][0]} for i in pending]
+        try:
+            check_deadline("opa")
+            decisions = await self.opa_client.evaluate_policy_batch(opa_payloads, current_latency_ms=elapsed_ms()) if pending else []
+            for i, decision in zip(pending, decisions):
+                violations[i].extend(self._policy_violations(decision))
+        except Exception as e:
+            for i in pending:
+                violations[i].append(f"OPA Check Failed: {e}")
+
+        pending = [i for i, v in enumerate(violations) if not (short_circuit and v)]
+        consensus = await asyncio.gather(*(self._simulate_consensus(*calls[i]) for i in pending))
+        for i, consensus_violations in zip(pending, consensus):
+            violations[i].extend(consensus_violations)
+
+        failed = sum(1 for v in violations if v)
+        logger.info(f"🧪 Plan dry run ({mode}): {len(steps)} steps, {failed} with violations")
+        return violations
+
+    @staticmethod
+    def _check_mode(mode: str):
+        if mode not in VERIFY_MODES:
+            raise ValueError(f"Unknown verify mode '{mode}' (expected one of {', '.join(VERIFY_MODES)})")
+
+    @staticmethod
+    def _short_circuit(tool_name: str, stage: str, violations: List[str]) -> List[str]:
+        logger.info(f"⏭️ Dry run of {tool_name} rejected at '{stage}': remaining checks skipped.")
+        return violations
+
+    async def _simulate_local_checks(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
+        return (
+            self._simulate_stpa(tool_name, params)
+            + self._simulate_confidence(tool_name, params)
+            + await self._simulate_cbf(tool_name, params)
+        )
+
+    def _simulate_stpa(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
         # 0. STPA Check
         # Inject simulated latency for Dry Run if missing (assume System is healthy)
         simulated_params = params.copy()
         if "latency_ms" not in simulated_params:
             simulated_params["latency_ms"] = float(os.getenv("GOVERNANCE_SIM_LATENCY_MS", "10.0"))
-        
-        stpa_violations = self.stpa_validator.validate(tool_name, simulated_params)
-        violations.extend(stpa_violations)
 
+        return list(self.stpa_validator.validate(tool_name, simulated_params))
+
+    def _simulate_confidence(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
         # 1. SR 11-7 Confidence Check (Trade specific)
-        if tool_name == "execute_trade":
-            # Default to High Confidence if not provided by Agent during simulation.
-            # The Agent doesn't calculate confidence itself usually; the Model Mesh does.
-            default_sim_confidence = float(os.getenv("GOVERNANCE_SIM_CONFIDENCE", "0.99"))
-            confidence = params.get("confidence", default_sim_confidence)
-            
-            min_confidence = float(os.getenv("GOVERNANCE_MIN_CONFIDENCE", "0.95"))
-            if confidence < min_confidence:
-                violations.append(f"SR 11-7 Violation: Model Confidence {confidence} < {min_confidence}.")
+        if tool_name != "execute_trade":
+            return []
+        # Default to High Confidence if not provided by Agent during simulation.
+        # The Agent doesn't calculate confidence itself usually; the Model Mesh does.
+        default_sim_confidence = float(os.getenv("GOVERNANCE_SIM_CONFIDENCE", "0.99"))
+        confidence = params.get("confidence", default_sim_confidence)
 
-            # 2. CBF Check
-            cbf_result = self.safety_filter.verify_action(tool_name, params)
-            if cbf_result.startswith("UNSAFE"):
-                violations.append(f"Safety Violation (CBF): {cbf_result}")
+        min_confidence = float(os.getenv("GOVERNANCE_MIN_CONFIDENCE", "0.95"))
+        if confidence < min_confidence:
+            return [f"SR 11-7 Violation: Model Confidence {confidence} < {min_confidence}."]
+        return []
 
-        # 3. OPA Check
-        opa_payload = params.copy()
-        opa_payload["action"] = tool_name
-        try:
-            policy_decision = await self.opa_client.evaluate_policy(opa_payload)
-            if policy_decision == "DENY":
-                violations.append("ISO 42001 Policy Violation: OPA Denied Action.")
-            elif policy_decision == "MANUAL_REVIEW":
-                violations.append("ISO 42001 Policy Check: Manual Review Required.")
-        except Exception as e:
-            violations.append(f"OPA Check Failed: {e}")
+    async def _simulate_cbf(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
+        # 2. CBF Check (Trade specific)
+        if tool_name != "execute_trade":
+            return []
+        cbf_result = await self._verify_action(tool_name, params)
+        if cbf_result.startswith("UNSAFE"):
+            return [f"Safety Violation (CBF): {cbf_result}"]
+        return []
+
+    @staticmethod
+    def _policy_violations(policy_decision: str) -> List[str]:
+        if policy_decision == "DENY":
+            return ["ISO 42001 Policy Violation: OPA Denied Action."]
+        if policy_decision == "MANUAL_REVIEW":
+            return ["ISO 42001 Policy Check: Manual Review Required."]
+        return []
 
+    async def _simulate_consensus(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
         # 4. Consensus Check (Trade specific) - Maybe skip for simple dry run to save time/tokens?
         # Or mock it. For now, we'll try to include it if feasible, but it's expensive.
         # Let's include it to be thorough, but wrap in try/except.
+        violations = []
         if tool_name == "execute_trade":
             try:
                 amount = params.get("amount", 0.0)
                 symbol = params.get("symbol", "UNKNOWN")
-                consensus = await self.consensus_engine.check_consensus(tool_name, amount, symbol)
+                consensus = await within_deadline(
+                    self.consensus_engine.check_consensus(tool_name, amount, symbol), "consensus"
+                )
                 if consensus["status"] == "REJECT":
                      violations.append(f"Consensus Rejection: {consensus['reason']}")
                 elif consensus["status"] == "ESCALATE":
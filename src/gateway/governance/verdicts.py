@@ -0,0 +1,114 @@
+"""
+Signed Governance Verdicts
+
+An approved dry run (`SymbolicGovernor.verify_with_verdict`) can issue a
+short-lived verdict token. The verdict records, per stage (CBF, OPA, consensus),
+a fingerprint of everything that stage's outcome depends on: the tool, the
+parameters it reads, the policy revision and the CBF state version. When
+`govern()` is handed the token it recomputes the fingerprints and skips the
+stages whose inputs are unchanged; STPA and confidence always run (they are
+free, and the dry run simulates their inputs).
+
+Verdicts live in Redis with a TTL, so a token issued by one gateway replica is
+honoured by any other. The token is `<id>.<hmac>`: the HMAC (shared secret
+`GOVERNANCE_VERDICT_SECRET`) covers the id and the stored record, so neither a
+forged token nor an edited Redis entry is accepted. Both are read and written
+from `govern()` on the event loop, through the asyncio Redis client.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+from typing import Dict, Optional, Set
+
+from config.settings import Config
+from src.gateway.core.metrics import GOVERNANCE_VERDICTS
+
+logger = logging.getLogger("Gateway.Governance.Verdicts")
+
+VERDICT_KEY_PREFIX = "governance:verdict:"
+
+
+class VerdictStore:
+    def __init__(self, secret: Optional[str] = None, ttl_s: Optional[int] = None, redis_client=None):
+        secret = Config.GOVERNANCE_VERDICT_SECRET if secret is None else secret
+        self.secret = secret.encode() if secret else None
+        self.ttl_s = Config.GOVERNANCE_VERDICT_TTL_S if ttl_s is None else ttl_s
+        self._redis = redis_client
+
+    @property
+    def enabled(self) -> bool:
+        return self.secret is not None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+            self._redis = redis_client
+        return self._redis
+
+    def _sign(self, verdict_id: str, record: str) -> str:
+        return hmac.new(self.secret, f"{verdict_id}.{record}".encode(), hashlib.sha256).hexdigest()
+
+    async def issue(self, tool_name: str, fingerprints: Dict[str, Optional[str]]) -> Optional[str]:
+        """Stores a verdict for the stages with a fingerprint; returns its token."""
+        stages = {stage: fp for stage, fp in fingerprints.items() if fp is not None}
+        if not self.enabled or not stages:
+            return None
+        verdict_id = secrets.token_hex(16)
+        # expires_at is checked on read too: it is signed, unlike the key's TTL.
+        record = json.dumps(
+            {"tool": tool_name, "stages": stages, "expires_at": time.time() + self.ttl_s},
+            sort_keys=True, separators=(",", ":")
+        )
+        await self.redis.aset(VERDICT_KEY_PREFIX + verdict_id, record, ttl=self.ttl_s)
+        GOVERNANCE_VERDICTS.labels("issued").inc()
+        logger.info(f"🎫 Verdict issued for {tool_name}: stages {sorted(stages)}")
+        return f"{verdict_id}.{self._sign(verdict_id, record)}"
+
+    async def reusable_stages(
+        self,
+        token: Optional[str],
+        tool_name: str,
+        fingerprints: Dict[str, Optional[str]],
+        consume: bool = False
+    ) -> Set[str]:
+        """
+        Stages of a valid, unexpired verdict for `tool_name` whose fingerprint
+        still matches. `consume` deletes the verdict (one live execution per token)
+        with a compare-and-delete, so of two replicas presenting the same token
+        only one honours it.
+        """
+        if not self.enabled or not token:
+            return set()
+        verdict_id, _, signature = token.partition(".")
+        key = VERDICT_KEY_PREFIX + verdict_id
+        record = await self.redis.aget(key) if verdict_id else None
+        if record is None:
+            return self._reject("expired", tool_name)
+        if not hmac.compare_digest(signature, self._sign(verdict_id, record)):
+            return self._reject("invalid", tool_name)
+        verdict = json.loads(record)
+        if verdict["expires_at"] < time.time():
+            return self._reject("expired", tool_name)
+        if verdict["tool"] != tool_name:
+            return self._reject("mismatch", tool_name)
+
+        reused = {
+            stage for stage, fp in verdict["stages"].items()
+            if fingerprints.get(stage) is not None and hmac.compare_digest(fp, fingerprints[stage])
+        }
+        if consume and not await self.redis.adelete_if_equals(key, record):
+            # Another live execution consumed it since we read it.
+            return self._reject("consumed", tool_name)
+        GOVERNANCE_VERDICTS.labels("reused" if reused else "mismatch").inc()
+        return reused
+
+    @staticmethod
+    def _reject(outcome: str, tool_name: str) -> Set[str]:
+        GOVERNANCE_VERDICTS.labels(outcome).inc()
+        logger.warning(f"🎫 Verdict for {tool_name} not honoured ({outcome}): running every stage.")
+        return set()
@@ -0,0 +1,149 @@
+"""
+gRPC front-end for the Hybrid Gateway (gateway.proto).
+
+Runs on the FastAPI app's event loop (started from its lifespan) and serves the
+same pipeline as the HTTP/MCP transports: `Chat` goes through the NeMo input
+rails, generation and windowed output rails; `ExecuteTool` dispatches through the
+tool registry, which applies `enforce_governance` for side-effecting tools.
+The chat pipeline is injected by hybrid_server to avoid a circular import.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+import grpc
+from opentelemetry import trace
+
+from config.settings import Config
+from src.gateway.core.admission import AdmissionRejected
+from src.gateway.core.deadline import DeadlineExceeded, deadline_scope
+from src.gateway.core.registry import ToolRegistry
+from src.gateway.protos import gateway_pb2, gateway_pb2_grpc
+
+logger = logging.getLogger("Gateway.gRPC")
+tracer = trace.get_tracer("gateway.grpc")
+
+ChatPipeline = Callable[[Dict[str, Any]], AsyncIterator[Tuple[str, Any]]]
+
+# Long-lived agent channels: keep them warm through idle proxies / load balancers.
+SERVER_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+def grpc_deadline_ms(context) -> float:
+    """The caller's native gRPC deadline in ms, else the gateway default."""
+    remaining = context.time_remaining()
+    return remaining * 1000 if remaining is not None else Config.GATEWAY_REQUEST_DEADLINE_MS
+
+
+def chat_payload(request: gateway_pb2.ChatRequest) -> Dict[str, Any]:
+    """Maps a ChatRequest onto the HTTP endpoint's ChatCompletionRequest fields."""
+    payload: Dict[str, Any] = {
+        "model": request.model or "default",
+        "messages": [{"role": m.role, "content": m.content} for m in request.messages],
+        # proto3 scalars have no presence: 0.0 is passed through (deterministic decoding).
+        "temperature": request.temperature,
+        "stream": True,
+        "system_instruction": request.system_instruction or None,
+        "guided_regex": request.guided_regex or None,
+        "mode": request.mode or "chat",
+    }
+    # JSON-encoded constraint fields
+    if request.guided_json:
+        payload["guided_json"] = json.loads(request.guided_json)
+    if request.guided_choice:
+        payload["guided_choice"] = json.loads(request.guided_choice)
+    return payload
+
+
+class GatewayService(gateway_pb2_grpc.GatewayServicer):
+    def __init__(self, chat_pipeline: ChatPipeline, registry: ToolRegistry):
+        self.chat_pipeline = chat_pipeline
+        self.registry = registry
+
+    async def Chat(self, request, context):
+        try:
+            payload = chat_payload(request)
+        except json.JSONDecodeError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Invalid guided_json/guided_choice: {e}")
+
+        with tracer.start_as_current_span("gateway.grpc.chat") as span, deadline_scope(grpc_deadline_ms(context)):
+            span.set_attribute("gen_ai.request.model", payload["model"])
+            span.set_attribute("gateway.chat.mode", request.mode or "chat")
+            try:
+                final = gateway_pb2.ChatResponse(is_final=True)
+                async for kind, value in self.chat_pipeline(payload):
+                    if kind == "content":
+                        yield gateway_pb2.ChatResponse(content=value)
+                    elif kind == "usage":
+                        # Reported on the final chunk (generation tokens, as in the HTTP `usage`).
+                        final.input_tokens = value["prompt_tokens"]
+                        final.output_tokens = value["completion_tokens"]
+                    else:
+                        yield final
+            except AdmissionRejected as e:
+                # gRPC equivalent of 429 + Retry-After.
+                span.set_attribute("gateway.admission.rejected", True)
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    str(e),
+                    trailing_metadata=(("retry-after", str(e.retry_after_s)),)
+                )
+            except DeadlineExceeded as e:
+                span.set_attribute("gateway.deadline.stage", e.stage)
+                await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+            except Exception as e:
+                logger.error(f"gRPC Chat Error: {e}")
+                span.record_exception(e)
+                await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+    async def ExecuteTool(self, request, context):
+        # Failures are reported in-band (status/error), mirroring /tools/execute.
+        logger.info(f"gRPC Tool Execution Request: {request.tool_name}")
+        try:
+            params = json.loads(request.params_json) if request.params_json else {}
+        except json.JSONDecodeError as e:
+            return gateway_pb2.ToolResponse(status="ERROR", error=f"Invalid params_json: {e}")
+
+        try:
+            with deadline_scope(grpc_deadline_ms(context)):
+                output = str(await self.registry.dispatch(request.tool_name, params))
+        except PermissionError as e:
+            return gateway_pb2.ToolResponse(status="BLOCKED", error=str(e))
+        except Exception as e:
+            logger.error(f"gRPC Tool Execution Error: {e}")
+            return gateway_pb2.ToolResponse(status="ERROR", error=str(e))
+
+        # Governed tools report refusals in-band (e.g. "BLOCKED: Governance Blocked: ...").
+        status = "BLOCKED" if output.startswith("BLOCKED") else "SUCCESS"
+        return gateway_pb2.ToolResponse(status=status, output=output)
+
+
+class GatewayGrpcServer:
+    """Owns the grpc.aio server; started/stopped from the FastAPI lifespan."""
+
+    def __init__(self, service: GatewayService, port: Optional[int] = None, reuseport: Optional[bool] = None):
+        self.service = service
+        self.port = Config.GATEWAY_GRPC_PORT if port is None else port
+        # gRPC turns SO_REUSEPORT on by default on Linux, so a second process would
+        # silently share the port. Only gunicorn workers opt in; otherwise a clash fails.
+        self.reuseport = Config.GATEWAY_GRPC_REUSEPORT if reuseport is None else reuseport
+        self.server: Optional[grpc.aio.Server] = None
+
+    async def start(self) -> int:
+        self.server = grpc.aio.server(options=SERVER_OPTIONS + [("grpc.so_reuseport", int(self.reuseport))])
+        gateway_pb2_grpc.add_GatewayServicer_to_server(self.service, self.server)
+        bound = self.server.add_insecure_port(f"[::]:{self.port}")
+        await self.server.start()
+        logger.info(f"🚀 Gateway gRPC server listening on port {bound}")
+        return bound
+
+    async def stop(self, grace: float = 5.0):
+        if self.server is not None:
+            await self.server.stop(grace)
+            self.server = None
@@ -0,0 +1,56 @@
+"""
+Gunicorn configuration for the multi-worker Hybrid Gateway.
+
+    gunicorn -c src/gateway/server/gunicorn_conf.py src.gateway.server.hybrid_server:app
+
+The app is imported once in the master (`preload_app`), so the Rails config,
+Colang flows and governance singletons are built before fork. The master then
+warms the Presidio/spaCy analyzers and freezes the GC so workers share those
+pages copy-on-write. Per-request clients (vLLM pool, tool threads) are created
+inside each worker's lifespan.
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+
+# These must be set before the app (and prometheus_client / config.settings) is imported.
+# Mutable governance state is shared through Redis rather than held per worker.
+os.environ.setdefault("CIRCUIT_BREAKER_BACKEND", "redis")
+# Every worker starts the gRPC server on GATEWAY_GRPC_PORT; SO_REUSEPORT lets the
+# kernel spread incoming connections across them.
+os.environ.setdefault("GATEWAY_GRPC_REUSEPORT", "true")
+multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "gateway-prometheus")
+)
+# Stale per-pid sample files from a previous run would be summed into the scrape.
+shutil.rmtree(multiproc_dir, ignore_errors=True)
+os.makedirs(multiproc_dir, exist_ok=True)
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv("GATEWAY_WORKERS", os.cpu_count() or 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GATEWAY_WORKER_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    """Runs in the master after the app is loaded and before the first fork."""
+    from src.gateway.governance.nemo.manager import warm_shared_resources
+    from src.gateway.server.hybrid_server import rails
+
+    warm_shared_resources(rails)
+
+    # Move everything allocated so far out of the GC's reach: collections in the
+    # workers would otherwise touch (and so copy) every shared object's header.
+    gc.freeze()
+    server.log.info(f"Gateway master ready: {workers} workers, {gc.get_freeze_count()} objects frozen")
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,13 +1,18 @@
 import asyncio
+import hmac
 import logging
 import json
 import os
 import sys
-from typing import List, Optional, Dict, Any, Union
+import time
+import uuid
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Union
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from opentelemetry import trace
 from pydantic import BaseModel, Field
 
 # Adjust path so we can import from src
@@ -15,13 +20,26 @@ sys.path.append(".")
 
 from mcp.server.fastmcp import FastMCP
 
+from config.settings import Config
+
 # Core logic
 from src.gateway.core.tools import execute_trade, TradeOrder
+from src.gateway.core.admission import Admission, AdmissionRejected, admission_controller, bind_request
+from src.gateway.core.batch import execute_batch
+from src.gateway.core.deadline import DeadlineExceeded, DeadlineMiddleware, within_deadline
+from src.gateway.core.registry import tool_registry
 from src.gateway.core.market import market_service
-from src.gateway.governance.singletons import symbolic_governor, opa_client
+from src.gateway.core.metrics import SCALING_METRICS, render_latest
+from src.gateway.core.speculation import SpeculativeGeneration
+from src.gateway.core.upstream import vllm_pool
+from src.gateway.core.usage import TokenUsage, track_usage
+from src.gateway.governance.singletons import symbolic_governor, opa_client, ontology_reloader
+from src.gateway.governance.ontology_reloader import RELOAD_ERRORS
 from src.gateway.governance.symbolic_governor import GovernanceError
 from src.gateway.governance.nemo.manager import initialize_rails, validate_with_nemo
-from src.governed_financial_advisor.tools.market_data_tool import get_market_data
+from src.gateway.server.grpc_server import GatewayGrpcServer, GatewayService
+from src.governed_financial_advisor.infrastructure.redis_client import SAFETY_VIOLATION_KEY, redis_client
+from src.governed_financial_advisor.tools.market_data_tool import get_market_data as fetch_market_data
 
 # Configure Logging via Telemetry (Centralized Control)
 from src.governed_financial_advisor.utils.telemetry import configure_telemetry, logger
@@ -34,13 +52,35 @@ rails = initialize_rails()
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Hybrid Gateway Starting...")
-    yield
+    await vllm_pool.start()
+    opa_client.cache.start_listener()
+    ontology_reloader.start()
+    grpc_server = None
+    if Config.GATEWAY_GRPC_ENABLED:
+        grpc_server = GatewayGrpcServer(GatewayService(governed_chat_events, tool_registry))
+        await grpc_server.start()
+    # Mounted sub-apps don't get lifespan events: run the streamable HTTP session manager here.
+    async with mcp.session_manager.run():
+        yield
     # Shutdown
     logger.info("🛑 Hybrid Gateway Shutting Down...")
+    if grpc_server is not None:
+        await grpc_server.stop()
+    await vllm_pool.close()
+    opa_client.cache.stop_listener()
+    await ontology_reloader.stop()
     await opa_client.close()
+    await redis_client.aclose()
+    tool_registry.shutdown()
 
 # --- 2. Initialize FastAPI App ---
 app = FastAPI(title="Governed Financial Advisor Gateway (Hybrid)", lifespan=lifespan)
+# Per-request latency budget; MCP tool calls get theirs in the tool registry.
+app.add_middleware(
+    DeadlineMiddleware,
+    default_ms=Config.GATEWAY_REQUEST_DEADLINE_MS,
+    exclude_prefixes=("/mcp", "/health", "/metrics")
+)
 
 try:
     from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -59,79 +99,146 @@ try:
 except ImportError:
     logger.warning("⚠️ FastAPIInstrumentor not found, skipping framework instrumentation.")
 
-# --- 3. Initialize MCP Server ---
-mcp = FastMCP("Governed Gateway")
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    # Load shedding: the vLLM route stayed saturated for longer than the queue budget.
+    return JSONResponse(
+        status_code=429,
+        content={"error": {"message": str(exc), "type": "rate_limit_exceeded", "route": exc.route, "priority": exc.priority}},
+        headers={"Retry-After": str(exc.retry_after_s)}
+    )
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    return JSONResponse(
+        status_code=504,
+        content={"error": {"message": str(exc), "type": "deadline_exceeded", "stage": exc.stage}}
+    )
 
-async def enforce_governance(tool_name: str, params: dict):
+# --- 3. Initialize MCP Server ---
+# Streamable HTTP is stateless with plain JSON responses: every tool call is an
+# independent POST, so calls spread across gateway replicas like any HTTP request.
+# host="0.0.0.0" matches the server bind address; FastMCP's localhost default turns on
+# DNS-rebinding Host checks that reject in-cluster / load-balanced Host headers.
+mcp = FastMCP(
+    "Governed Gateway",
+    host="0.0.0.0",
+    stateless_http=True,
+    json_response=True,
+    streamable_http_path="/"
+)
+
+async def enforce_governance(tool_name: str, params: dict, verdict_token: Optional[str] = None, reserve: bool = False) -> Optional[str]:
     """
     Centralized Governance Check (OPA, Safety, Consensus).
+    `verdict_token` is an approved dry run's verdict (see check_safety_constraints).
+    With `reserve`, returns the CBF reservation id holding a live trade's cost.
     """
     # 1. Neuro-Symbolic Governance Layer
     # Enforces SR 11-7 (Rules) and ISO 42001 (Policy/Process)
     if tool_name not in ["check_market_status", "verify_content_safety"]:
         try:
-            await symbolic_governor.govern(tool_name, params)
+            return await symbolic_governor.govern(tool_name, params, verdict_token=verdict_token, reserve=reserve)
         except GovernanceError as e:
             logger.warning(f"🛡️ Symbolic Governor BLOCKED {tool_name}: {e}")
             raise PermissionError(f"Governance Blocked: {e}")
 
-    return True
+    return None
+
+# Defaults of execute_trade_action. A dry run applies them too, so that its
+# verdict fingerprints the same policy input as the live call it approves.
+DEFAULT_RISK_PROFILE = "Medium"
+DEFAULT_TRADER_ROLE = "junior"
+
+def dry_run_params(tool_name: str, params: dict, risk_profile: str) -> dict:
+    """The parameters a dry run of `tool_name` is evaluated with."""
+    defaults = {"trader_role": DEFAULT_TRADER_ROLE} if tool_name == "execute_trade" else {}
+    return {**defaults, **params, "risk_profile": risk_profile}
 
 # --- 4. MCP Tools Definition ---
 
-@mcp.tool()
-async def check_safety_constraints(target_tool: str, target_params: dict, risk_profile: str = "Medium") -> str:
+@tool_registry.tool(mcp, read_only=True, deduplicate=False)
+async def check_safety_constraints(target_tool: str, target_params: dict, risk_profile: str = DEFAULT_RISK_PROFILE) -> str:
     """
     Meta-tool: Runs a dry-run of the Symbolic Governor on a proposed action.
     Used by the Evaluator Agent (System 3) to verify safety before execution.
+    An approval may carry a VERDICT token; passing it to execute_trade_action
+    lets the gateway skip the checks whose inputs have not changed.
     """
     logger.info(f"🔍 Evaluator verifying proposed action: {target_tool} (Risk: {risk_profile})")
     
-    verification_params = target_params.copy()
-    verification_params["risk_profile"] = risk_profile
-    
-    violations = await symbolic_governor.verify(target_tool, verification_params)
+    verification_params = dry_run_params(target_tool, target_params, risk_profile)
+
+    violations, verdict_token = await symbolic_governor.verify_with_verdict(
+        target_tool, verification_params, mode=Config.GOVERNANCE_VERIFY_MODE
+    )
 
     if not violations:
+        if verdict_token:
+            return f"APPROVED: No violations detected. VERDICT: {verdict_token}"
         return "APPROVED: No violations detected."
     else:
         return f"REJECTED: {'; '.join(violations)}"
 
-@mcp.tool()
-async def trigger_safety_intervention(reason: str) -> str:
+@tool_registry.tool(mcp, read_only=True, deduplicate=False)
+async def check_plan_safety(steps: list, risk_profile: str = DEFAULT_RISK_PROFILE) -> str:
+    """
+    Meta-tool: Dry-runs every step of an execution plan in one pass
+    (one batched OPA evaluation). Steps are {"id", "action", "parameters"} dicts.
+    An approval may carry VERDICTS, a JSON object of verdict tokens by step id:
+    each step's token goes to execute_trade_action with that step.
+    """
+    logger.info(f"🔍 Evaluator verifying plan of {len(steps)} steps (Risk: {risk_profile})")
+
+    plan_steps = [
+        {**step, "parameters": dry_run_params(step.get("action"), step.get("parameters") or {}, risk_profile)}
+        for step in steps
+    ]
+    results, verdicts = await symbolic_governor.verify_plan_with_verdicts(plan_steps, mode=Config.GOVERNANCE_VERIFY_MODE)
+
+    rejected = [
+        f"step {step.get('id', i + 1)} ({step.get('action')}): {'; '.join(violations)}"
+        for i, (step, violations) in enumerate(zip(plan_steps, results)) if violations
+    ]
+    if not rejected:
+        tokens = {
+            str(step.get("id", i + 1)): token
+            for i, (step, token) in enumerate(zip(plan_steps, verdicts)) if token
+        }
+        if tokens:
+            return f"APPROVED: No violations detected in {len(steps)} steps. VERDICTS: {json.dumps(tokens)}"
+        return f"APPROVED: No violations detected in {len(steps)} steps."
+    return f"REJECTED: {' | '.join(rejected)}"
+
+@tool_registry.tool(mcp)
+def trigger_safety_intervention(reason: str) -> str:
     """
     Emergency Stop: Locks the system via Redis when a violation is detected.
     """
     logger.critical(f"🛑 SAFETY INTERVENTION TRIGGERED: {reason}")
-    from src.governed_financial_advisor.infrastructure.redis_client import redis_client
-    redis_client.set("safety_violation", reason)
+    redis_client.set(SAFETY_VIOLATION_KEY, reason)
     return "INTERVENTION_ACK: System Locked."
 
-@mcp.tool()
-async def check_market_status(symbol: str) -> str:
+@tool_registry.tool(mcp, read_only=True)
+def check_market_status(symbol: str) -> str:
     """Checks the current market status and price for a given ticker symbol."""
     logger.info(f"Tool Call: check_market_status({symbol})")
     return market_service.check_status(symbol)
 
-@mcp.tool()
+@tool_registry.tool(mcp, read_only=True)
 async def get_market_sentiment(symbol: str) -> str:
     """Fetches real-time market sentiment and news for a given ticker symbol using AlphaVantage."""
     logger.info(f"Tool Call: get_market_sentiment({symbol})")
     return await market_service.get_sentiment(symbol)
 
-@mcp.tool()
-async def get_market_data(ticker: str) -> str:
+@tool_registry.tool(mcp, read_only=True)
+def get_market_data(ticker: str) -> str:
     """Fetches comprehensive market data for a given ticker using yfinance."""
     logger.info(f"Tool Call: get_market_data({ticker})")
-    # Wrap synchronous tool if necessary, but FastMCP supports async/sync
-    # get_market_data is likely sync, correct?
-    # FunctionTool wrapper in ADK can handle it if we just call it.
-    # But here we are in FastAPI/MCP. FastMCP handles sync functions in threadpool usually?
-    # Let's assume yes or make it async if needed.
-    # The original tool is sync.
-    return get_market_data(ticker)
+    # yfinance is blocking; the registry runs sync tools on its thread pool.
+    return fetch_market_data(ticker)
 
-@mcp.tool()
+@tool_registry.tool(mcp, read_only=True)
 async def verify_content_safety(text: str) -> str:
     """Verifies if the provided text content is safe using NeMo Guardrails."""
     logger.info("Tool Call: verify_content_safety")
@@ -140,7 +247,7 @@ async def verify_content_safety(text: str) -> str:
         return f"BLOCKED: {response}"
     return "SAFE"
 
-@mcp.tool()
+@tool_registry.tool(mcp, read_only=True)
 async def evaluate_policy(action: str, description: str = None, dry_run: bool = True, **kwargs) -> str:
     """Evaluates an action against OPA policy without executing it."""
     logger.info(f"Tool Call: evaluate_policy(action={action})")
@@ -159,9 +266,16 @@ async def evaluate_policy(action: str, description: str = None, dry_run: bool =
         logger.error(f"Policy Check Error: {e}")
         return f"ERROR: {e}"
 
-@mcp.tool()
-async def execute_trade_action(symbol: str, amount: float, currency: str, transaction_id: str = None, trader_id: str = "agent_001", trader_role: str = "junior", dry_run: bool = False) -> str:
-    """Executes a financial trade under strict governance."""
+# Serialised per trader: governance, safety-filter state and the broker call for one
+# account never interleave; different accounts trade in parallel.
+@tool_registry.tool(mcp, lane_key="trader_id")
+async def execute_trade_action(symbol: str, amount: float, currency: str, transaction_id: str = None, trader_id: str = "agent_001", trader_role: str = DEFAULT_TRADER_ROLE, dry_run: bool = False, risk_profile: str = DEFAULT_RISK_PROFILE, verdict_token: str = None) -> str:
+    """
+    Executes a financial trade under strict governance.
+    `verdict_token` is the VERDICT from an approving check_safety_constraints
+    call (or this step's entry in check_plan_safety's VERDICTS), made with the
+    same `risk_profile`.
+    """
     logger.info(f"Tool Call: execute_trade({symbol}, {amount})")
     import uuid
     if not transaction_id: transaction_id = str(uuid.uuid4())
@@ -169,36 +283,94 @@ async def execute_trade_action(symbol: str, amount: float, currency: str, transa
     params = {
         "symbol": symbol, "amount": amount, "currency": currency,
         "transaction_id": transaction_id, "trader_id": trader_id,
-        "trader_role": trader_role, "dry_run": dry_run
+        "trader_role": trader_role, "dry_run": dry_run, "risk_profile": risk_profile
     }
 
     try:
-        await enforce_governance("execute_trade", params)
+        # The CBF check holds the trade's cost atomically (one Redis round-trip).
+        reservation_id = await enforce_governance("execute_trade", params, verdict_token=verdict_token, reserve=True)
     except Exception as e:
         return f"BLOCKED: {e}"
 
     if dry_run:
         return "DRY_RUN: APPROVED by OPA, Safety, and Consensus."
 
-    symbolic_governor.safety_filter.update_state(amount)
-
     try:
         order = TradeOrder(**params)
         result = await execute_trade(order)
-        return result
     except Exception as e:
         logger.error(f"Execution Error: {e}")
-        symbolic_governor.safety_filter.rollback_state(amount)
+        if reservation_id:
+            await asyncio.to_thread(symbolic_governor.safety_filter.release, reservation_id)
         return f"ERROR: {e}"
+    if reservation_id:
+        # The commit script is a blocking Redis call: keep it off the event loop.
+        await asyncio.to_thread(symbolic_governor.safety_filter.commit, reservation_id, amount)
+    return result
+
+@mcp.tool()
+async def execute_tool_batch(calls: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> str:
+    """
+    Executes a list of {tool_name, params} calls in one round-trip.
+    Read-only tools run concurrently and identical calls run once (dry-run safety
+    checks excepted: each returns its own verdict token); side-effecting
+    tools (e.g. execute_trade_action) run in order. Returns a JSON list of
+    per-call results in input order.
+    """
+    logger.info(f"Tool Call: execute_tool_batch({len(calls)} calls)")
+    results = await execute_batch(
+        calls, tool_registry.dispatch, tool_registry.read_only_tools, max_concurrency, tool_registry.distinct_tools
+    )
+    return json.dumps(results)
 
 # --- 5. Mount MCP Server ---
-logger.info("Mounting MCP SSE App at /sse_app...")
+# Streamable HTTP first: the SSE mount at /mcp would otherwise shadow /mcp/http.
+logger.info("Mounting MCP Streamable HTTP App at /mcp/http/...")
+app.mount("/mcp/http", mcp.streamable_http_app())
+logger.info("Mounting MCP SSE App at /mcp/sse...")
 app.mount("/mcp", mcp.sse_app())
 
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "mode": "hybrid", "nemo": "active"}
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint."""
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
+
+@app.get("/metrics/scaling")
+async def scaling_metrics():
+    """
+    Autoscaling signal: in-flight and queued requests per vLLM route / priority
+    class and per tool. Small enough to scrape every few seconds (KEDA via GMP).
+    """
+    payload, content_type = render_latest(SCALING_METRICS)
+    return Response(content=payload, media_type=content_type)
+
+@app.post("/admin/governance/ontology/reload")
+async def reload_ontology(authorization: Optional[str] = Header(default=None)):
+    """
+    Reloads the STPA ontology file in this worker (the others pick the change
+    up by polling). A file that fails to load leaves the active ontology in place.
+    """
+    if not Config.GATEWAY_ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled.")
+    if not hmac.compare_digest(authorization or "", f"Bearer {Config.GATEWAY_ADMIN_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+    try:
+        snapshot = await ontology_reloader.reload("admin")
+    except RELOAD_ERRORS as e:
+        raise HTTPException(status_code=422, detail=f"Ontology not reloaded: {e}")
+    active = ontology_reloader.validator.snapshot
+    return {
+        "status": "swapped" if snapshot is not None else "unchanged",
+        "version": active.version,
+        "load_ms": active.load_ms,
+        "compile_ms": active.compile_ms
+    }
+
 # --- 6. Chat Endpoint (OpenAI Compatible) ---
 
 class ChatMessage(BaseModel):
@@ -214,85 +386,342 @@ class ChatCompletionRequest(BaseModel):
     guided_json: Optional[Dict[str, Any]] = None
     guided_regex: Optional[str] = None
     guided_choice: Optional[List[str]] = None
+    # Overrides Config.SPECULATIVE_GENERATION for this request
+    speculative: Optional[bool] = None
+    # Admission priority class: governance > verifier > chat > planner
+    mode: Optional[str] = "chat"
+    # OpenAI stream options; {"include_usage": true} adds a final usage chunk to SSE streams
+    stream_options: Optional[Dict[str, Any]] = None
+
+def _to_nemo_messages(request: ChatCompletionRequest) -> List[Dict[str, str]]:
+    """Converts OpenAI-style messages to NeMo's role names and injects the system instruction."""
+    messages = []
+    for m in request.messages:
+        role = m.role
+        if role == "assistant":
+            role = "bot"
+        messages.append({"role": role, "content": m.content})
+
+    # Inject system instruction if provided (as first message)
+    if request.system_instruction:
+        if not messages or messages[0]["role"] != "system":
+            messages.insert(0, {"role": "system", "content": request.system_instruction})
+    return messages
+
+def _to_openai_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Maps NeMo role names back to the OpenAI roles vLLM expects."""
+    role_map = {"bot": "assistant", "human": "user"}
+    return [{"role": role_map.get(m["role"], m["role"]), "content": m["content"]} for m in messages]
+
+def _generation_params(request: ChatCompletionRequest) -> Dict[str, Any]:
+    """Sampling and guided-decoding params forwarded to vLLM."""
+    return {
+        "temperature": request.temperature,
+        "guided_json": request.guided_json,
+        "guided_regex": request.guided_regex,
+        "guided_choice": request.guided_choice,
+    }
+
+def _first_response_content(res: Any) -> str:
+    """Extracts the first bot message from a NeMo generation result."""
+    if hasattr(res, "response") and isinstance(res.response, list) and len(res.response) > 0:
+        return res.response[0].get("content", "")
+    # Fallback for dictionaries if NeMo changes API
+    if isinstance(res, dict) and "response" in res and len(res["response"]) > 0:
+        return res["response"][0].get("content", "")
+    return ""
+
+async def _apply_output_rails(messages: List[Dict[str, str]], response_text: str) -> tuple[str, bool]:
+    """
+    Runs the output rails (Unsafe Dialogues & PII Masking) over a bot response.
+    Returns (possibly rewritten text, blocked).
+    """
+    output_res = await rails.generate_async(
+        messages=messages + [{"role": "bot", "content": response_text}],
+        options={"rails": ["output"], "log": {"activated_rails": True}}
+    )
+    out_content = _first_response_content(output_res)
+
+    log = getattr(output_res, "log", None)
+    activated = getattr(log, "activated_rails", None) or []
+    blocked = any(getattr(r, "stop", False) for r in activated)
+
+    return (out_content if out_content else response_text), blocked
+
+def _sse_chunk(resp_id: str, created: int, model: str, delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+    payload = {
+        "id": resp_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+async def _governed_stream(
+    request: ChatCompletionRequest,
+    messages: List[Dict[str, str]],
+    refusal: str,
+    span,
+    speculation: Optional[SpeculativeGeneration] = None,
+    admission: Optional[Admission] = None
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Transport-agnostic governed token stream, shared by the SSE endpoint and the
+    gRPC `Chat` RPC. Yields ("content", text) pieces, then ("finish", reason).
+    Tokens come from the pooled vLLM upstream client (or the committed speculative
+    generation's buffer, if one was started); output rails run over sliding windows
+    (see StreamingOutputRails) so a violation stops the stream before the bad span
+    is flushed. TTFT and per-window rail latency are recorded on the request span.
+    `admission` is the slot acquired for this request's generation; it is released
+    when the upstream stream ends (or right away if there is nothing to generate).
+    """
+    from src.gateway.governance.nemo.stream_rails import StreamingOutputRails
+
+    start = time.perf_counter()
+    first_token_ms = None
+    finish_reason = "stop"
+
+    def _record_first_token():
+        nonlocal first_token_ms
+        if first_token_ms is None:
+            first_token_ms = (time.perf_counter() - start) * 1000
+            if span is not None:
+                span.set_attribute("gen_ai.response.time_to_first_token_ms", first_token_ms)
+
+    # Input rails already refused: stream the canned refusal and stop.
+    if refusal:
+        if admission is not None:
+            admission.release()
+        _record_first_token()
+        yield "content", refusal
+        yield "finish", finish_reason
+        return
+
+    window = StreamingOutputRails(
+        check=lambda text: _apply_output_rails(messages, text),
+        window_chars=Config.STREAM_RAIL_WINDOW_CHARS,
+        context_chars=Config.STREAM_RAIL_CONTEXT_CHARS
+    )
+
+    if speculation is not None:
+        upstream_chunks = speculation.events()
+    else:
+        upstream_chunks = vllm_pool.stream_chat(
+            _to_openai_messages(messages), mode=request.mode, admission=admission, **_generation_params(request)
+        )
+    try:
+        async for event in upstream_chunks:
+            choices = event.get("choices") or []
+            content = choices[0].get("delta", {}).get("content") if choices else None
+            for piece in await window.feed(content or ""):
+                _record_first_token()
+                yield "content", piece
+            if window.blocked:
+                break
+
+        for piece in await window.close():
+            _record_first_token()
+            yield "content", piece
+
+        if window.blocked:
+            finish_reason = "content_filter"
+            if window.refusal:
+                _record_first_token()
+                yield "content", window.refusal
+    finally:
+        # Release the upstream connection slot immediately on early termination.
+        await upstream_chunks.aclose()
+        if span is not None:
+            latencies = window.window_latencies_ms
+            span.set_attribute("guardrails.stream.windows", len(latencies))
+            if latencies:
+                span.set_attribute("guardrails.stream.rail_latency_ms", latencies)
+                span.set_attribute("guardrails.stream.rail_latency_ms.max", max(latencies))
+                span.set_attribute("guardrails.stream.rail_latency_ms.total", sum(latencies))
+            span.set_attribute("guardrails.stream.blocked", window.blocked)
+
+    yield "finish", finish_reason
+
+async def _stream_chat_completion(
+    request: ChatCompletionRequest,
+    messages: List[Dict[str, str]],
+    refusal: str,
+    span,
+    speculation: Optional[SpeculativeGeneration] = None,
+    admission: Optional[Admission] = None,
+    usage: Optional[TokenUsage] = None
+):
+    """
+    Streams an OpenAI-style `chat.completion.chunk` SSE response over `_governed_stream`.
+    `usage` already holds the input rails' tokens; generation and output rail tokens
+    are added as the stream runs and reported in a final chunk if the client asked
+    for `stream_options.include_usage`.
+    """
+    created = int(time.time())
+    resp_id = f"chatcmpl-{uuid.uuid4().hex}"
+    include_usage = bool((request.stream_options or {}).get("include_usage"))
+
+    yield _sse_chunk(resp_id, created, request.model, {"role": "assistant"})
+
+    try:
+        with track_usage(usage) as usage:
+            async for kind, value in _governed_stream(request, messages, refusal, span, speculation, admission):
+                if kind == "content":
+                    yield _sse_chunk(resp_id, created, request.model, {"content": value})
+                else:
+                    yield _sse_chunk(resp_id, created, request.model, {}, value)
+        if include_usage:
+            chunk = {
+                "id": resp_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": request.model,
+                "choices": [],
+                "usage": usage.openai_usage()
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+    except Exception as e:
+        # Headers are already sent; report the failure in-band like OpenAI does.
+        logger.error(f"Chat Stream Error: {e}")
+        if span is not None:
+            span.record_exception(e)
+        yield f"data: {json.dumps({'error': {'message': str(e), 'type': 'server_error'}})}\n\n"
+
+    yield "data: [DONE]\n\n"
+
+async def _run_input_rails(
+    request: ChatCompletionRequest,
+    messages: List[Dict[str, str]],
+    span,
+    admission: Optional[Admission] = None
+) -> Tuple[str, Optional[SpeculativeGeneration]]:
+    """
+    Runs the NeMo input rails (PII Masking & Safety).
+    Returns (refusal, speculation): a non-empty refusal means a rail blocked the input;
+    speculation is the committed speculative generation, if one was started.
+    """
+    speculative = request.speculative if request.speculative is not None else Config.SPECULATIVE_GENERATION
+    speculation = None
+
+    if speculative:
+        speculation = SpeculativeGeneration(
+            vllm_pool.stream_chat(
+                _to_openai_messages(messages), mode=request.mode, admission=admission, **_generation_params(request)
+            )
+        ).start()
+
+    try:
+        res = await within_deadline(
+            rails.generate_async(messages=messages, options={"rails": ["input"]}), "nemo.input_rails"
+        )
+
+        # If NeMo generated a bot response during the input rail phase, 
+        # it means a guardrail blocked the input and provided a canned refusal.
+        bot_response = _first_response_content(res)
+
+        if speculation is not None:
+            if bot_response:
+                span.set_attribute("gateway.speculation.cancelled_tokens", await speculation.cancel())
+                speculation = None
+            else:
+                speculation.commit()
+                span.set_attribute("gateway.speculation.time_saved_ms", speculation.time_saved_s * 1000)
+            span.set_attribute("gateway.speculation.outcome", "cancelled" if bot_response else "committed")
+    finally:
+        # Rail failure, client disconnect or handler cancellation: never leave
+        # an uncommitted generation running upstream.
+        if speculation is not None and speculation.outcome is None:
+            await speculation.cancel()
+
+    return bot_response, speculation
+
+async def _admit_generation(request: ChatCompletionRequest) -> Admission:
+    """
+    Admits the request's generation on its vLLM route before any work is done,
+    so an overloaded route is reported (429 / RESOURCE_EXHAUSTED) up front.
+    The slot is bound to the request, so its NeMo self-checks run on it.
+    """
+    route = vllm_pool.route(request.model if request.model != "default" else vllm_pool.default_model)
+    admission = await admission_controller.acquire(route, request.mode)
+    bind_request(admission)
+    return admission
+
+async def governed_chat_events(payload: Dict[str, Any]) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Chat pipeline entry point for non-HTTP transports (gRPC): input rails,
+    generation and windowed output rails, exactly as `/v1/chat/completions`.
+    A ("usage", dict) event with the request's token usage precedes ("finish", reason).
+    Raises AdmissionRejected before the first event if the route is saturated.
+    """
+    request = ChatCompletionRequest(**payload)
+    messages = _to_nemo_messages(request)
+    span = trace.get_current_span()
+
+    admission = await _admit_generation(request)
+    try:
+        with track_usage() as usage:
+            refusal, speculation = await _run_input_rails(request, messages, span, admission)
+            async for kind, value in _governed_stream(request, messages, refusal, span, speculation, admission):
+                if kind == "finish":
+                    yield "usage", usage.openai_usage()
+                yield kind, value
+    finally:
+        admission.release()
 
 @app.post("/v1/chat/completions")
 async def chat_completions(request: ChatCompletionRequest):
     """
     OpenAI-compatible Chat Completion Endpoint using NeMo Guardrails.
     Routes to VLLM via NeMo (configured in config/rails or manager.py).
+    With `stream: true` the response is an SSE stream of `chat.completion.chunk` events.
+    With speculation enabled, generation starts alongside the input rails and is
+    only released once they pass.
+    Requests that cannot be admitted within the queue budget get 429 + Retry-After.
     """
-    logger.info(f"Chat Request: Model={request.model} Stream={request.stream}")
+    logger.info(f"Chat Request: Model={request.model} Stream={request.stream} Speculative={request.speculative} Mode={request.mode}")
+    span = trace.get_current_span()
+
+    # Raises AdmissionRejected (-> 429) before any rail or model work is done.
+    admission = await _admit_generation(request)
+    streaming = False
+    # Real vLLM token counts (generation + NeMo self-checks) for this request.
+    usage = TokenUsage()
 
     try:
         # Convert Pydantic messages to dicts for NeMo
-        messages = []
-        for m in request.messages:
-            role = m.role
-            if role == "assistant":
-                role = "bot"
-            messages.append({"role": role, "content": m.content})
-
-        # Inject system instruction if provided (as first message)
-        if request.system_instruction:
-            if not messages or messages[0]["role"] != "system":
-                messages.insert(0, {"role": "system", "content": request.system_instruction})
+        messages = _to_nemo_messages(request)
 
         # 1. Guardrails Check (Input Rails Only - PII Masking & Safety)
-        res = await rails.generate_async(
-            messages=messages,
-            options={"rails": ["input"]}
-        )
-
-        bot_response = ""
-        if hasattr(res, "response") and isinstance(res.response, list) and len(res.response) > 0:
-            bot_response = res.response[0].get("content", "")
-        # Fallback for dictionaries if NeMo changes API
-        elif isinstance(res, dict) and "response" in res and len(res["response"]) > 0:
-            bot_response = res["response"][0].get("content", "")
-
-        # If NeMo generated a bot response during the input rail phase, 
-        # it means a guardrail blocked the input and provided a canned refusal.
-        if bot_response:
-            final_response = bot_response
-        else:
-            # 2. Native LLM Call (Bypassing NeMo Dialog Logic)
-            from src.gateway.governance.nemo.vllm_client import VLLMLLM
-            from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-
-            llm = VLLMLLM()
-            
-            # Convert dict messages to Langchain messages
-            lc_messages = []
-            for m in messages:
-                if m["role"] == "system":
-                    lc_messages.append(SystemMessage(content=m["content"]))
-                elif m["role"] == "assistant" or m["role"] == "bot":
-                    lc_messages.append(AIMessage(content=m["content"]))
-                else:
-                    lc_messages.append(HumanMessage(content=m["content"]))
-                    
-            # Generate completion
-            llm_response = await llm._acall(lc_messages)
-            response_text = llm_response
-
-            # 3. Guardrails Check (Output Rails - Unsafe Dialogues & PII Masking)
-            messages.append({"role": "bot", "content": response_text})
-            output_res = await rails.generate_async(
-                messages=messages,
-                options={"rails": ["output"]}
+        with track_usage(usage):
+            bot_response, speculation = await _run_input_rails(request, messages, span, admission)
+
+        if request.stream:
+            streaming = True
+            return StreamingResponse(
+                _stream_chat_completion(request, messages, bot_response, span, speculation, admission, usage),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                # Covers clients that disconnect before the stream starts.
+                background=BackgroundTask(admission.release)
             )
-            
-            if hasattr(output_res, "response") and isinstance(output_res.response, list) and len(output_res.response) > 0:
-                out_content = output_res.response[0].get("content", "")
-                final_response = out_content if out_content else response_text
-            elif isinstance(output_res, dict) and "response" in output_res and len(output_res["response"]) > 0:
-                out_content = output_res["response"][0].get("content", "")
-                final_response = out_content if out_content else response_text
+
+        with track_usage(usage):
+            if bot_response:
+                final_response = bot_response
             else:
-                final_response = response_text
+                # 2. Native LLM Call (Bypassing NeMo Dialog Logic) via the pooled upstream client
+                if speculation is not None:
+                    response_text = await speculation.text()
+                else:
+                    response_text = await vllm_pool.complete_text(
+                        _to_openai_messages(messages), mode=request.mode, admission=admission, **_generation_params(request)
+                    )
+
+                # 3. Guardrails Check (Output Rails - Unsafe Dialogues & PII Masking)
+                final_response, _ = await _apply_output_rails(messages, response_text)
 
         # Build OpenAI Response
-        import time
         resp_id = f"chatcmpl-{int(time.time())}"
 
         response_data = {
@@ -310,18 +739,19 @@ async def chat_completions(request: ChatCompletionRequest):
                     "finish_reason": "stop"
                 }
             ],
-            "usage": {
-                "prompt_tokens": 0,
-                "completion_tokens": len(final_response) // 4,
-                "total_tokens": len(final_response) // 4
-            }
+            "usage": usage.openai_usage()
         }
 
         return JSONResponse(content=response_data)
 
+    except (AdmissionRejected, DeadlineExceeded):
+        raise
     except Exception as e:
         logger.error(f"Chat Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if not streaming:
+            admission.release()
 
 # --- 7. Tool Execution Endpoint (HTTP) ---
 # Supports GatewayClient (HTTP) calls
@@ -338,57 +768,34 @@ async def execute_tool_endpoint(request: ToolExecutionRequest):
     logger.info(f"Tool Execution Request: {request.tool_name}")
     
     try:
-        output = None
-        
-        # Dispatcher Mapping
-        tool_map = {
-            "check_safety_constraints": check_safety_constraints,
-            "trigger_safety_intervention": trigger_safety_intervention,
-            "check_market_status": check_market_status,
-            "get_market_sentiment": get_market_sentiment,
-            "verify_content_safety": verify_content_safety,
-            "evaluate_policy": evaluate_policy,
-            "execute_trade_action": execute_trade_action,
-            "get_market_data": get_market_data
-        }
-
-        if request.tool_name not in tool_map:
-             raise HTTPException(status_code=404, detail=f"Tool '{request.tool_name}' not found")
-
-        func = tool_map[request.tool_name]
-
-        # Argument binding logic
-        if request.tool_name == "check_safety_constraints":
-             target_tool = request.params.get("target_tool")
-             target_params = request.params.get("target_params") or {}
-             risk_profile = request.params.get("risk_profile", "Medium")
-             output = await func(target_tool, target_params, risk_profile)
-
-        elif request.tool_name == "trigger_safety_intervention":
-             output = await func(request.params.get("reason", "Unknown"))
-
-        elif request.tool_name == "check_market_status":
-             output = await func(request.params.get("symbol"))
-
-        elif request.tool_name == "get_market_sentiment":
-             output = await func(request.params.get("symbol"))
-
-        elif request.tool_name == "get_market_data":
-             output = func(request.params.get("ticker"))
-
-        elif request.tool_name == "verify_content_safety":
-             output = await func(request.params.get("text", ""))
-
-        else:
-             # evaluate_policy and execute_trade_action accept kwargs
-             output = await func(**request.params)
-        
+        output = await tool_registry.dispatch(request.tool_name, request.params)
         return {"status": "SUCCESS", "output": str(output)}
 
     except Exception as e:
         logger.error(f"Tool Execution Error: {e}")
         return {"status": "ERROR", "error": str(e)}
 
+class BatchToolExecutionRequest(BaseModel):
+    calls: List[ToolExecutionRequest]
+    # Overrides Config.TOOL_BATCH_CONCURRENCY for this batch
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+
+@app.post("/tools/execute_batch")
+async def execute_tool_batch_endpoint(request: BatchToolExecutionRequest):
+    """
+    Executes several named tools in one round-trip.
+    Read-only tools run concurrently; side-effecting tools keep their order.
+    """
+    logger.info(f"Batch Tool Execution Request: {[c.tool_name for c in request.calls]}")
+    results = await execute_batch(
+        [c.model_dump() for c in request.calls],
+        tool_registry.dispatch,
+        tool_registry.read_only_tools,
+        request.max_concurrency,
+        tool_registry.distinct_tools
+    )
+    return {"results": results}
+
 if __name__ == "__main__":
     import uvicorn
     http_port = int(os.getenv("PORT", 8080))
@@ -48,8 +48,10 @@ async def verify_policy_opa(action: str, params: str) -> str:
              # If just checking general policy
              params_dict['action'] = action
 
-        # Call the generic policy tool
-        return await get_mcp_client().call_tool("evaluate_policy", params_dict)
+        # Call the generic policy tool: fields other than its declared
+        # arguments travel in its "kwargs" object.
+        arguments = {k: params_dict.pop(k) for k in ("action", "description", "dry_run") if k in params_dict}
+        return await get_mcp_client().call_tool("evaluate_policy", {**arguments, "kwargs": params_dict})
     except Exception as e:
         logger.error(f"OPA Check Failed: {e}")
         return f"DENIED: System Error: {e}"
@@ -81,6 +83,20 @@ async def check_safety_constraints(target_tool: str, target_params: dict[str, An
         logger.error(f"Safety Check Failed: {e}")
         return f"REJECTED: Governance System Error: {e}"
 
+async def check_plan_safety_constraints(steps: list[dict[str, Any]], risk_profile: str = "Medium") -> str:
+    """
+    Dry-runs every step of an execution plan through the Gateway's SymbolicGovernor
+    in one call (policy evaluated as a single OPA batch).
+    """
+    try:
+        return await get_mcp_client().call_tool(
+            "check_plan_safety",
+            {"steps": steps, "risk_profile": risk_profile}
+        )
+    except Exception as e:
+        logger.error(f"Plan Safety Check Failed: {e}")
+        return f"REJECTED: Governance System Error: {e}"
+
 # --- NEW: SAFETY INTERVENTION TOOL (Module 5) ---
 async def safety_intervention(reason: str) -> str:
     """
@@ -44,6 +44,7 @@ Your role is to **EXECUTE** the plan provided to you. You are a "Dumb Executor"
       - If the plan is APPROVED and clear, set `confidence` to **0.99**.
       - If the plan is ambiguous or you are unsure, set `confidence` to **0.5**.
       - **CRITICAL**: The Symbolic Governor will REJECT any trade with `confidence < 0.95`.
+    - If the step's parameters include `risk_profile` and `verdict_token` (stamped by the Evaluator), pass both unchanged.
 4.  After execution, return the result.
 
 **Strict Constraint:**
@@ -61,9 +62,11 @@ from src.governed_financial_advisor.infrastructure.llm.config import get_adk_mod
 from config.settings import Config
 
 
-async def execute_trade(symbol: str, amount: float, currency: str, transaction_id: str, confidence: float) -> str:
+async def execute_trade(symbol: str, amount: float, currency: str, transaction_id: str, confidence: float, risk_profile: str = "", verdict_token: str = "") -> str:
     """
     Executes a financial trade via the Gateway (MCP).
+    `verdict_token` is the VERDICT of the Evaluator's approval and `risk_profile`
+    the profile it was checked under, if the plan step carries them.
     """
     params = {
         "symbol": symbol,
@@ -72,6 +75,10 @@ async def execute_trade(symbol: str, amount: float, currency: str, transaction_i
         "transaction_id": transaction_id,
         "confidence": confidence
     }
+    if risk_profile:
+        params["risk_profile"] = risk_profile
+    if verdict_token:
+        params["verdict_token"] = verdict_token
     return await get_mcp_client().call_tool("execute_trade_action", params)
 
 def create_governed_trader_agent(model_name: str = MODEL_FAST) -> Agent:
@@ -74,3 +74,12 @@ allow = "DENY" if {
     input.risk_profile == "Speculative"
     not input.trader_role == "senior"
 }
+
+# --- Batch Entry Point ---
+# Evaluates every element of `input.inputs` (e.g. each step of an ExecutionPlan)
+# against `allow` in one request: POST /v1/data/finance/batch_allow
+# {"input": {"inputs": [...]}} -> one decision per element, in order.
+batch_allow := [decision |
+    some step in input.inputs
+    decision := allow with input as step
+]
@@ -545,6 +545,10 @@ def governed_trader_node(state):
     """Wraps the Governed Trader agent for LangGraph."""
     print("--- [Graph] Calling Governed Trader ---")
     agent = get_agent("governed_trader", create_governed_trader_agent)
-    last_msg = get_valid_last_message(state)
-    res = run_adk_agent(agent, last_msg)
+    trader_input = get_valid_last_message(state)
+    plan = state.get("execution_plan_output")
+    if isinstance(trader_input, str) and isinstance(plan, dict) and plan.get("steps"):
+        # The approved steps carry the Evaluator's verdict tokens (see evaluator_node).
+        trader_input += f"\n\nexecution_plan_output:\n{json.dumps(plan)}"
+    res = run_adk_agent(agent, trader_input)
     return {"messages": [("ai", res.answer)]}
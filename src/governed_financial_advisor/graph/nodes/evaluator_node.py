@@ -7,9 +7,11 @@ from typing import Any
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
+from src.gateway.core.deadline import current_deadline
 from src.governed_financial_advisor.agents.evaluator.agent import (
     create_evaluator_agent,
-    check_safety_constraints
+    check_safety_constraints,
+    check_plan_safety_constraints
 )
 from src.governed_financial_advisor.graph.nodes.adapters import run_adk_agent
 from src.governed_financial_advisor.graph.state import AgentState
@@ -28,9 +30,12 @@ async def evaluator_node(state: AgentState) -> dict[str, Any]:
         # No plan to evaluate, so no race.
         return {"next_step": "execution_analyst", "risk_feedback": "No plan provided."}
 
-    # Extract details for checks
+    # Extract details for checks: every side-effecting step of the plan is verified.
     target_tool = "market_analysis" # Default to analysis (was execute_trade)
     target_params = {}
+    action_steps = []
+    # Index in plan["steps"] of each action step, to stamp its verdict back onto it.
+    action_indices = []
 
     if isinstance(plan, dict):
         # Check if plan implies no action (Analysis Only)
@@ -50,12 +55,16 @@ async def evaluator_node(state: AgentState) -> dict[str, Any]:
             }
 
         if "steps" in plan:
-            for step in plan["steps"]:
-                if "trade" in step.get("action", "") or "execute" in step.get("action", ""):
-                    target_params = step.get("parameters", {})
-                    target_tool = step.get("action", "execute_trade")
-                    if target_tool == "execute_buy": target_tool = "execute_trade"
-                    break
+            for i, step in enumerate(plan["steps"]):
+                action = step.get("action", "")
+                if "trade" in action or "execute" in action:
+                    if action == "execute_buy": action = "execute_trade"
+                    action_steps.append({
+                        "id": step.get("id", str(i + 1)),
+                        "action": action or "execute_trade",
+                        "parameters": step.get("parameters", {})
+                    })
+                    action_indices.append(i)
 
     # --- SAFETY CONSTRAINT CHECK (The "Monitor" Phase) ---
     # We check safety constraints in parallel (logically) with execution.
@@ -64,14 +73,22 @@ async def evaluator_node(state: AgentState) -> dict[str, Any]:
     with tracer.start_as_current_span("evaluator.safety_check") as span:
         start_time = time.time()
 
-        logger.info(f"🛡️ Evaluator: Monitoring execution for {target_tool}")
+        if action_steps:
+            logger.info(f"🛡️ Evaluator: Monitoring execution for {len(action_steps)} plan steps")
+        else:
+            logger.info(f"🛡️ Evaluator: Monitoring execution for {target_tool}")
 
         # Call the meta-tool exposed in Gateway
         # Extract risk profile from state, default to 'Moderate'
     
         raw_risk = state.get("risk_attitude")
         risk_profile = raw_risk.capitalize() if raw_risk else "Moderate"
-        safety_result_str = await check_safety_constraints(target_tool, target_params, risk_profile)
+        if action_steps:
+            # One round-trip for the whole plan (batched OPA evaluation in the Gateway).
+            safety_result_str = await check_plan_safety_constraints(action_steps, risk_profile)
+        else:
+            safety_result_str = await check_safety_constraints(target_tool, target_params, risk_profile)
+        span.set_attribute("safety_check.steps", len(action_steps) or 1)
 
         latency = (time.time() - start_time) * 1000
         span.set_attribute("safety_check.latency_ms", latency)
@@ -119,9 +136,63 @@ async def evaluator_node(state: AgentState) -> dict[str, Any]:
     if not is_safe:
         feedback_msg += "\n\n**Action Required:** The assessment indicates High Risk. Please LOWER the risk level or adjust parameters to proceed."
 
-    return {
+    updates = {
         "evaluation_result": eval_result,
         "next_step": next_step, # Used by conditional edge
         "risk_status": risk_status,
-        "risk_feedback": feedback_msg if not is_safe else "Plan verified safe."
+        "risk_feedback": feedback_msg if not is_safe else "Plan verified safe.",
+        "latency_stats": _latency_stats(state, latency)
     }
+    if is_safe and action_steps:
+        verdicts = _plan_verdicts(safety_result_str)
+        if verdicts:
+            updates["execution_plan_output"] = _stamp_verdicts(plan, action_steps, action_indices, verdicts, risk_profile)
+    return updates
+
+
+def _plan_verdicts(safety_result: str) -> dict[str, str]:
+    """Verdict tokens by step id from an approving check_plan_safety result."""
+    _, found, tokens = safety_result.partition(" VERDICTS: ")
+    if not found:
+        return {}
+    try:
+        return json.loads(tokens)
+    except json.JSONDecodeError:
+        logger.warning("⚠️ Evaluator: unreadable plan verdicts; the trader runs every check.")
+        return {}
+
+
+def _stamp_verdicts(
+    plan: dict[str, Any],
+    action_steps: list[dict[str, Any]],
+    action_indices: list[int],
+    verdicts: dict[str, str],
+    risk_profile: str
+) -> dict[str, Any]:
+    """
+    A copy of `plan` whose verified steps carry their verdict token, and the
+    risk profile it was issued for, as execute_trade parameters. The Governed
+    Trader passes them on, so the Gateway skips the checks this dry run covers.
+    """
+    steps = list(plan["steps"])
+    for step, index in zip(action_steps, action_indices):
+        token = verdicts.get(str(step["id"]))
+        if token:
+            parameters = {**(steps[index].get("parameters") or {}), "risk_profile": risk_profile, "verdict_token": token}
+            steps[index] = {**steps[index], "parameters": parameters}
+    return {**plan, "steps": steps}
+
+
+def _latency_stats(state: AgentState, safety_check_ms: float) -> dict[str, float]:
+    """
+    Cumulative spend against the /agent/query deadline. Only the evaluator writes
+    it: the executor branch runs in parallel and would conflict on the same key.
+    """
+    stats = dict(state.get("latency_stats") or {})
+    stats["safety_check_ms"] = safety_check_ms
+    deadline = current_deadline()
+    if deadline is not None:
+        stats["budget_ms"] = deadline.budget_ms
+        stats["cumulative_ms"] = deadline.elapsed_ms()
+        stats["remaining_ms"] = deadline.remaining_s() * 1000
+    return stats
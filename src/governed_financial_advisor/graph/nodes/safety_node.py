@@ -29,12 +29,15 @@ async def safety_check_node(state: AgentState) -> dict[str, Any]:
     # 2. Construct the OPA Payload
     # We map the Plan object to the OPA input schema.
     # Assuming 'plan' has 'action', 'amount', 'symbol' etc.
+    # Fields other than evaluate_policy's declared arguments travel in its "kwargs" object.
     opa_input = {
         "action": plan.get("action", "unknown"),
-        "amount": plan.get("amount", 0),
-        "symbol": plan.get("symbol", "UNKNOWN"),
-        "user_id": state.get("user_id", "anonymous"),
-        "risk_profile": state.get("risk_attitude", "neutral")
+        "kwargs": {
+            "amount": plan.get("amount", 0),
+            "symbol": plan.get("symbol", "UNKNOWN"),
+            "user_id": state.get("user_id", "anonymous"),
+            "risk_profile": state.get("risk_attitude", "neutral")
+        }
     }
 
     # 3. Query OPA (Governance Layer) - ASYNC
@@ -0,0 +1,98 @@
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import grpc
+
+from src.gateway.core.deadline import timeout_for
+from src.gateway.protos import gateway_pb2, gateway_pb2_grpc
+
+logger = logging.getLogger("Infrastructure.GrpcGatewayClient")
+
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
+class GatewayGrpcClient:
+    """
+    Async client for the Gateway's gRPC service (gateway.proto).
+    One HTTP/2 channel is shared by all calls; chat tokens are streamed.
+    """
+    def __init__(self, target: str):
+        self.target = target
+        self.channel: grpc.aio.Channel | None = None
+        self.stub: gateway_pb2_grpc.GatewayStub | None = None
+
+    async def connect(self):
+        logger.info(f"Connecting to Gateway gRPC at {self.target}...")
+        self.channel = grpc.aio.insecure_channel(self.target, options=CHANNEL_OPTIONS)
+        await self.channel.channel_ready()
+        self.stub = gateway_pb2_grpc.GatewayStub(self.channel)
+        logger.info("✅ Connected to Gateway gRPC.")
+
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "default",
+        temperature: float = 0.7,
+        system_instruction: Optional[str] = None,
+        mode: str = "chat",
+        guided_json: Optional[Dict[str, Any]] = None,
+        guided_regex: Optional[str] = None,
+        guided_choice: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """Yields governed content pieces as the gateway releases them."""
+        if not self.stub:
+            await self.connect()
+
+        request = gateway_pb2.ChatRequest(
+            model=model,
+            messages=[gateway_pb2.Message(role=m["role"], content=m["content"]) for m in messages],
+            temperature=temperature,
+            system_instruction=system_instruction or "",
+            mode=mode,
+            guided_json=json.dumps(guided_json) if guided_json is not None else "",
+            guided_regex=guided_regex or "",
+            guided_choice=json.dumps(guided_choice) if guided_choice is not None else ""
+        )
+        # Unset timeouts inherit the request deadline (sent as the native gRPC deadline).
+        async for response in self.stub.Chat(request, timeout=timeout_for(timeout)):
+            if response.content:
+                yield response.content
+            if response.is_final:
+                break
+
+    async def chat(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
+        return "".join([piece async for piece in self.chat_stream(messages, **kwargs)])
+
+    async def execute_tool(self, tool_name: str, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, str]:
+        """Returns {"status", "output", "error"}; status is SUCCESS, ERROR or BLOCKED."""
+        if not self.stub:
+            await self.connect()
+
+        logger.info(f"📞 Calling gRPC Tool: {tool_name}")
+        response = await self.stub.ExecuteTool(
+            gateway_pb2.ToolRequest(tool_name=tool_name, params_json=json.dumps(params)),
+            timeout=timeout_for(timeout)
+        )
+        return {"status": response.status, "output": response.output, "error": response.error}
+
+    async def close(self):
+        if self.channel:
+            await self.channel.close()
+            self.channel = None
+            self.stub = None
+            logger.info("gRPC Client Closed.")
+
+# Singleton Instance
+_grpc_client_instance = None
+
+def get_grpc_gateway_client() -> GatewayGrpcClient:
+    global _grpc_client_instance
+    if not _grpc_client_instance:
+        from config.settings import Config
+        _grpc_client_instance = GatewayGrpcClient(Config.GATEWAY_GRPC_TARGET)
+    return _grpc_client_instance
@@ -1,32 +1,49 @@
 import asyncio
 import logging
+from datetime import timedelta
 from typing import Any, Callable, Dict, List
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamable_http_client
 from google.adk.tools import FunctionTool
 
+from src.gateway.core.deadline import check_deadline, timeout_for
+
 logger = logging.getLogger("Infrastructure.MCPClient")
 
 class GatewayMCPClient:
     """
-    Client for interacting with the Gateway's MCP Server via SSE.
+    Client for interacting with the Gateway's MCP Server.
+
+    transport="sse" holds one long-lived SSE stream (pinned to one gateway pod);
+    transport="streamable_http" sends each call as an independent POST to the
+    gateway's stateless endpoint, so calls are load-balanced across replicas.
     """
-    def __init__(self, sse_url: str):
+    def __init__(self, sse_url: str, transport: str = "sse"):
+        if transport not in ("sse", "streamable_http"):
+            raise ValueError(f"Unknown MCP transport: {transport}")
         self.sse_url = sse_url
+        self.transport = transport
         self.session: ClientSession | None = None
         self._exit_stack = None
 
     async def connect(self):
-        """Connects to the Gateway MCP SSE endpoint."""
-        logger.info(f"Connecting to Gateway MCP at {self.sse_url}...")
+        """Connects to the Gateway MCP endpoint (SSE or streamable HTTP)."""
+        logger.info(f"Connecting to Gateway MCP at {self.sse_url} ({self.transport})...")
         from contextlib import AsyncExitStack
         self._exit_stack = AsyncExitStack()
 
-        # Connect via SSE
-        read_stream, write_stream = await self._exit_stack.enter_async_context(
-            sse_client(self.sse_url)
-        )
+        if self.transport == "streamable_http":
+            # Stateless server: no session id is pinned, any replica can serve any call.
+            read_stream, write_stream, _ = await self._exit_stack.enter_async_context(
+                streamable_http_client(self.sse_url)
+            )
+        else:
+            # Connect via SSE
+            read_stream, write_stream = await self._exit_stack.enter_async_context(
+                sse_client(self.sse_url)
+            )
         
         self.session = await self._exit_stack.enter_async_context(
             ClientSession(read_stream, write_stream)
@@ -45,7 +62,13 @@ class GatewayMCPClient:
             await self.connect()
         
         logger.info(f"📞 Calling MCP Tool: {name}")
-        result = await self.session.call_tool(name, arguments)
+        # Bounded by what is left of the /agent/query deadline, if one is set.
+        check_deadline(f"mcp.{name}")
+        timeout_s = timeout_for()
+        result = await self.session.call_tool(
+            name, arguments,
+            read_timeout_seconds=timedelta(seconds=timeout_s) if timeout_s is not None else None
+        )
         
         # Parse result (MCP returns a list of content objects)
         output = []
@@ -59,6 +82,8 @@ class GatewayMCPClient:
     async def close(self):
         if self._exit_stack:
             await self._exit_stack.aclose()
+            self._exit_stack = None
+            self.session = None
             logger.info("MCP Client Closed.")
 
 # Singleton Instance
@@ -68,9 +93,12 @@ def get_mcp_client() -> GatewayMCPClient:
     global _mcp_client_instance
     if not _mcp_client_instance:
         from config.settings import Config
-        # Ensure Config has MCP_SERVER_SSE_URL
-        url = getattr(Config, "MCP_SERVER_SSE_URL", "http://localhost:8080/mcp/sse")
-        _mcp_client_instance = GatewayMCPClient(url)
+        if Config.MCP_TRANSPORT == "streamable_http":
+            _mcp_client_instance = GatewayMCPClient(Config.MCP_SERVER_HTTP_URL, transport="streamable_http")
+        else:
+            # Ensure Config has MCP_SERVER_SSE_URL
+            url = getattr(Config, "MCP_SERVER_SSE_URL", "http://localhost:8080/mcp/sse")
+            _mcp_client_instance = GatewayMCPClient(url)
     return _mcp_client_instance
 
 def create_mcp_tool_adapter(tool_name: str, description: str = "") -> FunctionTool:
@@ -1,17 +1,39 @@
+import asyncio
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 import redis
+import redis.asyncio as aioredis
 from opentelemetry import trace
 from urllib.parse import urlparse
+from config.settings import Config
 from src.governed_financial_advisor.utils.telemetry import get_tracer
 
 logger = logging.getLogger("Infrastructure.Redis")
 
+# Set by the safety monitor (trigger_safety_intervention); trades check it before executing.
+SAFETY_VIOLATION_KEY = "safety_violation"
+
+# KEYS[1] key, ARGV[1] expected value. Returns 1 if the key held it and was deleted.
+DELETE_IF_EQUALS_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 class RedisClient:
     """
     Wrapper around Redis for state management.
     Handles connection pooling and provides typed accessors.
-    Falls back to in-memory dictionary if Redis is not configured or unavailable.
+    Falls back to an in-memory store if Redis is not configured or unavailable.
+
+    Every accessor has an asyncio twin (`aget`, `aset`, `amget`, ...) for
+    callers on the event loop: those share one non-blocking connection pool
+    per event loop, so a Redis round-trip never stalls other requests. The
+    synchronous methods stay for callers in threads and legacy code.
     """
     def __init__(self):
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -41,7 +63,12 @@ class RedisClient:
         self.use_redis = bool(self.redis_host) and self.redis_host.lower() not in ["", "none", "false"]
         
         self.client = None
-        self.memory_store = {}
+        self.memory_store = _MemoryStore(Config.REDIS_MEMORY_MAX_KEYS)
+        self.memory_subscribers = {}
+        self._async_client = None
+        self._async_loop = None
+        self._delete_if_equals = None
+        self._adelete_if_equals = None
         
         if self.use_redis:
             try:
@@ -58,6 +85,43 @@ class RedisClient:
         
         self.tracer = get_tracer()
 
+    def _async_redis(self) -> "aioredis.Redis | None":
+        """
+        The asyncio client for the running event loop (None in memory mode).
+        Connections belong to the loop that opened them, so a new loop (e.g.
+        a test's) gets its own pool; a gateway worker runs a single loop.
+        """
+        if not (self.use_redis and self.client):
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            pool = aioredis.BlockingConnectionPool(
+                host=self.redis_host,
+                port=self.redis_port,
+                decode_responses=True,
+                max_connections=Config.REDIS_MAX_CONNECTIONS,
+                timeout=Config.REDIS_POOL_TIMEOUT_S,
+            )
+            self._async_client = aioredis.Redis(connection_pool=pool)
+            self._async_loop = loop
+        return self._async_client
+
+    async def aclose(self):
+        """Closes the asyncio connection pool (on shutdown)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    @staticmethod
+    def _to_float(val: str | None, default: float) -> float:
+        if val is None:
+            return default
+        try:
+            return float(val)
+        except ValueError:
+            return default
+
     def get(self, key: str) -> str | None:
         if self.use_redis and self.client:
             try:
@@ -67,14 +131,21 @@ class RedisClient:
                 return None
         return self.memory_store.get(key)
 
+    async def aget(self, key: str) -> str | None:
+        client = self._async_redis()
+        if client is not None:
+            try:
+                return await client.get(key)
+            except redis.RedisError as e:
+                logger.error(f"Redis GET Error: {e}")
+                return None
+        return self.memory_store.get(key)
+
     def get_float(self, key: str, default: float = 0.0) -> float:
-        val = self.get(key)
-        if val is None:
-            return default
-        try:
-            return float(val)
-        except ValueError:
-            return default
+        return self._to_float(self.get(key), default)
+
+    async def aget_float(self, key: str, default: float = 0.0) -> float:
+        return self._to_float(await self.aget(key), default)
 
     def set(self, key: str, value: str, ttl: int = None):
         if self.use_redis and self.client:
@@ -86,10 +157,108 @@ class RedisClient:
                 # Fallback to memory if Redis fails?? No, might be split-brain. 
                 # But for now we just log error if we supposedly have Redis.
                 pass
-        
-        # In-memory implementation of TTL is not supported in this simple dict, 
-        # but acceptable for simple state flags.
-        self.memory_store[key] = value
+
+        self.memory_store.set(key, value, ttl)
+
+    async def aset(self, key: str, value: str, ttl: int = None):
+        client = self._async_redis()
+        if client is not None:
+            try:
+                await client.set(key, value, ex=ttl)
+                return
+            except redis.RedisError as e:
+                logger.error(f"Redis SET Error: {e}")
+
+        self.memory_store.set(key, value, ttl)
+
+    def incr(self, key: str, amount: int = 1, ttl: int = None) -> int:
+        """Atomic increment (shared counters across gateway workers). `ttl` sets the key's expiry."""
+        if self.use_redis and self.client:
+            try:
+                if ttl is None:
+                    return int(self.client.incr(key, amount))
+                pipe = self.client.pipeline()
+                pipe.incr(key, amount)
+                pipe.expire(key, ttl)
+                return int(pipe.execute()[0])
+            except redis.RedisError as e:
+                logger.error(f"Redis INCR Error: {e}")
+
+        return self.memory_store.incr(key, amount, ttl)
+
+    async def aincr(self, key: str, amount: int = 1, ttl: int = None) -> int:
+        client = self._async_redis()
+        if client is not None:
+            try:
+                if ttl is None:
+                    return int(await client.incr(key, amount))
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.incr(key, amount)
+                    pipe.expire(key, ttl)
+                    return int((await pipe.execute())[0])
+            except redis.RedisError as e:
+                logger.error(f"Redis INCR Error: {e}")
+
+        return self.memory_store.incr(key, amount, ttl)
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        """Reads many keys in one round-trip."""
+        if not keys:
+            return []
+        if self.use_redis and self.client:
+            try:
+                return self.client.mget(keys)
+            except redis.RedisError as e:
+                logger.error(f"Redis MGET Error: {e}")
+                return [None] * len(keys)
+        return [self.memory_store.get(key) for key in keys]
+
+    async def amget(self, keys: list[str]) -> list[str | None]:
+        """
+        Reads many keys in one round-trip, e.g. the safety interrupt flag and
+        the cash balance together instead of one awaited GET each.
+        """
+        if not keys:
+            return []
+        client = self._async_redis()
+        if client is not None:
+            try:
+                return await client.mget(keys)
+            except redis.RedisError as e:
+                logger.error(f"Redis MGET Error: {e}")
+                return [None] * len(keys)
+        return [self.memory_store.get(key) for key in keys]
+
+    def publish(self, channel: str, message: str) -> int:
+        """Broadcasts to every subscriber of `channel` (all gateway workers/pods)."""
+        if self.use_redis and self.client:
+            try:
+                return int(self.client.publish(channel, message))
+            except redis.RedisError as e:
+                logger.error(f"Redis PUBLISH Error: {e}")
+                return 0
+
+        handlers = list(self.memory_subscribers.get(channel, []))
+        for handler in handlers:
+            handler(message)
+        return len(handlers)
+
+    def subscribe(self, channel: str, handler):
+        """
+        Calls `handler(message)` for each message on `channel` from a background
+        thread. Returns a subscription with `.stop()`.
+        """
+        if self.use_redis and self.client:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{channel: lambda msg: handler(msg["data"])})
+                return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except redis.RedisError as e:
+                logger.error(f"Redis SUBSCRIBE Error: {e}")
+                return None
+
+        self.memory_subscribers.setdefault(channel, []).append(handler)
+        return _MemorySubscription(self.memory_subscribers[channel], handler)
 
     def delete(self, key: str):
         if self.use_redis and self.client:
@@ -99,9 +268,163 @@ class RedisClient:
             except redis.RedisError as e:
                 logger.error(f"Redis DELETE Error: {e}")
                 pass
-        
-        if key in self.memory_store:
-            del self.memory_store[key]
+
+        self.memory_store.delete(key)
+
+    def delete_if_equals(self, key: str, value: str) -> bool:
+        """
+        Deletes `key` only if it still holds `value`, atomically (compare-and-delete).
+        Of several callers that read the same value, exactly one gets True.
+        """
+        if self.use_redis and self.client:
+            try:
+                if self._delete_if_equals is None or self._delete_if_equals.registered_client is not self.client:
+                    self._delete_if_equals = self.client.register_script(DELETE_IF_EQUALS_LUA)
+                return bool(self._delete_if_equals(keys=[key], args=[value]))
+            except redis.RedisError as e:
+                logger.error(f"Redis compare-and-delete Error: {e}")
+                return False
+        return self.memory_store.delete_if_equals(key, value)
+
+    async def adelete_if_equals(self, key: str, value: str) -> bool:
+        client = self._async_redis()
+        if client is not None:
+            try:
+                if self._adelete_if_equals is None or self._adelete_if_equals.registered_client is not client:
+                    self._adelete_if_equals = client.register_script(DELETE_IF_EQUALS_LUA)
+                return bool(await self._adelete_if_equals(keys=[key], args=[value]))
+            except redis.RedisError as e:
+                logger.error(f"Redis compare-and-delete Error: {e}")
+                return False
+        return self.memory_store.delete_if_equals(key, value)
+
+    async def adelete(self, key: str):
+        client = self._async_redis()
+        if client is not None:
+            try:
+                await client.delete(key)
+                return
+            except redis.RedisError as e:
+                logger.error(f"Redis DELETE Error: {e}")
+
+        self.memory_store.delete(key)
+
+class _MemoryStore:
+    """
+    In-memory stand-in for Redis string keys (no Redis configured or reachable).
+    Keys expire after their TTL like in Redis (checked on access). Beyond
+    `max_keys`, expired keys are purged first, then the least recently used key
+    *with* a TTL is evicted (Redis' volatile-lru). Persistent keys such as the
+    safety interrupt flag or the cash balance are never evicted: if only those
+    are left, the store grows past `max_keys` and logs a warning instead.
+    Thread-safe: sync callers may run in worker threads.
+    """
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> (value, expiry on the monotonic clock or None); oldest access first
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._over_limit = False
+
+    def _live(self, key: str) -> tuple[str, float | None] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key: str, value: str, expires_at: float | None):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_keys:
+            self._evict()
+
+    def _evict(self):
+        now = time.monotonic()
+        for expired in [k for k, (_, exp) in self._entries.items() if exp is not None and exp <= now]:
+            del self._entries[expired]
+        # Oldest access first: evict the least recently used volatile keys.
+        volatile = (k for k, (_, exp) in self._entries.items() if exp is not None)
+        excess = len(self._entries) - self.max_keys
+        for victim in [k for k, _ in zip(volatile, range(max(0, excess)))]:
+            del self._entries[victim]
+        over = len(self._entries) > self.max_keys
+        if over and not self._over_limit:
+            logger.warning(
+                f"⚠️ In-memory store holds {len(self._entries)} persistent keys (limit {self.max_keys}); "
+                "not evicting persistent state."
+            )
+        self._over_limit = over
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        with self._lock:
+            entry = self._live(key)
+            return default if entry is None else entry[0]
+
+    def set(self, key: str, value: str, ttl: float | None = None):
+        # Like SET: a write without `ttl` makes the key persistent.
+        with self._lock:
+            self._put(key, value, None if ttl is None else time.monotonic() + ttl)
+
+    def incr(self, key: str, amount: int = 1, ttl: float | None = None) -> int:
+        with self._lock:
+            entry = self._live(key)
+            value = (int(entry[0]) if entry else 0) + amount
+            # Like INCR (keeps the key's expiry), then EXPIRE if `ttl` is given.
+            expires_at = entry[1] if entry else None
+            if ttl is not None:
+                expires_at = time.monotonic() + ttl
+            self._put(key, str(value), expires_at)
+            return value
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_if_equals(self, key: str, value: str) -> bool:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None or entry[0] != value:
+                return False
+            del self._entries[key]
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: str):
+        self.set(key, value)
+
+    def __delitem__(self, key: str):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for _, expires_at in self._entries.values() if expires_at is None or expires_at > now)
+
+class _MemorySubscription:
+    def __init__(self, handlers: list, handler):
+        self.handlers = handlers
+        self.handler = handler
+
+    def stop(self):
+        if self.handler in self.handlers:
+            self.handlers.remove(self.handler)
 
 # Global Instance
 redis_client = RedisClient()
@@ -15,6 +15,7 @@ from opentelemetry.instrumentation.langchain import LangchainInstrumentor
 from pydantic import BaseModel
 
 from config.settings import Config
+from src.gateway.core.deadline import DeadlineExceeded, deadline_scope
 from src.governed_financial_advisor.demo.router import demo_router
 from src.governed_financial_advisor.tools.api import tools_router
 from src.governed_financial_advisor.graph.graph import create_graph
@@ -80,52 +81,61 @@ def health_check():
 @app.post("/agent/query")
 async def query_agent(req: QueryRequest, request: Request):
     token = user_context.set(req.user_id)
-    try:
-        # ISO 42001: A.7.2 Accountability - Tag trace with User Identity
-        current_span = trace.get_current_span()
-        trace_id = None
-        if current_span:
-            current_span.set_attribute("enduser.id", req.user_id)
-            current_span.set_attribute("thread.id", req.thread_id)
-            # Capture trace_id for UI ONLY if sampled
-            ctx = current_span.get_span_context()
-            if ctx.trace_flags.sampled:
-                trace_id = f"{ctx.trace_id:032x}"
-
-        # 1. NeMo Security
-        is_safe, msg = await validate_with_nemo(req.prompt, rails)
-        print(f"DEBUG: NeMo is_safe={is_safe}, msg='{msg}'")
-
-        if not is_safe:
-            return {"response": msg, "trace_id": trace_id}
+    # Latency budget for the whole query: NeMo, every graph node and gateway hop.
+    with deadline_scope(Config.AGENT_REQUEST_DEADLINE_MS):
+        try:
+            # ISO 42001: A.7.2 Accountability - Tag trace with User Identity
+            current_span = trace.get_current_span()
+            trace_id = None
+            if current_span:
+                current_span.set_attribute("enduser.id", req.user_id)
+                current_span.set_attribute("thread.id", req.thread_id)
+                # Capture trace_id for UI ONLY if sampled
+                ctx = current_span.get_span_context()
+                if ctx.trace_flags.sampled:
+                    trace_id = f"{ctx.trace_id:032x}"
+
+            # 1. NeMo Security
+            is_safe, msg = await validate_with_nemo(req.prompt, rails)
+            print(f"DEBUG: NeMo is_safe={is_safe}, msg='{msg}'")
+
+            if not is_safe:
+                return {"response": msg, "trace_id": trace_id}
         
-        # If NeMo generated a valid response (e.g. greeting), return it
-        if msg:
-            print("DEBUG: NeMo handled response.")
-            return {"response": msg, "trace_id": trace_id}
-
-        # 2. Graph Execution (Calls Existing Agents)
-        print(f"DEBUG: Invoking Graph with prompt '{req.prompt}'")
-        res = await request.app.state.graph.ainvoke(
-            {"messages": [("user", req.prompt)], "user_id": req.user_id},
-            {"recursion_limit": 100, "configurable": {"thread_id": req.thread_id}}
-        )
-        print(f"DEBUG: Graph result messages keys: {res.keys() if res else 'None'}")
-        if res and "messages" in res and res["messages"]:
-             print(f"DEBUG: Last message content: '{res['messages'][-1].content}'")
-
-        # Extract the last message content
-        return {
-            "response": res["messages"][-1].content,
-            "trace_id": trace_id
-        }
-
-    except Exception as e:
-        print(f"❌ Error invoking agent graph: {e}")
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        user_context.reset(token)
+            # If NeMo generated a valid response (e.g. greeting), return it
+            if msg:
+                print("DEBUG: NeMo handled response.")
+                return {"response": msg, "trace_id": trace_id}
+
+            # 2. Graph Execution (Calls Existing Agents)
+            print(f"DEBUG: Invoking Graph with prompt '{req.prompt}'")
+            res = await request.app.state.graph.ainvoke(
+                {
+                    "messages": [("user", req.prompt)],
+                    "user_id": req.user_id,
+                    "latency_stats": {"budget_ms": Config.AGENT_REQUEST_DEADLINE_MS, "cumulative_ms": 0.0}
+                },
+                {"recursion_limit": 100, "configurable": {"thread_id": req.thread_id}}
+            )
+            print(f"DEBUG: Graph result messages keys: {res.keys() if res else 'None'}")
+            if res and "messages" in res and res["messages"]:
+                 print(f"DEBUG: Last message content: '{res['messages'][-1].content}'")
+
+            # Extract the last message content
+            return {
+                "response": res["messages"][-1].content,
+                "trace_id": trace_id
+            }
+
+        except DeadlineExceeded as e:
+            print(f"⏱️ Agent query deadline exceeded: {e}")
+            raise HTTPException(status_code=504, detail=str(e))
+        except Exception as e:
+            print(f"❌ Error invoking agent graph: {e}")
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=str(e))
+        finally:
+            user_context.reset(token)
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=Config.PORT, log_config=None)
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from config.settings import Config
 from src.governed_financial_advisor.tools.market_data_tool import get_market_data
 from src.governed_financial_advisor.tools.trades import execute_trade, propose_trade
 from src.gateway.governance.singletons import symbolic_governor, opa_client
@@ -60,7 +61,7 @@ async def execute_tool_endpoint(request: ToolExecutionRequest):
             target_params = params.get("target_params") or {}
             risk = params.get("risk_profile", "Medium")
             # Call Symbolic Governor
-            violations = await symbolic_governor.verify(target_tool, target_params)
+            violations = await symbolic_governor.verify(target_tool, target_params, mode=Config.GOVERNANCE_VERIFY_MODE)
             if not violations:
                 output = "APPROVED: No violations detected."
             else:
@@ -68,8 +69,8 @@ async def execute_tool_endpoint(request: ToolExecutionRequest):
 
         elif tool == "trigger_safety_intervention":
             reason = params.get("reason", "Unknown")
-            from src.governed_financial_advisor.infrastructure.redis_client import redis_client
-            redis_client.set("safety_violation", reason)
+            from src.governed_financial_advisor.infrastructure.redis_client import SAFETY_VIOLATION_KEY, redis_client
+            await redis_client.aset(SAFETY_VIOLATION_KEY, reason)
             output = "INTERVENTION_ACK: System Locked."
 
         elif tool == "verify_content_safety":
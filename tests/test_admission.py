@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from src.gateway.core.admission import AdmissionController, AdmissionRejected, bind_request, priority_class
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_admitted_by_priority():
+    controller = AdmissionController(limits={"fast": 1}, queue_budget_s=5.0, enabled=True)
+    holder = await controller.acquire("fast", "chat")
+    order = []
+
+    async def request(mode):
+        async with controller.admit("fast", mode):
+            order.append(mode)
+
+    # Planner arrives first, governance last: governance must still go first.
+    tasks = []
+    for mode in ("planner", "chat", "verifier", "governance"):
+        tasks.append(asyncio.create_task(request(mode)))
+        await asyncio.sleep(0)
+
+    assert controller.lanes["fast"].queued == 4
+    holder.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["governance", "verifier", "chat", "planner"]
+    assert controller.lanes["fast"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_routes_have_independent_limits():
+    controller = AdmissionController(limits={"reasoning": 1, "fast": 2}, queue_budget_s=0.0, enabled=True)
+    await controller.acquire("reasoning", "planner")
+
+    # The saturated reasoning lane does not block the fast lane.
+    first = await controller.acquire("fast", "governance")
+    second = await controller.acquire("fast", "governance")
+    assert controller.lanes["fast"].in_flight == 2
+
+    first.release()
+    first.release()  # idempotent
+    second.release()
+    assert controller.lanes["fast"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_request_is_shed_after_queue_budget():
+    controller = AdmissionController(limits={"reasoning": 1}, queue_budget_s=0.01, enabled=True)
+    holder = await controller.acquire("reasoning", "planner")
+
+    with pytest.raises(AdmissionRejected) as exc:
+        await controller.acquire("reasoning", "planner")
+
+    assert exc.value.route == "reasoning"
+    assert exc.value.priority == "planner"
+    assert exc.value.retry_after_s >= 1
+    assert controller.lanes["reasoning"].queued == 0
+
+    # The timed-out waiter is skipped: the next request gets the freed slot.
+    holder.release()
+    admission = await controller.acquire("reasoning", "chat")
+    assert controller.lanes["reasoning"].in_flight == 1
+    admission.release()
+
+
+@pytest.mark.asyncio
+async def test_nested_governance_calls_run_on_the_request_slot():
+    controller = AdmissionController(limits={"fast": 2}, queue_budget_s=0.05, enabled=True)
+
+    async def chat():
+        admission = await controller.acquire("fast", "chat")
+        bind_request(admission)
+        try:
+            await asyncio.sleep(0.01)
+            # The NeMo self-check of an admitted request must not wait for a second slot.
+            async with controller.admit("fast", "governance"):
+                await asyncio.sleep(0.01)
+        finally:
+            admission.release()
+
+    # More requests than slots: without nesting every admitted request would
+    # hold the slot its own self-check needs and all of them would be shed.
+    results = await asyncio.gather(*(chat() for _ in range(4)), return_exceptions=True)
+    assert results == [None] * 4
+    assert controller.lanes["fast"].in_flight == 0
+
+    # Outside a bound request (or once its slot is gone) governance queues as usual.
+    holder = await controller.acquire("fast", "chat")
+    bind_request(holder)
+    holder.release()
+    first = await controller.acquire("fast", "governance")
+    second = await controller.acquire("fast", "governance")
+    assert controller.lanes["fast"].in_flight == 2
+    first.release()
+    second.release()
+
+
+@pytest.mark.asyncio
+async def test_disabled_controller_admits_everything():
+    controller = AdmissionController(limits={"fast": 1}, queue_budget_s=0.0, enabled=False)
+    admissions = [await controller.acquire("fast") for _ in range(3)]
+    for admission in admissions:
+        admission.release()
+    assert controller.lanes["fast"].in_flight == 0
+
+
+def test_modes_map_to_priority_classes():
+    assert priority_class("reasoning") == "planner"
+    assert priority_class("analysis") == "planner"
+    assert priority_class(None) == "chat"
+    assert priority_class("unknown") == "chat"
+
+
+@pytest.mark.asyncio
+async def test_scaling_endpoint_exposes_in_flight_and_queued_per_route():
+    from src.gateway.core.metrics import SCALING_METRICS, render_latest
+
+    controller = AdmissionController(limits={"scaling-test": 1}, queue_budget_s=5.0, enabled=True)
+    holder = await controller.acquire("scaling-test", "governance")
+    waiter = asyncio.create_task(controller.acquire("scaling-test", "planner"))
+    await asyncio.sleep(0)
+
+    payload = render_latest(SCALING_METRICS)[0].decode()
+    assert 'gateway_admission_in_flight{priority="governance",route="scaling-test"} 1.0' in payload
+    assert 'gateway_admission_queue_depth{priority="planner",route="scaling-test"} 1.0' in payload
+    # Only the scaling signal, not the full registry.
+    assert "gateway_upstream_request_seconds" not in payload
+
+    holder.release()
+    (await waiter).release()
+
+
+def test_scaling_endpoint_renders_under_multiprocess_workers(tmp_path):
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    # The multiprocess value class is chosen at import: render in a fresh interpreter.
+    script = (
+        "from src.gateway.core.metrics import ADMISSION_IN_FLIGHT, SCALING_METRICS, render_latest\n"
+        "ADMISSION_IN_FLIGHT.labels('fast', 'chat').set(3)\n"
+        "print(render_latest(SCALING_METRICS)[0].decode())\n"
+    )
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    payload = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parents[1]
+    ).stdout
+
+    assert 'gateway_admission_in_flight{priority="chat",route="fast"} 3.0' in payload
+    assert "gateway_upstream_request_seconds" not in payload
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.gateway.governance import GovernanceError, SymbolicGovernor, safety
+from src.gateway.governance.safety import ControlBarrierFunction
+from src.governed_financial_advisor.infrastructure.redis_client import RedisClient
+
+
+@pytest.fixture(params=["memory", "lua"])
+def cbf(request, monkeypatch):
+    client = RedisClient()
+    if request.param == "memory":
+        # In memory the scripts run as their Python equivalents under the CBF's lock.
+        client.use_redis, client.client = False, None
+    else:
+        # RESERVE_LUA / COMMIT_LUA / RELEASE_LUA themselves, on a Lua-capable fake server.
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        client.use_redis, client.client = True, fakeredis.FakeRedis(server=server, decode_responses=True)
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        monkeypatch.setattr(client, "_async_redis", lambda: async_client)
+    monkeypatch.setattr(safety, "redis_client", client)
+    cbf = ControlBarrierFunction(min_cash_balance=1000.0, gamma=0.5)
+    client.set(cbf.redis_key, "41000.0")
+    return cbf
+
+
+def held(cbf) -> set:
+    """Ids of the reservations currently holding cash."""
+    client = safety.redis_client
+    if client.use_redis:
+        return set(client.client.hkeys(cbf.reserved_key))
+    return set(cbf._local_reservations)
+
+
+def trade(amount, **extra):
+    return {"symbol": "AAPL", "amount": amount, "currency": "USD", "confidence": 0.99,
+            "approval_token": "signed", "latency_ms": 20.0, **extra}
+
+
+def test_reserve_commit_release(cbf):
+    result, first = cbf.reserve("execute_trade", trade(20000))
+    assert result == "SAFE" and first
+    assert cbf._get_current_cash() == 21000.0
+
+    # The barrier sees the held cash: h = 20000, so 15000 > gamma * h is rejected.
+    result, none = cbf.reserve("execute_trade", trade(15000))
+    assert result == "UNSAFE: CBF violation. h(next)=5000.0 < threshold=10000.0" and none is None
+
+    _, second = cbf.reserve("execute_trade", trade(5000))
+    assert cbf.release(second) and not cbf.release(second)
+    assert cbf.commit(first)
+    assert cbf._get_current_cash() == 21000.0
+    assert held(cbf) == set()
+
+
+def test_expired_reservation_returns_to_balance(cbf):
+    _, reservation_id = cbf.reserve("execute_trade", trade(1000), ttl_s=0.05)
+    assert cbf._get_current_cash() == 40000.0
+    time.sleep(0.1)
+
+    assert not cbf.release(reservation_id)
+    assert cbf._get_current_cash() == 41000.0
+    # Executed after all: committing with the cost deducts it again.
+    assert cbf.commit(reservation_id, 1000)
+    assert cbf._get_current_cash() == 40000.0
+
+
+def test_parallel_trades_never_overspend(cbf):
+    cbf.gamma = 1.0  # Only the floor: h(next) >= 0
+    safety.redis_client.set(cbf.redis_key, "101000.0")
+    reserved, lock = [], threading.Lock()
+
+    def trader():
+        for _ in range(25):
+            _, reservation_id = cbf.reserve("execute_trade", trade(1000.0))
+            if reservation_id:
+                with lock:
+                    reserved.append(reservation_id)
+
+    threads = [threading.Thread(target=trader) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 400 attempts against room for exactly 100: never one more.
+    assert len(reserved) == 100
+    assert cbf._get_current_cash() == 1000.0
+    for i, reservation_id in enumerate(reserved):
+        assert (cbf.release if i % 2 else cbf.commit)(reservation_id)
+    assert cbf._get_current_cash() == 51000.0
+
+
+@pytest.mark.asyncio
+async def test_govern_releases_hold_when_a_later_stage_rejects(cbf):
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.side_effect = lambda payload, **kwargs: "DENY" if payload["symbol"] == "BAD" else "ALLOW"
+    consensus_engine = AsyncMock()
+    consensus_engine.check_consensus.return_value = {"status": "APPROVE", "reason": "ok"}
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+    governor = SymbolicGovernor(opa_client, cbf, consensus_engine, stpa_validator)
+
+    orders = [trade(500.0, symbol="BAD" if i % 3 == 0 else "AAPL") for i in range(60)]
+    results = await asyncio.gather(
+        *(governor.govern("execute_trade", order, reserve=True) for order in orders), return_exceptions=True
+    )
+
+    denied = [r for r in results if isinstance(r, GovernanceError)]
+    holds = [r for r in results if isinstance(r, str)]
+    assert len(denied) == 20 and len(holds) == 40
+    # Only the approved trades hold cash.
+    assert cbf._get_current_cash() == 41000.0 - 40 * 500.0
+    assert held(cbf) == set(holds)
+
+    assert await governor.govern("execute_trade", trade(500.0, dry_run=True), reserve=True) is None
+
+
+@pytest.mark.asyncio
+async def test_rejected_trade_releases_its_hold_off_the_event_loop(cbf, monkeypatch):
+    loop_thread, release_threads = threading.get_ident(), []
+    release = cbf.release
+
+    def recording_release(reservation_id):
+        release_threads.append(threading.get_ident())
+        return release(reservation_id)
+
+    monkeypatch.setattr(cbf, "release", recording_release)
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.return_value = "DENY"
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+    governor = SymbolicGovernor(opa_client, cbf, AsyncMock(), stpa_validator)
+
+    with pytest.raises(GovernanceError):
+        await governor.govern("execute_trade", trade(500.0), reserve=True)
+
+    # The hold is back before govern() raises, and the script ran on a thread.
+    assert cbf._get_current_cash() == 41000.0 and held(cbf) == set()
+    assert release_threads and loop_thread not in release_threads
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+import respx
+
+from src.gateway.core.deadline import (
+    DeadlineExceeded,
+    current_deadline,
+    deadline_headers,
+    deadline_scope,
+    elapsed_ms,
+    timeout_for,
+    within_deadline,
+)
+from src.gateway.core.policy import CircuitBreaker, OPAClient
+from src.gateway.governance import GovernanceError, SymbolicGovernor
+
+
+def test_nested_scopes_only_tighten():
+    assert current_deadline() is None
+    assert timeout_for(1.0) == 1.0
+
+    with deadline_scope(1000) as outer:
+        time.sleep(0.01)
+        # A looser inner budget keeps the outer deadline.
+        with deadline_scope(5000) as inner:
+            assert inner is outer
+        with deadline_scope(100) as inner:
+            assert inner.expires_at < outer.expires_at
+            # Spend is measured from the outermost scope.
+            assert elapsed_ms() >= 10
+            assert timeout_for(1.0) <= 0.1
+            assert int(deadline_headers()["X-Deadline-Ms"]) <= 100
+        assert current_deadline() is outer
+
+    assert current_deadline() is None
+    assert deadline_headers() == {}
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_cancels_slow_stage():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with deadline_scope(50):
+        with pytest.raises(DeadlineExceeded) as excinfo:
+            await within_deadline(slow(), "consensus")
+    assert excinfo.value.stage == "consensus"
+    assert cancelled.is_set()
+
+    # Already spent: the stage is never started.
+    with deadline_scope(0):
+        coro = slow()
+        with pytest.raises(DeadlineExceeded):
+            await within_deadline(coro, "nemo.input_rails")
+        assert coro.cr_frame is None
+
+
+@pytest.mark.asyncio
+async def test_govern_fails_closed_when_consensus_overruns():
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.return_value = "ALLOW"
+    safety_filter = Mock()
+    safety_filter.verify_action.return_value = "SAFE"
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+
+    async def slow_consensus(*args):
+        await asyncio.sleep(5)
+
+    consensus_engine = Mock()
+    consensus_engine.check_consensus = slow_consensus
+
+    governor = SymbolicGovernor(opa_client, safety_filter, consensus_engine, stpa_validator)
+    params = {"confidence": 0.99, "amount": 100, "symbol": "AAPL"}
+
+    with deadline_scope(50):
+        with pytest.raises(GovernanceError, match="Latency Budget Exhausted"):
+            await governor.govern("execute_trade", params)
+
+    # OPA saw the real cumulative spend, not 0.
+    assert opa_client.evaluate_policy.await_args.kwargs["current_latency_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_opa_denies_on_spent_budget_without_tripping_breaker():
+    client = OPAClient()
+    client.cb.failures = 0
+
+    def slow_timeout(request):
+        time.sleep(0.06)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(client.url).mock(side_effect=slow_timeout)
+
+        with deadline_scope(0):
+            assert await client.evaluate_policy({"action": "test"}) == "DENY"
+        assert route.call_count == 0
+
+        # The deadline runs out during the call: DENY, but OPA is not blamed.
+        with deadline_scope(50):
+            assert await client.evaluate_policy({"action": "test"}) == "DENY"
+        assert route.call_count == 1
+
+    assert client.cb.failures == 0
+    assert client.cb.state == "CLOSED"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_long_batch_within_deadline_still_reaches_opa():
+    client = OPAClient()
+    steps = [{"action": "execute_trade", "amount": 100}] * 3
+
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(client.batch_target_url).mock(
+            return_value=httpx.Response(200, json={"result": ["ALLOW"] * 3})
+        )
+        with deadline_scope(60000) as deadline:
+            # 5s already spent on the plan, well within the request's budget.
+            deadline.started -= 5
+            deadline.expires_at -= 5
+            assert elapsed_ms() > 3000
+            assert await client.evaluate_policy_batch(steps, current_latency_ms=elapsed_ms()) == ["ALLOW"] * 3
+        assert route.call_count == 1
+
+        # Too little budget left for a round-trip: denied without calling OPA.
+        with deadline_scope(client.cb.min_remaining_ms / 2):
+            assert await client.evaluate_policy_batch(steps, bypass_cache=True) == ["DENY"] * 3
+        assert route.call_count == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_probe_cut_short_by_deadline_releases_half_open_slot():
+    client = OPAClient()
+    client.cb = CircuitBreaker(failure_threshold=2, recovery_timeout=5, half_open_max_calls=1)
+    client.cb.record_failure()
+    client.cb.record_failure()
+    client.cb.last_failure_time -= 6
+
+    def slow_timeout(request):
+        time.sleep(0.06)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(client.url).mock(side_effect=slow_timeout)
+        with deadline_scope(50):
+            assert await client.evaluate_policy({"action": "test"}) == "DENY"
+        assert client.cb.state == "HALF_OPEN"
+
+        # The timed-out probe was not OPA's fault and did not keep its slot.
+        route.side_effect = None
+        route.return_value = httpx.Response(200, json={"result": "ALLOW"})
+        assert await client.evaluate_policy({"action": "test"}) == "ALLOW"
+    assert client.cb.state == "CLOSED"
+    await client.close()
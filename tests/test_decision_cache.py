@@ -0,0 +1,108 @@
+import time
+
+import httpx
+import pytest
+import respx
+
+from src.gateway.core.decision_cache import DecisionCache, canonical_key, publish_invalidation
+from src.gateway.core.policy import OPAClient
+from src.governed_financial_advisor.infrastructure.redis_client import RedisClient
+
+
+def opa_response(result, revision="r1"):
+    return httpx.Response(200, json={"result": result, "provenance": {"bundles": {"finance": {"revision": revision}}}})
+
+
+@pytest.fixture
+def opa_client():
+    client = OPAClient()
+    client.cache = DecisionCache(max_entries=100, ttl_s=30.0, ignore_fields=("transaction_id",), enabled=True)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_repeated_input_is_served_from_cache(opa_client):
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(opa_client.url).mock(return_value=opa_response("ALLOW"))
+
+        first = {"action": "execute_trade", "symbol": "AAPL", "amount": 100, "transaction_id": "t-1"}
+        # Same input, different key order and transaction id.
+        second = {"transaction_id": "t-2", "amount": 100, "symbol": "AAPL", "action": "execute_trade"}
+
+        assert await opa_client.evaluate_policy(first) == "ALLOW"
+        assert await opa_client.evaluate_policy(second) == "ALLOW"
+        assert route.call_count == 1
+        assert route.calls[0].request.url.params["provenance"] == "true"
+
+        assert await opa_client.evaluate_policy({**first, "amount": 200}) == "ALLOW"
+        assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bypass_and_failures_are_not_cached(opa_client):
+    payload = {"action": "execute_trade", "amount": 100}
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(opa_client.url).mock(return_value=httpx.Response(500))
+        assert await opa_client.evaluate_policy(payload) == "DENY"
+        assert opa_client.cache.entries == {}
+
+        route.mock(return_value=opa_response("ALLOW"))
+        assert await opa_client.evaluate_policy(payload) == "ALLOW"
+        assert await opa_client.evaluate_policy(payload, bypass_cache=True) == "ALLOW"
+        assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_revision_change_clears_cache(opa_client):
+    a = {"action": "execute_trade", "amount": 1}
+    b = {"action": "execute_trade", "amount": 2}
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(opa_client.url).mock(return_value=opa_response("ALLOW", "r1"))
+        await opa_client.evaluate_policy(a)
+
+        # A new bundle is loaded: the next OPA round-trip reports it.
+        route.mock(return_value=opa_response("DENY", "r2"))
+        assert await opa_client.evaluate_policy(b) == "DENY"
+        assert opa_client.cache.revision == "finance@r2"
+        assert await opa_client.evaluate_policy(a) == "DENY"
+        assert route.call_count == 3
+
+
+def test_ttl_and_lru_eviction():
+    cache = DecisionCache(max_entries=2, ttl_s=30.0, enabled=True)
+    cache.put("a", "ALLOW")
+    cache.put("b", "ALLOW")
+    assert cache.get("a") == "ALLOW"  # a is now most recent
+    cache.put("c", "DENY")
+    assert cache.get("b") is None
+    assert cache.get("a") == "ALLOW"
+
+    expiring = DecisionCache(max_entries=2, ttl_s=0.0, enabled=True)
+    expiring.put("a", "ALLOW")
+    time.sleep(0.001)
+    assert expiring.get("a") is None
+    assert len(expiring.entries) == 0
+
+
+def test_published_invalidation_clears_subscribed_caches():
+    bus = RedisClient()
+    bus.use_redis = False
+    bus.client = None
+
+    caches = [DecisionCache(enabled=True) for _ in range(2)]
+    for cache in caches:
+        cache.start_listener(bus)
+        cache.put("k", "ALLOW")
+
+    assert publish_invalidation("policy-updated", bus) == 2
+    assert all(cache.get("k") is None for cache in caches)
+
+    for cache in caches:
+        cache.stop_listener()
+    assert publish_invalidation("policy-updated", bus) == 0
+
+
+def test_canonical_key_ignores_order_and_ignored_fields():
+    assert canonical_key({"a": 1, "b": {"y": 2, "x": 1}}) == canonical_key({"b": {"x": 1, "y": 2}, "a": 1})
+    assert canonical_key({"a": 1, "dry_run": True}, ["dry_run"]) == canonical_key({"a": 1})
+    assert canonical_key({"a": 1}) != canonical_key({"a": 2})
@@ -0,0 +1,177 @@
+import itertools
+import json
+import os
+import shutil
+import socket
+import subprocess
+import time
+
+import httpx
+import pytest
+import respx
+
+from config.settings import Config
+from src.gateway.core.embedded_policy import (
+    DEFAULT_POLICY_PATHS,
+    POLICY_DIR,
+    PolicyConflict,
+    UnsupportedRego,
+    load_embedded_engine,
+)
+from src.gateway.core.policy import OPAClient
+
+RECORDED_INPUTS = os.path.join(os.path.dirname(__file__), "data", "opa_recorded_inputs.jsonl")
+
+
+def recorded_inputs():
+    with open(RECORDED_INPUTS) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def boundary_inputs():
+    """Threshold edges of every finance rule, plus missing and mistyped fields."""
+    roles = ["junior", "senior", "intern", None]
+    amounts = [0, 5000, 5000.5, 10000, 10001, 500000, 500001, 1000000, 1000001, "100", None]
+    currencies = ["USD", "BTC", None]
+    profiles = [None, "Aggressive", "Speculative"]
+    for role, amount, currency, profile in itertools.product(roles, amounts, currencies, profiles):
+        payload = {"action": "execute_trade"}
+        for key, value in (("trader_role", role), ("amount", amount), ("currency", currency), ("risk_profile", profile)):
+            if value is not None:
+                payload[key] = value
+        yield payload
+
+
+def embedded_outcome(engine, payload):
+    try:
+        return engine.evaluate(payload)
+    except PolicyConflict:
+        return "CONFLICT"
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return load_embedded_engine("finance")
+
+
+def test_finance_thresholds(engine):
+    trade = {"action": "execute_trade", "currency": "USD"}
+    assert engine.evaluate({"action": "market_analysis"}) == "ALLOW"
+    assert engine.evaluate({**trade, "trader_role": "junior", "amount": 5000}) == "ALLOW"
+    assert engine.evaluate({**trade, "trader_role": "junior", "amount": 5001}) == "MANUAL_REVIEW"
+    assert engine.evaluate({**trade, "trader_role": "junior", "amount": 10001}) == "DENY"
+    assert engine.evaluate({**trade, "trader_role": "senior", "amount": 500000}) == "ALLOW"
+    assert engine.evaluate({**trade, "trader_role": "senior", "amount": 1000000}) == "MANUAL_REVIEW"
+    assert engine.evaluate({**trade, "trader_role": "junior", "amount": 100, "currency": "BTC"}) == "DENY"
+    assert engine.evaluate({**trade, "trader_role": "intern", "amount": 100}) == "DENY"
+
+
+def test_rego_undefined_and_type_semantics(engine):
+    # Missing currency: `input.currency != "BTC"` is undefined, so no ALLOW row fires.
+    assert engine.evaluate({"action": "execute_trade", "trader_role": "junior", "amount": 100}) == "DENY"
+    # Strings sort after numbers in Rego: "100" <= 5000 is false.
+    assert engine.evaluate({"action": "execute_trade", "trader_role": "junior", "amount": "100", "currency": "USD"}) == "DENY"
+    # Two rules with different values is a conflict, as in OPA.
+    with pytest.raises(PolicyConflict):
+        engine.evaluate({"action": "execute_trade", "trader_role": "junior", "amount": 7000, "currency": "USD", "risk_profile": "Moderate"})
+
+
+def test_policies_outside_the_subset_are_rejected():
+    # generated_rules.rego uses object.get and arithmetic.
+    with pytest.raises(UnsupportedRego):
+        load_embedded_engine("finance/generated/decision", [POLICY_DIR])
+    # The batch comprehension is outside the subset but does not block `allow`.
+    assert load_embedded_engine("finance/allow", [POLICY_DIR]).rule == "allow"
+    with pytest.raises(UnsupportedRego):
+        load_embedded_engine("finance/batch_allow")
+
+
+@pytest.mark.asyncio
+async def test_opa_client_embedded_scheme_skips_http(monkeypatch):
+    monkeypatch.setattr(Config, "OPA_URL", "embedded://finance")
+    client = OPAClient()
+    assert client.engine is not None
+
+    async with respx.mock(base_url=None, assert_all_called=False) as mock:
+        route = mock.post(url__regex=r".*").mock(return_value=httpx.Response(500))
+        steps = [
+            {"action": "execute_trade", "trader_role": "junior", "amount": 100, "currency": "USD"},
+            {"action": "execute_trade", "trader_role": "junior", "amount": 7000, "currency": "USD"},
+            {"action": "execute_trade", "trader_role": "junior", "amount": 7000, "currency": "USD", "risk_profile": "Moderate"},
+        ]
+        assert await client.evaluate_policy(steps[0]) == "ALLOW"
+        assert await client.evaluate_policy_batch(steps) == ["ALLOW", "MANUAL_REVIEW", "DENY"]
+        assert route.call_count == 0
+    await client.close()
+
+
+def test_opa_client_falls_back_to_http(monkeypatch):
+    monkeypatch.setattr(Config, "OPA_URL", "embedded://finance/generated/decision")
+    monkeypatch.setattr(Config, "OPA_EMBEDDED_POLICY_PATHS", [POLICY_DIR])
+    client = OPAClient()
+    assert client.engine is None
+    assert client.target_url == Config.OPA_FALLBACK_URL
+
+
+# --- Differential harness: embedded engine vs a real OPA ---
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def real_opa():
+    """
+    A running OPA serving the finance policy: OPA_DIFFERENTIAL_URL (base URL),
+    else an `opa` binary on PATH is started for the module.
+    """
+    url = os.getenv("OPA_DIFFERENTIAL_URL")
+    if url:
+        yield url.rstrip("/")
+        return
+    opa = shutil.which("opa")
+    if not opa:
+        pytest.skip("No OPA available (set OPA_DIFFERENTIAL_URL or install the opa binary)")
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [opa, "run", "--server", "--addr", f"127.0.0.1:{port}", *DEFAULT_POLICY_PATHS],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(50):
+            try:
+                if httpx.get(f"{url}/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        else:
+            pytest.skip("OPA did not start")
+        yield url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def opa_outcome(client, url, payload):
+    response = client.post(f"{url}/v1/data/finance/allow", json={"input": payload})
+    if response.status_code == 500 and response.json().get("errors", [{}])[0].get("code") == "eval_conflict_error":
+        return "CONFLICT"
+    response.raise_for_status()
+    return response.json().get("result")
+
+
+def test_embedded_engine_matches_opa(engine, real_opa):
+    payloads = recorded_inputs() + list(boundary_inputs())
+    divergent = []
+    with httpx.Client(timeout=5.0) as client:
+        for payload in payloads:
+            expected = opa_outcome(client, real_opa, payload)
+            actual = embedded_outcome(engine, payload)
+            if actual != expected:
+                divergent.append(f"{payload} -> embedded={actual!r} opa={expected!r}")
+
+    assert not divergent, f"{len(divergent)}/{len(payloads)} inputs diverge:\n" + "\n".join(divergent[:20])
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from src.gateway.core.lanes import KeyedExecutionLanes
+from src.gateway.core.registry import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry(max_workers=2, lanes=KeyedExecutionLanes())
+    yield registry
+    registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_trades_serialise_per_trader_and_parallelise_across_traders(registry):
+    active = {}
+    overlap = {"same_trader": False, "cross_trader": False}
+    log = []
+
+    @registry.tool(FastMCP("Test Gateway"), lane_key="trader_id")
+    async def execute_trade_action(symbol: str, amount: float, trader_id: str = "agent_001") -> str:
+        if active.get(trader_id):
+            overlap["same_trader"] = True
+        if any(v for k, v in active.items() if k != trader_id):
+            overlap["cross_trader"] = True
+        active[trader_id] = True
+        log.append((trader_id, amount))
+        await asyncio.sleep(0.01)
+        active[trader_id] = False
+        return "OK"
+
+    calls = [
+        registry.dispatch("execute_trade_action", {"symbol": "AAPL", "amount": amount, "trader_id": trader})
+        for amount, trader in [(1, "alice"), (2, "alice"), (3, "bob"), (4, "alice"), (5, "bob")]
+    ]
+    assert await asyncio.gather(*calls) == ["OK"] * 5
+
+    assert not overlap["same_trader"]
+    assert overlap["cross_trader"]
+    # FIFO within a lane
+    assert [a for t, a in log if t == "alice"] == [1, 2, 4]
+    assert [a for t, a in log if t == "bob"] == [3, 5]
+    # Idle lanes are dropped
+    assert registry.lanes.lanes == {}
+
+
+@pytest.mark.asyncio
+async def test_read_only_tools_bypass_lanes(registry):
+    release = asyncio.Event()
+
+    @registry.tool(FastMCP("Test Gateway"), lane_key="trader_id")
+    async def execute_trade_action(symbol: str, trader_id: str = "agent_001") -> str:
+        await release.wait()
+        return "OK"
+
+    @registry.tool(FastMCP("Test Gateway"), read_only=True)
+    async def check_market_status(symbol: str, trader_id: str = "agent_001") -> str:
+        return "OPEN"
+
+    trade = asyncio.create_task(registry.dispatch("execute_trade_action", {"symbol": "AAPL"}))
+    await asyncio.sleep(0)
+    assert registry.lanes.depth("agent_001") == 1
+
+    # Not blocked behind the in-flight trade for the same trader.
+    assert await asyncio.wait_for(registry.dispatch("check_market_status", {"symbol": "AAPL"}), 1) == "OPEN"
+
+    release.set()
+    assert await trade == "OK"
+
+
+def test_lane_key_must_be_a_side_effecting_tool_argument(registry):
+    async def lookup(symbol: str) -> str:
+        return symbol
+
+    with pytest.raises(ValueError):
+        registry.register(lookup, read_only=True, lane_key="symbol")
+    with pytest.raises(ValueError):
+        registry.register(lookup, lane_key="trader_id")
@@ -0,0 +1,121 @@
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.gateway.governance import GovernanceError, SymbolicGovernor
+from src.gateway.governance.safety import ControlBarrierFunction, redis_client
+from src.gateway.governance.stpa_validator import STPAValidator
+
+
+def opa_rule(payload):
+    if payload.get("currency") == "BTC":
+        return "DENY"
+    return "MANUAL_REVIEW" if payload.get("amount", 0) > 20000 else "ALLOW"
+
+
+async def consensus_rule(action, amount, symbol):
+    if symbol == "BAD":
+        return {"status": "REJECT", "reason": "Irregular symbol"}
+    return {"status": "APPROVE", "reason": "ok"}
+
+
+@pytest.fixture
+def cbf():
+    cbf = ControlBarrierFunction(min_cash_balance=1000.0, gamma=0.5)
+    redis_client.set(cbf.redis_key, "100000.0")
+    yield cbf
+    redis_client.set(cbf.redis_key, "100000.0")
+
+
+@pytest.fixture
+def governor(cbf):
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.side_effect = lambda payload, **kwargs: opa_rule(payload)
+    opa_client.evaluate_policy_batch.side_effect = lambda payloads, **kwargs: [opa_rule(p) for p in payloads]
+    consensus_engine = AsyncMock()
+    consensus_engine.check_consensus.side_effect = consensus_rule
+    return SymbolicGovernor(opa_client, cbf, consensus_engine, STPAValidator())
+
+
+def order(amount, **overrides):
+    return {
+        "symbol": "AAPL", "amount": amount, "currency": "USD", "confidence": 0.99,
+        "approval_token": "signed", "latency_ms": 20.0, **overrides
+    }
+
+
+def random_orders(n, seed=7):
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(n):
+        o = order(round(rng.uniform(10, 30000), 2))
+        roll = rng.random()
+        if roll < 0.05:
+            o["confidence"] = 0.5
+        elif roll < 0.10:
+            del o["approval_token"]
+        elif roll < 0.15:
+            o["latency_ms"] = 350.0
+        elif roll < 0.20:
+            o["currency"] = "BTC"
+        elif roll < 0.25:
+            o["drawdown_pct"] = 9.0
+        orders.append(o)
+    return orders
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_sequential_govern(governor, cbf):
+    orders = random_orders(60)
+
+    # Reference: govern() one order at a time, executing (depleting cash) the approved ones.
+    expected = []
+    for o in orders:
+        try:
+            await governor.govern("execute_trade", o)
+            cbf.update_state(o["amount"])
+            expected.append(None)
+        except GovernanceError as e:
+            expected.append(str(e))
+    redis_client.set(cbf.redis_key, "100000.0")
+
+    # Barrier values differ in the last float digits (cumsum vs running subtraction).
+    def decision(message):
+        return message.split(" h(next)=")[0] if message else None
+
+    assert [decision(e) for e in await governor.govern_batch(orders)] == [decision(e) for e in expected]
+    assert sum(e is None for e in expected) > 0
+    assert any(e and "RBC/CBF" in e for e in expected)
+
+
+@pytest.mark.asyncio
+async def test_batch_depletes_cash_cumulatively(governor, cbf):
+    redis_client.set(cbf.redis_key, "40000.0")
+    # Each order fits the barrier alone (cost <= gamma * h = 19500); after the first
+    # the second does not, and a rejected order leaves its cash to the ones after it.
+    orders = [order(19000), order(15000), order(9000), order(5000)]
+    results = await governor.govern_batch(orders)
+
+    assert results[0] is None
+    assert results[1].startswith("Safety Violation (RBC/CBF)")
+    assert results[2] is None
+    assert results[3] is None
+    # Policy-denied orders are reported as such and reserve no cash.
+    results = await governor.govern_batch([order(19000, currency="BTC"), order(19000)])
+    assert results == ["ISO 42001 Policy Violation: OPA Denied Action.", None]
+
+
+@pytest.mark.asyncio
+async def test_only_survivors_reach_opa_and_consensus(governor):
+    orders = [order(100, confidence=0.1), order(200), order(300, latency_ms=999), order(400, symbol="BAD")]
+    results = await governor.govern_batch(orders)
+
+    governor.opa_client.evaluate_policy_batch.assert_awaited_once()
+    assert [p["amount"] for p in governor.opa_client.evaluate_policy_batch.await_args.args[0]] == [200, 400]
+    assert governor.consensus_engine.check_consensus.await_count == 2
+
+    assert results[0].startswith("SR 11-7 Violation")
+    assert results[1] is None
+    assert results[2] == "STPA Violation: STPA Violation FIN-2: Agent must not execute trade if latency > 200ms"
+    assert results[3] == "Consensus Rejection: Irregular symbol"
@@ -0,0 +1,175 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.gateway.governance import SymbolicGovernor
+from src.gateway.governance.verdicts import VERDICT_KEY_PREFIX, VerdictStore
+from src.governed_financial_advisor.infrastructure.redis_client import RedisClient
+
+PARAMS = {"confidence": 0.99, "amount": 100, "symbol": "AAPL", "currency": "USD"}
+
+
+@pytest.fixture(scope="module")
+def memory_redis():
+    client = RedisClient()
+    client.use_redis = False
+    client.client = None
+    return client
+
+
+@pytest.fixture
+def bus(memory_redis):
+    memory_redis.memory_store.clear()
+    return memory_redis
+
+
+def make_governor(bus, secret="test-secret"):
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.return_value = "ALLOW"
+    opa_client.policy_revision = "finance@r1"
+    safety_filter = Mock()
+    safety_filter.verify_action.return_value = "SAFE"
+    safety_filter.state_version.return_value = "100000.0"
+    consensus_engine = AsyncMock()
+    consensus_engine.check_consensus.return_value = {"status": "APPROVE"}
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+    return SymbolicGovernor(
+        opa_client, safety_filter, consensus_engine, stpa_validator,
+        verdict_store=VerdictStore(secret=secret, ttl_s=60, redis_client=bus)
+    )
+
+
+def reset_calls(governor):
+    for mock in (governor.opa_client.evaluate_policy, governor.safety_filter.verify_action,
+                 governor.consensus_engine.check_consensus, governor.stpa_validator.validate):
+        mock.reset_mock()
+
+
+@pytest.mark.asyncio
+async def test_verdict_skips_unchanged_stages_once(bus):
+    governor = make_governor(bus)
+    violations, token = await governor.verify_with_verdict("execute_trade", PARAMS)
+    assert violations == [] and token
+    reset_calls(governor)
+
+    await governor.govern("execute_trade", {**PARAMS, "transaction_id": "t-1"}, verdict_token=token)
+    governor.consensus_engine.check_consensus.assert_not_called()
+    governor.opa_client.evaluate_policy.assert_not_called()
+    governor.safety_filter.verify_action.assert_not_called()
+    # STPA is always re-run on the live parameters.
+    governor.stpa_validator.validate.assert_called_once()
+
+    # A live execution consumes the verdict.
+    await governor.govern("execute_trade", PARAMS, verdict_token=token)
+    governor.consensus_engine.check_consensus.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_plan_step_verdict_skips_opa_when_the_step_executes(bus):
+    governor = make_governor(bus)
+    governor.opa_client.evaluate_policy_batch.return_value = ["ALLOW"]
+    governor.safety_filter.reserve.return_value = ("SAFE", "r-1")
+    # check_plan_safety: the plan step's parameters plus the trade defaults and risk profile.
+    step = {"id": "1", "action": "execute_trade", "parameters": {
+        "symbol": "AAPL", "amount": 100, "currency": "USD", "trader_role": "junior", "risk_profile": "Moderate"
+    }}
+    results, verdicts = await governor.verify_plan_with_verdicts([step])
+    assert results == [[]] and verdicts[0]
+    reset_calls(governor)
+
+    # execute_trade_action: the same policy input, plus per-call bookkeeping.
+    live = {
+        **step["parameters"], "confidence": 0.99, "transaction_id": "t-1",
+        "trader_id": "agent_001", "dry_run": False
+    }
+    reservation = await governor.govern("execute_trade", live, verdict_token=verdicts[0], reserve=True)
+    assert reservation == "r-1"
+    governor.opa_client.evaluate_policy.assert_not_called()
+    governor.consensus_engine.check_consensus.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_policy_input_change_reruns_opa(bus):
+    governor = make_governor(bus)
+    _, token = await governor.verify_with_verdict("execute_trade", {**PARAMS, "risk_profile": "Moderate"})
+    reset_calls(governor)
+
+    await governor.govern("execute_trade", {**PARAMS, "risk_profile": "Speculative"}, verdict_token=token)
+    governor.opa_client.evaluate_policy.assert_awaited_once()
+    governor.consensus_engine.check_consensus.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_inputs_rerun_their_stages(bus):
+    governor = make_governor(bus)
+    _, token = await governor.verify_with_verdict("execute_trade", PARAMS)
+    reset_calls(governor)
+
+    # The cash balance moved and the policy was redeployed: only consensus still holds.
+    governor.safety_filter.state_version.return_value = "90000.0"
+    governor.opa_client.policy_revision = "finance@r2"
+    await governor.govern("execute_trade", PARAMS, verdict_token=token)
+    governor.safety_filter.verify_action.assert_called_once()
+    governor.opa_client.evaluate_policy.assert_awaited_once()
+    governor.consensus_engine.check_consensus.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_forged_or_foreign_verdicts_are_ignored(bus):
+    governor = make_governor(bus)
+    _, token = await governor.verify_with_verdict("execute_trade", PARAMS)
+    verdict_id = token.split(".")[0]
+    reset_calls(governor)
+
+    # Signed with another key (e.g. a replica with the wrong secret).
+    other = make_governor(bus, secret="other-secret")
+    await other.govern("execute_trade", PARAMS, verdict_token=token)
+    other.consensus_engine.check_consensus.assert_awaited_once()
+
+    # The stored record was edited to cover a larger trade.
+    key = VERDICT_KEY_PREFIX + verdict_id
+    bus.memory_store[key] = bus.memory_store[key].replace('"expires_at"', '"forged":1,"expires_at"')
+    await governor.govern("execute_trade", {**PARAMS, "dry_run": True}, verdict_token=token)
+    governor.consensus_engine.check_consensus.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_no_verdict_without_secret_or_on_rejection(bus):
+    governor = make_governor(bus, secret="")
+    assert (await governor.verify_with_verdict("execute_trade", PARAMS))[1] is None
+
+    governor = make_governor(bus)
+    governor.opa_client.evaluate_policy.return_value = "DENY"
+    violations, token = await governor.verify_with_verdict("execute_trade", PARAMS)
+    assert violations and token is None
+
+
+@pytest.mark.asyncio
+async def test_consuming_a_verdict_is_atomic_across_replicas(bus):
+    store = VerdictStore(secret="test-secret", ttl_s=60, redis_client=bus)
+    token = await store.issue("execute_trade", {"opa": "fp"})
+    barrier = asyncio.Barrier(2)
+
+    class Replica:
+        # Both replicas read the verdict before either consumes it.
+        async def aget(self, key):
+            value = await bus.aget(key)
+            await barrier.wait()
+            return value
+
+        async def adelete_if_equals(self, key, value):
+            return await bus.adelete_if_equals(key, value)
+
+        def __getattr__(self, name):
+            # The verdict store runs on the event loop: no blocking Redis calls.
+            raise AssertionError(f"blocking Redis call: {name}")
+
+    async def live_execution():
+        replica = VerdictStore(secret="test-secret", ttl_s=60, redis_client=Replica())
+        return await replica.reusable_stages(token, "execute_trade", {"opa": "fp"}, consume=True)
+
+    results = await asyncio.gather(live_execution(), live_execution())
+
+    assert sorted(results, key=len) == [set(), {"opa"}]
@@ -0,0 +1,124 @@
+import grpc
+import pytest
+import pytest_asyncio
+from mcp.server.fastmcp import FastMCP
+
+from src.gateway.core.admission import AdmissionRejected
+from src.gateway.core.registry import ToolRegistry
+from src.gateway.server.grpc_server import GatewayGrpcServer, GatewayService
+from src.governed_financial_advisor.infrastructure.grpc_gateway_client import GatewayGrpcClient
+
+
+@pytest_asyncio.fixture
+async def gateway():
+    received = []
+
+    async def chat_pipeline(payload):
+        received.append(payload)
+        if payload["mode"] == "planner":
+            raise AdmissionRejected("reasoning", "planner", 3)
+        for piece in ["Hello", " world"]:
+            yield "content", piece
+        yield "usage", {"prompt_tokens": 12, "completion_tokens": 2}
+        yield "finish", "stop"
+
+    registry = ToolRegistry(max_workers=1)
+    mcp = FastMCP("Test Gateway")
+
+    @registry.tool(mcp, read_only=True)
+    def check_market_status(symbol: str) -> str:
+        return f"OPEN: {symbol}"
+
+    @registry.tool(mcp)
+    async def execute_trade_action(symbol: str, amount: float) -> str:
+        raise PermissionError("Governance Blocked: limit exceeded")
+
+    server = GatewayGrpcServer(GatewayService(chat_pipeline, registry), port=0)
+    port = await server.start()
+    client = GatewayGrpcClient(f"localhost:{port}")
+
+    yield client, received
+
+    await client.close()
+    await server.stop(grace=0)
+    registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chat_streams_pieces_and_forwards_guided_params(gateway):
+    client, received = gateway
+
+    pieces = [p async for p in client.chat_stream(
+        [{"role": "user", "content": "hi"}],
+        temperature=0.0,
+        guided_json={"type": "object"},
+        guided_choice=["BUY", "SELL"]
+    )]
+
+    assert pieces == ["Hello", " world"]
+    assert received[0]["guided_json"] == {"type": "object"}
+    assert received[0]["guided_choice"] == ["BUY", "SELL"]
+    assert received[0]["guided_regex"] is None
+    assert received[0]["temperature"] == 0.0
+    assert received[0]["mode"] == "chat"
+
+
+@pytest.mark.asyncio
+async def test_chat_reports_usage_on_final_chunk(gateway):
+    from src.gateway.protos import gateway_pb2
+
+    client, _ = gateway
+    await client.connect()
+    request = gateway_pb2.ChatRequest(messages=[gateway_pb2.Message(role="user", content="hi")])
+    responses = [r async for r in client.stub.Chat(request)]
+
+    assert responses[-1].is_final
+    assert (responses[-1].input_tokens, responses[-1].output_tokens) == (12, 2)
+
+
+@pytest.mark.asyncio
+async def test_chat_shed_maps_to_resource_exhausted(gateway):
+    client, _ = gateway
+
+    with pytest.raises(grpc.aio.AioRpcError) as exc:
+        await client.chat([{"role": "user", "content": "plan"}], mode="planner")
+
+    assert exc.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert ("retry-after", "3") in tuple(exc.value.trailing_metadata())
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_maps_statuses(gateway):
+    client, _ = gateway
+
+    assert await client.execute_tool("check_market_status", {"symbol": "AAPL"}) == {
+        "status": "SUCCESS", "output": "OPEN: AAPL", "error": ""
+    }
+
+    blocked = await client.execute_tool("execute_trade_action", {"symbol": "AAPL", "amount": 1})
+    assert blocked["status"] == "BLOCKED"
+
+    missing = await client.execute_tool("no_such_tool", {})
+    assert missing["status"] == "ERROR"
+
+
+@pytest.mark.asyncio
+async def test_port_is_shared_only_with_reuseport():
+    registry = ToolRegistry(max_workers=1)
+    service = GatewayService(None, registry)
+    first = GatewayGrpcServer(service, port=0, reuseport=True)
+    port = await first.start()
+    servers = [first]
+    try:
+        # Gunicorn workers: every worker binds the same port.
+        second = GatewayGrpcServer(service, port=port, reuseport=True)
+        assert await second.start() == port
+        servers.append(second)
+
+        # A single-process gateway must not silently share its port.
+        with pytest.raises(RuntimeError):
+            await GatewayGrpcServer(service, port=port, reuseport=False).start()
+    finally:
+        for server in servers:
+            await server.stop(grace=0)
+        registry.shutdown()
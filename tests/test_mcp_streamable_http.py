@@ -0,0 +1,52 @@
+import itertools
+
+import httpx
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+
+def _replica(name: str):
+    # Same transport settings as the gateway's FastMCP instance (hybrid_server.py).
+    mcp = FastMCP("Governed Gateway", host="0.0.0.0", stateless_http=True, json_response=True, streamable_http_path="/")
+    served = []
+
+    @mcp.tool()
+    def check_market_status(symbol: str) -> str:
+        served.append(name)
+        return f"OPEN: {symbol}"
+
+    app = Starlette(routes=[Mount("/mcp/http", mcp.streamable_http_app())])
+    return mcp, app, served
+
+
+class RoundRobinTransport(httpx.AsyncBaseTransport):
+    """Stands in for a load balancer that sends each request to the next replica."""
+
+    def __init__(self, apps):
+        self.transports = itertools.cycle([httpx.ASGITransport(app=app) for app in apps])
+
+    async def handle_async_request(self, request):
+        return await next(self.transports).handle_async_request(request)
+
+
+@pytest.mark.asyncio
+async def test_stateless_tool_calls_spread_across_replicas():
+    mcp_a, app_a, served_a = _replica("a")
+    mcp_b, app_b, served_b = _replica("b")
+
+    http_client = httpx.AsyncClient(transport=RoundRobinTransport([app_a, app_b]))
+
+    async with mcp_a.session_manager.run(), mcp_b.session_manager.run(), http_client:
+        # Host header as seen behind an in-cluster Service.
+        async with streamable_http_client("http://gateway:8080/mcp/http/", http_client=http_client) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                results = [await session.call_tool("check_market_status", {"symbol": "AAPL"}) for _ in range(4)]
+
+    assert all(r.content[0].text == "OPEN: AAPL" for r in results)
+    # No session affinity: both replicas served calls from the one client.
+    assert served_a and served_b
@@ -0,0 +1,75 @@
+import asyncio
+import shutil
+
+import pytest
+
+from config.settings import Config
+from src.gateway.governance.ontology import OntologyError
+from src.gateway.governance.ontology_reloader import OntologyReloader
+from src.gateway.governance.stpa_validator import STPAValidator
+
+TRADE = {"approval_token": "signed", "latency_ms": 150}
+
+
+@pytest.fixture
+def ontology_file(tmp_path):
+    path = tmp_path / "stpa_ontology.yaml"
+    shutil.copy(Config.STPA_ONTOLOGY_FILE, path)
+    return path
+
+
+def edit(path, old, new):
+    path.write_text(path.read_text().replace(old, new))
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_compiled_snapshot(ontology_file):
+    validator = STPAValidator()
+    reloader = OntologyReloader(validator, path=str(ontology_file), poll_s=0)
+    # The bundled file and the copy have the same content: nothing to swap.
+    assert await reloader.reload() is None
+
+    before = validator.snapshot
+    edit(ontology_file, 'logic: "latency_ms <= 200"', 'logic: "latency_ms <= 100"')
+    snapshot = await reloader.reload()
+
+    assert snapshot is validator.snapshot and snapshot.version != before.version
+    assert snapshot.load_ms > 0 and snapshot.compile_ms > 0
+    assert validator.validate("execute_trade", TRADE) == [
+        "STPA Violation FIN-2: Agent must not execute trade if latency > 200ms"
+    ]
+    # A reader still holding the previous snapshot sees it whole.
+    assert before.rules_for("execute_trade")[1].predicate(TRADE)
+
+
+@pytest.mark.asyncio
+async def test_invalid_file_keeps_active_snapshot(ontology_file):
+    validator = STPAValidator()
+    reloader = OntologyReloader(validator, path=str(ontology_file), poll_s=0)
+    active = validator.snapshot
+
+    edit(ontology_file, 'logic: "latency_ms <= 200"', 'logic: "__import__(\'os\')"')
+    with pytest.raises(ValueError):
+        await reloader.reload()
+    ontology_file.write_text("constraints: [{id: X}]")
+    with pytest.raises(OntologyError):
+        await reloader.reload()
+
+    assert validator.snapshot is active
+    assert validator.validate("execute_trade", TRADE) == []
+
+
+@pytest.mark.asyncio
+async def test_file_change_triggers_reload(ontology_file):
+    validator = STPAValidator()
+    reloader = OntologyReloader(validator, path=str(ontology_file), poll_s=0.01)
+    reloader.start()
+    try:
+        edit(ontology_file, '"execute_trade"]', '"execute_trade", "execute_sell"]')
+        for _ in range(200):
+            if validator.snapshot.rules_for("execute_sell")[-1].constraint_id == "FIN-2":
+                break
+            await asyncio.sleep(0.01)
+        assert [r.constraint_id for r in validator.snapshot.rules_for("execute_sell")] == ["SC-1", "FIN-1", "FIN-2"]
+    finally:
+        await reloader.stop()
@@ -1,3 +1,6 @@
+import asyncio
+import json
+import time
 import httpx
 import pytest
 import respx
@@ -43,3 +46,192 @@ async def test_circuit_breaker(opa_client):
 
         # Now CB should be OPEN
         assert opa_client.cb.state == "OPEN"
+
+def test_shared_circuit_breaker_trips_all_workers():
+    from src.gateway.core.policy import CircuitBreaker
+    from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+
+    key = "test:opa_breaker"
+    worker_a = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05, half_open_max_calls=1, shared_key=key)
+    worker_b = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05, half_open_max_calls=1, shared_key=key)
+    try:
+        worker_a.record_failure()
+        worker_b.record_failure()
+
+        # Failures from both workers count towards the same window.
+        assert worker_a.state == worker_b.state == "OPEN"
+        assert not worker_b.can_execute()
+
+        # After the timeout one probe is shared by all workers.
+        time.sleep(0.06)
+        assert worker_b.can_execute()
+        assert worker_a.state == "HALF_OPEN"
+        assert not worker_a.can_execute()
+
+        worker_b.record_success()
+        assert worker_a.state == "CLOSED"
+        assert worker_a.failures == 0
+    finally:
+        for field in ("state", "failures", "last_failure_time", "half_open_since", "window_start"):
+            redis_client.delete(f"{key}:{field}")
+
+@pytest.mark.asyncio
+async def test_shared_breaker_keeps_redis_off_the_event_loop(opa_client):
+    import threading
+    from src.gateway.core.policy import CircuitBreaker
+    from src.governed_financial_advisor.infrastructure.redis_client import redis_client
+
+    key = "test:opa_breaker_threads"
+    loop_thread = threading.get_ident()
+    calls = []
+
+    class Store:
+        # Records the thread of every Redis call the breaker makes.
+        def __getattr__(self, name):
+            method = getattr(redis_client, name)
+
+            def call(*args, **kwargs):
+                calls.append((name, threading.get_ident()))
+                return method(*args, **kwargs)
+            return call
+
+    opa_client.cb = CircuitBreaker(shared_key=key)
+    opa_client.cb.store = Store()
+    opa_client.cache.enabled = False
+    try:
+        async with respx.mock(base_url=None) as mock:
+            mock.post(opa_client.url).mock(return_value=httpx.Response(200, json={"result": "ALLOW"}))
+            assert await opa_client.evaluate_policy({"action": "test"}) == "ALLOW"
+            mock.post(opa_client.url).mock(return_value=httpx.Response(500))
+            assert await opa_client.evaluate_policy({"action": "test"}) == "DENY"
+    finally:
+        for field in ("state", "window_start"):
+            redis_client.delete(f"{key}:{field}")
+
+    assert {name for name, _ in calls} >= {"get", "incr"}
+    assert all(thread != loop_thread for _, thread in calls)
+
+@pytest.mark.asyncio
+async def test_opa_batch_evaluates_plan_in_one_request(opa_client):
+    steps = [
+        {"action": "execute_trade", "amount": 100, "trader_role": "junior"},
+        {"action": "execute_trade", "amount": 7000, "trader_role": "junior"},
+        {"action": "execute_trade", "amount": 100, "currency": "BTC"},
+    ]
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(opa_client.batch_target_url).mock(
+            return_value=httpx.Response(200, json={"result": ["ALLOW", "MANUAL_REVIEW", "DENY"]})
+        )
+
+        assert await opa_client.evaluate_policy_batch(steps) == ["ALLOW", "MANUAL_REVIEW", "DENY"]
+        assert route.call_count == 1
+        assert json.loads(route.calls[0].request.content) == {"input": {"inputs": steps}}
+
+@pytest.mark.asyncio
+async def test_opa_batch_failure_denies_every_step(opa_client):
+    async with respx.mock(base_url=None) as mock:
+        # A malformed answer (wrong length) is treated like an outage.
+        mock.post(opa_client.batch_target_url).mock(return_value=httpx.Response(200, json={"result": ["ALLOW"]}))
+
+        result = await opa_client.evaluate_policy_batch([{"action": "a"}, {"action": "b"}])
+        assert result == ["DENY", "DENY"]
+
+def test_half_open_admits_limited_probes():
+    from src.gateway.core.policy import CircuitBreaker
+
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05, half_open_max_calls=2)
+    cb.record_failure()
+    cb.record_failure()
+    assert cb.state == "OPEN"
+
+    time.sleep(0.06)
+    # The backlog does not all hit OPA at once: only two probes get through.
+    assert [cb.can_execute() for _ in range(5)] == [True, True, False, False, False]
+
+    # A failed probe re-opens; successful probes close with a fresh window.
+    cb.record_failure()
+    assert cb.state == "OPEN"
+    time.sleep(0.06)
+    assert cb.can_execute() and cb.can_execute()
+    cb.record_success()
+    assert cb.state == "HALF_OPEN"
+    cb.record_success()
+    assert cb.state == "CLOSED"
+    assert cb.window() == (0, 0, 0)
+
+def test_breaker_trips_on_failure_rate_not_consecutive_failures():
+    from src.gateway.core.policy import CircuitBreaker
+
+    cb = CircuitBreaker(failure_threshold=4, failure_rate_threshold=0.5)
+    for _ in range(3):
+        cb.record_success()
+        cb.record_failure()
+    # 3/6 failed, never two in a row: still a 50% failure rate.
+    assert cb.state == "OPEN"
+
+    healthy = CircuitBreaker(failure_threshold=4, failure_rate_threshold=0.5)
+    for _ in range(3):
+        healthy.record_success()
+        healthy.record_success()
+        healthy.record_failure()
+    assert healthy.state == "CLOSED"
+
+def test_breaker_trips_on_slow_calls():
+    from src.gateway.core.policy import CircuitBreaker
+
+    cb = CircuitBreaker(failure_threshold=3, slow_call_ms=100, slow_call_rate_threshold=0.6)
+    cb.record_success(latency_ms=20)
+    cb.record_success(latency_ms=400)
+    cb.record_success(latency_ms=450)
+    assert cb.state == "OPEN"
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_half_open_slot():
+    from src.gateway.core.policy import CircuitBreaker
+
+    client = OPAClient()
+    # Long recovery_timeout: only the released slot, not a new probe epoch, can recover.
+    client.cb = CircuitBreaker(failure_threshold=2, recovery_timeout=5, half_open_max_calls=1)
+    client.cb.record_failure()
+    client.cb.record_failure()
+    client.cb.last_failure_time -= 6
+
+    started = asyncio.Event()
+
+    async def hang(request):
+        started.set()
+        await asyncio.sleep(10)
+
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post(client.url)
+        route.side_effect = hang
+        probe = asyncio.create_task(client.evaluate_policy({"action": "test"}))
+        await started.wait()
+        assert client.cb.state == "HALF_OPEN"
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        # The cancelled probe gave its slot back: the next call probes and recovers.
+        route.side_effect = None
+        route.return_value = httpx.Response(200, json={"result": "ALLOW"})
+        assert await client.evaluate_policy({"action": "test"}) == "ALLOW"
+    assert client.cb.state == "CLOSED"
+    await client.close()
+
+def test_half_open_without_outcome_starts_new_probe_epoch():
+    from src.gateway.core.policy import CircuitBreaker
+
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05, half_open_max_calls=1)
+    cb.record_failure()
+    cb.record_failure()
+    time.sleep(0.06)
+    # The probe's outcome never arrives (e.g. its worker died).
+    assert cb.can_execute()
+    assert not cb.can_execute()
+
+    time.sleep(0.06)
+    assert cb.can_execute()
+    assert cb.state == "HALF_OPEN"
+    cb.record_success()
+    assert cb.state == "CLOSED"
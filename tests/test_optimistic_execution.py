@@ -15,6 +15,7 @@ def mock_redis():
         def set(key, val): store[key] = val
         mock.get.side_effect = get
         mock.set.side_effect = set
+        mock.aget = AsyncMock(side_effect=get)
         yield mock
 
 @pytest.fixture
@@ -61,7 +62,10 @@ async def test_optimistic_execution_interruption(mock_redis, slow_executor_setup
     # Simulate:
     # 1. Main thread check -> None
     # 2. Thread check -> "Hazard"
-    mock_redis.get.side_effect = [None, "Simulated Hazard", "Simulated Hazard"]
+    # The first check is awaited (aget), the late one runs in the executor thread (get).
+    reads = iter([None, "Simulated Hazard", "Simulated Hazard"])
+    mock_redis.aget.side_effect = lambda key: next(reads)
+    mock_redis.get.side_effect = lambda key: next(reads)
 
     # We use create_task to run it "in the background"
     trade_task = asyncio.create_task(execute_trade(order))
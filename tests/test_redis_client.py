@@ -0,0 +1,155 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.gateway.governance import SymbolicGovernor, safety
+from src.gateway.governance.safety import ControlBarrierFunction
+from src.governed_financial_advisor.infrastructure.redis_client import RedisClient, _MemoryStore
+
+
+@pytest.fixture
+def memory_redis():
+    client = RedisClient()
+    client.use_redis, client.client = False, None
+    return client
+
+
+def test_memory_fallback_expires_keys(memory_redis):
+    memory_redis.set("flag", "1", ttl=0.05)
+    memory_redis.set("sticky", "1")
+    assert memory_redis.incr("counter", ttl=0.05) == 1
+    assert memory_redis.mget(["flag", "sticky", "counter"]) == ["1", "1", "1"]
+
+    time.sleep(0.1)
+    assert memory_redis.mget(["flag", "sticky", "counter"]) == [None, "1", None]
+    # A fresh counter after expiry, like INCR on a missing key.
+    assert memory_redis.incr("counter") == 1
+    # A write without a TTL makes the key persistent again.
+    memory_redis.set("flag", "2", ttl=0.05)
+    memory_redis.set("flag", "3")
+    time.sleep(0.1)
+    assert memory_redis.get("flag") == "3"
+
+
+def test_memory_fallback_evicts_least_recently_used():
+    store = _MemoryStore(max_keys=3)
+    for key in "abc":
+        store.set(key, key, ttl=60)
+    assert store.get("a") == "a"  # "b" is now the least recently used
+    store.set("d", "d", ttl=60)
+
+    assert len(store) == 3
+    assert [store.get(key) for key in "abcd"] == ["a", None, "c", "d"]
+
+
+def test_memory_fallback_never_evicts_persistent_keys():
+    store = _MemoryStore(max_keys=3)
+    store.set("safety_violation", "drawdown")
+    store.set("safety:current_cash", "1000.5")
+    store.set("expired", "x", ttl=0.01)
+    store.set("volatile", "v", ttl=60)
+    time.sleep(0.02)
+
+    # The expired key is purged, then the least recently used key with a TTL.
+    store.set("counter", "1", ttl=60)
+    assert set(store._entries) == {"safety_violation", "safety:current_cash", "counter"}
+
+    # Only persistent keys left to evict: the store grows instead of dropping them.
+    store.set("flag_2", "on")
+    store.set("flag_3", "on")
+    assert set(store._entries) == {"safety_violation", "safety:current_cash", "flag_2", "flag_3"}
+    assert store.get("safety_violation") == "drawdown"
+    assert store.get("safety:current_cash") == "1000.5"
+
+
+@pytest.mark.asyncio
+async def test_async_twins_share_the_store(memory_redis):
+    await memory_redis.aset("safety_violation", "drawdown", ttl=60)
+    memory_redis.set("safety:current_cash", "1000.5")
+
+    assert memory_redis.get("safety_violation") == "drawdown"
+    assert await memory_redis.amget(["safety_violation", "safety:current_cash", "missing"]) == [
+        "drawdown", "1000.5", None
+    ]
+    assert await memory_redis.aget_float("safety:current_cash") == 1000.5
+    assert await memory_redis.aget_float("safety_violation", 7.0) == 7.0
+    assert await memory_redis.aincr("calls", 2, ttl=60) == 2
+
+    await memory_redis.adelete("safety_violation")
+    assert await memory_redis.aget("safety_violation") is None
+    assert await memory_redis.amget([]) == []
+
+
+@pytest.mark.asyncio
+async def test_governor_awaits_the_cbf_read(memory_redis, monkeypatch):
+    monkeypatch.setattr(safety, "redis_client", memory_redis)
+    cbf = ControlBarrierFunction(min_cash_balance=1000.0, gamma=0.5)
+    memory_redis.set(cbf.redis_key, "11000.0")
+    monkeypatch.setattr(cbf, "verify_action", Mock(side_effect=AssertionError("blocking read")))
+
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.return_value = "ALLOW"
+    consensus_engine = AsyncMock()
+    consensus_engine.check_consensus.return_value = {"status": "APPROVE"}
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+    governor = SymbolicGovernor(opa_client, cbf, consensus_engine, stpa_validator)
+
+    trade = {"symbol": "AAPL", "amount": 1000.0, "confidence": 0.99}
+    results = await asyncio.gather(*(governor.govern("execute_trade", trade) for _ in range(20)))
+    assert results == [None] * 20
+
+    with pytest.raises(Exception, match="CBF violation"):
+        await governor.govern("execute_trade", {**trade, "amount": 6000.0})
+
+
+@pytest.mark.asyncio
+async def test_cbf_reads_cash_and_interrupt_in_one_trip(memory_redis, monkeypatch):
+    monkeypatch.setattr(safety, "redis_client", memory_redis)
+    cbf = ControlBarrierFunction(min_cash_balance=1000.0, gamma=0.5)
+    memory_redis.set(cbf.redis_key, "11000.0")
+    monkeypatch.setattr(memory_redis, "aget", AsyncMock(side_effect=AssertionError("one GET per key")))
+    amget = AsyncMock(wraps=memory_redis.amget)
+    monkeypatch.setattr(memory_redis, "amget", amget)
+
+    assert await cbf.averify_action("execute_trade", {"amount": 1000.0}) == "SAFE"
+    memory_redis.set("safety_violation", "drawdown breach")
+    assert await cbf.averify_action("execute_trade", {"amount": 1000.0}) == "UNSAFE: Safety interrupt active: drawdown breach"
+    assert cbf.verify_action("execute_trade", {"amount": 1000.0}).startswith("UNSAFE: Safety interrupt")
+    assert amget.await_count == 2
+
+
+@pytest.mark.parametrize("backend", ["memory", "lua"])
+def test_delete_if_equals_is_compare_and_delete(memory_redis, backend):
+    if backend == "lua":
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        memory_redis.use_redis, memory_redis.client = True, fakeredis.FakeRedis(decode_responses=True)
+
+    memory_redis.set("verdict", "v1")
+    assert not memory_redis.delete_if_equals("verdict", "v0")
+    assert memory_redis.get("verdict") == "v1"
+    assert memory_redis.delete_if_equals("verdict", "v1")
+    assert not memory_redis.delete_if_equals("verdict", "v1")
+    assert memory_redis.get("verdict") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "lua"])
+async def test_async_delete_if_equals_is_compare_and_delete(memory_redis, monkeypatch, backend):
+    if backend == "lua":
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        memory_redis.use_redis, memory_redis.client = True, fakeredis.FakeRedis(server=server, decode_responses=True)
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        monkeypatch.setattr(memory_redis, "_async_redis", lambda: async_client)
+
+    await memory_redis.aset("verdict", "v1")
+    assert not await memory_redis.adelete_if_equals("verdict", "v0")
+    assert await memory_redis.aget("verdict") == "v1"
+    assert await memory_redis.adelete_if_equals("verdict", "v1")
+    assert not await memory_redis.adelete_if_equals("verdict", "v1")
+    assert await memory_redis.aget("verdict") is None
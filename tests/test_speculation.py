@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from src.gateway.core.speculation import SpeculativeGeneration
+
+
+async def _generation(pieces):
+    for piece in pieces:
+        await asyncio.sleep(0)
+        yield {"choices": [{"delta": {"content": piece}}]}
+
+
+@pytest.mark.asyncio
+async def test_commit_replays_buffered_generation():
+    speculation = SpeculativeGeneration(_generation(["Hel", "lo", "!"])).start()
+
+    # Input rails "run" while the generation drains into the buffer.
+    await asyncio.sleep(0.01)
+    speculation.commit()
+
+    assert await speculation.text() == "Hello!"
+    assert speculation.outcome == "committed"
+    assert speculation.time_saved_s > 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_generation_and_counts_wasted_tokens():
+    started = asyncio.Event()
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                started.set()
+                await asyncio.sleep(0.001)
+                yield {"choices": [{"delta": {"content": "x"}}]}
+        finally:
+            closed.append(True)
+
+    speculation = SpeculativeGeneration(endless()).start()
+    await started.wait()
+    await asyncio.sleep(0.01)
+
+    wasted = await speculation.cancel()
+
+    assert wasted == speculation.tokens > 0
+    assert speculation.outcome == "cancelled"
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_upstream_error_surfaces_to_consumer():
+    async def failing():
+        yield {"choices": [{"delta": {"content": "partial"}}]}
+        raise RuntimeError("upstream reset")
+
+    speculation = SpeculativeGeneration(failing()).start()
+    speculation.commit()
+
+    with pytest.raises(RuntimeError, match="upstream reset"):
+        await speculation.text()
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from config.settings import Config
+from src.gateway.governance.constraint_compiler import ConstraintSyntaxError, compile_constraint
+from src.gateway.governance.ontology import Constraint, TradingKnowledgeGraph
+from src.gateway.governance.stpa_validator import OntologySnapshot, STPAValidator
+
+
+def test_default_ontology_constraints():
+    validator = STPAValidator()
+    trade = {"approval_token": "signed", "latency_ms": 20}
+
+    assert validator.validate("execute_trade", trade) == []
+    assert validator.validate("execute_trade", {**trade, "latency_ms": "150"}) == []
+    assert [v.split(":")[0] for v in validator.validate("execute_trade", {"latency_ms": 500})] == [
+        "STPA Violation SC-1", "STPA Violation FIN-2"
+    ]
+    # Missing inputs fail closed.
+    assert validator.validate("execute_trade", {"approval_token": "signed"})
+
+    assert validator.validate("execute_sell", {"quantity": 5, "portfolio_total": 100}) == []
+    assert validator.validate("execute_sell", {"quantity": 50, "portfolio_total": 100})
+    assert validator.validate("execute_sell", {"quantity": 5, "portfolio_total": 0})
+    assert validator.validate("execute_sell", {"quantity": 5, "portfolio_total": -100})
+    assert validator.validate("lookup_quote", {}) == []
+
+
+def test_facts_cannot_be_supplied_by_the_agent():
+    validator = STPAValidator()
+    assert validator.validate("write_db", {"has_approval_token": True})
+    assert validator.validate("execute_sell", {"sell_percentage": 0.01, "quantity": 90, "portfolio_total": 100})
+
+
+def test_new_constraints_need_no_code_change():
+    ontology = TradingKnowledgeGraph.from_yaml(Config.STPA_ONTOLOGY_FILE)
+    ontology.add_fact("notional", "amount * price")
+    ontology.add_constraint(Constraint(
+        id="FIN-3", description="Notional must stay under 1M in allowed currencies.",
+        logic="notional < 1_000_000 and currency in ('USD', 'EUR')", scope=["execute_trade"]
+    ))
+    validator = STPAValidator(ontology)
+    trade = {"approval_token": "t", "latency_ms": 10, "amount": 10, "price": 100.0, "currency": "USD"}
+
+    assert validator.validate("execute_trade", trade) == []
+    assert validator.validate("execute_trade", {**trade, "price": 200_000})
+    assert validator.validate("execute_trade", {**trade, "currency": "BTC"})
+
+    # Redefining a constraint replaces it in the action index (and in the next snapshot).
+    ontology.add_constraint(Constraint(id="FIN-2", description="Latency", logic="latency_ms <= 5", scope=["execute_trade"]))
+    assert [c.id for c in ontology.get_constraints_for_action("execute_trade")].count("FIN-2") == 1
+    assert validator.validate("execute_trade", trade) == []
+    validator.swap(OntologySnapshot.compile(ontology))
+    assert validator.validate("execute_trade", trade) == ["STPA Violation FIN-2: Latency"]
+
+
+@pytest.mark.parametrize("logic", [
+    "__import__('os').system('true')",
+    "params.__class__",
+    "amount ** 1000",
+    "[x for x in amount]",
+    "lambda: True",
+    "amount is 5",
+    "amount >",
+])
+def test_logic_outside_the_grammar_is_rejected(logic):
+    with pytest.raises(ConstraintSyntaxError):
+        compile_constraint(logic)
+
+
+def test_bad_constraint_fails_at_load_time():
+    ontology = TradingKnowledgeGraph()
+    ontology.add_constraint(Constraint(id="BAD", description="", logic="open('/etc/passwd')", scope=["x"]))
+    with pytest.raises(ConstraintSyntaxError):
+        STPAValidator(ontology)
+
+
+@pytest.mark.parametrize("logic", [
+    "latency_ms <= 200",
+    "0 < amount / price <= 10",
+    "not (amount > 100) or price is None",
+    "approval_token is not None and -amount < -5",
+    "amount % 7 != 0",
+    "flag == True",
+    "price == 100 or amount != 3",
+])
+def test_batch_matches_scalar(logic):
+    predicate = compile_constraint(logic)
+    assert predicate.evaluate_column is not None
+
+    rng = random.Random(3)
+    values = [None, 0, 3, 7, 100, 250.5, -1, "12", "abc", True, float("inf")]
+    keys = ["latency_ms", "amount", "price", "approval_token", "flag"]
+    rows = [{k: rng.choice(values) for k in keys if rng.random() < 0.8} for _ in range(400)]
+
+    def scalar(row):
+        try:
+            return predicate(row)
+        except Exception:
+            return False
+
+    assert predicate.check_batch(rows).tolist() == [scalar(row) for row in rows]
@@ -0,0 +1,66 @@
+import pytest
+
+from src.gateway.governance.nemo.stream_rails import StreamingOutputRails
+
+
+async def _passthrough(text):
+    return text, False
+
+
+@pytest.mark.asyncio
+async def test_buffers_until_window_is_full():
+    window = StreamingOutputRails(_passthrough, window_chars=20, context_chars=0)
+
+    assert await window.feed("Hello ") == []
+    released = await window.feed("there, this is a streamed answer")
+
+    # Released up to the last whitespace; the partial word stays buffered.
+    assert released == ["Hello there, this is a streamed "]
+    assert await window.close() == ["answer"]
+    assert window.flushed == "Hello there, this is a streamed answer"
+
+
+@pytest.mark.asyncio
+async def test_masking_is_applied_before_flush():
+    async def mask_email(text):
+        return text.replace("jane@example.com", "<EMAIL_ADDRESS>"), False
+
+    window = StreamingOutputRails(mask_email, window_chars=10, context_chars=8)
+    out = []
+    for chunk in ["Contact ", "jane@example.com ", "for ", "details."]:
+        out.extend(await window.feed(chunk))
+    out.extend(await window.close())
+
+    assert "jane@example.com" not in "".join(out)
+    assert "".join(out) == "Contact <EMAIL_ADDRESS> for details."
+
+
+@pytest.mark.asyncio
+async def test_block_stops_stream_before_bad_span_is_flushed():
+    async def block_secret(text):
+        if "SECRET" in text:
+            return "I cannot share that.", True
+        return text, False
+
+    window = StreamingOutputRails(block_secret, window_chars=10, context_chars=0)
+    out = []
+    out.extend(await window.feed("Safe prefix text "))
+    out.extend(await window.feed("then the SECRET leaks "))
+
+    assert window.blocked
+    assert window.refusal == "I cannot share that."
+    assert "SECRET" not in "".join(out)
+    # Nothing further is accepted once blocked.
+    assert await window.feed("more ") == []
+    assert await window.close() == []
+
+
+@pytest.mark.asyncio
+async def test_rail_failure_fails_closed():
+    async def broken(text):
+        raise RuntimeError("rails down")
+
+    window = StreamingOutputRails(broken, window_chars=5, context_chars=0)
+    assert await window.feed("some text here ") == []
+    assert window.blocked
+    assert len(window.window_latencies_ms) == 1
@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, Mock
 
@@ -96,3 +99,162 @@ async def test_symbolic_governor_consensus_fail():
         await governor.govern("execute_trade", params)
 
     assert "Consensus Rejection" in str(excinfo.value)
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_verify_plan_batches_policy():
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy_batch.return_value = ["ALLOW", "DENY", "ALLOW"]
+
+    safety_filter = Mock()
+    safety_filter.verify_action.return_value = "SAFE"
+
+    consensus_engine = AsyncMock()
+    consensus_engine.check_consensus.return_value = {"status": "APPROVE"}
+
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+
+    governor = SymbolicGovernor(opa_client, safety_filter, consensus_engine, stpa_validator)
+
+    steps = [
+        {"action": "execute_trade", "parameters": {"amount": 100, "symbol": "AAPL"}},
+        {"action": "execute_trade", "parameters": {"amount": 9000, "symbol": "MSFT"}},
+        {"action": "execute_trade", "parameters": {"amount": 50, "symbol": "GOOG", "confidence": 0.5}},
+    ]
+    violations = await governor.verify_plan(steps)
+
+    # One OPA round-trip for the whole plan.
+    opa_client.evaluate_policy_batch.assert_awaited_once()
+    opa_client.evaluate_policy.assert_not_called()
+    assert opa_client.evaluate_policy_batch.await_args.args[0][1] == {"amount": 9000, "symbol": "MSFT", "action": "execute_trade"}
+
+    assert violations[0] == []
+    assert violations[1] == ["ISO 42001 Policy Violation: OPA Denied Action."]
+    assert "SR 11-7 Violation" in violations[2][0]
+    assert consensus_engine.check_consensus.await_count == 3
+
+def _governor(opa_decision="ALLOW", cbf=lambda *args: "SAFE", consensus=None):
+    opa_client = AsyncMock()
+    opa_client.evaluate_policy.return_value = opa_decision
+    safety_filter = Mock()
+    safety_filter.verify_action.side_effect = cbf
+    if consensus is None:
+        consensus_engine = AsyncMock()
+        consensus_engine.check_consensus.return_value = {"status": "APPROVE"}
+    else:
+        consensus_engine = Mock()
+        consensus_engine.check_consensus = consensus
+    stpa_validator = Mock()
+    stpa_validator.validate.return_value = []
+    return SymbolicGovernor(opa_client, safety_filter, consensus_engine, stpa_validator)
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_first_violation_cancels_consensus():
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def slow_consensus(*args):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    governor = _governor(opa_decision="DENY", consensus=slow_consensus)
+    params = {"confidence": 0.99, "amount": 100, "symbol": "AAPL"}
+
+    start = time.perf_counter()
+    with pytest.raises(GovernanceError, match="ISO 42001 Policy Violation"):
+        await governor.govern("execute_trade", params)
+
+    # Consensus overlapped with OPA and was cancelled by its DENY.
+    assert started.is_set() and cancelled.is_set()
+    assert time.perf_counter() - start < 1
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_error_precedence_is_deterministic():
+    def slow_unsafe_cbf(*args):
+        time.sleep(0.05)
+        return "UNSAFE: CBF violation."
+
+    # OPA denies first, but the (slower) CBF violation has precedence, as when run in sequence.
+    governor = _governor(opa_decision="DENY", cbf=slow_unsafe_cbf)
+    with pytest.raises(GovernanceError, match="Safety Violation"):
+        await governor.govern("execute_trade", {"confidence": 0.99, "amount": 100, "symbol": "AAPL"})
+
+    # A failed gate means consensus never starts.
+    governor = _governor()
+    with pytest.raises(GovernanceError, match="SR 11-7 Violation"):
+        await governor.govern("execute_trade", {"confidence": 0.5, "amount": 100, "symbol": "AAPL"})
+    governor.consensus_engine.check_consensus.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_verify_short_circuit_skips_expensive_checks():
+    governor = _governor()
+    params = {"confidence": 0.5, "amount": 100, "symbol": "AAPL"}
+
+    violations = await governor.verify("execute_trade", params, mode="short_circuit")
+    assert len(violations) == 1 and "SR 11-7 Violation" in violations[0]
+    governor.safety_filter.verify_action.assert_not_called()
+    governor.opa_client.evaluate_policy.assert_not_called()
+    governor.consensus_engine.check_consensus.assert_not_called()
+
+    # Exhaustive (the default) still reports everything.
+    governor.opa_client.evaluate_policy.return_value = "DENY"
+    violations = await governor.verify("execute_trade", params)
+    assert len(violations) == 2
+    governor.consensus_engine.check_consensus.assert_awaited_once()
+
+    with pytest.raises(ValueError):
+        await governor.verify("execute_trade", params, mode="fastest")
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_verify_plan_short_circuit():
+    governor = _governor()
+    governor.opa_client.evaluate_policy_batch.return_value = ["DENY", "ALLOW"]
+    steps = [
+        {"action": "execute_trade", "parameters": {"amount": 50, "symbol": "GOOG", "confidence": 0.5}},
+        {"action": "execute_trade", "parameters": {"amount": 9000, "symbol": "MSFT"}},
+        {"action": "execute_trade", "parameters": {"amount": 100, "symbol": "AAPL"}},
+    ]
+    violations = await governor.verify_plan(steps, mode="short_circuit")
+
+    # The locally rejected step is left out of the OPA batch; only the clean step reaches consensus.
+    assert [p["symbol"] for p in governor.opa_client.evaluate_policy_batch.await_args.args[0]] == ["MSFT", "AAPL"]
+    assert "SR 11-7 Violation" in violations[0][0]
+    assert violations[1] == ["ISO 42001 Policy Violation: OPA Denied Action."]
+    assert violations[2] == []
+    governor.consensus_engine.check_consensus.assert_awaited_once_with("execute_trade", 100, "AAPL")
+
+@pytest.mark.asyncio
+async def test_symbolic_governor_cancelled_opa_probe_still_reports_outcome():
+    import httpx
+    import respx
+
+    from src.gateway.core.policy import CircuitBreaker, OPAClient
+
+    opa_client = OPAClient()
+    opa_client.cb = CircuitBreaker(failure_threshold=2, recovery_timeout=5, half_open_max_calls=1)
+    opa_client.cb.record_failure()
+    opa_client.cb.record_failure()
+    opa_client.cb.last_failure_time -= 6
+
+    async def slow_allow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"result": "ALLOW"})
+
+    governor = _governor()
+    governor.opa_client = opa_client
+    async with respx.mock(base_url=None) as mock:
+        mock.post(opa_client.url).mock(side_effect=slow_allow)
+
+        # The confidence violation cancels the OPA stage while it holds the probe.
+        with pytest.raises(GovernanceError, match="SR 11-7 Violation"):
+            await governor.govern("execute_trade", {"confidence": 0.1, "amount": 100, "symbol": "AAPL"})
+        assert opa_client.cb.state == "HALF_OPEN"
+
+        # The probe finished in the background and closed the breaker.
+        await asyncio.gather(*governor._detached)
+        assert opa_client.cb.state == "CLOSED"
+        await governor.govern("execute_trade", {"confidence": 0.99, "amount": 100, "symbol": "AAPL"})
+    await opa_client.close()
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from src.gateway.core.batch import execute_batch
+
+READ_ONLY = {"check_market_status", "evaluate_policy"}
+
+
+class RecordingDispatcher:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.events = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, tool_name, params):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.events.append(("start", tool_name, params.get("symbol")))
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.events.append(("end", tool_name, params.get("symbol")))
+        if params.get("fail"):
+            raise ValueError("boom")
+        return f"{tool_name}:{params.get('symbol')}"
+
+
+@pytest.mark.asyncio
+async def test_read_only_calls_run_concurrently_and_results_keep_input_order():
+    dispatch = RecordingDispatcher()
+    calls = [{"tool_name": "check_market_status", "params": {"symbol": s}} for s in ["AAPL", "MSFT", "NVDA"]]
+
+    results = await execute_batch(calls, dispatch, READ_ONLY, concurrency=3)
+
+    assert dispatch.peak == 3
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert [r["output"] for r in results] == ["check_market_status:AAPL", "check_market_status:MSFT", "check_market_status:NVDA"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected():
+    dispatch = RecordingDispatcher()
+    calls = [{"tool_name": "check_market_status", "params": {"symbol": str(i)}} for i in range(6)]
+
+    await execute_batch(calls, dispatch, READ_ONLY, concurrency=2)
+
+    assert dispatch.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_read_only_calls_execute_once():
+    dispatch = RecordingDispatcher()
+    calls = [
+        {"tool_name": "evaluate_policy", "params": {"symbol": "AAPL", "amount": 10}},
+        {"tool_name": "evaluate_policy", "params": {"amount": 10, "symbol": "AAPL"}},
+    ]
+
+    results = await execute_batch(calls, dispatch, READ_ONLY)
+
+    assert len([e for e in dispatch.events if e[0] == "start"]) == 1
+    assert results[0]["output"] == results[1]["output"]
+
+
+@pytest.mark.asyncio
+async def test_distinct_tools_run_every_call():
+    dispatch = RecordingDispatcher()
+    # Each dry-run check issues its own single-use verdict token.
+    calls = [{"tool_name": "evaluate_policy", "params": {"symbol": "AAPL", "amount": 10}}] * 2
+
+    results = await execute_batch(calls, dispatch, READ_ONLY, distinct_tools={"evaluate_policy"})
+
+    assert len([e for e in dispatch.events if e[0] == "start"]) == 2
+    assert dispatch.peak == 2
+    assert [r["status"] for r in results] == ["SUCCESS", "SUCCESS"]
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_calls_are_ordered_barriers():
+    dispatch = RecordingDispatcher()
+    calls = [
+        {"tool_name": "check_market_status", "params": {"symbol": "AAPL"}},
+        {"tool_name": "execute_trade_action", "params": {"symbol": "T1"}},
+        {"tool_name": "execute_trade_action", "params": {"symbol": "T2", "fail": True}},
+        {"tool_name": "check_market_status", "params": {"symbol": "AAPL"}},
+    ]
+
+    results = await execute_batch(calls, dispatch, READ_ONLY)
+
+    assert dispatch.events == [
+        ("start", "check_market_status", "AAPL"), ("end", "check_market_status", "AAPL"),
+        ("start", "execute_trade_action", "T1"), ("end", "execute_trade_action", "T1"),
+        ("start", "execute_trade_action", "T2"), ("end", "execute_trade_action", "T2"),
+        # Not de-duplicated with the first read: a trade ran in between.
+        ("start", "check_market_status", "AAPL"), ("end", "check_market_status", "AAPL"),
+    ]
+    assert [r["status"] for r in results] == ["SUCCESS", "SUCCESS", "ERROR", "SUCCESS"]
+    assert results[2]["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_malformed_calls_fail_alone():
+    dispatch = RecordingDispatcher()
+    calls = [
+        {"tool_name": "check_market_status", "params": {"symbol": "AAPL"}},
+        {"params": {"symbol": "MSFT"}},
+        "check_market_status",
+        {"tool_name": "check_market_status", "params": ["NVDA"]},
+        {"tool_name": "check_market_status", "params": {"symbol": "NVDA"}},
+    ]
+
+    results = await execute_batch(calls, dispatch, READ_ONLY)
+
+    assert [r["status"] for r in results] == ["SUCCESS", "ERROR", "ERROR", "ERROR", "SUCCESS"]
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert "tool_name" in results[1]["error"]
+    assert results[2]["tool_name"] is None
+    assert [e[2] for e in dispatch.events if e[0] == "start"] == ["AAPL", "NVDA"]
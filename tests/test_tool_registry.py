@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from typing import Optional
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from pydantic import ValidationError
+
+from src.gateway.core.registry import ToolNotFoundError, ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry(max_workers=2)
+    yield registry
+    registry.shutdown()
+
+
+@pytest.fixture
+def mcp():
+    return FastMCP("Test Gateway")
+
+
+@pytest.mark.asyncio
+async def test_sync_tools_run_off_the_event_loop(registry, mcp):
+    @registry.tool(mcp, read_only=True)
+    def blocking_lookup(ticker: str) -> str:
+        return threading.current_thread().name
+
+    thread_name = await registry.dispatch("blocking_lookup", {"ticker": "AAPL"})
+
+    assert thread_name.startswith("gateway-tool")
+    assert registry.read_only_tools == {"blocking_lookup"}
+
+
+@pytest.mark.asyncio
+async def test_arguments_are_validated_and_coerced(registry, mcp):
+    @registry.tool(mcp)
+    async def trade(symbol: str, amount: float, note: Optional[str] = None) -> str:
+        return f"{symbol}:{amount:.1f}:{note}"
+
+    assert await registry.dispatch("trade", {"symbol": "AAPL", "amount": "10"}) == "AAPL:10.0:None"
+
+    with pytest.raises(ValidationError):
+        await registry.dispatch("trade", {"symbol": "AAPL"})
+
+    with pytest.raises(ToolNotFoundError):
+        await registry.dispatch("missing", {})
+
+
+@pytest.mark.asyncio
+async def test_mcp_and_http_share_binding_including_kwargs(registry, mcp):
+    @registry.tool(mcp, read_only=True)
+    async def evaluate_policy(action: str, dry_run: bool = True, **kwargs) -> str:
+        return f"{action}:{dry_run}:{sorted(kwargs.items())}"
+
+    extra = {"amount": 500, "symbol": "AAPL"}
+    via_http = await registry.dispatch("evaluate_policy", {"action": "execute_trade", **extra})
+    # MCP carries extra arguments as one optional object named after **kwargs.
+    content, _ = await mcp.call_tool("evaluate_policy", {"action": "execute_trade", "kwargs": extra})
+    via_mcp = content[0].text
+
+    assert via_http == via_mcp == "execute_trade:True:[('amount', 500), ('symbol', 'AAPL')]"
+
+    [listed] = await mcp.list_tools()
+    assert listed.annotations.readOnlyHint is True
+    assert listed.inputSchema["required"] == ["action"]
+    assert "kwargs" in listed.inputSchema["properties"]
+
+
+@pytest.mark.asyncio
+async def test_sync_calls_waiting_for_a_thread_are_counted_as_queued(mcp):
+    from src.gateway.core.metrics import TOOL_QUEUED
+
+    registry = ToolRegistry(max_workers=1)
+    release = threading.Event()
+
+    @registry.tool(mcp, read_only=True)
+    def slow_lookup(ticker: str) -> str:
+        release.wait(5)
+        return ticker
+
+    queued = TOOL_QUEUED.labels("slow_lookup")
+    first = asyncio.create_task(registry.dispatch("slow_lookup", {"ticker": "A"}))
+    second = asyncio.create_task(registry.dispatch("slow_lookup", {"ticker": "B"}))
+    await asyncio.sleep(0.05)
+    assert queued._value.get() == 1
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["A", "B"]
+    assert queued._value.get() == 0
+    registry.shutdown()
@@ -0,0 +1,153 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from config.settings import Config
+from src.gateway.core.upstream import VLLMUpstreamPool
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(Config, "VLLM_GATEWAY_URL", None)
+    monkeypatch.setattr(Config, "VLLM_FAST_API_BASE", "http://vllm-fast:8000/v1")
+    monkeypatch.setattr(Config, "VLLM_REASONING_API_BASE", "http://vllm-reasoning:8000/v1")
+    return VLLMUpstreamPool()
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_one_client_per_upstream(pool):
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post("http://vllm-fast:8000/v1/chat/completions").mock(
+            return_value=httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+        )
+
+        await pool.start()
+        client = pool.clients["fast"]
+
+        assert await pool.complete_text([{"role": "user", "content": "hi"}]) == "ok"
+        assert await pool.complete_text([{"role": "user", "content": "again"}]) == "ok"
+
+        assert pool.clients["fast"] is client
+        assert route.call_count == 2
+        assert pool.in_flight["fast"] == 0
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_routes_reasoning_models_and_forwards_guided_params(pool):
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post("http://vllm-reasoning:8000/v1/chat/completions").mock(
+            return_value=httpx.Response(200, json={"choices": [{"message": {"content": "{}"}}]})
+        )
+
+        await pool.chat(
+            [{"role": "user", "content": "plan"}],
+            model="deepseek-ai/DeepSeek-R1-Distill-Llama-8B",
+            guided_json={"type": "object"},
+            guided_regex=None,
+        )
+
+        body = json.loads(route.calls.last.request.content)
+        assert body["guided_json"] == {"type": "object"}
+        assert "guided_regex" not in body
+        assert body["stream"] is False
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_parses_sse_events(pool):
+    events = [
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Hel"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+    ]
+    body = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+
+    async with respx.mock(base_url=None) as mock:
+        mock.post("http://vllm-fast:8000/v1/chat/completions").mock(
+            return_value=httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        )
+
+        received = [e async for e in pool.stream_chat([{"role": "user", "content": "hi"}])]
+
+    assert [e["choices"][0]["delta"].get("content") for e in received] == [None, "Hel", "lo"]
+    assert pool.in_flight["fast"] == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_attributes_vllm_usage_to_request(pool):
+    from src.gateway.core.usage import track_usage
+
+    usage_chunk = {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2, "total_tokens": 9}}
+    body = f"data: {json.dumps({'choices': [{'delta': {'content': 'ok'}}]})}\n\ndata: {json.dumps(usage_chunk)}\n\ndata: [DONE]\n\n"
+
+    async with respx.mock(base_url=None) as mock:
+        stream_route = mock.post("http://vllm-fast:8000/v1/chat/completions").mock(
+            return_value=httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        )
+        with track_usage() as usage:
+            [e async for e in pool.stream_chat([{"role": "user", "content": "hi"}])]
+
+        assert json.loads(stream_route.calls.last.request.content)["stream_options"] == {"include_usage": True}
+
+        stream_route.mock(return_value=httpx.Response(200, json={
+            "choices": [{"message": {"content": "SAFE"}}],
+            "usage": {"prompt_tokens": 40, "completion_tokens": 1, "total_tokens": 41}
+        }))
+        with track_usage(usage):
+            await pool.complete_text([{"role": "user", "content": "check"}], mode="governance")
+
+    assert usage.openai_usage() == {
+        "prompt_tokens": 7,
+        "completion_tokens": 2,
+        "total_tokens": 9,
+        "guardrails": {"prompt_tokens": 40, "completion_tokens": 1, "total_tokens": 41},
+    }
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_nemo_llm_calls_go_through_the_pool(pool, monkeypatch):
+    from langchain_core.messages import HumanMessage
+
+    from src.gateway.core.usage import track_usage
+    from src.gateway.governance.nemo import vllm_client
+
+    monkeypatch.setattr(vllm_client, "vllm_pool", pool)
+    llm = vllm_client.VLLMLLM(model_name="openai/meta-llama/Meta-Llama-3.1-8B-Instruct")
+    stream_body = (
+        f"data: {json.dumps({'choices': [{'delta': {'content': 'SA'}}]})}\n\n"
+        f"data: {json.dumps({'choices': [{'delta': {'content': 'FE'}}]})}\n\ndata: [DONE]\n\n"
+    )
+
+    async with respx.mock(base_url=None) as mock:
+        route = mock.post("http://vllm-fast:8000/v1/chat/completions").mock(return_value=httpx.Response(200, json={
+            "choices": [{"message": {"content": "SAFE"}}],
+            "usage": {"prompt_tokens": 40, "completion_tokens": 1, "total_tokens": 41}
+        }))
+        await pool.start()
+        client = pool.clients["fast"]
+
+        with track_usage() as usage:
+            result = await llm._agenerate([HumanMessage(content="check")], stop=["\n"])
+        assert result.generations[0].message.content == "SAFE"
+        body = json.loads(route.calls.last.request.content)
+        assert body["model"] == "meta-llama/Meta-Llama-3.1-8B-Instruct"
+        assert body["messages"] == [{"role": "user", "content": "check"}]
+        assert body["stop"] == ["\n"]
+        assert usage.openai_usage()["guardrails"]["total_tokens"] == 41
+
+        route.mock(return_value=httpx.Response(200, text=stream_body, headers={"content-type": "text/event-stream"}))
+        chunks = [chunk.message.content async for chunk in llm._astream([HumanMessage(content="check")])]
+        assert chunks == ["SA", "FE"]
+
+        assert pool.clients["fast"] is client
+        assert route.call_count == 2
+        assert pool.in_flight["fast"] == 0
+
+    await pool.close()